@@ -324,15 +324,11 @@ for taint_start_index in range(0, test_padding_len + 8, 8):
             # Skip non-writable maps (e.g., vsyscall)
             if 'w' not in map.permissions:
                 continue
-            
-            pid = d.threads[0].process_id
-            
-            with open(f'/proc/{pid}/mem', 'rb', 0) as mem:
-                mem.seek(map.start)
-                memory_content = mem.read(map.end - map.start)
-
-                if TAINT in memory_content:
-                    print_color(f">> Taint found in {map.backing_file} at address {hex(map.start + memory_content.index(TAINT))}", color=LT_COLOR_RED)
+
+            # Stream the map instead of reading it all at once
+            for address in d.memory.finditer(TAINT, maps=[map]):
+                print_color(f">> Taint found in {map.backing_file} at address {hex(address)}", color=LT_COLOR_RED)
+                break
     elif d.dead:
         print(f">>  Program exited with code {d.exit_code} and signal {d.exit_signal}")
                 
@@ -44,23 +44,19 @@ def detect_function_branches(function_asm: str) -> list:
 branches = detect_function_branches(function_asm)
 
 
-# This function sets up a debugger instance, as provided by libdebug, and sets up
-# breakpoints on all branches detected in the function. It returns the debugger,
-# along with the pipe to the target process and a list of breakpoints set.
+# This function sets up a debugger instance, as provided by libdebug, and covers
+# all branches detected in the function with one-shot breakpoints, installed in a
+# single batch. It returns the debugger, along with the pipe to the target process
+# and the coverage object, which records the addresses that were reached.
 def setup_debugger():
     """Setup the debugger."""
-    def empty_callback(_, __): pass
-
     debugger = libdebug.debugger("main")
     pipe = debugger.run()
-    breakpoints = []
-    for b in branches:
-        bp_conditional = debugger.breakpoint(b[0], callback=empty_callback)
-        bp_target = debugger.breakpoint(b[1], callback=empty_callback)
-        bp_non_hit = debugger.breakpoint(b[2], callback=empty_callback)
-        breakpoints.append((bp_conditional, bp_target, bp_non_hit))
+    # For each branch, we cover the conditional jump, its target and the fall-through instruction
+    addresses = [address for branch in branches for address in branch]
+    branch_coverage = debugger.coverage(addresses)
 
-    return (debugger, pipe, breakpoints)
+    return (debugger, pipe, branch_coverage)
 
 
 # We use a global variable to store the coverage information
@@ -71,17 +67,18 @@ def setup_debugger():
 coverage = {branch[1]: set() for branch in branches}
 
 
-# This function is used to register the coverage information for a specific set of breakpoints
-# It iterates over all breakpoints and checks whether the conditional branch was hit and whether
-# the target branch was not hit. It then updates the coverage dictionary accordingly.
-def register_coverage(bps):
-    for bp in bps:
+# This function is used to register the coverage information for a specific run
+# It iterates over all branches and checks whether the conditional branch was reached and whether
+# the target branch was reached. It then updates the coverage dictionary accordingly.
+def register_coverage(branch_coverage):
+    reached = set(branch_coverage.reached)
+    for conditional, target, non_hit in branches:
         # Check that we hit a conditional jump instruction
-        if bp[0].hit_count > 0:
+        if conditional in reached:
             # Check that the took the jump
-            coverage[bp[1].address].add(bp[1].hit_count > 0)
+            coverage[target].add(target in reached)
             # Check that we did not take the jump
-            coverage[bp[1].address].add(bp[2].hit_count == 0)
+            coverage[target].add(non_hit not in reached)
 
 # This function calculates the coverage of the function by counting the number of branches
 # that were hit. It does so by summing the number of branches that were hit and dividing
@@ -94,99 +91,99 @@ def calculate_coverage():
 
 def test_correct_input():
     number = base64.b64encode(b"1234567890")
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"1234567890"
     debugger.terminate()
 
 def test_empty_string():
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(b"")
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_invalid_length_base64():
     number = base64.b64encode(b"1234567890")[:-1]
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_invalid_base64_characters():
     number = base64.b64encode(b"1234567890")[:-1] + b"\xf0"
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_out_of_range_base64_characters_1():
     number = b"::::"
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_out_of_range_base64_characters_2():
     number = b"!!!!"
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_out_of_range_base64_characters_3():
     number = b"//++"
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"0"
     debugger.terminate()
 
 def test_out_of_range_base64_characters_4():
     number = b"{{}}"
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_out_of_range_base64_characters_5():
     number = b"\x1f\x1f\x1f\x1f"
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
@@ -197,7 +194,7 @@ def test_out_of_range_base64_characters_5():
 # function correctly handles it.
 def test_null_input():
     number = base64.b64encode(b"1234567890")
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
 
     # Set an additional breakpoint at the beginning of the function to test
     debugger.breakpoint("long_from_base64_decimal_str")
@@ -212,7 +209,7 @@ def test_null_input():
     debugger.cont()
     pipe.recvline()
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
@@ -223,7 +220,7 @@ def test_null_input():
 # this condition and returns an error message.
 def test_malloc_failure():
     number = base64.b64encode(b"1234567890")
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
 
     # Set a breakpoint on malloc and simulate a failure
     def bad_malloc(t, _):
@@ -238,18 +235,18 @@ def test_malloc_failure():
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
 def test_integer_overflow():
     number = base64.b64encode(b"123456789012345678901234567890")
-    debugger, pipe, breakpoints = setup_debugger()
+    debugger, pipe, branch_coverage = setup_debugger()
     debugger.cont()
     pipe.recvline()
     pipe.sendline(number)
     debugger.wait()
-    register_coverage(breakpoints)
+    register_coverage(branch_coverage)
     assert pipe.recvline().strip() == b"Invalid input string"
     debugger.terminate()
 
@@ -1,3 +1,4 @@
+from .debugger.debuggee_pool import DebuggeePool
 from .libdebug import debugger
 from .utils.libcontext import libcontext
 
@@ -8,4 +9,4 @@ except ImportError:
 else:
     install()
 
-__all__ = ["debugger", "libcontext"]
+__all__ = ["DebuggeePool", "debugger", "libcontext"]
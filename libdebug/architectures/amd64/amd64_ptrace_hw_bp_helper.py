@@ -42,6 +42,8 @@ AMD64_DBREGS_COUNT = 4
 class Amd64PtraceHardwareBreakpointManager(PtraceHardwareBreakpointManager):
     """A hardware breakpoint manager for the amd64 architecture.
 
+    The debug registers are shadowed, and only the ones that changed are written when the thread is about to resume.
+
     Attributes:
         thread (ThreadContext): The target thread.
         peek_user (callable): A function that reads a number of bytes from the target thread registers.
@@ -64,6 +66,12 @@ class Amd64PtraceHardwareBreakpointManager(PtraceHardwareBreakpointManager):
             "DR3": None,
         }
 
+        # The values last written to the debug registers of the thread, None if unknown
+        self._written: dict[str, int | None] = dict.fromkeys(["DR0", "DR1", "DR2", "DR3", "DR7"])
+        # The bits of the control register that are not ours, read from the thread once
+        self._ctrl_reserved: int | None = None
+        self._changed = True
+
     def install_breakpoint(self: Amd64PtraceHardwareBreakpointManager, bp: Breakpoint) -> None:
         """Installs a hardware breakpoint at the provided location."""
         if self.breakpoint_count >= AMD64_DBREGS_COUNT:
@@ -73,33 +81,9 @@ class Amd64PtraceHardwareBreakpointManager(PtraceHardwareBreakpointManager):
         register = next(reg for reg, bp in self.breakpoint_registers.items() if bp is None)
         liblog.debugger(f"Installing hardware breakpoint on register {register}.")
 
-        # Write the breakpoint address in the register
-        self.poke_user(self.thread.thread_id, AMD64_DBGREGS_OFF[register], bp.address)
-
-        # Set the breakpoint control register
-        ctrl = (
-            AMD64_DBGREGS_CTRL_LOCAL[register]
-            | (AMD64_DBGREGS_CTRL_COND_VAL[bp.condition] << AMD64_DBGREGS_CTRL_COND[register])
-            | (AMD64_DBGREGS_CTRL_LEN_VAL[bp.length] << AMD64_DBGREGS_CTRL_LEN[register])
-        )
-
-        # Read the current value of the register
-        current_ctrl = self.peek_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR7"])
-
-        # Clear condition and length fields for the current register
-        current_ctrl &= ~(0x3 << AMD64_DBGREGS_CTRL_COND[register])
-        current_ctrl &= ~(0x3 << AMD64_DBGREGS_CTRL_LEN[register])
-
-        # Set the new value of the register
-        current_ctrl |= ctrl
-
-        # Write the new value of the register
-        self.poke_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR7"], current_ctrl)
-
-        # Save the breakpoint
+        # Save the breakpoint, it is written to the thread before it resumes
         self.breakpoint_registers[register] = bp
-
-        liblog.debugger(f"Hardware breakpoint installed on register {register}.")
+        self._changed = True
 
         self.breakpoint_count += 1
 
@@ -109,32 +93,76 @@ class Amd64PtraceHardwareBreakpointManager(PtraceHardwareBreakpointManager):
             raise RuntimeError("No more hardware breakpoints to remove.")
 
         # Find the breakpoint register
-        register = next(reg for reg, bp_ in self.breakpoint_registers.items() if bp_ == bp)
+        register = next((reg for reg, bp_ in self.breakpoint_registers.items() if bp_ == bp), None)
 
         if register is None:
             raise RuntimeError("Hardware breakpoint not found.")
 
         liblog.debugger(f"Removing hardware breakpoint on register {register}.")
 
-        # Clear the breakpoint address in the register
-        self.poke_user(self.thread.thread_id, AMD64_DBGREGS_OFF[register], 0)
-
-        # Read the current value of the control register
-        current_ctrl = self.peek_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR7"])
-
-        # Clear the breakpoint control register
-        current_ctrl &= ~AMD64_DBGREGS_CTRL_LOCAL[register]
-
-        # Write the new value of the register
-        self.poke_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR7"], current_ctrl)
-
-        # Remove the breakpoint
+        # Remove the breakpoint, it is cleared from the thread before it resumes
         self.breakpoint_registers[register] = None
-
-        liblog.debugger(f"Hardware breakpoint removed from register {register}.")
+        self._changed = True
 
         self.breakpoint_count -= 1
 
+    def copy_breakpoints(
+        self: Amd64PtraceHardwareBreakpointManager,
+        other: Amd64PtraceHardwareBreakpointManager,
+    ) -> None:
+        """Installs the hardware breakpoints of another thread, in the same registers."""
+        self.breakpoint_registers = dict(other.breakpoint_registers)
+        self.breakpoint_count = other.breakpoint_count
+
+        # A cloned thread reports the debug registers of its parent, which are not armed in it
+        self.invalidate()
+
+    def sync(self: Amd64PtraceHardwareBreakpointManager) -> None:
+        """Writes the debug registers that changed since they were last written."""
+        if not self._changed:
+            return
+
+        ctrl = 0
+        ctrl_mask = 0
+
+        for register, bp in self.breakpoint_registers.items():
+            # A free register is disabled in the control register, its address does not matter
+            if bp is not None and self._written[register] != bp.address:
+                self.poke_user(self.thread.thread_id, AMD64_DBGREGS_OFF[register], bp.address)
+                self._written[register] = bp.address
+
+            ctrl_mask |= (
+                AMD64_DBGREGS_CTRL_LOCAL[register]
+                | (0x3 << AMD64_DBGREGS_CTRL_COND[register])
+                | (0x3 << AMD64_DBGREGS_CTRL_LEN[register])
+            )
+
+            if bp is not None:
+                ctrl |= (
+                    AMD64_DBGREGS_CTRL_LOCAL[register]
+                    | (AMD64_DBGREGS_CTRL_COND_VAL[bp.condition] << AMD64_DBGREGS_CTRL_COND[register])
+                    | (AMD64_DBGREGS_CTRL_LEN_VAL[bp.length] << AMD64_DBGREGS_CTRL_LEN[register])
+                )
+
+        # The control register is read only once, to preserve the bits that are not ours
+        if self._ctrl_reserved is None:
+            self._ctrl_reserved = self.peek_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR7"]) & ~ctrl_mask
+
+        ctrl |= self._ctrl_reserved
+
+        # The value read from the thread is never trusted, the control register is written unless we wrote it
+        if self._written["DR7"] != ctrl:
+            self.poke_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR7"], ctrl)
+            self._written["DR7"] = ctrl
+
+        self._changed = False
+
+    def invalidate(self: Amd64PtraceHardwareBreakpointManager) -> None:
+        """Forgets the content of the debug registers of the thread, so that they are all written again."""
+        self._written = dict.fromkeys(self._written)
+        self._ctrl_reserved = None
+        self._changed = True
+
     def available_breakpoints(self: Amd64PtraceHardwareBreakpointManager) -> int:
         """Returns the number of available hardware breakpoint registers."""
         return AMD64_DBREGS_COUNT - self.breakpoint_count
@@ -145,6 +173,10 @@ class Amd64PtraceHardwareBreakpointManager(PtraceHardwareBreakpointManager):
         Returns:
             Breakpoint | None: The watchpoint that has been hit, or None if no watchpoint has been hit.
         """
+        # Only the watchpoints must be looked up in the status register, breakpoints are found by their address
+        if all(bp is None or bp.condition == "x" for bp in self.breakpoint_registers.values()):
+            return None
+
         dr6 = self.peek_user(self.thread.thread_id, AMD64_DBGREGS_OFF["DR6"])
 
         watchpoint: Breakpoint | None = None
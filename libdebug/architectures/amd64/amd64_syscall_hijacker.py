@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 
     from libdebug.state.thread_context import ThreadContext
 
+# The syscall number that makes the kernel skip a syscall, -1 as an unsigned 64-bit value
+SKIPPED_SYSCALL = 0xFFFFFFFFFFFFFFFF
+
 
 class Amd64SyscallHijacker(SyscallHijackingManager):
     """Class that provides syscall hijacking for the x86_64 architecture."""
@@ -50,6 +53,29 @@ class Amd64SyscallHijacker(SyscallHijackingManager):
 
         return hijack_on_enter_wrapper
 
+    def create_rewriter(
+        self: Amd64SyscallHijacker,
+        syscall_return: int | None,
+        **kwargs: int,
+    ) -> Callable[[ThreadContext, int], None]:
+        """Create a new rewriter for the given syscall.
+
+        Args:
+            syscall_return (int | None): The value the syscall returns without being executed, or None to execute it.
+            **kwargs: The keyword arguments.
+        """
+
+        def rewrite_on_enter_wrapper(d: ThreadContext, _: int) -> None:
+            """Wrapper for the hijack_on_enter method."""
+            if syscall_return is None:
+                self._hijack_on_enter(d, kwargs.get("syscall_number", d.syscall_number), **kwargs)
+            else:
+                # The kernel leaves the return value untouched when the syscall is skipped
+                self._hijack_on_enter(d, SKIPPED_SYSCALL, **kwargs)
+                d.syscall_return = syscall_return & 0xFFFFFFFFFFFFFFFF
+
+        return rewrite_on_enter_wrapper
+
     def _hijack_on_enter(
         self: Amd64SyscallHijacker,
         d: ThreadContext,
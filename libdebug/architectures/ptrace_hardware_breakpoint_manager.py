@@ -46,6 +46,18 @@ class PtraceHardwareBreakpointManager(ABC):
     def remove_breakpoint(self: PtraceHardwareBreakpointManager, bp: Breakpoint) -> None:
         """Removes a hardware breakpoint at the provided location."""
 
+    @abstractmethod
+    def copy_breakpoints(self: PtraceHardwareBreakpointManager, other: PtraceHardwareBreakpointManager) -> None:
+        """Installs the hardware breakpoints of another thread."""
+
+    @abstractmethod
+    def sync(self: PtraceHardwareBreakpointManager) -> None:
+        """Writes the changes to the hardware breakpoints to the debug registers of the thread."""
+
+    @abstractmethod
+    def invalidate(self: PtraceHardwareBreakpointManager) -> None:
+        """Forgets the content of the debug registers of the thread, e.g. after another debugger had access to it."""
+
     @abstractmethod
     def available_breakpoints(self: PtraceHardwareBreakpointManager) -> int:
         """Returns the number of available hardware breakpoint registers."""
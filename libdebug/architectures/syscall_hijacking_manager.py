@@ -26,6 +26,14 @@ class SyscallHijackingManager(ABC):
     ) -> Callable[[ThreadContext, int], None]:
         """Create a new hijacker for the given syscall."""
 
+    @abstractmethod
+    def create_rewriter(
+        self: SyscallHijackingManager,
+        syscall_return: int | None,
+        **kwargs: int,
+    ) -> Callable[[ThreadContext, int], None]:
+        """Create a new rewriter for the given syscall, which skips it if a return value is given."""
+
     @abstractmethod
     def _hijack_on_enter(self: SyscallHijackingManager, d: ThreadContext, new_syscall: int, **kwargs: int) -> None:
         """Hijack the syscall on enter."""
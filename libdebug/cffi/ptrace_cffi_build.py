@@ -49,6 +49,36 @@ if platform.machine() == "x86_64":
     #define IS_SW_BREAKPOINT(instruction) (instruction == 0xCC)
     """
 
+    syscall_define = """
+    #define INSTALL_SYSCALL(instruction) ((instruction & 0xFFFFFFFFFFFF0000) | 0x050F)
+    #define PREPARE_SYSCALL(regs, number, args) do { \\
+        regs.rax = number; \\
+        regs.orig_rax = -1; \\
+        regs.rdi = args[0]; \\
+        regs.rsi = args[1]; \\
+        regs.rdx = args[2]; \\
+        regs.r10 = args[3]; \\
+        regs.r8 = args[4]; \\
+        regs.r9 = args[5]; \\
+    } while (0)
+    #define SYSCALL_RETURN(regs) (regs.rax)
+    #define SYSCALL_NUMBER(regs) (regs.orig_rax)
+    #define SET_SYSCALL_ARG(regs, i, value) do { \\
+        switch (i) { \\
+        case 0: regs.rdi = value; break; \\
+        case 1: regs.rsi = value; break; \\
+        case 2: regs.rdx = value; break; \\
+        case 3: regs.r10 = value; break; \\
+        case 4: regs.r8 = value; break; \\
+        case 5: regs.r9 = value; break; \\
+        } \\
+    } while (0)
+    """
+
+    displaced_define = """
+    #define STACK_POINTER(regs) (regs.rsp)
+    """
+
     finish_define = """
     #define IS_RET_INSTRUCTION(instruction) (instruction == 0xC3 || instruction == 0xCB || instruction == 0xC2 || instruction == 0xCA)
     
@@ -94,14 +124,44 @@ ffibuilder.cdef(
         uint64_t instruction;
         uint64_t patched_instruction;
         char enabled;
+        char installed;
+        char counting;
+        uint64_t hit_count;
+        uint64_t *condition;
+        uint64_t condition_size;
+        uint8_t displaced_code[16];
+        uint8_t displaced_length;
+        uint8_t displaced_disp_offset;
+        uint8_t displaced_flags;
         struct software_breakpoint *next;
     };
 
+    struct coverage_point {
+        uint64_t addr;
+        uint64_t instruction;
+        uint8_t *bitmap;
+        uint64_t index;
+        char installed;
+        struct coverage_point *chain;
+    };
+
     struct thread {
         int tid;
         struct user_regs_struct regs;
         int signal_to_forward;
+        int syscall_stops;
+        _Bool stepping;
+        _Bool rule_pending;
         struct thread *next;
+        struct thread *prev;
+    };
+
+    struct syscall_rule {
+        int flags;
+        uint64_t new_number;
+        uint64_t args[6];
+        uint64_t return_value;
+        uint64_t hits;
     };
 
     struct thread_status {
@@ -110,11 +170,43 @@ ffibuilder.cdef(
         struct thread_status *next;
     };
 
+    struct hash_entry {
+        uint64_t key;
+        void *value;
+    };
+
+    struct hash_table {
+        struct hash_entry *entries;
+        uint64_t size;
+        uint64_t count;
+    };
+
     struct global_state {
         struct thread *t_HEAD;
         struct thread *dead_t_HEAD;
         struct software_breakpoint *b_HEAD;
         _Bool handle_syscall_enabled;
+        _Bool syscall_filter_enabled;
+        uint8_t syscall_filter[128];
+        uint8_t syscall_observe[128];
+        int observed_tid;
+        _Bool syscall_rules_enabled;
+        struct syscall_rule syscall_rules[1024];
+        struct hash_table t_table;
+        struct hash_table b_table;
+        struct software_breakpoint **b_sorted;
+        uint64_t b_count;
+        uint64_t b_capacity;
+        uint64_t b_counting;
+        uint64_t b_conditional;
+        struct hash_table cov_table;
+        struct coverage_point **cov_sorted;
+        uint64_t cov_count;
+        uint64_t cov_capacity;
+        uint64_t cov_installed;
+        uint64_t scratch[8];
+        uint8_t scratch_code[8][16];
+        uint64_t scratch_count;
     };
 
 
@@ -124,24 +216,38 @@ ffibuilder.cdef(
     void ptrace_detach_for_kill(struct global_state *state, int pid);
     void ptrace_detach_for_migration(struct global_state *state, int pid);
     void ptrace_reattach_from_gdb(struct global_state *state, int pid);
-    void ptrace_set_options(int pid);
+    void ptrace_set_options(int pid, _Bool trace_seccomp);
 
     uint64_t ptrace_peekdata(int pid, uint64_t addr);
     uint64_t ptrace_pokedata(int pid, uint64_t addr, uint64_t data);
 
+    int ptrace_read_memory(int pid, uint64_t addr, uint8_t *buf, uint64_t size);
+    int ptrace_write_memory(int pid, uint64_t addr, const uint8_t *buf, uint64_t size);
+    int ptrace_read_memory_vector(int pid, const uint64_t *addrs, const uint64_t *sizes, int count, uint8_t *buf);
+    int ptrace_write_memory_vector(int pid, const uint64_t *addrs, const uint64_t *sizes, int count, const uint8_t *buf);
+    int ptrace_follow_pointers(int pid, uint64_t addr, uint64_t next_offset, uint64_t payload_size, int max_nodes, uint64_t *nodes, uint8_t *payloads);
+
+    int ptrace_inject_syscall(struct global_state *state, int tid, uint64_t number, const uint64_t *args, uint64_t *result);
+    int ptrace_detach_forked_child(struct global_state *state, int tid, int child, const uint64_t *pages, const uint64_t *protections, int count);
+
     uint64_t ptrace_peekuser(int pid, uint64_t addr);
     uint64_t ptrace_pokeuser(int pid, uint64_t addr, uint64_t data);
 
     uint64_t ptrace_geteventmsg(int pid);
+    int ptrace_get_fault_address(int tid, uint64_t *address);
 
     long singlestep(struct global_state *state, int tid);
     int step_until(struct global_state *state, int tid, uint64_t addr, int max_steps);
+    int ptrace_step_thread(struct global_state *state, int tid);
 
     int cont_all_and_set_bps(struct global_state *state, int pid);
 
     int stepping_finish(struct global_state *state, int tid);
 
     struct thread_status *wait_all_and_update_regs(struct global_state *state, int pid);
+    int cont_observed_thread(struct global_state *state);
+    struct thread_status *stop_observed_siblings(struct global_state *state, int pid);
+    int ptrace_get_syscall_info(int tid, uint64_t *info);
     void free_thread_status_list(struct thread_status *head);
 
     struct user_regs_struct* register_thread(struct global_state *state, int tid);
@@ -149,17 +255,27 @@ ffibuilder.cdef(
     void free_thread_list(struct global_state *state);
 
     void register_breakpoint(struct global_state *state, int pid, uint64_t address);
+    int register_breakpoints(struct global_state *state, int pid, const uint64_t *addrs, uint64_t count);
     void unregister_breakpoint(struct global_state *state, uint64_t address);
     void enable_breakpoint(struct global_state *state, uint64_t address);
     void disable_breakpoint(struct global_state *state, uint64_t address);
     void free_breakpoints(struct global_state *state);
+    void set_breakpoint_counting(struct global_state *state, uint64_t address, int counting);
+    uint64_t collect_breakpoint_hits(struct global_state *state, uint64_t address);
+    int set_breakpoint_condition(struct global_state *state, uint64_t address, const uint64_t *code, uint64_t size);
+    void set_breakpoint_displacement(struct global_state *state, uint64_t address, const uint8_t *code, uint64_t length, uint64_t disp_offset, int flags);
+    void ptrace_mask_breakpoints(struct global_state *state, uint64_t addr, uint8_t *buf, uint64_t size);
+    void ptrace_shadow_breakpoints(struct global_state *state, uint64_t addr, uint8_t *buf, uint64_t size);
+
+    int ptrace_install_coverage(struct global_state *state, int pid, const uint64_t *addrs, uint64_t count, uint8_t *bitmap);
+    void free_coverage_points(struct global_state *state);
 """
 )
 
 with open("libdebug/cffi/ptrace_cffi_source.c") as f:
     ffibuilder.set_source(
         "libdebug.cffi._ptrace_cffi",
-        breakpoint_define + finish_define + f.read(),
+        breakpoint_define + syscall_define + displaced_define + finish_define + f.read(),
         libraries=[],
     )
 
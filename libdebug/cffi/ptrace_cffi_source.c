@@ -5,14 +5,77 @@
 //
 
 #include <errno.h>
+#include <fcntl.h>
 #include <signal.h>
 #include <stdint.h>
 #include <stdio.h>
 #include <string.h>
+#include <sys/mman.h>
 #include <sys/ptrace.h>
+#include <sys/syscall.h>
 #include <sys/types.h>
+#include <sys/uio.h>
 #include <sys/user.h>
 #include <sys/wait.h>
+#include <unistd.h>
+
+// The maximum number of iovec entries accepted by process_vm_readv/writev (IOV_MAX)
+#define MAX_IOVEC_COUNT 1024
+
+// The number of syscalls whose traced state is kept by the backend, the others are always traced
+#define SYSCALL_FILTER_SIZE 1024
+
+// The changes a syscall rule applies to the syscall at its entry
+#define SYSCALL_RULE_NUMBER (1 << 0)
+#define SYSCALL_RULE_ARG(i) (1 << (1 + (i)))
+#define SYSCALL_RULE_RETURN (1 << 7)
+
+// The initial number of slots of a hash table, must be a power of two
+#define HASH_TABLE_MIN_SIZE 16
+
+// Coverage points closer than this are patched with a single read and write of the memory between them
+#define COVERAGE_SPAN_GAP 0x1000
+#define COVERAGE_SPAN_MAX_SIZE 0x100000
+
+// The opcodes of the breakpoint conditions, compiled by libdebug.utils.condition_utils
+#define CONDITION_CONST 0
+#define CONDITION_REGISTER 1
+#define CONDITION_LOAD 2
+#define CONDITION_ADD 3
+#define CONDITION_SUB 4
+#define CONDITION_MUL 5
+#define CONDITION_AND 6
+#define CONDITION_OR 7
+#define CONDITION_XOR 8
+#define CONDITION_SHL 9
+#define CONDITION_SHR 10
+#define CONDITION_NEG 11
+#define CONDITION_INVERT 12
+#define CONDITION_NOT 13
+#define CONDITION_EQ 14
+#define CONDITION_NE 15
+#define CONDITION_LT 16
+#define CONDITION_LE 17
+#define CONDITION_GT 18
+#define CONDITION_GE 19
+#define CONDITION_JZ 20
+#define CONDITION_JNZ 21
+#define CONDITION_POP 22
+#define CONDITION_BOOL 23
+
+// The maximum depth of the evaluation stack of a breakpoint condition
+#define CONDITION_STACK_SIZE 32
+
+// How the instruction pointer is fixed after an instruction is executed out of line
+#define DISPLACED_ABSOLUTE 1
+#define DISPLACED_CALL 2
+#define DISPLACED_MAX_LENGTH 16
+
+// The pages mapped in the process to execute the instructions of software breakpoints out of line
+#define SCRATCH_AREA_MAX 8
+#define SCRATCH_AREA_SIZE 0x1000
+// The distance from the code at which a scratch page is requested, well within the range of a 32-bit displacement
+#define SCRATCH_AREA_DISTANCE 0x40000000ULL
 
 struct ptrace_hit_bp {
     int pid;
@@ -26,14 +89,53 @@ struct software_breakpoint {
     uint64_t instruction;
     uint64_t patched_instruction;
     char enabled;
+    char installed;
+    char counting;
+    uint64_t hit_count;
+    // The compiled condition that must hold for a hit to be reported, if any
+    uint64_t *condition;
+    uint64_t condition_size;
+    // The original instruction, which is executed out of line to step over the breakpoint
+    uint8_t displaced_code[DISPLACED_MAX_LENGTH];
+    uint8_t displaced_length;
+    uint8_t displaced_disp_offset;
+    uint8_t displaced_flags;
     struct software_breakpoint *next;
 };
 
+// A one-shot breakpoint that records in a bitmap that its address was reached
+struct coverage_point {
+    uint64_t addr;
+    uint64_t instruction;
+    uint8_t *bitmap;
+    uint64_t index;
+    // Set if the breakpoint is in memory, otherwise it relies on the software breakpoint at the same address
+    char installed;
+    // Other coverage points at the same address, which share the same breakpoint
+    struct coverage_point *chain;
+};
+
 struct thread {
     int tid;
     struct user_regs_struct regs;
     int signal_to_forward;
+    // The syscall stops still expected after a seccomp stop, the thread is resumed with PTRACE_SYSCALL until then
+    int syscall_stops;
+    // Set while the thread is stepped by the caller
+    _Bool stepping;
+    // Set while the thread is inside a syscall rewritten by a rule, whose remaining stops are not reported
+    _Bool rule_pending;
     struct thread *next;
+    struct thread *prev;
+};
+
+struct syscall_rule {
+    int flags;
+    uint64_t new_number;
+    uint64_t args[6];
+    uint64_t return_value;
+    // The number of syscalls rewritten by the rule, collected by the caller
+    uint64_t hits;
 };
 
 struct thread_status {
@@ -42,29 +144,226 @@ struct thread_status {
     struct thread_status *next;
 };
 
+struct hash_entry {
+    uint64_t key;
+    void *value;
+};
+
+// Open addressing hash table with linear probing, a NULL value marks an empty slot
+struct hash_table {
+    struct hash_entry *entries;
+    uint64_t size;
+    uint64_t count;
+};
+
 struct global_state {
     struct thread *t_HEAD;
     struct thread *dead_t_HEAD;
     struct software_breakpoint *b_HEAD;
     _Bool handle_syscall_enabled;
+    // Whether the syscalls are reported by a seccomp filter, instead of stopping the threads at every syscall
+    _Bool syscall_filter_enabled;
+    // The bitmap of the handled syscalls, whose seccomp stops are followed by syscall stops
+    uint8_t syscall_filter[SYSCALL_FILTER_SIZE / 8];
+    // The bitmap of the syscalls whose stops are handled while the other threads keep running
+    uint8_t syscall_observe[SYSCALL_FILTER_SIZE / 8];
+    // The thread stopped at an observed syscall, while the other threads are running
+    int observed_tid;
+    // The syscalls rewritten at their entry without being reported, indexed by syscall number
+    _Bool syscall_rules_enabled;
+    struct syscall_rule syscall_rules[SYSCALL_FILTER_SIZE];
+    // The live threads, indexed by tid
+    struct hash_table t_table;
+    // The software breakpoints, indexed by address
+    struct hash_table b_table;
+    // The software breakpoints sorted by address, b_HEAD links them in the same order
+    struct software_breakpoint **b_sorted;
+    uint64_t b_count;
+    uint64_t b_capacity;
+    // The number of breakpoints whose hits are counted without stopping the process
+    uint64_t b_counting;
+    // The number of breakpoints with a condition
+    uint64_t b_conditional;
+    // The coverage points that were not reached yet, indexed by address and sorted by address
+    struct hash_table cov_table;
+    struct coverage_point **cov_sorted;
+    uint64_t cov_count;
+    uint64_t cov_capacity;
+    uint64_t cov_installed;
+    // The scratch pages and the instruction each one currently holds
+    uint64_t scratch[SCRATCH_AREA_MAX];
+    uint8_t scratch_code[SCRATCH_AREA_MAX][DISPLACED_MAX_LENGTH];
+    uint64_t scratch_count;
 };
 
+static uint64_t hash_key(uint64_t key)
+{
+    // Mix the bits, so that aligned addresses spread over the whole table
+    key ^= key >> 33;
+    key *= 0xff51afd7ed558ccdULL;
+    key ^= key >> 33;
+    return key;
+}
+
+static void *hash_table_get(struct hash_table *table, uint64_t key)
+{
+    uint64_t i, mask = table->size - 1;
+
+    if (!table->size) return NULL;
+
+    for (i = hash_key(key) & mask; table->entries[i].value != NULL; i = (i + 1) & mask)
+        if (table->entries[i].key == key) return table->entries[i].value;
+
+    return NULL;
+}
+
+static int hash_table_resize(struct hash_table *table, uint64_t size)
+{
+    struct hash_entry *entries = calloc(size, sizeof(struct hash_entry));
+    uint64_t i, j, mask = size - 1;
+
+    if (entries == NULL) return -1;
+
+    for (i = 0; i < table->size; i++) {
+        if (table->entries[i].value == NULL) continue;
+
+        for (j = hash_key(table->entries[i].key) & mask; entries[j].value != NULL; j = (j + 1) & mask);
+
+        entries[j] = table->entries[i];
+    }
+
+    free(table->entries);
+    table->entries = entries;
+    table->size = size;
+
+    return 0;
+}
+
+static int hash_table_put(struct hash_table *table, uint64_t key, void *value)
+{
+    uint64_t i, mask;
+
+    // Keep the load factor below one half, so that probe sequences stay short
+    if ((table->count + 1) * 2 > table->size &&
+        hash_table_resize(table, table->size ? table->size * 2 : HASH_TABLE_MIN_SIZE) == -1)
+        return -1;
+
+    mask = table->size - 1;
+
+    for (i = hash_key(key) & mask; table->entries[i].value != NULL; i = (i + 1) & mask) {
+        if (table->entries[i].key == key) {
+            table->entries[i].value = value;
+            return 0;
+        }
+    }
+
+    table->entries[i].key = key;
+    table->entries[i].value = value;
+    table->count++;
+
+    return 0;
+}
+
+static void hash_table_remove(struct hash_table *table, uint64_t key)
+{
+    uint64_t i, j, home, mask = table->size - 1;
+
+    if (!table->size) return;
+
+    for (i = hash_key(key) & mask; table->entries[i].value != NULL; i = (i + 1) & mask)
+        if (table->entries[i].key == key) break;
+
+    if (table->entries[i].value == NULL) return;
+
+    table->count--;
+
+    // Shift back the following entries of the cluster instead of leaving a tombstone
+    for (j = (i + 1) & mask; table->entries[j].value != NULL; j = (j + 1) & mask) {
+        home = hash_key(table->entries[j].key) & mask;
+
+        // The entry can fill the hole only if its home slot is not between the hole and the entry
+        if (i < j ? (home <= i || home > j) : (home <= i && home > j)) {
+            table->entries[i] = table->entries[j];
+            i = j;
+        }
+    }
+
+    table->entries[i].value = NULL;
+}
+
+static void hash_table_free(struct hash_table *table)
+{
+    free(table->entries);
+    table->entries = NULL;
+    table->size = 0;
+    table->count = 0;
+}
+
+static uint64_t breakpoint_lower_bound(struct global_state *state, uint64_t addr)
+{
+    // Index of the first breakpoint whose address is not lower than addr
+    uint64_t low = 0, high = state->b_count, mid;
+
+    while (low < high) {
+        mid = low + (high - low) / 2;
+        if (state->b_sorted[mid]->addr < addr)
+            low = mid + 1;
+        else
+            high = mid;
+    }
+
+    return low;
+}
+
+static struct software_breakpoint *first_breakpoint_from(struct global_state *state, uint64_t addr)
+{
+    // The first breakpoint whose patched bytes can overlap addr
+    addr = addr >= BREAKPOINT_SIZE - 1 ? addr - (BREAKPOINT_SIZE - 1) : 0;
+
+    uint64_t index = breakpoint_lower_bound(state, addr);
+
+    return index < state->b_count ? state->b_sorted[index] : NULL;
+}
+
+static uint64_t coverage_lower_bound(struct global_state *state, uint64_t addr)
+{
+    // Index of the first coverage point whose address is not lower than addr
+    uint64_t low = 0, high = state->cov_count, mid;
+
+    while (low < high) {
+        mid = low + (high - low) / 2;
+        if (state->cov_sorted[mid]->addr < addr)
+            low = mid + 1;
+        else
+            high = mid;
+    }
+
+    return low;
+}
+
 struct user_regs_struct *register_thread(struct global_state *state, int tid)
 {
     // Verify if the thread is already registered
-    struct thread *t = state->t_HEAD;
-    while (t != NULL) {
-        if (t->tid == tid) return &t->regs;
-        t = t->next;
-    }
+    struct thread *t = hash_table_get(&state->t_table, tid);
+    if (t != NULL) return &t->regs;
 
     t = malloc(sizeof(struct thread));
     t->tid = tid;
     t->signal_to_forward = 0;
+    t->syscall_stops = 0;
+    t->stepping = 0;
+    t->rule_pending = 0;
+
+    if (hash_table_put(&state->t_table, tid, t) == -1) {
+        free(t);
+        return NULL;
+    }
 
     ptrace(PTRACE_GETREGS, tid, NULL, &t->regs);
 
     t->next = state->t_HEAD;
+    t->prev = NULL;
+    if (state->t_HEAD != NULL) state->t_HEAD->prev = t;
     state->t_HEAD = t;
 
     return &t->regs;
@@ -72,24 +371,24 @@ struct user_regs_struct *register_thread(struct global_state *state, int tid)
 
 void unregister_thread(struct global_state *state, int tid)
 {
-    struct thread *t = state->t_HEAD;
-    struct thread *prev = NULL;
+    struct thread *t = hash_table_get(&state->t_table, tid);
 
-    while (t != NULL) {
-        if (t->tid == tid) {
-            if (prev == NULL) {
-                state->t_HEAD = t->next;
-            } else {
-                prev->next = t->next;
-            }
-            // Add the thread to the dead list
-            t->next = state->dead_t_HEAD;
-            state->dead_t_HEAD = t;
-            return;
-        }
-        prev = t;
-        t = t->next;
+    if (t == NULL) return;
+
+    hash_table_remove(&state->t_table, tid);
+
+    if (t->prev == NULL) {
+        state->t_HEAD = t->next;
+    } else {
+        t->prev->next = t->next;
     }
+
+    if (t->next != NULL) t->next->prev = t->prev;
+
+    // Add the thread to the dead list
+    t->next = state->dead_t_HEAD;
+    t->prev = NULL;
+    state->dead_t_HEAD = t;
 }
 
 void free_thread_list(struct global_state *state)
@@ -114,6 +413,169 @@ void free_thread_list(struct global_state *state)
     }
 
     state->dead_t_HEAD = NULL;
+
+    hash_table_free(&state->t_table);
+}
+
+static int write_original_instruction(int pid, uint64_t addr, uint64_t original)
+{
+    uint64_t instruction;
+
+    errno = 0;
+    instruction = ptrace(PTRACE_PEEKDATA, pid, (void *)addr, NULL);
+    if (errno) return -1;
+
+    // Only the patched bytes are restored, the rest of the word might hold other breakpoints
+    memcpy(&instruction, &original, BREAKPOINT_SIZE);
+
+    return ptrace(PTRACE_POKEDATA, pid, (void *)addr, instruction) == -1 ? -1 : 0;
+}
+
+static int install_breakpoint(int pid, struct software_breakpoint *b)
+{
+    uint64_t instruction;
+
+    errno = 0;
+    instruction = ptrace(PTRACE_PEEKDATA, pid, (void *)b->addr, NULL);
+    if (errno) return -1;
+
+    b->instruction = instruction;
+    b->patched_instruction = INSTALL_BREAKPOINT(instruction);
+
+    if (ptrace(PTRACE_POKEDATA, pid, (void *)b->addr, b->patched_instruction) == -1) return -1;
+
+    b->installed = 1;
+    return 0;
+}
+
+static int remove_breakpoint(int pid, struct software_breakpoint *b)
+{
+    if (write_original_instruction(pid, b->addr, b->instruction) == -1) return -1;
+
+    b->installed = 0;
+    return 0;
+}
+
+static struct software_breakpoint *find_installed_breakpoint(struct global_state *state, uint64_t addr)
+{
+    struct software_breakpoint *b = hash_table_get(&state->b_table, addr);
+
+    return b != NULL && b->installed ? b : NULL;
+}
+
+static void install_enabled_breakpoints(struct global_state *state, int pid)
+{
+    struct software_breakpoint *b = state->b_HEAD;
+
+    while (b != NULL) {
+        if (b->enabled && !b->installed && install_breakpoint(pid, b) == -1)
+            fprintf(stderr, "failed to install breakpoint at %lx: %s\\n", b->addr, strerror(errno));
+        b = b->next;
+    }
+}
+
+static void remove_installed_breakpoints(struct global_state *state, int pid)
+{
+    struct software_breakpoint *b = state->b_HEAD;
+
+    while (b != NULL) {
+        if (b->installed && remove_breakpoint(pid, b) == -1)
+            fprintf(stderr, "failed to remove breakpoint at %lx: %s\\n", b->addr, strerror(errno));
+        b = b->next;
+    }
+}
+
+static int install_coverage_point(struct global_state *state, int pid, struct coverage_point *c)
+{
+    uint64_t instruction;
+
+    errno = 0;
+    instruction = ptrace(PTRACE_PEEKDATA, pid, (void *)c->addr, NULL);
+    if (errno) return -1;
+
+    c->instruction = instruction;
+
+    if (ptrace(PTRACE_POKEDATA, pid, (void *)c->addr, INSTALL_BREAKPOINT(instruction)) == -1) return -1;
+
+    c->installed = 1;
+    state->cov_installed++;
+    return 0;
+}
+
+static int remove_coverage_point(struct global_state *state, int pid, struct coverage_point *c)
+{
+    if (write_original_instruction(pid, c->addr, c->instruction) == -1) return -1;
+
+    c->installed = 0;
+    state->cov_installed--;
+    return 0;
+}
+
+static void sync_coverage_point(struct global_state *state, int pid, uint64_t addr)
+{
+    struct coverage_point *c = hash_table_get(&state->cov_table, addr);
+    struct software_breakpoint *b = hash_table_get(&state->b_table, addr);
+
+    if (c == NULL) return;
+
+    // A single breakpoint must be in memory, the one of the software breakpoint has precedence
+    if (b != NULL && b->installed) {
+        if (c->installed) remove_coverage_point(state, pid, c);
+    } else if (!c->installed) {
+        install_coverage_point(state, pid, c);
+    }
+}
+
+static void lift_coverage_point(struct global_state *state, int pid, uint64_t addr)
+{
+    // A software breakpoint is about to be installed at the same address
+    struct coverage_point *c = hash_table_get(&state->cov_table, addr);
+
+    if (c != NULL && c->installed) remove_coverage_point(state, pid, c);
+}
+
+static int consume_coverage_point(struct global_state *state, int pid, uint64_t addr)
+{
+    struct coverage_point *c = hash_table_get(&state->cov_table, addr), *next;
+    uint64_t index;
+    int installed;
+
+    if (c == NULL) return 0;
+
+    // The address is reached, the breakpoint is not needed anymore
+    installed = c->installed;
+    if (installed) remove_coverage_point(state, pid, c);
+
+    hash_table_remove(&state->cov_table, addr);
+
+    index = coverage_lower_bound(state, addr);
+    memmove(&state->cov_sorted[index], &state->cov_sorted[index + 1],
+            (state->cov_count - index - 1) * sizeof(*state->cov_sorted));
+    state->cov_count--;
+
+    while (c != NULL) {
+        c->bitmap[c->index / 8] |= 1 << (c->index % 8);
+        next = c->chain;
+        free(c);
+        c = next;
+    }
+
+    return installed;
+}
+
+static void install_enabled_coverage_points(struct global_state *state, int pid)
+{
+    for (uint64_t i = 0; i < state->cov_count; i++)
+        sync_coverage_point(state, pid, state->cov_sorted[i]->addr);
+}
+
+static void remove_installed_coverage_points(struct global_state *state, int pid)
+{
+    for (uint64_t i = 0; i < state->cov_count; i++) {
+        struct coverage_point *c = state->cov_sorted[i];
+        if (c->installed && remove_coverage_point(state, pid, c) == -1)
+            fprintf(stderr, "failed to remove coverage point at %lx: %s\\n", c->addr, strerror(errno));
+    }
 }
 
 int ptrace_trace_me(void)
@@ -174,6 +636,17 @@ void ptrace_detach_for_migration(struct global_state *state, int pid)
             ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs);
         }
 
+        t = t->next;
+    }
+
+    // The breakpoints must not be left in the memory of the process
+    if (state->t_HEAD != NULL) {
+        remove_installed_breakpoints(state, state->t_HEAD->tid);
+        remove_installed_coverage_points(state, state->t_HEAD->tid);
+    }
+
+    t = state->t_HEAD;
+    while (t != NULL) {
         // Be sure that the thread will not run during gdb reattachment
         tgkill(pid, t->tid, SIGSTOP);
 
@@ -201,6 +674,12 @@ void ptrace_reattach_from_gdb(struct global_state *state, int pid)
 
         t = t->next;
     }
+
+    // The breakpoints were removed before the migration
+    if (state->t_HEAD != NULL) {
+        install_enabled_breakpoints(state, state->t_HEAD->tid);
+        install_enabled_coverage_points(state, state->t_HEAD->tid);
+    }
 }
 
 void ptrace_detach_and_cont(struct global_state *state, int pid)
@@ -211,11 +690,14 @@ void ptrace_detach_and_cont(struct global_state *state, int pid)
     kill(pid, SIGCONT);
 }
 
-void ptrace_set_options(int pid)
+void ptrace_set_options(int pid, _Bool trace_seccomp)
 {
     int options = PTRACE_O_TRACEFORK | PTRACE_O_TRACEVFORK | PTRACE_O_TRACESYSGOOD |
                   PTRACE_O_TRACECLONE | PTRACE_O_TRACEEXEC | PTRACE_O_TRACEEXIT;
 
+    // The stops of the seccomp filter installed by the debugger, which would otherwise fail the syscalls
+    if (trace_seccomp) options |= PTRACE_O_TRACESECCOMP;
+
     ptrace(PTRACE_SETOPTIONS, pid, NULL, options);
 }
 
@@ -256,132 +738,716 @@ uint64_t ptrace_geteventmsg(int pid)
     return data;
 }
 
-long singlestep(struct global_state *state, int tid)
+int ptrace_get_fault_address(int tid, uint64_t *address)
 {
-    // flush any register changes
-    struct thread *t = state->t_HEAD;
-    int signal_to_forward = 0;
-    while (t != NULL) {
-        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs))
-            perror("ptrace_setregs");
-        if (t->tid == tid) {
-            signal_to_forward = t->signal_to_forward;
-            t->signal_to_forward = 0;
-        }
-        t = t->next;
-    }
+    siginfo_t info;
 
-    return ptrace(PTRACE_SINGLESTEP, tid, NULL, signal_to_forward);
+    if (ptrace(PTRACE_GETSIGINFO, tid, NULL, &info) == -1) return -1;
+
+    *address = (uint64_t)info.si_addr;
+
+    return info.si_code;
 }
 
-int step_until(struct global_state *state, int tid, uint64_t addr, int max_steps)
+static int peek_memory_range(int pid, uint64_t addr, uint8_t *buf, uint64_t size)
 {
-    // flush any register changes
-    struct thread *t = state->t_HEAD, *stepping_thread = NULL;
-    while (t != NULL) {
-        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs))
-            perror("ptrace_setregs");
+    uint64_t cursor = addr, end = addr + size;
+    uint64_t word_addr, offset, chunk, word;
+
+    while (cursor < end) {
+        // Aligned accesses never cross a page boundary
+        word_addr = cursor & ~(uint64_t)(sizeof(uint64_t) - 1);
+        offset = cursor - word_addr;
+        chunk = sizeof(uint64_t) - offset;
+        if (chunk > end - cursor) chunk = end - cursor;
+
+        errno = 0;
+        word = ptrace(PTRACE_PEEKDATA, pid, (void *)word_addr, NULL);
+        if (errno) return -1;
+
+        memcpy(buf + (cursor - addr), ((uint8_t *)&word) + offset, chunk);
+        cursor += chunk;
+    }
 
-        if (t->tid == tid)
-            stepping_thread = t;
+    return 0;
+}
 
-        t = t->next;
-    }
+static int poke_memory_range(int pid, uint64_t addr, const uint8_t *buf, uint64_t size)
+{
+    uint64_t cursor = addr, end = addr + size;
+    uint64_t word_addr, offset, chunk, word;
+
+    while (cursor < end) {
+        word_addr = cursor & ~(uint64_t)(sizeof(uint64_t) - 1);
+        offset = cursor - word_addr;
+        chunk = sizeof(uint64_t) - offset;
+        if (chunk > end - cursor) chunk = end - cursor;
+
+        if (chunk != sizeof(uint64_t)) {
+            // Partial word, we must preserve the surrounding bytes
+            errno = 0;
+            word = ptrace(PTRACE_PEEKDATA, pid, (void *)word_addr, NULL);
+            if (errno) return -1;
+        }
 
-    int count = 0, status = 0;
-    uint64_t previous_ip;
+        memcpy(((uint8_t *)&word) + offset, buf + (cursor - addr), chunk);
 
-    if (!stepping_thread) {
-        perror("Thread not found");
-        return -1;
-    }
+        if (ptrace(PTRACE_POKEDATA, pid, (void *)word_addr, word)) return -1;
 
-    while (max_steps == -1 || count < max_steps) {
-        if (ptrace(PTRACE_SINGLESTEP, tid, NULL, NULL)) return -1;
+        cursor += chunk;
+    }
 
-        // wait for the child
-        waitpid(tid, &status, 0);
+    return 0;
+}
 
-        previous_ip = INSTRUCTION_POINTER(stepping_thread->regs);
+static uint64_t split_remote_range(struct iovec *remote, int *count, uint64_t addr, uint64_t size, uint64_t page_size)
+{
+    // Split the remote range on page boundaries, so that a partial transfer
+    // always stops exactly at the first page that could not be accessed
+    uint64_t cursor = addr, end = addr + size, chunk;
 
-        // update the registers
-        ptrace(PTRACE_GETREGS, tid, NULL, &stepping_thread->regs);
+    *count = 0;
 
-        if (INSTRUCTION_POINTER(stepping_thread->regs) == addr) break;
+    while (cursor < end && *count < MAX_IOVEC_COUNT) {
+        chunk = page_size - (cursor & (page_size - 1));
+        if (chunk > end - cursor) chunk = end - cursor;
 
-        // if the instruction pointer didn't change, we have to step again
-        // because we hit a hardware breakpoint
-        if (INSTRUCTION_POINTER(stepping_thread->regs) == previous_ip) continue;
+        remote[*count].iov_base = (void *)cursor;
+        remote[*count].iov_len = chunk;
+        (*count)++;
 
-        count++;
+        cursor += chunk;
     }
 
-    return 0;
+    return cursor - addr;
 }
 
-int prepare_for_run(struct global_state *state, int pid)
+int ptrace_read_memory(int pid, uint64_t addr, uint8_t *buf, uint64_t size)
 {
-    int status = 0;
+    struct iovec local, remote[MAX_IOVEC_COUNT];
+    uint64_t page_size = sysconf(_SC_PAGESIZE);
+    uint64_t done = 0, chunk;
+    ssize_t result;
+    int count;
 
-    // flush any register changes
-    struct thread *t = state->t_HEAD;
-    while (t != NULL) {
-        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs))
-            fprintf(stderr, "ptrace_setregs failed for thread %d: %s\\n",
-                    t->tid, strerror(errno));
-        t = t->next;
-    }
+    while (done < size) {
+        chunk = split_remote_range(remote, &count, addr + done, size - done, page_size);
 
-    // iterate over all the threads and check if any of them has hit a software
-    // breakpoint
-    t = state->t_HEAD;
-    struct software_breakpoint *b;
-    int t_hit;
+        local.iov_base = buf + done;
+        local.iov_len = chunk;
 
-    while (t != NULL) {
-        t_hit = 0;
-        uint64_t ip = INSTRUCTION_POINTER(t->regs);
+        result = process_vm_readv(pid, &local, 1, remote, count, 0);
 
-        b = state->b_HEAD;
-        while (b != NULL && !t_hit) {
-            if (b->addr == ip)
-                // we hit a software breakpoint on this thread
-                t_hit = 1;
+        if (result > 0) done += result;
 
-            b = b->next;
-        }
+        if (result == (ssize_t)chunk) continue;
 
-        if (t_hit) {
-            // step over the breakpoint
-            if (ptrace(PTRACE_SINGLESTEP, t->tid, NULL, NULL)) return -1;
+        // The next page cannot be read through process_vm_readv (e.g. it is not
+        // readable, or the syscall is not available), fall back to PEEKDATA
+        chunk = page_size - ((addr + done) & (page_size - 1));
+        if (chunk > size - done) chunk = size - done;
 
-            // wait for the child
-            waitpid(t->tid, &status, 0);
+        if (peek_memory_range(pid, addr + done, buf + done, chunk)) return -1;
 
-            // status == 4991 ==> (WIFSTOPPED(status) && WSTOPSIG(status) ==
-            // SIGSTOP) this should happen only if threads are involved
-            if (status == 4991) {
-                ptrace(PTRACE_SINGLESTEP, t->tid, NULL, NULL);
-                waitpid(t->tid, &status, 0);
-            }
-        }
+        done += chunk;
+    }
 
-        t = t->next;
+    return 0;
+}
+
+int ptrace_write_memory(int pid, uint64_t addr, const uint8_t *buf, uint64_t size)
+{
+    struct iovec local, remote[MAX_IOVEC_COUNT];
+    uint64_t page_size = sysconf(_SC_PAGESIZE);
+    uint64_t done = 0, chunk;
+    ssize_t result;
+    int count;
+
+    while (done < size) {
+        chunk = split_remote_range(remote, &count, addr + done, size - done, page_size);
+
+        local.iov_base = (void *)(buf + done);
+        local.iov_len = chunk;
+
+        result = process_vm_writev(pid, &local, 1, remote, count, 0);
+
+        if (result > 0) done += result;
+
+        if (result == (ssize_t)chunk) continue;
+
+        // The next page cannot be written through process_vm_writev (e.g. it is
+        // read-only code), fall back to POKEDATA
+        chunk = page_size - ((addr + done) & (page_size - 1));
+        if (chunk > size - done) chunk = size - done;
+
+        if (poke_memory_range(pid, addr + done, buf + done, chunk)) return -1;
+
+        done += chunk;
     }
 
-    // Reset any software breakpoint
-    b = state->b_HEAD;
-    while (b != NULL) {
-        if (b->enabled) {
-            ptrace(PTRACE_POKEDATA, pid, (void *)b->addr,
-                   b->patched_instruction);
+    return 0;
+}
+
+int ptrace_read_memory_vector(int pid, const uint64_t *addrs, const uint64_t *sizes, int count, uint8_t *buf)
+{
+    struct iovec local[MAX_IOVEC_COUNT], remote[MAX_IOVEC_COUNT];
+    uint64_t offset = 0, batch_size, done;
+    ssize_t result;
+    int i = 0, j, n;
+
+    while (i < count) {
+        // Pack as many regions as possible in a single process_vm_readv call
+        batch_size = 0;
+        for (j = i, n = 0; j < count && n < MAX_IOVEC_COUNT; j++, n++) {
+            local[n].iov_base = buf + offset + batch_size;
+            local[n].iov_len = sizes[j];
+            remote[n].iov_base = (void *)addrs[j];
+            remote[n].iov_len = sizes[j];
+            batch_size += sizes[j];
         }
-        b = b->next;
+
+        result = process_vm_readv(pid, local, n, remote, n, 0);
+        if (result < 0) result = 0;
+
+        // Skip all the regions that were transferred completely
+        done = 0;
+        while (i < j && done + sizes[i] <= (uint64_t)result) {
+            done += sizes[i];
+            offset += sizes[i];
+            i++;
+        }
+
+        if (i == j) continue;
+
+        // The transfer stopped inside this region, read it with the fallback path
+        if (ptrace_read_memory(pid, addrs[i], buf + offset, sizes[i])) return -1;
+
+        offset += sizes[i];
+        i++;
+    }
+
+    return 0;
+}
+
+int ptrace_write_memory_vector(int pid, const uint64_t *addrs, const uint64_t *sizes, int count, const uint8_t *buf)
+{
+    struct iovec local[MAX_IOVEC_COUNT], remote[MAX_IOVEC_COUNT];
+    uint64_t offset = 0, batch_size, done;
+    ssize_t result;
+    int i = 0, j, n;
+
+    while (i < count) {
+        // Pack as many regions as possible in a single process_vm_writev call
+        batch_size = 0;
+        for (j = i, n = 0; j < count && n < MAX_IOVEC_COUNT; j++, n++) {
+            local[n].iov_base = (void *)(buf + offset + batch_size);
+            local[n].iov_len = sizes[j];
+            remote[n].iov_base = (void *)addrs[j];
+            remote[n].iov_len = sizes[j];
+            batch_size += sizes[j];
+        }
+
+        result = process_vm_writev(pid, local, n, remote, n, 0);
+        if (result < 0) result = 0;
+
+        // Skip all the regions that were transferred completely
+        done = 0;
+        while (i < j && done + sizes[i] <= (uint64_t)result) {
+            done += sizes[i];
+            offset += sizes[i];
+            i++;
+        }
+
+        if (i == j) continue;
+
+        // The transfer stopped inside this region, write it with the fallback path
+        if (ptrace_write_memory(pid, addrs[i], buf + offset, sizes[i])) return -1;
+
+        offset += sizes[i];
+        i++;
+    }
+
+    return 0;
+}
+
+int ptrace_follow_pointers(int pid, uint64_t addr, uint64_t next_offset, uint64_t payload_size, int max_nodes, uint64_t *nodes, uint8_t *payloads)
+{
+    struct iovec local[2], remote[2];
+    uint64_t node = addr, next;
+    ssize_t result;
+    int count = 0;
+
+    while (node && count < max_nodes) {
+        // Read the payload and the pointer to the next node with a single call
+        local[0].iov_base = payloads + count * payload_size;
+        local[0].iov_len = payload_size;
+        local[1].iov_base = &next;
+        local[1].iov_len = sizeof(next);
+        remote[0].iov_base = (void *)node;
+        remote[0].iov_len = payload_size;
+        remote[1].iov_base = (void *)(node + next_offset);
+        remote[1].iov_len = sizeof(next);
+
+        result = process_vm_readv(pid, local, 2, remote, 2, 0);
+
+        if (result != (ssize_t)(payload_size + sizeof(next)) &&
+            (ptrace_read_memory(pid, node, payloads + count * payload_size, payload_size) ||
+             ptrace_read_memory(pid, node + next_offset, (uint8_t *)&next, sizeof(next)))) {
+            // The walk stops at the first node that cannot be read
+            return count ? count : -1;
+        }
+
+        nodes[count++] = node;
+
+        // Circular lists point back to their first node
+        if (next == addr) break;
+
+        node = next;
+    }
+
+    return count;
+}
+
+int ptrace_inject_syscall(struct global_state *state, int tid, uint64_t number, const uint64_t *args, uint64_t *result)
+{
+    struct user_regs_struct saved_regs, regs;
+    struct thread *t = hash_table_get(&state->t_table, tid);
+    uint64_t ip, saved_instruction;
+    int status, pending_signal = 0, ret = 0;
+
+    // The cached registers might hold changes not written to the thread yet, such as a rewound instruction pointer
+    if (t != NULL && ptrace(PTRACE_SETREGS, tid, NULL, &t->regs) == -1) return -1;
+
+    if (ptrace(PTRACE_GETREGS, tid, NULL, &saved_regs) == -1) return -1;
+
+    // The syscall instruction temporarily replaces the one at the instruction pointer
+    ip = INSTRUCTION_POINTER(saved_regs);
+
+    errno = 0;
+    saved_instruction = ptrace(PTRACE_PEEKDATA, tid, (void *)ip, NULL);
+    if (errno) return -1;
+
+    if (ptrace(PTRACE_POKEDATA, tid, (void *)ip, INSTALL_SYSCALL(saved_instruction)) == -1) return -1;
+
+    regs = saved_regs;
+    PREPARE_SYSCALL(regs, number, args);
+
+    if (ptrace(PTRACE_SETREGS, tid, NULL, &regs) == -1) {
+        ptrace(PTRACE_POKEDATA, tid, (void *)ip, saved_instruction);
+        return -1;
+    }
+
+    while (1) {
+        if (ptrace(PTRACE_SINGLESTEP, tid, NULL, NULL) == -1 || waitpid(tid, &status, __WALL) == -1) {
+            ret = -1;
+            break;
+        }
+
+        if (!WIFSTOPPED(status)) {
+            // The thread died while executing the syscall
+            errno = ESRCH;
+            return -1;
+        }
+
+        // Event stops (e.g., fork) are followed by the end of the step
+        if (status >> 16) continue;
+
+        if (WSTOPSIG(status) == SIGTRAP) break;
+
+        // Signals delivered during the step are raised again after the registers are restored
+        pending_signal = WSTOPSIG(status);
+    }
+
+    if (!ret && ptrace(PTRACE_GETREGS, tid, NULL, &regs) != -1)
+        *result = SYSCALL_RETURN(regs);
+    else
+        ret = -1;
+
+    ptrace(PTRACE_POKEDATA, tid, (void *)ip, saved_instruction);
+    ptrace(PTRACE_SETREGS, tid, NULL, &saved_regs);
+
+    if (pending_signal) syscall(SYS_tkill, tid, pending_signal);
+
+    return ret;
+}
+
+int ptrace_detach_forked_child(struct global_state *state, int tid, int child, const uint64_t *pages, const uint64_t *protections, int count)
+{
+    struct software_breakpoint *b;
+    struct user_regs_struct regs;
+    uint64_t page_size = sysconf(_SC_PAGESIZE);
+    uint64_t ip, instruction, result, args[6] = {0};
+    int status;
+
+    // The child is traced automatically and starts with a SIGSTOP
+    if (waitpid(child, &status, __WALL) == -1) return -1;
+
+    // Move the child to its own process group, so that its events are not mixed with the ones of the parent
+    if (ptrace_inject_syscall(state, child, SYS_setpgid, args, &result) == -1) return -1;
+
+    // The child also inherited the pages protected for the page watchpoints, which nobody would handle
+    for (int i = 0; i < count; i++) {
+        args[0] = pages[i];
+        args[1] = page_size;
+        args[2] = protections[i];
+        if (ptrace_inject_syscall(state, child, SYS_mprotect, args, &result) == -1) return -1;
+    }
+
+    // The child inherited the injected syscall instruction and the registers after its execution,
+    // we replace them with the original instruction and registers of the parent
+    if (ptrace(PTRACE_GETREGS, tid, NULL, &regs) == -1) return -1;
+
+    ip = INSTRUCTION_POINTER(regs);
+
+    errno = 0;
+    instruction = ptrace(PTRACE_PEEKDATA, tid, (void *)ip, NULL);
+    if (errno) return -1;
+
+    if (ptrace(PTRACE_POKEDATA, child, (void *)ip, instruction) == -1) return -1;
+    if (ptrace(PTRACE_SETREGS, child, NULL, &regs) == -1) return -1;
+
+    // The child also inherited the breakpoints installed in the parent, which nobody would handle
+    for (b = state->b_HEAD; b != NULL; b = b->next)
+        if (b->installed && write_original_instruction(child, b->addr, b->instruction) == -1) return -1;
+
+    for (uint64_t i = 0; i < state->cov_count; i++) {
+        struct coverage_point *c = state->cov_sorted[i];
+        if (c->installed && write_original_instruction(child, c->addr, c->instruction) == -1) return -1;
+    }
+
+    // The child stays stopped, so that another debugger can attach to it
+    return ptrace(PTRACE_DETACH, child, NULL, SIGSTOP);
+}
+
+static int allocate_scratch_area(struct global_state *state, int tid, uint64_t near)
+{
+    uint64_t args[6], address;
+
+    if (state->scratch_count == SCRATCH_AREA_MAX) return -1;
+
+    // The page should be close to the code, so that RIP-relative operands can reach their targets
+    args[0] = (near > SCRATCH_AREA_DISTANCE ? near - SCRATCH_AREA_DISTANCE : near + SCRATCH_AREA_DISTANCE) & ~(uint64_t)(SCRATCH_AREA_SIZE - 1);
+    args[1] = SCRATCH_AREA_SIZE;
+    args[2] = PROT_READ | PROT_EXEC;
+    args[3] = MAP_PRIVATE | MAP_ANONYMOUS;
+    args[4] = -1;
+    args[5] = 0;
+
+    if (ptrace_inject_syscall(state, tid, SYS_mmap, args, &address) == -1 || address >= (uint64_t)-SCRATCH_AREA_SIZE)
+        return -1;
+
+    // A new page is filled with zeros
+    memset(state->scratch_code[state->scratch_count], 0, DISPLACED_MAX_LENGTH);
+    state->scratch[state->scratch_count] = address;
+
+    return state->scratch_count++;
+}
+
+static void drop_scratch_area(struct global_state *state, int index)
+{
+    state->scratch_count--;
+    state->scratch[index] = state->scratch[state->scratch_count];
+    memcpy(state->scratch_code[index], state->scratch_code[state->scratch_count], DISPLACED_MAX_LENGTH);
+}
+
+static int relocate_instruction(struct software_breakpoint *b, uint64_t scratch, uint8_t *code)
+{
+    int32_t displacement;
+    int64_t relocated;
+
+    memcpy(code, b->displaced_code, DISPLACED_MAX_LENGTH);
+
+    if (!b->displaced_disp_offset) return 0;
+
+    // The RIP-relative operand must reach the same address from the scratch page
+    memcpy(&displacement, code + b->displaced_disp_offset, sizeof(displacement));
+    relocated = (int64_t)displacement + (int64_t)(b->addr - scratch);
+
+    if (relocated < INT32_MIN || relocated > INT32_MAX) return -1;
+
+    displacement = (int32_t)relocated;
+    memcpy(code + b->displaced_disp_offset, &displacement, sizeof(displacement));
+
+    return 0;
+}
+
+static int select_scratch_area(struct global_state *state, int tid, struct software_breakpoint *b, uint8_t *code, int allocate)
+{
+    int index;
+
+    for (index = 0; index < (int)state->scratch_count; index++)
+        if (!relocate_instruction(b, state->scratch[index], code)) return index;
+
+    // Mapping a page requires all the threads to be stopped
+    if (!allocate) return -1;
+
+    index = allocate_scratch_area(state, tid, b->addr);
+
+    if (index == -1 || relocate_instruction(b, state->scratch[index], code)) {
+        // Do not try again for this breakpoint
+        b->displaced_length = 0;
+        return -1;
+    }
+
+    return index;
+}
+
+static int displaced_step(struct global_state *state, struct thread *t, struct software_breakpoint *b, int *status, int allocate)
+{
+    uint8_t code[DISPLACED_MAX_LENGTH];
+    uint64_t scratch, word, ip;
+    siginfo_t info;
+    int index;
+
+    if (!b->displaced_length) return 1;
+
+    index = select_scratch_area(state, t->tid, b, code, allocate);
+    if (index == -1) return 1;
+
+    scratch = state->scratch[index];
+
+    // Consecutive hits of the same breakpoint find the instruction already in place
+    if (memcmp(code, state->scratch_code[index], DISPLACED_MAX_LENGTH)) {
+        for (int i = 0; i < DISPLACED_MAX_LENGTH; i += sizeof(uint64_t)) {
+            memcpy(&word, code + i, sizeof(uint64_t));
+            if (ptrace(PTRACE_POKEDATA, t->tid, (void *)(scratch + i), word) == -1) {
+                drop_scratch_area(state, index);
+                return 1;
+            }
+        }
+
+        memcpy(state->scratch_code[index], code, DISPLACED_MAX_LENGTH);
+    }
+
+    INSTRUCTION_POINTER(t->regs) = scratch;
+
+    do {
+        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs) == -1 || ptrace(PTRACE_SINGLESTEP, t->tid, NULL, NULL) == -1 ||
+            waitpid(t->tid, status, __WALL) == -1 || ptrace(PTRACE_GETREGS, t->tid, NULL, &t->regs) == -1) {
+            INSTRUCTION_POINTER(t->regs) = b->addr;
+            ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs);
+            return -1;
+        }
+
+        // A pending SIGSTOP can interrupt the step before the instruction is executed
+    } while (WIFSTOPPED(*status) && WSTOPSIG(*status) == SIGSTOP && INSTRUCTION_POINTER(t->regs) == scratch);
+
+    ip = INSTRUCTION_POINTER(t->regs);
+
+    if (ip == scratch) {
+        // The instruction did not complete, e.g. because of a signal or of a string instruction
+        INSTRUCTION_POINTER(t->regs) = b->addr;
+
+        // A fault on the fetch of the instruction means the page is gone, e.g. after a checkpoint was restored
+        if (WIFSTOPPED(*status) && WSTOPSIG(*status) == SIGSEGV &&
+            ptrace(PTRACE_GETSIGINFO, t->tid, NULL, &info) != -1 && (uint64_t)info.si_addr == scratch) {
+            drop_scratch_area(state, index);
+            ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs);
+            return 1;
+        }
+    } else {
+        if (!(b->displaced_flags & DISPLACED_ABSOLUTE))
+            INSTRUCTION_POINTER(t->regs) = ip - scratch + b->addr;
+
+        // The return address pushed by a call points to the scratch page
+        if (b->displaced_flags & DISPLACED_CALL)
+            ptrace(PTRACE_POKEDATA, t->tid, (void *)STACK_POINTER(t->regs), b->addr + b->displaced_length);
+    }
+
+    return ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs) == -1 ? -1 : 0;
+}
+
+static int step_over_breakpoint(struct global_state *state, struct thread *t, struct software_breakpoint *b, int *status, int allocate)
+{
+    // The breakpoint stays installed if its instruction can be executed out of line
+    int ret = displaced_step(state, t, b, status, allocate);
+
+    if (ret != 1) return ret;
+
+    if (remove_breakpoint(t->tid, b) == -1) return -1;
+
+    do {
+        if (ptrace(PTRACE_SINGLESTEP, t->tid, NULL, NULL) == -1 || waitpid(t->tid, status, __WALL) == -1 ||
+            ptrace(PTRACE_GETREGS, t->tid, NULL, &t->regs) == -1) {
+            install_breakpoint(t->tid, b);
+            return -1;
+        }
+
+        // A pending SIGSTOP can interrupt the step before the instruction is executed
+    } while (WIFSTOPPED(*status) && WSTOPSIG(*status) == SIGSTOP && INSTRUCTION_POINTER(t->regs) == b->addr);
+
+    return install_breakpoint(t->tid, b);
+}
+
+static int singlestep_thread(struct global_state *state, struct thread *t, int *status)
+{
+    // The original instruction must be executed in place of an installed breakpoint
+    struct software_breakpoint *b = find_installed_breakpoint(state, INSTRUCTION_POINTER(t->regs));
+
+    consume_coverage_point(state, t->tid, INSTRUCTION_POINTER(t->regs));
+
+    if (b != NULL) return step_over_breakpoint(state, t, b, status, 1) == -1 ? -1 : 0;
+
+    if (ptrace(PTRACE_SINGLESTEP, t->tid, NULL, NULL)) return -1;
+
+    // wait for the child
+    waitpid(t->tid, status, 0);
+
+    return 0;
+}
+
+long singlestep(struct global_state *state, int tid)
+{
+    // flush any register changes
+    struct thread *t = state->t_HEAD;
+    struct software_breakpoint *b;
+    int signal_to_forward = 0;
+    while (t != NULL) {
+        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs))
+            perror("ptrace_setregs");
+        if (t->tid == tid) {
+            signal_to_forward = t->signal_to_forward;
+            t->signal_to_forward = 0;
+
+            // a syscall executed by the step is not followed by syscall stops
+            t->stepping = 1;
+            t->syscall_stops = 0;
+
+            // the original instruction must be executed, the breakpoint is
+            // installed again before the process is resumed
+            b = find_installed_breakpoint(state, INSTRUCTION_POINTER(t->regs));
+            if (b != NULL && remove_breakpoint(tid, b) == -1) return -1;
+
+            consume_coverage_point(state, tid, INSTRUCTION_POINTER(t->regs));
+        }
+        t = t->next;
+    }
+
+    return ptrace(PTRACE_SINGLESTEP, tid, NULL, signal_to_forward);
+}
+
+int step_until(struct global_state *state, int tid, uint64_t addr, int max_steps)
+{
+    // flush any register changes
+    struct thread *t = state->t_HEAD, *stepping_thread = NULL;
+    while (t != NULL) {
+        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs))
+            perror("ptrace_setregs");
+
+        if (t->tid == tid)
+            stepping_thread = t;
+
+        t = t->next;
+    }
+
+    int count = 0, status = 0;
+    uint64_t previous_ip;
+
+    if (!stepping_thread) {
+        perror("Thread not found");
+        return -1;
     }
 
+    while (max_steps == -1 || count < max_steps) {
+        // A displaced step updates the registers, the instruction pointer is taken before it
+        previous_ip = INSTRUCTION_POINTER(stepping_thread->regs);
+
+        if (singlestep_thread(state, stepping_thread, &status)) return -1;
+
+        // update the registers
+        ptrace(PTRACE_GETREGS, tid, NULL, &stepping_thread->regs);
+
+        if (INSTRUCTION_POINTER(stepping_thread->regs) == addr) break;
+
+        // if the instruction pointer didn't change, we have to step again
+        // because we hit a hardware breakpoint
+        if (INSTRUCTION_POINTER(stepping_thread->regs) == previous_ip) continue;
+
+        count++;
+    }
+
+    return 0;
+}
+
+int ptrace_step_thread(struct global_state *state, int tid)
+{
+    struct thread *t = hash_table_get(&state->t_table, tid);
+    int status, pending_signal = 0;
+
+    if (t == NULL) {
+        errno = ESRCH;
+        return -1;
+    }
+
+    if (ptrace(PTRACE_SETREGS, tid, NULL, &t->regs) == -1) return -1;
+
+    while (1) {
+        if (singlestep_thread(state, t, &status) == -1 || ptrace(PTRACE_GETREGS, tid, NULL, &t->regs) == -1) return -1;
+
+        // Event stops are followed by the end of the step
+        if (!WIFSTOPPED(status) || WSTOPSIG(status) == SIGTRAP || WSTOPSIG(status) == SIGSEGV) break;
+
+        // Signals delivered before the instruction is executed are raised again after the step
+        if (WSTOPSIG(status) != SIGSTOP) pending_signal = WSTOPSIG(status);
+    }
+
+    if (pending_signal) syscall(SYS_tkill, tid, pending_signal);
+
     return status;
 }
 
+int prepare_for_run(struct global_state *state, int pid)
+{
+    int status = 0;
+
+    // flush any register changes
+    struct thread *t = state->t_HEAD;
+    while (t != NULL) {
+        if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs))
+            fprintf(stderr, "ptrace_setregs failed for thread %d: %s\\n",
+                    t->tid, strerror(errno));
+        t = t->next;
+    }
+
+    // install the breakpoints that were removed to step over them
+    install_enabled_breakpoints(state, pid);
+
+    // iterate over all the threads and check if any of them is stopped on a
+    // software breakpoint, only those breakpoints have to be touched
+    t = state->t_HEAD;
+    struct software_breakpoint *b;
+
+    while (t != NULL) {
+        // the address is reached as soon as the thread executes the instruction
+        consume_coverage_point(state, t->tid, INSTRUCTION_POINTER(t->regs));
+
+        b = find_installed_breakpoint(state, INSTRUCTION_POINTER(t->regs));
+
+        // step over the breakpoint, a pending SIGSTOP is consumed on the way
+        // this should happen only if threads are involved
+        if (b != NULL && step_over_breakpoint(state, t, b, &status, 1) == -1) return -1;
+
+        t = t->next;
+    }
+
+    return status;
+}
+
+static int resume_request(struct global_state *state, struct thread *t)
+{
+    if (!state->handle_syscall_enabled) {
+        // The exit of a syscall entered before the handlers were disabled is not reported
+        t->syscall_stops = 0;
+        t->rule_pending = 0;
+        return PTRACE_CONT;
+    }
+
+    // With the seccomp filter, only the threads inside a handled syscall have to stop at its syscall stops
+    if (state->syscall_filter_enabled && t->syscall_stops <= 0) return PTRACE_CONT;
+
+    return PTRACE_SYSCALL;
+}
+
 int cont_all_and_set_bps(struct global_state *state, int pid)
 {
     int status = prepare_for_run(state, pid);
@@ -389,8 +1455,9 @@ int cont_all_and_set_bps(struct global_state *state, int pid)
     // continue the execution of all the threads
     struct thread *t = state->t_HEAD;
     while (t != NULL) {
-        if (ptrace(state->handle_syscall_enabled
- ? PTRACE_SYSCALL : PTRACE_CONT, t->tid, NULL, t->signal_to_forward))
+        t->stepping = 0;
+
+        if (ptrace(resume_request(state, t), t->tid, NULL, t->signal_to_forward))
             fprintf(stderr, "ptrace_cont failed for thread %d with signal %d: %s\\n", t->tid, t->signal_to_forward,
                     strerror(errno));
         t->signal_to_forward = 0;
@@ -400,27 +1467,318 @@ int cont_all_and_set_bps(struct global_state *state, int pid)
     return status;
 }
 
-struct thread_status *wait_all_and_update_regs(struct global_state *state, int pid)
+void ptrace_mask_breakpoints(struct global_state *state, uint64_t addr, uint8_t *buf, uint64_t size);
+
+static int read_condition_memory(struct global_state *state, int tid, uint64_t addr, uint64_t size, uint64_t *value)
 {
-    // Allocate the head of the list
-    struct thread_status *head;
-    head = malloc(sizeof(struct thread_status));
-    head->next = NULL;
+    uint64_t aligned = addr & ~7ULL, offset = addr & 7, words[2] = {0, 0};
 
-    // The first element is the first status we get from polling with waitpid
-    head->tid = waitpid(-getpgid(pid), &head->status, 0);
+    // The value might span two words
+    for (uint64_t i = 0; i < (offset + size + 7) / 8; i++) {
+        errno = 0;
+        words[i] = ptrace(PTRACE_PEEKDATA, tid, (void *)(aligned + i * 8), NULL);
+        if (errno) return -1;
+    }
 
-    if (head->tid == -1) {
-        free(head);
-        perror("waitpid");
-        return NULL;
+    // The condition must see the original instructions
+    ptrace_mask_breakpoints(state, aligned, (uint8_t *)words, sizeof(words));
+
+    *value = 0;
+    memcpy(value, (uint8_t *)words + offset, size);
+    return 0;
+}
+
+static int evaluate_condition(struct global_state *state, struct thread *t, struct software_breakpoint *b, uint64_t *result)
+{
+    uint64_t stack[CONDITION_STACK_SIZE], *code = b->condition, a, c;
+    uint64_t pc = 0, sp = 0;
+
+    while (pc < b->condition_size) {
+        uint64_t op = code[pc++];
+
+        // These opcodes are followed by an operand
+        if ((op == CONDITION_CONST || op == CONDITION_REGISTER || op == CONDITION_LOAD || op == CONDITION_JZ ||
+             op == CONDITION_JNZ) && pc >= b->condition_size)
+            return -1;
+
+        if (op == CONDITION_CONST || op == CONDITION_REGISTER) {
+            if (sp == CONDITION_STACK_SIZE) return -1;
+        } else if (sp < 1) {
+            return -1;
+        }
+
+        switch (op) {
+        case CONDITION_CONST:
+            stack[sp++] = code[pc++];
+            break;
+        case CONDITION_REGISTER:
+            if (code[pc] + sizeof(uint64_t) > sizeof(t->regs)) return -1;
+            memcpy(&stack[sp++], (uint8_t *)&t->regs + code[pc++], sizeof(uint64_t));
+            break;
+        case CONDITION_LOAD:
+            if (code[pc] < 1 || code[pc] > 8) return -1;
+            if (read_condition_memory(state, t->tid, stack[sp - 1], code[pc++], &stack[sp - 1])) return -1;
+            break;
+        case CONDITION_NEG:
+            stack[sp - 1] = -stack[sp - 1];
+            break;
+        case CONDITION_INVERT:
+            stack[sp - 1] = ~stack[sp - 1];
+            break;
+        case CONDITION_NOT:
+            stack[sp - 1] = !stack[sp - 1];
+            break;
+        case CONDITION_BOOL:
+            stack[sp - 1] = !!stack[sp - 1];
+            break;
+        case CONDITION_POP:
+            sp--;
+            break;
+        case CONDITION_JZ:
+        case CONDITION_JNZ:
+            // The value is kept, it is the result of a short-circuited boolean operator
+            if ((op == CONDITION_JZ) == !stack[sp - 1]) pc = code[pc];
+            else pc++;
+            break;
+        default:
+            if (op > CONDITION_BOOL || sp < 2) return -1;
+
+            c = stack[--sp];
+            a = stack[sp - 1];
+
+            switch (op) {
+            case CONDITION_ADD: a += c; break;
+            case CONDITION_SUB: a -= c; break;
+            case CONDITION_MUL: a *= c; break;
+            case CONDITION_AND: a &= c; break;
+            case CONDITION_OR: a |= c; break;
+            case CONDITION_XOR: a ^= c; break;
+            case CONDITION_SHL: a = c < 64 ? a << c : 0; break;
+            case CONDITION_SHR: a = c < 64 ? a >> c : 0; break;
+            case CONDITION_EQ: a = a == c; break;
+            case CONDITION_NE: a = a != c; break;
+            case CONDITION_LT: a = a < c; break;
+            case CONDITION_LE: a = a <= c; break;
+            case CONDITION_GT: a = a > c; break;
+            case CONDITION_GE: a = a >= c; break;
+            }
+
+            stack[sp - 1] = a;
+        }
+    }
+
+    if (sp != 1) return -1;
+
+    *result = stack[0];
+    return 0;
+}
+
+static int breakpoint_reports_hit(struct global_state *state, struct thread *t, struct software_breakpoint *b)
+{
+    uint64_t result;
+
+    // A condition that cannot be evaluated, e.g. because of an invalid memory access, does not hide the hit
+    if (b->condition != NULL && evaluate_condition(state, t, b, &result) == 0 && !result) return 0;
+
+    if (b->counting) {
+        b->hit_count++;
+        return 0;
     }
 
+    return 1;
+}
+
+static int handle_native_breakpoint(struct global_state *state, int tid, int *status, int resume)
+{
+    struct software_breakpoint *b;
+    struct thread *t;
+    siginfo_t info;
+    uint64_t ip;
+
+    // Only plain SIGTRAP stops can come from a breakpoint
+    if (!state->b_counting && !state->b_conditional && !state->cov_table.count) return 0;
+    if (!WIFSTOPPED(*status) || *status >> 8 != SIGTRAP) return 0;
+
+    t = hash_table_get(&state->t_table, tid);
+    if (t == NULL) return 0;
+
+    // int3 traps are reported with SI_KERNEL, unlike single steps and hardware breakpoints
+    if (ptrace(PTRACE_GETSIGINFO, tid, NULL, &info) == -1 || info.si_code != SI_KERNEL) return 0;
+
+    if (ptrace(PTRACE_GETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+    ip = INSTRUCTION_POINTER(t->regs) - BREAKPOINT_SIZE;
+
+    // A coverage point is restored on its first hit, the thread goes on from the original instruction
+    if (consume_coverage_point(state, tid, ip)) {
+        INSTRUCTION_POINTER(t->regs) = ip;
+        if (ptrace(PTRACE_SETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+        if (resume && ptrace(resume_request(state, t), tid, NULL, 0) == -1) return 0;
+
+        return 1;
+    }
+
+    b = find_installed_breakpoint(state, ip);
+    if (b == NULL || !b->enabled || (!b->counting && b->condition == NULL)) return 0;
+
+    // The registers seen by the condition are the ones of the breakpoint address
+    INSTRUCTION_POINTER(t->regs) = ip;
+    if (breakpoint_reports_hit(state, t, b)) return 0;
+
+    if (ptrace(PTRACE_SETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+    // A stopped thread steps over the breakpoint when the process is resumed
+    if (!resume) return 1;
+
+    // Step over the breakpoint, while the other threads keep running
+    // A scratch page can be mapped only if no other thread is running
+    if (step_over_breakpoint(state, t, b, status, state->t_HEAD->next == NULL) == -1) return 0;
+
+    // Any other stop, such as a signal delivered during the step, is reported to the caller
+    if (!WIFSTOPPED(*status) || *status >> 8 != SIGTRAP) return 0;
+
+    if (ptrace(resume_request(state, t), tid, NULL, 0) == -1) return 0;
+
+    return 1;
+}
+
+static int handle_native_seccomp(struct global_state *state, int tid, int *status, int resume)
+{
+    struct thread *t;
+    uint64_t number;
+
+    if (!state->syscall_filter_enabled || !WIFSTOPPED(*status)) return 0;
+    if (*status >> 8 != (SIGTRAP | (PTRACE_EVENT_SECCOMP << 8))) return 0;
+
+    t = hash_table_get(&state->t_table, tid);
+    if (t == NULL || ptrace(PTRACE_GETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+    // The filter might still report syscalls that are no longer handled
+    number = SYSCALL_NUMBER(t->regs);
+
+    if (state->handle_syscall_enabled && !t->stepping &&
+        (number >= SYSCALL_FILTER_SIZE || state->syscall_filter[number / 8] & (1 << (number % 8)))) {
+        // The seccomp stop is reported as the entry of the syscall, only its syscall-exit-stop follows
+        t->syscall_stops = 1;
+        return 0;
+    }
+
+    // A stopped thread is resumed by the caller
+    if (!resume) return 1;
+
+    // A syscall executed by a step is not reported
+    if (ptrace(t->stepping ? PTRACE_SINGLESTEP : resume_request(state, t), tid, NULL, 0) == -1) return 0;
+
+    return 1;
+}
+
+int ptrace_get_syscall_info(int tid, uint64_t *info);
+
+static int handle_native_syscall_rule(struct global_state *state, int tid, int *status, int resume)
+{
+    struct syscall_rule *r;
+    struct thread *t;
+    uint64_t number, info[8];
+    int seccomp, op, i;
+
+    if (!WIFSTOPPED(*status)) return 0;
+
+    seccomp = *status >> 8 == (SIGTRAP | (PTRACE_EVENT_SECCOMP << 8));
+    if (!seccomp && WSTOPSIG(*status) != (SIGTRAP | 0x80)) return 0;
+
+    t = hash_table_get(&state->t_table, tid);
+    // The syscalls of a stepping thread are rewritten by the callbacks of the handlers
+    if (t == NULL || t->stepping) return 0;
+
+    if (t->rule_pending) {
+        // The seccomp stop of the new syscall and the syscall-exit-stop are not reported
+        if (!seccomp) t->rule_pending = 0;
+    } else {
+        if (!state->syscall_rules_enabled || ptrace(PTRACE_GETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+        number = SYSCALL_NUMBER(t->regs);
+        if (number >= SYSCALL_FILTER_SIZE || !state->syscall_rules[number].flags) return 0;
+
+        // A seccomp stop is always an entry, older kernels cannot tell syscall stops apart, but only an entry
+        // holds -ENOSYS as the return value
+        if (!seccomp) {
+            op = ptrace_get_syscall_info(tid, info);
+            if (op == PTRACE_SYSCALL_INFO_EXIT || (op == -1 && SYSCALL_RETURN(t->regs) != (uint64_t)-ENOSYS))
+                return 0;
+        }
+
+        r = &state->syscall_rules[number];
+
+        if (r->flags & SYSCALL_RULE_NUMBER) SYSCALL_NUMBER(t->regs) = r->new_number;
+
+        for (i = 0; i < 6; i++)
+            if (r->flags & SYSCALL_RULE_ARG(i)) SET_SYSCALL_ARG(t->regs, i, r->args[i]);
+
+        // The syscall is skipped, the kernel leaves the return value set at the entry
+        if (r->flags & SYSCALL_RULE_RETURN) {
+            SYSCALL_NUMBER(t->regs) = -1;
+            SYSCALL_RETURN(t->regs) = r->return_value;
+        }
+
+        if (ptrace(PTRACE_SETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+        r->hits++;
+        t->rule_pending = 1;
+
+        // The thread must stop at the exit even if the filter does not report the new syscall
+        if (t->syscall_stops < 1) t->syscall_stops = 1;
+    }
+
+    // A stopped thread is resumed by the caller
+    if (!resume) return 1;
+
+    if (ptrace(resume_request(state, t), tid, NULL, 0) == -1) return 0;
+
+    return 1;
+}
+
+static int handle_native_stop(struct global_state *state, int tid, int *status, int resume)
+{
+    struct thread *t;
+
+    if (handle_native_seccomp(state, tid, status, resume) || handle_native_breakpoint(state, tid, status, resume))
+        return 1;
+
+    // The syscall stops of a handled syscall are reported to the caller
+    if (WIFSTOPPED(*status) && WSTOPSIG(*status) == (SIGTRAP | 0x80) &&
+        (t = hash_table_get(&state->t_table, tid)) != NULL && t->syscall_stops > 0)
+        t->syscall_stops--;
+
+    // The syscalls rewritten by a rule are not reported
+    return handle_native_syscall_rule(state, tid, status, resume);
+}
+
+static int is_observed_syscall_stop(struct global_state *state, int tid, int status)
+{
+    struct thread *t;
+    uint64_t number;
+
+    if (!state->handle_syscall_enabled || !WIFSTOPPED(status)) return 0;
+    if (WSTOPSIG(status) != (SIGTRAP | 0x80) && status >> 8 != (SIGTRAP | (PTRACE_EVENT_SECCOMP << 8))) return 0;
+
+    t = hash_table_get(&state->t_table, tid);
+    // A stepping thread must be resumed by a step, with the other threads stopped
+    if (t == NULL || t->stepping || ptrace(PTRACE_GETREGS, tid, NULL, &t->regs) == -1) return 0;
+
+    // The syscall number is kept at the syscall-exit-stop too
+    number = SYSCALL_NUMBER(t->regs);
+
+    return number < SYSCALL_FILTER_SIZE && state->syscall_observe[number / 8] & (1 << (number % 8));
+}
+
+static struct thread_status *stop_all_threads(struct global_state *state, int pid, struct thread_status *head)
+{
     // We must interrupt all the other threads with a SIGSTOP
     struct thread *t = state->t_HEAD;
     int temp_tid, temp_status;
     while (t != NULL) {
-        if (t->tid != head->tid) {
+        if (head == NULL || t->tid != head->tid) {
             // If GETREGS succeeds, the thread is already stopped, so we must
             // not "stop" it again
             if (ptrace(PTRACE_GETREGS, t->tid, NULL, &t->regs) == -1) {
@@ -429,6 +1787,12 @@ struct thread_status *wait_all_and_update_regs(struct global_state *state, int p
                 // Wait for the thread to stop
                 temp_tid = waitpid(t->tid, &temp_status, 0);
 
+                // The thread might have stopped on a breakpoint handled natively instead
+                if (handle_native_stop(state, temp_tid, &temp_status, 0)) {
+                    t = t->next;
+                    continue;
+                }
+
                 // Register the status of the thread, as it might contain useful
                 // information
                 struct thread_status *ts = malloc(sizeof(struct thread_status));
@@ -443,6 +1807,8 @@ struct thread_status *wait_all_and_update_regs(struct global_state *state, int p
 
     // We keep polling but don't block, we want to get all the statuses we can
     while ((temp_tid = waitpid(-getpgid(pid), &temp_status, WNOHANG)) > 0) {
+        if (handle_native_stop(state, temp_tid, &temp_status, 0)) continue;
+
         struct thread_status *ts = malloc(sizeof(struct thread_status));
         ts->tid = temp_tid;
         ts->status = temp_status;
@@ -457,17 +1823,93 @@ struct thread_status *wait_all_and_update_regs(struct global_state *state, int p
         t = t->next;
     }
 
-    // Restore any software breakpoint
-    struct software_breakpoint *b = state->b_HEAD;
+    // Software breakpoints are left installed, reads of the memory of the
+    // process see the original instructions through ptrace_mask_breakpoints
+    return head;
+}
+
+struct thread_status *wait_all_and_update_regs(struct global_state *state, int pid)
+{
+    // Allocate the head of the list
+    struct thread_status *head;
+    head = malloc(sizeof(struct thread_status));
+    head->next = NULL;
+
+    // The first element is the first status we get from polling with waitpid
+    // Hits of counting and coverage breakpoints, and the seccomp stops of the syscalls that are not handled, are
+    // handled here and the thread is resumed
+    do {
+        head->tid = waitpid(-getpgid(pid), &head->status, 0);
+
+        if (head->tid == -1) {
+            free(head);
+            perror("waitpid");
+            return NULL;
+        }
+    } while (handle_native_stop(state, head->tid, &head->status, 1));
+
+    // The other threads keep running while an observed syscall is handled
+    if (is_observed_syscall_stop(state, head->tid, head->status)) {
+        state->observed_tid = head->tid;
+        return head;
+    }
+
+    return stop_all_threads(state, pid, head);
+}
+
+int cont_observed_thread(struct global_state *state)
+{
+    struct thread *t = hash_table_get(&state->t_table, state->observed_tid);
+
+    state->observed_tid = 0;
+
+    if (t == NULL) {
+        errno = ESRCH;
+        return -1;
+    }
+
+    if (ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs) == -1) return -1;
 
-    while (b != NULL) {
-        if (b->enabled) {
-            ptrace(PTRACE_POKEDATA, pid, (void *)b->addr, b->instruction);
-        }
-        b = b->next;
+    return ptrace(resume_request(state, t), t->tid, NULL, 0);
+}
+
+struct thread_status *stop_observed_siblings(struct global_state *state, int pid)
+{
+    struct thread *t = hash_table_get(&state->t_table, state->observed_tid);
+
+    state->observed_tid = 0;
+
+    // The changes to the registers of the observed thread must survive the refresh of the registers
+    if (t != NULL && ptrace(PTRACE_SETREGS, t->tid, NULL, &t->regs) == -1)
+        fprintf(stderr, "ptrace_setregs failed for thread %d: %s\\n", t->tid, strerror(errno));
+
+    return stop_all_threads(state, pid, NULL);
+}
+
+int ptrace_get_syscall_info(int tid, uint64_t *info)
+{
+    struct __ptrace_syscall_info data;
+
+    memset(info, 0, 8 * sizeof(uint64_t));
+
+    if (ptrace(PTRACE_GET_SYSCALL_INFO, tid, sizeof(data), &data) <= 0) return -1;
+
+    // The number, the arguments and the return value, where the kind of stop provides them
+    switch (data.op) {
+    case PTRACE_SYSCALL_INFO_ENTRY:
+        info[0] = data.entry.nr;
+        memcpy(&info[1], data.entry.args, sizeof(data.entry.args));
+        break;
+    case PTRACE_SYSCALL_INFO_SECCOMP:
+        info[0] = data.seccomp.nr;
+        memcpy(&info[1], data.seccomp.args, sizeof(data.seccomp.args));
+        break;
+    case PTRACE_SYSCALL_INFO_EXIT:
+        info[7] = data.exit.rval;
+        break;
     }
 
-    return head;
+    return data.op;
 }
 
 void free_thread_status_list(struct thread_status *head)
@@ -483,103 +1925,359 @@ void free_thread_status_list(struct thread_status *head)
 
 void register_breakpoint(struct global_state *state, int pid, uint64_t address)
 {
-    uint64_t instruction, patched_instruction;
-
-    instruction = ptrace(PTRACE_PEEKDATA, pid, (void *)address, NULL);
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
 
-    patched_instruction = INSTALL_BREAKPOINT(instruction);
+    if (b != NULL) {
+        b->enabled = 1;
+        if (!b->installed) {
+            lift_coverage_point(state, pid, address);
+            install_breakpoint(pid, b);
+        }
+        return;
+    }
 
-    ptrace(PTRACE_POKEDATA, pid, (void *)address, patched_instruction);
+    // Make room in the sorted array before the breakpoint becomes reachable
+    if (state->b_count == state->b_capacity) {
+        uint64_t capacity = state->b_capacity ? state->b_capacity * 2 : HASH_TABLE_MIN_SIZE;
+        struct software_breakpoint **sorted = realloc(state->b_sorted, capacity * sizeof(*sorted));
 
-    struct software_breakpoint *b = state->b_HEAD;
+        if (sorted == NULL) return;
 
-    while (b != NULL) {
-        if (b->addr == address) {
-            b->enabled = 1;
-            return;
-        }
-        b = b->next;
+        state->b_sorted = sorted;
+        state->b_capacity = capacity;
     }
 
     b = malloc(sizeof(struct software_breakpoint));
     b->addr = address;
-    b->instruction = instruction;
-    b->patched_instruction = patched_instruction;
     b->enabled = 1;
+    b->installed = 0;
+    b->counting = 0;
+    b->hit_count = 0;
+    b->condition = NULL;
+    b->condition_size = 0;
+    b->displaced_length = 0;
+
+    if (hash_table_put(&state->b_table, address, b) == -1) {
+        free(b);
+        return;
+    }
 
     // Breakpoints should be inserted ordered by address, increasing
     // This is important, because we don't want a breakpoint patching another
-    if (state->b_HEAD == NULL || state->b_HEAD->addr > address) {
-        b->next = state->b_HEAD;
+    uint64_t index = breakpoint_lower_bound(state, address);
+
+    memmove(&state->b_sorted[index + 1], &state->b_sorted[index],
+            (state->b_count - index) * sizeof(*state->b_sorted));
+    state->b_sorted[index] = b;
+    state->b_count++;
+
+    b->next = index + 1 < state->b_count ? state->b_sorted[index + 1] : NULL;
+
+    if (index == 0) {
         state->b_HEAD = b;
-        return;
     } else {
-        struct software_breakpoint *prev = state->b_HEAD;
-        struct software_breakpoint *next = state->b_HEAD->next;
+        state->b_sorted[index - 1]->next = b;
+    }
 
-        while (next != NULL && next->addr < address) {
-            prev = next;
-            next = next->next;
-        }
+    // The breakpoint stays installed until it is disabled or removed
+    lift_coverage_point(state, pid, address);
+    install_breakpoint(pid, b);
+}
+
+static int compare_breakpoints(const void *a, const void *b)
+{
+    uint64_t x = (*(struct software_breakpoint **)a)->addr, y = (*(struct software_breakpoint **)b)->addr;
+
+    return x < y ? -1 : x > y;
+}
+
+static int patch_breakpoint_span(int fd, struct software_breakpoint **bps, uint64_t count)
+{
+    uint64_t start = bps[0]->addr, size = bps[count - 1]->addr + BREAKPOINT_SIZE - start;
+    uint64_t available;
+    uint8_t *buf = malloc(size);
+    int result = -1;
+
+    if (buf == NULL) return -1;
+
+    // The whole span is read and written back at once, instead of a PEEK and POKE per breakpoint
+    if (pread(fd, buf, size, start) != (ssize_t)size) goto cleanup;
+
+    for (uint64_t i = 0; i < count; i++) {
+        uint64_t offset = bps[i]->addr - start;
 
-        b->next = next;
-        prev->next = b;
+        available = size - offset < sizeof(uint64_t) ? size - offset : sizeof(uint64_t);
+        bps[i]->instruction = 0;
+        memcpy(&bps[i]->instruction, buf + offset, available);
+
+        bps[i]->patched_instruction = INSTALL_BREAKPOINT(bps[i]->instruction);
+        memcpy(buf + offset, &bps[i]->patched_instruction, BREAKPOINT_SIZE);
     }
+
+    if (pwrite(fd, buf, size, start) != (ssize_t)size) goto cleanup;
+
+    for (uint64_t i = 0; i < count; i++) bps[i]->installed = 1;
+
+    result = 0;
+
+cleanup:
+    free(buf);
+    return result;
 }
 
-void unregister_breakpoint(struct global_state *state, uint64_t address)
+int register_breakpoints(struct global_state *state, int pid, const uint64_t *addrs, uint64_t count)
 {
-    struct software_breakpoint *b = state->b_HEAD;
-    struct software_breakpoint *prev = NULL;
+    struct software_breakpoint **added, *b;
+    uint64_t new_count = 0, i, j, k;
+    char path[64];
+    int fd, result = 0;
 
-    while (b != NULL) {
-        if (b->addr == address) {
-            if (prev == NULL) {
-                state->b_HEAD = b->next;
-            } else {
-                prev->next = b->next;
-            }
+    if (!count) return 0;
+
+    if (state->b_count + count > state->b_capacity) {
+        uint64_t capacity = state->b_capacity ? state->b_capacity : HASH_TABLE_MIN_SIZE;
+        struct software_breakpoint **sorted;
+
+        while (capacity < state->b_count + count) capacity *= 2;
+
+        sorted = realloc(state->b_sorted, capacity * sizeof(*sorted));
+        if (sorted == NULL) return -1;
+
+        state->b_sorted = sorted;
+        state->b_capacity = capacity;
+    }
+
+    added = malloc(count * sizeof(*added));
+    if (added == NULL) return -1;
+
+    for (i = 0; i < count; i++) {
+        // Known breakpoints are only enabled again, duplicates of the new ones are installed with them
+        b = hash_table_get(&state->b_table, addrs[i]);
+        if (b != NULL) {
+            if (!b->enabled || b->installed) register_breakpoint(state, pid, addrs[i]);
+            continue;
+        }
+
+        b = malloc(sizeof(struct software_breakpoint));
+        if (b == NULL) {
+            result = -1;
+            break;
+        }
+
+        b->addr = addrs[i];
+        b->enabled = 1;
+        b->installed = 0;
+        b->counting = 0;
+        b->hit_count = 0;
+        b->condition = NULL;
+        b->condition_size = 0;
+        b->displaced_length = 0;
+
+        if (hash_table_put(&state->b_table, addrs[i], b) == -1) {
             free(b);
-            return;
+            result = -1;
+            break;
         }
-        prev = b;
-        b = b->next;
+
+        added[new_count++] = b;
+    }
+
+    qsort(added, new_count, sizeof(*added), compare_breakpoints);
+
+    // Merge the new breakpoints into the sorted array, starting from the end
+    i = state->b_count;
+    j = new_count;
+    k = state->b_count + new_count;
+    while (j > 0) {
+        if (i > 0 && state->b_sorted[i - 1]->addr > added[j - 1]->addr)
+            state->b_sorted[--k] = state->b_sorted[--i];
+        else
+            state->b_sorted[--k] = added[--j];
+    }
+    state->b_count += new_count;
+
+    // b_HEAD links the breakpoints in the same order
+    for (i = 0; i < state->b_count; i++)
+        state->b_sorted[i]->next = i + 1 < state->b_count ? state->b_sorted[i + 1] : NULL;
+
+    state->b_HEAD = state->b_count ? state->b_sorted[0] : NULL;
+
+    for (i = 0; i < new_count; i++) lift_coverage_point(state, pid, added[i]->addr);
+
+    snprintf(path, sizeof(path), "/proc/%d/mem", pid);
+    fd = open(path, O_RDWR);
+
+    for (i = 0; i < new_count; i = j) {
+        // Nearby breakpoints are grouped in a span, as long as the span stays small
+        for (j = i + 1; j < new_count; j++) {
+            if (added[j]->addr - added[j - 1]->addr > COVERAGE_SPAN_GAP ||
+                added[j]->addr - added[i]->addr > COVERAGE_SPAN_MAX_SIZE)
+                break;
+        }
+
+        if (fd != -1 && patch_breakpoint_span(fd, &added[i], j - i) == 0) continue;
+
+        // Fall back to patching one word at a time
+        for (k = i; k < j; k++) {
+            if (install_breakpoint(pid, added[k]) == -1) {
+                fprintf(stderr, "failed to install breakpoint at %lx: %s\\n", added[k]->addr, strerror(errno));
+                result = -1;
+            }
+        }
+    }
+
+    if (fd != -1) close(fd);
+    free(added);
+
+    return result;
+}
+
+void unregister_breakpoint(struct global_state *state, uint64_t address)
+{
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
+
+    if (b == NULL) return;
+
+    hash_table_remove(&state->b_table, address);
+
+    uint64_t index = breakpoint_lower_bound(state, address);
+
+    if (index == 0) {
+        state->b_HEAD = b->next;
+    } else {
+        state->b_sorted[index - 1]->next = b->next;
     }
+
+    memmove(&state->b_sorted[index], &state->b_sorted[index + 1],
+            (state->b_count - index - 1) * sizeof(*state->b_sorted));
+    state->b_count--;
+
+    if (b->counting) state->b_counting--;
+    if (b->condition != NULL) state->b_conditional--;
+
+    // Restore the original instruction
+    if (b->installed && state->t_HEAD != NULL)
+        remove_breakpoint(state->t_HEAD->tid, b);
+
+    free(b->condition);
+    free(b);
+
+    // A coverage point at the same address needs its own breakpoint now
+    if (state->t_HEAD != NULL)
+        sync_coverage_point(state, state->t_HEAD->tid, address);
 }
 
 void enable_breakpoint(struct global_state *state, uint64_t address)
 {
-    struct software_breakpoint *b = state->b_HEAD;
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
 
-    while (b != NULL) {
-        if (b->addr == address) {
-            b->enabled = 1;
-            break;
+    if (b == NULL) return;
+
+    b->enabled = 1;
+
+    // Patch the instruction with the breakpoint, unless it is already there
+    if (!b->installed && state->t_HEAD != NULL) {
+        lift_coverage_point(state, state->t_HEAD->tid, address);
+        install_breakpoint(state->t_HEAD->tid, b);
+    }
+}
+
+void disable_breakpoint(struct global_state *state, uint64_t address)
+{
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
+
+    if (b == NULL) return;
+
+    b->enabled = 0;
+
+    // Restore the original instruction
+    if (b->installed && state->t_HEAD != NULL) {
+        remove_breakpoint(state->t_HEAD->tid, b);
+        sync_coverage_point(state, state->t_HEAD->tid, address);
+    }
+}
+
+void ptrace_mask_breakpoints(struct global_state *state, uint64_t addr, uint8_t *buf, uint64_t size)
+{
+    struct software_breakpoint *b;
+    uint64_t i;
+
+    // Replace the patched bytes with the original ones, so that installed breakpoints are invisible
+    for (b = first_breakpoint_from(state, addr); b != NULL && b->addr < addr + size; b = b->next) {
+        if (!b->installed || b->addr + BREAKPOINT_SIZE <= addr) continue;
+
+        for (i = 0; i < BREAKPOINT_SIZE; i++) {
+            if (b->addr + i >= addr && b->addr + i < addr + size)
+                buf[b->addr + i - addr] = ((uint8_t *)&b->instruction)[i];
         }
-        b = b->next;
     }
 
-    // Patch the instruction with the breakpoint
-    if (b != NULL) {
-        ptrace(PTRACE_POKEDATA, state->t_HEAD->tid, (void *)address, b->patched_instruction);
+    // The same holds for the coverage points that were not reached yet
+    struct coverage_point *c;
+
+    for (uint64_t j = coverage_lower_bound(state, addr >= BREAKPOINT_SIZE - 1 ? addr - (BREAKPOINT_SIZE - 1) : 0);
+         j < state->cov_count && state->cov_sorted[j]->addr < addr + size; j++) {
+        c = state->cov_sorted[j];
+        if (!c->installed || c->addr + BREAKPOINT_SIZE <= addr) continue;
+
+        for (i = 0; i < BREAKPOINT_SIZE; i++) {
+            if (c->addr + i >= addr && c->addr + i < addr + size)
+                buf[c->addr + i - addr] = ((uint8_t *)&c->instruction)[i];
+        }
     }
 }
 
-void disable_breakpoint(struct global_state *state, uint64_t address)
+void ptrace_shadow_breakpoints(struct global_state *state, uint64_t addr, uint8_t *buf, uint64_t size)
 {
-    struct software_breakpoint *b = state->b_HEAD;
+    struct software_breakpoint *b;
+    uint64_t i;
 
-    while (b != NULL) {
-        if (b->addr == address) {
-            b->enabled = 0;
-            break;
+    // The bytes written over an installed breakpoint become its original instruction,
+    // while the breakpoint itself is written back in their place
+    for (b = first_breakpoint_from(state, addr); b != NULL && b->addr < addr + size; b = b->next) {
+        if (!b->installed || b->addr + BREAKPOINT_SIZE <= addr) continue;
+
+        for (i = 0; i < BREAKPOINT_SIZE; i++) {
+            if (b->addr + i >= addr && b->addr + i < addr + size)
+                ((uint8_t *)&b->instruction)[i] = buf[b->addr + i - addr];
+        }
+
+        b->patched_instruction = INSTALL_BREAKPOINT(b->instruction);
+
+        for (i = 0; i < BREAKPOINT_SIZE; i++) {
+            if (b->addr + i >= addr && b->addr + i < addr + size)
+                buf[b->addr + i - addr] = ((uint8_t *)&b->patched_instruction)[i];
         }
-        b = b->next;
     }
 
-    // Restore the original instruction
-    if (b != NULL) {
-        ptrace(PTRACE_POKEDATA, state->t_HEAD->tid, (void *)address, b->instruction);
+    // The copies of the overwritten instructions are stale, those breakpoints are stepped over in place
+    uint64_t index = breakpoint_lower_bound(state, addr >= DISPLACED_MAX_LENGTH - 1 ? addr - (DISPLACED_MAX_LENGTH - 1) : 0);
+
+    for (; index < state->b_count && state->b_sorted[index]->addr < addr + size; index++) {
+        b = state->b_sorted[index];
+        if (b->addr + b->displaced_length > addr) b->displaced_length = 0;
+    }
+
+    // The same holds for the coverage points that were not reached yet
+    struct coverage_point *c;
+    uint64_t patched;
+
+    for (uint64_t j = coverage_lower_bound(state, addr >= BREAKPOINT_SIZE - 1 ? addr - (BREAKPOINT_SIZE - 1) : 0);
+         j < state->cov_count && state->cov_sorted[j]->addr < addr + size; j++) {
+        c = state->cov_sorted[j];
+        if (!c->installed || c->addr + BREAKPOINT_SIZE <= addr) continue;
+
+        for (i = 0; i < BREAKPOINT_SIZE; i++) {
+            if (c->addr + i >= addr && c->addr + i < addr + size)
+                ((uint8_t *)&c->instruction)[i] = buf[c->addr + i - addr];
+        }
+
+        patched = INSTALL_BREAKPOINT(c->instruction);
+
+        for (i = 0; i < BREAKPOINT_SIZE; i++) {
+            if (c->addr + i >= addr && c->addr + i < addr + size)
+                buf[c->addr + i - addr] = ((uint8_t *)&patched)[i];
+        }
     }
 }
 
@@ -590,26 +2288,270 @@ void free_breakpoints(struct global_state *state)
 
     while (b != NULL) {
         next = b->next;
+        free(b->condition);
         free(b);
         b = next;
     }
 
     state->b_HEAD = NULL;
+
+    hash_table_free(&state->b_table);
+
+    free(state->b_sorted);
+    state->b_sorted = NULL;
+    state->b_count = 0;
+    state->b_capacity = 0;
+    state->b_counting = 0;
+    state->b_conditional = 0;
+
+    // The scratch pages belong to the process that was debugged
+    state->scratch_count = 0;
 }
 
-int stepping_finish(struct global_state *state, int tid)
+void set_breakpoint_counting(struct global_state *state, uint64_t address, int counting)
 {
-    int status = prepare_for_run(state, tid);
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
+
+    if (b == NULL || b->counting == !!counting) return;
+
+    b->counting = !!counting;
+
+    if (counting)
+        state->b_counting++;
+    else
+        state->b_counting--;
+}
+
+int set_breakpoint_condition(struct global_state *state, uint64_t address, const uint64_t *code, uint64_t size)
+{
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
+    uint64_t *condition = NULL;
+
+    if (b == NULL) return -1;
+
+    if (size) {
+        condition = malloc(size * sizeof(uint64_t));
+        if (condition == NULL) return -1;
+
+        memcpy(condition, code, size * sizeof(uint64_t));
+    }
+
+    if (b->condition != NULL) state->b_conditional--;
+    if (condition != NULL) state->b_conditional++;
+
+    free(b->condition);
+    b->condition = condition;
+    b->condition_size = size;
+
+    return 0;
+}
+
+void set_breakpoint_displacement(struct global_state *state, uint64_t address, const uint8_t *code, uint64_t length, uint64_t disp_offset, int flags)
+{
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
+
+    if (b == NULL || !length || length > DISPLACED_MAX_LENGTH || (disp_offset && disp_offset + sizeof(int32_t) > length)) return;
+
+    memset(b->displaced_code, 0, DISPLACED_MAX_LENGTH);
+    memcpy(b->displaced_code, code, length);
+    b->displaced_disp_offset = disp_offset;
+    b->displaced_flags = flags;
+    b->displaced_length = length;
+}
+
+uint64_t collect_breakpoint_hits(struct global_state *state, uint64_t address)
+{
+    struct software_breakpoint *b = hash_table_get(&state->b_table, address);
+    uint64_t hits;
+
+    if (b == NULL) return 0;
+
+    // The hits are handed over to the caller
+    hits = b->hit_count;
+    b->hit_count = 0;
+
+    return hits;
+}
+
+static int compare_coverage_points(const void *a, const void *b)
+{
+    uint64_t x = (*(struct coverage_point **)a)->addr, y = (*(struct coverage_point **)b)->addr;
+
+    return x < y ? -1 : x > y;
+}
+
+static int patch_coverage_span(int fd, struct coverage_point **points, uint64_t count)
+{
+    uint64_t start = points[0]->addr, size = points[count - 1]->addr + BREAKPOINT_SIZE - start;
+    uint64_t patched, available;
+    uint8_t *buf = malloc(size);
+    int result = -1;
+
+    if (buf == NULL) return -1;
+
+    // The whole span is read and written back at once, instead of a PEEK and POKE per breakpoint
+    if (pread(fd, buf, size, start) != (ssize_t)size) goto cleanup;
+
+    for (uint64_t i = 0; i < count; i++) {
+        uint64_t offset = points[i]->addr - start;
+
+        available = size - offset < sizeof(uint64_t) ? size - offset : sizeof(uint64_t);
+        points[i]->instruction = 0;
+        memcpy(&points[i]->instruction, buf + offset, available);
+
+        patched = INSTALL_BREAKPOINT(points[i]->instruction);
+        memcpy(buf + offset, &patched, BREAKPOINT_SIZE);
+    }
 
-    struct thread *stepping_thread = state->t_HEAD;
-    while (stepping_thread != NULL) {
-        if (stepping_thread->tid == tid) {
+    if (pwrite(fd, buf, size, start) != (ssize_t)size) goto cleanup;
+
+    result = 0;
+
+cleanup:
+    free(buf);
+    return result;
+}
+
+int ptrace_install_coverage(struct global_state *state, int pid, const uint64_t *addrs, uint64_t count, uint8_t *bitmap)
+{
+    struct coverage_point **heads, *c, *head;
+    struct software_breakpoint *b;
+    uint64_t new_count = 0, i, j, k, span;
+    char path[64];
+    int fd, result = 0;
+
+    if (!count) return 0;
+
+    if (state->cov_count + count > state->cov_capacity) {
+        uint64_t capacity = state->cov_capacity ? state->cov_capacity : HASH_TABLE_MIN_SIZE;
+        struct coverage_point **sorted;
+
+        while (capacity < state->cov_count + count) capacity *= 2;
+
+        sorted = realloc(state->cov_sorted, capacity * sizeof(*sorted));
+        if (sorted == NULL) return -1;
+
+        state->cov_sorted = sorted;
+        state->cov_capacity = capacity;
+    }
+
+    heads = malloc(count * sizeof(*heads));
+    if (heads == NULL) return -1;
+
+    for (i = 0; i < count; i++) {
+        c = malloc(sizeof(struct coverage_point));
+        if (c == NULL) {
+            result = -1;
+            break;
+        }
+
+        c->addr = addrs[i];
+        c->instruction = 0;
+        c->bitmap = bitmap;
+        c->index = i;
+        c->installed = 0;
+        c->chain = NULL;
+
+        // Points at an address that is already covered share its breakpoint
+        head = hash_table_get(&state->cov_table, addrs[i]);
+        if (head != NULL) {
+            c->chain = head->chain;
+            head->chain = c;
+            continue;
+        }
+
+        if (hash_table_put(&state->cov_table, addrs[i], c) == -1) {
+            free(c);
+            result = -1;
             break;
         }
 
-        stepping_thread = stepping_thread->next;
+        heads[new_count++] = c;
+    }
+
+    qsort(heads, new_count, sizeof(*heads), compare_coverage_points);
+
+    // Merge the new points into the sorted array, starting from the end
+    i = state->cov_count;
+    j = new_count;
+    k = state->cov_count + new_count;
+    while (j > 0) {
+        if (i > 0 && state->cov_sorted[i - 1]->addr > heads[j - 1]->addr)
+            state->cov_sorted[--k] = state->cov_sorted[--i];
+        else
+            state->cov_sorted[--k] = heads[--j];
+    }
+    state->cov_count += new_count;
+
+    // The points at an installed software breakpoint rely on it, the others are patched in batches
+    j = 0;
+    for (i = 0; i < new_count; i++) {
+        b = hash_table_get(&state->b_table, heads[i]->addr);
+        if (b == NULL || !b->installed) heads[j++] = heads[i];
+    }
+    new_count = j;
+
+    snprintf(path, sizeof(path), "/proc/%d/mem", pid);
+    fd = open(path, O_RDWR);
+
+    for (i = 0; i < new_count; i = j) {
+        // Nearby points are grouped in a span, as long as the span stays small
+        for (j = i + 1; j < new_count; j++) {
+            if (heads[j]->addr - heads[j - 1]->addr > COVERAGE_SPAN_GAP ||
+                heads[j]->addr - heads[i]->addr > COVERAGE_SPAN_MAX_SIZE)
+                break;
+        }
+        span = j - i;
+
+        if (fd != -1 && patch_coverage_span(fd, &heads[i], span) == 0) {
+            for (k = i; k < j; k++) heads[k]->installed = 1;
+            state->cov_installed += span;
+            continue;
+        }
+
+        // Fall back to patching one word at a time
+        for (k = i; k < j; k++) {
+            if (install_coverage_point(state, pid, heads[k]) == -1) {
+                fprintf(stderr, "failed to install coverage point at %lx: %s\\n", heads[k]->addr, strerror(errno));
+                result = -1;
+            }
+        }
+    }
+
+    if (fd != -1) close(fd);
+    free(heads);
+
+    return result;
+}
+
+void free_coverage_points(struct global_state *state)
+{
+    struct coverage_point *c, *next;
+
+    for (uint64_t i = 0; i < state->cov_count; i++) {
+        c = state->cov_sorted[i];
+        while (c != NULL) {
+            next = c->chain;
+            free(c);
+            c = next;
+        }
     }
 
+    hash_table_free(&state->cov_table);
+
+    free(state->cov_sorted);
+    state->cov_sorted = NULL;
+    state->cov_count = 0;
+    state->cov_capacity = 0;
+    state->cov_installed = 0;
+}
+
+int stepping_finish(struct global_state *state, int tid)
+{
+    int status = prepare_for_run(state, tid);
+
+    struct thread *stepping_thread = hash_table_get(&state->t_table, tid);
+
     if (!stepping_thread) {
         perror("Thread not found");
         return -1;
@@ -617,18 +2559,17 @@ int stepping_finish(struct global_state *state, int tid)
 
     uint64_t previous_ip, current_ip;
     uint64_t opcode_window, first_opcode_byte;
+    struct software_breakpoint *b;
 
     // We need to keep track of the nested calls
     int nested_call_counter = 1;
 
     do {
-        if (ptrace(PTRACE_SINGLESTEP, tid, NULL, NULL)) return -1;
-
-        // wait for the child
-        waitpid(tid, &status, 0);
-
+        // A displaced step updates the registers, the instruction pointer is taken before it
         previous_ip = INSTRUCTION_POINTER(stepping_thread->regs);
 
+        if (singlestep_thread(state, stepping_thread, &status)) return -1;
+
         // update the registers
         ptrace(PTRACE_GETREGS, tid, NULL, &stepping_thread->regs);
 
@@ -636,13 +2577,22 @@ int stepping_finish(struct global_state *state, int tid)
 
         // Get value at current instruction pointer
         opcode_window = ptrace(PTRACE_PEEKDATA, tid, (void *)current_ip, NULL);
+
+        // counting breakpoints do not interrupt the stepping, their original
+        // instruction is stepped instead, as for coverage points
+        b = find_installed_breakpoint(state, current_ip);
+        if (b != NULL && b->enabled && breakpoint_reports_hit(state, stepping_thread, b))
+            return 0;
+
+        ptrace_mask_breakpoints(state, current_ip, (uint8_t *)&opcode_window, sizeof(opcode_window));
+
         first_opcode_byte = opcode_window & 0xFF;
 
         // if the instruction pointer didn't change, we return
         // because we hit a hardware breakpoint
         // we do the same if we hit a software breakpoint
         if (current_ip == previous_ip || IS_SW_BREAKPOINT(first_opcode_byte))
-            goto cleanup;
+            return 0;
 
         // If we hit a call instruction, we increment the counter
         if (IS_CALL_INSTRUCTION((uint8_t*) &opcode_window))
@@ -653,23 +2603,10 @@ int stepping_finish(struct global_state *state, int tid)
     } while (nested_call_counter > 0);
 
     // We are in a return instruction, do the last step
-    if (ptrace(PTRACE_SINGLESTEP, tid, NULL, NULL)) return -1;
-
-    // wait for the child
-    waitpid(tid, &status, 0);
+    if (singlestep_thread(state, stepping_thread, &status)) return -1;
 
     // update the registers
     ptrace(PTRACE_GETREGS, tid, NULL, &stepping_thread->regs);
 
-cleanup:
-    // remove any installed breakpoint
-    struct software_breakpoint *b = state->b_HEAD;
-    while (b != NULL) {
-        if (b->enabled) {
-            ptrace(PTRACE_POKEDATA, tid, (void *)b->addr, b->instruction);
-        }
-        b = b->next;
-    }
-
     return 0;
 }
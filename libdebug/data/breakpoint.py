@@ -27,9 +27,11 @@ class Breakpoint:
         hit_count (int): The number of times this specific breakpoint has been hit.
         hardware (bool): Whether the breakpoint is a hardware breakpoint or not.
         callback (Callable[[ThreadContext, Breakpoint], None]): The callback defined by the user to execute when the breakpoint is hit.
-        condition (str): The breakpoint condition. Available values are "X", "W", "RW". Supported only for hardware breakpoints.
-        length (int): The length of the breakpoint area. Supported only for hardware breakpoints.
+        condition (str): The breakpoint condition. Available values are "X", "W", "RW". Software breakpoints with the "W" or "RW" condition are watchpoints implemented by protecting the memory pages they cover.
+        length (int): The length of the breakpoint area. Supported only for watchpoints.
         enabled (bool): Whether the breakpoint is enabled or not.
+        counting (bool): Whether the breakpoint only counts its hits, without stopping the process.
+        when (str): The condition evaluated by the debugging backend, only the hits where it holds are reported. Supported only for software breakpoints.
     """
 
     address: int = 0
@@ -40,6 +42,8 @@ class Breakpoint:
     condition: str = "x"
     length: int = 1
     enabled: bool = True
+    counting: bool = False
+    when: str | None = None
 
     _linked_thread_ids: list[int] = field(default_factory=list)
     # The thread ID that hit the breakpoint
@@ -59,6 +63,11 @@ class Breakpoint:
         self.enabled = False
         self._changed = True
 
+    @property
+    def _page_watchpoint(self: Breakpoint) -> bool:
+        """Whether the breakpoint is a watchpoint implemented by protecting the memory pages it covers."""
+        return not self.hardware and self.condition in ("w", "rw")
+
     def hit_on(self: Breakpoint, thread_context: ThreadContext) -> bool:
         """Returns whether the breakpoint has been hit on the given thread context."""
         return self.enabled and thread_context.instruction_pointer == self.address
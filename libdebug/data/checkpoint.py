@@ -0,0 +1,38 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from libdebug.data.memory_map import MemoryMap
+    from libdebug.data.memory_snapshot import MemorySnapshot
+
+
+@dataclass
+class Checkpoint:
+    """A checkpoint of the state of the target process, which can be restored in place.
+
+    Attributes:
+        memory (MemorySnapshot): The content of the writable memory of the process.
+        maps (list[MemoryMap]): All the memory maps of the process.
+        registers (dict[int, bytes]): The register file of each thread, indexed by thread ID.
+        file_offsets (dict[int, int]): The file offset of each file descriptor.
+        program_break (int): The program break of the process.
+    """
+
+    memory: MemorySnapshot = field(repr=False)
+    maps: list[MemoryMap] = field(repr=False)
+    registers: dict[int, bytes] = field(repr=False)
+    file_offsets: dict[int, int]
+    program_break: int
+
+    @property
+    def process_id(self: Checkpoint) -> int:
+        """The PID of the process the checkpoint was taken from."""
+        return self.memory.process_id
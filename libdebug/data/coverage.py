@@ -0,0 +1,45 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Coverage:
+    """The addresses covered by one-shot breakpoints in the target process.
+
+    Attributes:
+        addresses (list[int]): The covered addresses.
+        bitmap (bytearray): The bitmap whose i-th bit is set once the i-th address is reached. It is updated by the
+        debugging backend every time the process stops.
+    """
+
+    addresses: list[int]
+    bitmap: bytearray
+
+    def is_reached(self: Coverage, index: int) -> bool:
+        """Returns whether the address at the specified index was reached."""
+        return bool(self.bitmap[index // 8] >> (index % 8) & 1)
+
+    @property
+    def reached(self: Coverage) -> list[int]:
+        """The addresses that were reached."""
+        return [address for i, address in enumerate(self.addresses) if self.is_reached(i)]
+
+    @property
+    def missed(self: Coverage) -> list[int]:
+        """The addresses that were not reached yet."""
+        return [address for i, address in enumerate(self.addresses) if not self.is_reached(i)]
+
+    @property
+    def ratio(self: Coverage) -> float:
+        """The fraction of the addresses that were reached."""
+        if not self.addresses:
+            return 0.0
+
+        return sum(byte.bit_count() for byte in self.bitmap) / len(self.addresses)
@@ -0,0 +1,118 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from libdebug.data.memory_map import MemoryMap
+
+
+@dataclass
+class MemorySnapshot:
+    """A snapshot of the writable memory of the target process.
+
+    Pages are stored in a table indexed by their address. Identical pages, such as the zero-filled pages of a large
+    heap, share the same object, and pages that did not change since a previous snapshot are shared with it.
+
+    Attributes:
+        process_id (int): The PID of the process the snapshot was taken from.
+        maps (list[MemoryMap]): The writable memory maps captured by the snapshot.
+        pages (dict[int, bytes]): The content of the captured pages, indexed by their address.
+        page_size (int): The size of a page.
+    """
+
+    process_id: int
+    maps: list[MemoryMap]
+    pages: dict[int, bytes] = field(repr=False)
+    page_size: int
+
+    _epoch: int | None = field(default=None, repr=False)
+    """The soft-dirty epoch the snapshot is consistent with, if soft-dirty tracking is available."""
+
+    @property
+    def size(self: MemorySnapshot) -> int:
+        """The amount of memory captured by the snapshot."""
+        return len(self.pages) * self.page_size
+
+    def read(self: MemorySnapshot, address: int, size: int) -> bytes:
+        """Reads memory from the snapshot.
+
+        Args:
+            address (int): The address to read from.
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes: The captured content of the memory range.
+        """
+        data = bytearray()
+        end = address + size
+
+        while address < end:
+            page = address - address % self.page_size
+            if page not in self.pages:
+                raise ValueError(f"Address {address:#x} is not part of the snapshot.")
+            chunk_end = min(end, page + self.page_size)
+            data += self.pages[page][address - page : chunk_end - page]
+            address = chunk_end
+
+        return bytes(data)
+
+    def diff(self: MemorySnapshot, other: MemorySnapshot) -> list[tuple[int, int]]:
+        """Returns the memory ranges whose content differs between this snapshot and another one.
+
+        Pages captured only by the other snapshot, such as those of newly mapped memory, are reported entirely.
+
+        Args:
+            other (MemorySnapshot): The snapshot to compare with.
+
+        Returns:
+            list[tuple[int, int]]: The sorted list of the changed ranges, as (start, end) tuples.
+        """
+        ranges = []
+
+        for address in sorted(other.pages):
+            new = other.pages[address]
+            old = self.pages.get(address)
+
+            if old is new:
+                continue
+
+            if old is None:
+                _append_range(ranges, address, address + len(new))
+            elif old != new:
+                for start, end in _changed_ranges(old, new):
+                    _append_range(ranges, address + start, address + end)
+
+        return ranges
+
+
+def _append_range(ranges: list[tuple[int, int]], start: int, end: int) -> None:
+    """Appends a range to a sorted list of ranges, merging it with the last one if they are contiguous."""
+    if ranges and ranges[-1][1] == start:
+        ranges[-1] = (ranges[-1][0], end)
+    else:
+        ranges.append((start, end))
+
+
+def _changed_ranges(old: bytes, new: bytes, block_size: int = 64) -> list[tuple[int, int]]:
+    """Returns the byte ranges that differ between two pages of the same size."""
+    ranges = []
+
+    for block in range(0, len(new), block_size):
+        block_end = block + block_size
+
+        # Most of the page is usually unchanged, so we only compare single bytes in the blocks that differ
+        if old[block:block_end] == new[block:block_end]:
+            continue
+
+        for offset in range(block, min(block_end, len(new))):
+            if old[offset] != new[offset]:
+                _append_range(ranges, offset, offset + 1)
+
+    return ranges
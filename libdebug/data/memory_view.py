@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 from collections.abc import Callable, MutableSequence
 from typing import TYPE_CHECKING
 
@@ -13,6 +15,9 @@ from libdebug.debugger.internal_debugger_instance_manager import provide_interna
 from libdebug.liblog import liblog
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from libdebug.data.memory_map import MemoryMap
     from libdebug.debugger.internal_debugger import InternalDebugger
 
 
@@ -27,23 +32,46 @@ class MemoryView(MutableSequence):
             maps_provider (Callable[[], list[MemoryMap]]): A function that returns the memory maps of the target process.
             unit_size (int, optional): The data size used by the getter and setter functions. Defaults to 8.
             align_to (int, optional): The address alignment that must be used when reading and writing memory. Defaults to 1.
+            bulk_getter (Callable[[int, int], bytes], optional): A function that reads a whole memory range at once. Defaults to None.
+            bulk_setter (Callable[[int, bytes], None], optional): A function that writes a whole memory range at once. Defaults to None.
+            buffer_getter (Callable[[int, bytearray | memoryview], int], optional): A function that reads a whole memory range into a writable buffer. Defaults to None.
+            vector_getter (Callable[[list[tuple[int, int]]], bytes], optional): A function that reads multiple memory ranges at once. Defaults to None.
+            vector_setter (Callable[[list[tuple[int, bytes]]], None], optional): A function that writes multiple memory ranges at once. Defaults to None.
+            follow_getter (Callable[[int, int, int, int], list[tuple[int, bytes]]], optional): A function that walks a linked structure at once. Defaults to None.
     """
 
     context: InternalDebugger
     """The debugging context of the target process."""
 
+    _page_cache: dict[int, bytes] | None
+    """The cached pages of the target process, indexed by page address. None if the cache is disabled."""
+
     def __init__(
         self: MemoryView,
         getter: Callable[[int], bytes],
         setter: Callable[[int, bytes], None],
         unit_size: int = 8,
         align_to: int = 1,
+        bulk_getter: Callable[[int, int], bytes] | None = None,
+        bulk_setter: Callable[[int, bytes], None] | None = None,
+        buffer_getter: Callable[[int, bytearray | memoryview], int] | None = None,
+        vector_getter: Callable[[list[tuple[int, int]]], bytes] | None = None,
+        vector_setter: Callable[[list[tuple[int, bytes]]], None] | None = None,
+        follow_getter: Callable[[int, int, int, int], list[tuple[int, bytes]]] | None = None,
     ) -> None:
         """Initializes the MemoryView."""
         self.getter = getter
         self.setter = setter
         self.unit_size = unit_size
         self.align_to = align_to
+        self.bulk_getter = bulk_getter
+        self.bulk_setter = bulk_setter
+        self.buffer_getter = buffer_getter
+        self.vector_getter = vector_getter
+        self.vector_setter = vector_setter
+        self.follow_getter = follow_getter
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self._page_cache = None
         self._internal_debugger = provide_internal_debugger(self)
         self.maps_provider = self._internal_debugger.debugging_interface.maps
 
@@ -57,6 +85,17 @@ class MemoryView(MutableSequence):
         Returns:
             bytes: The read bytes.
         """
+        if self._page_cache is not None:
+            return self._read_cached(address, size)
+
+        return self._read(address, size)
+
+    def _read(self: MemoryView, address: int, size: int) -> bytes:
+        """Reads memory from the target process, bypassing the page cache."""
+        if self.bulk_getter is not None:
+            # The whole range can be fetched with a single request
+            return self.bulk_getter(address, size)
+
         if self.align_to == 1:
             data = b""
 
@@ -89,6 +128,23 @@ class MemoryView(MutableSequence):
 
             return data
 
+    def readinto(self: MemoryView, address: int, buffer: bytearray | memoryview) -> int:
+        """Reads memory from the target process directly into a preallocated buffer.
+
+        Args:
+            address (int): The address to read from.
+            buffer (bytearray | memoryview): The writable buffer to fill. Its length is the number of bytes to read.
+
+        Returns:
+            int: The number of bytes read.
+        """
+        if self.buffer_getter is not None and self._page_cache is None:
+            return self.buffer_getter(address, buffer)
+
+        view = memoryview(buffer).cast("B")
+        view[:] = self.read(address, len(view))
+        return len(view)
+
     def write(self: MemoryView, address: int, data: bytes) -> None:
         """Writes memory to the target process.
 
@@ -96,6 +152,18 @@ class MemoryView(MutableSequence):
             address (int): The address to write to.
             data (bytes): The data to write.
         """
+        self._write(address, data)
+
+        if self._page_cache is not None:
+            self._update_cached_pages(address, data)
+
+    def _write(self: MemoryView, address: int, data: bytes) -> None:
+        """Writes memory to the target process, bypassing the page cache."""
+        if self.bulk_setter is not None:
+            # The whole range can be written with a single request
+            self.bulk_setter(address, data)
+            return
+
         size = len(data)
 
         if self.align_to == 1:
@@ -122,6 +190,302 @@ class MemoryView(MutableSequence):
                 data[size - remainder :] + prev_data[remainder:],
             )
 
+    def read_many(
+        self: MemoryView,
+        regions: list[tuple[int, int]],
+        packed: bool = False,
+    ) -> list[bytes] | tuple[bytes, list[int]]:
+        """Reads multiple memory ranges from the target process at once.
+
+        Args:
+            regions (list[tuple[int, int]]): The (address, size) pairs to read.
+            packed (bool, optional): Whether to return a single buffer with the offset of each range, instead of a list. Defaults to False.
+
+        Returns:
+            list[bytes] | tuple[bytes, list[int]]: The read ranges, in the same order as the regions.
+        """
+        regions = list(regions)
+
+        if self.vector_getter is not None and self._page_cache is None:
+            data = self.vector_getter(regions)
+        else:
+            data = b"".join(self.read(address, size) for address, size in regions)
+
+        offsets = []
+        offset = 0
+        for _, size in regions:
+            offsets.append(offset)
+            offset += size
+
+        if packed:
+            return data, offsets
+
+        return [data[offset : offset + size] for offset, (_, size) in zip(offsets, regions, strict=True)]
+
+    def write_many(self: MemoryView, regions: list[tuple[int, bytes]]) -> None:
+        """Writes multiple memory ranges to the target process at once.
+
+        Args:
+            regions (list[tuple[int, bytes]]): The (address, data) pairs to write.
+        """
+        regions = list(regions)
+
+        if self.vector_setter is None:
+            for address, data in regions:
+                self.write(address, data)
+            return
+
+        self.vector_setter(regions)
+
+        if self._page_cache is not None:
+            for address, data in regions:
+                self._update_cached_pages(address, data)
+
+    def follow(
+        self: MemoryView,
+        address: int,
+        next_offset: int,
+        payload_size: int,
+        max_nodes: int = 0x1000,
+    ) -> list[tuple[int, bytes]]:
+        """Walks a linked structure in the target process, such as a singly linked list.
+
+        Starting from the specified address, the pointer found at `next_offset` inside each node is followed
+        until a NULL pointer is found, the list loops back to the first node or `max_nodes` nodes have been visited.
+        The walk stops at the first node that cannot be read.
+
+        Args:
+            address (int): The address of the first node.
+            next_offset (int): The offset of the pointer to the next node, inside each node.
+            payload_size (int): The number of bytes to read from the start of each node.
+            max_nodes (int, optional): The maximum number of nodes to visit. Defaults to 0x1000.
+
+        Returns:
+            list[tuple[int, bytes]]: The address and the payload of each visited node.
+        """
+        if max_nodes <= 0 or not address:
+            return []
+
+        if self.follow_getter is not None:
+            return self.follow_getter(address, next_offset, payload_size, max_nodes)
+
+        nodes = []
+        node = address
+
+        while node and len(nodes) < max_nodes:
+            try:
+                payload = self.read(node, payload_size)
+                next_node = int.from_bytes(self.read(node + next_offset, 8), "little")
+            except OSError:
+                if not nodes:
+                    raise
+                break
+
+            nodes.append((node, payload))
+
+            if next_node == address:
+                break
+
+            node = next_node
+
+        return nodes
+
+    def find(
+        self: MemoryView,
+        pattern: bytes | re.Pattern | int,
+        maps: list[MemoryMap] | str | None = None,
+        permissions: str = "rw",
+        size: int = 8,
+        chunk_size: int = 0x100000,
+        overlap: int = 0x1000,
+    ) -> list[int]:
+        """Searches the memory of the target process for a pattern.
+
+        Args:
+            pattern (bytes | re.Pattern | int): The pattern to search for. It can be a bytes object, a compiled bytes regular expression or an integer.
+            maps (list[MemoryMap] | str, optional): The memory maps to search, or a substring of their backing file. Defaults to all the memory maps.
+            permissions (str, optional): The permissions that a memory map must have to be searched. Defaults to "rw".
+            size (int, optional): The size in bytes of an integer pattern, which is only matched at addresses aligned to its size. Defaults to 8.
+            chunk_size (int, optional): The number of bytes read from the process at once. Defaults to 0x100000.
+            overlap (int, optional): The maximum length of a match of a regular expression. Defaults to 0x1000.
+
+        Returns:
+            list[int]: The addresses of all the matches.
+        """
+        return list(self.finditer(pattern, maps, permissions, size, chunk_size, overlap))
+
+    def finditer(
+        self: MemoryView,
+        pattern: bytes | re.Pattern | int,
+        maps: list[MemoryMap] | str | None = None,
+        permissions: str = "rw",
+        size: int = 8,
+        chunk_size: int = 0x100000,
+        overlap: int = 0x1000,
+    ) -> Iterator[int]:
+        """Lazily searches the memory of the target process for a pattern.
+
+        Each memory map is read in chunks of fixed size, so that the memory usage stays constant regardless of the
+        size of the searched maps. Consecutive chunks overlap, so that matches across chunk boundaries are found.
+
+        Args:
+            pattern (bytes | re.Pattern | int): The pattern to search for. It can be a bytes object, a compiled bytes regular expression or an integer.
+            maps (list[MemoryMap] | str, optional): The memory maps to search, or a substring of their backing file. Defaults to all the memory maps.
+            permissions (str, optional): The permissions that a memory map must have to be searched. Defaults to "rw".
+            size (int, optional): The size in bytes of an integer pattern, which is only matched at addresses aligned to its size. Defaults to 8.
+            chunk_size (int, optional): The number of bytes read from the process at once. Defaults to 0x100000.
+            overlap (int, optional): The maximum length of a match of a regular expression. Defaults to 0x1000.
+
+        Yields:
+            int: The address of each match.
+        """
+        alignment = 1
+
+        if isinstance(pattern, int):
+            alignment = size
+            pattern = pattern.to_bytes(size, "little")
+
+        if isinstance(pattern, bytes):
+            if not pattern:
+                raise ValueError("The pattern must not be empty.")
+            overlap = len(pattern) - 1
+        elif not isinstance(pattern, re.Pattern):
+            raise TypeError("Invalid type for the pattern. Expected bytes, int or a compiled regular expression.")
+
+        if chunk_size % alignment:
+            raise ValueError("The chunk size must be a multiple of the size of the pattern.")
+
+        if maps is None:
+            maps = self.maps_provider()
+        elif isinstance(maps, str):
+            maps = [vmap for vmap in self.maps_provider() if maps in vmap.backing_file]
+
+        buffer = bytearray(chunk_size + overlap)
+        view = memoryview(buffer)
+
+        for vmap in maps:
+            if any(permission not in vmap.permissions for permission in permissions):
+                continue
+
+            position = search_from = vmap.start
+
+            while position < vmap.end:
+                length = min(chunk_size + overlap, vmap.end - position)
+
+                try:
+                    self.readinto(position, view[:length])
+                except OSError as e:
+                    liblog.debugger(f"Skipping memory map {vmap}: {e}")
+                    break
+
+                # Matches starting in the overlap are reported by the next chunk
+                limit = chunk_size if position + length < vmap.end else length
+
+                for start, end in self._search_chunk(buffer, search_from - position, length, limit, pattern):
+                    # The next search must not find matches overlapping a reported regular expression match
+                    search_from = position + end
+
+                    if (position + start) % alignment == 0:
+                        yield position + start
+
+                position += chunk_size
+
+    def _search_chunk(
+        self: MemoryView,
+        buffer: bytearray,
+        start: int,
+        length: int,
+        limit: int,
+        pattern: bytes | re.Pattern,
+    ) -> Iterator[tuple[int, int]]:
+        """Yields the boundaries of the matches in buffer[start:length] which start before the limit.
+
+        Matches of a bytes pattern may overlap, so the end of each one is placed right after its start.
+        """
+        start = max(start, 0)
+
+        if isinstance(pattern, bytes):
+            offset = buffer.find(pattern, start, length)
+
+            while offset != -1 and offset < limit:
+                yield offset, offset + 1
+                offset = buffer.find(pattern, offset + 1, length)
+        else:
+            for match in pattern.finditer(buffer, start, length):
+                if match.start() >= limit:
+                    break
+                yield match.start(), match.end()
+
+    def enable_cache(self: MemoryView) -> None:
+        """Enables the page cache for memory reads.
+
+        While the process is stopped, each page is read from the process only the first time it is accessed.
+        The cache is dropped every time the process is resumed or stopped, and writes are applied to it.
+        """
+        if self._page_cache is None:
+            self._page_cache = {}
+
+    def disable_cache(self: MemoryView) -> None:
+        """Disables the page cache for memory reads."""
+        self._page_cache = None
+
+    def invalidate_cache(self: MemoryView) -> None:
+        """Drops all the cached pages, if the cache is enabled."""
+        if self._page_cache:
+            self._page_cache.clear()
+
+    def _read_cached(self: MemoryView, address: int, size: int) -> bytes:
+        """Reads memory from the target process through the page cache."""
+        # The cache can only be trusted while the process is stopped
+        self._internal_debugger._ensure_process_stopped()
+
+        if size <= 0:
+            return b""
+
+        first_page = address - address % self.page_size
+        last_page = (address + size - 1) - (address + size - 1) % self.page_size
+        pages = range(first_page, last_page + self.page_size, self.page_size)
+
+        missing = [page for page in pages if page not in self._page_cache]
+
+        # Fetch every run of consecutive missing pages with a single read
+        index = 0
+        while index < len(missing):
+            run_start = run_end = missing[index]
+
+            while index < len(missing) and missing[index] == run_end:
+                run_end += self.page_size
+                index += 1
+
+            try:
+                data = self._read(run_start, run_end - run_start)
+            except OSError:
+                # Some page is not accessible, let the uncached read handle it
+                return self._read(address, size)
+
+            for offset in range(0, run_end - run_start, self.page_size):
+                self._page_cache[run_start + offset] = data[offset : offset + self.page_size]
+
+        data = b"".join(self._page_cache[page] for page in pages)
+        start = address - first_page
+        return data[start : start + size]
+
+    def _update_cached_pages(self: MemoryView, address: int, data: bytes) -> None:
+        """Applies a write to the cached pages it overlaps."""
+        end = address + len(data)
+        page = address - address % self.page_size
+
+        while page < end:
+            if page in self._page_cache:
+                start = max(address, page)
+                stop = min(end, page + self.page_size)
+
+                content = bytearray(self._page_cache[page])
+                content[start - page : stop - page] = data[start - address : stop - address]
+                self._page_cache[page] = bytes(content)
+
+            page += self.page_size
+
     def __getitem__(self: MemoryView, key: int | slice | str | tuple) -> bytes:
         """Read from memory, either a single byte or a byte string.
 
@@ -35,6 +35,7 @@ class SyscallHandler:
         the new syscall should be considered as well. Defaults to False.
         enabled (bool): Whether the syscall will be handled or not.
         hit_count (int): The number of times the syscall has been handled.
+        observe (bool): Whether the callbacks run while the other threads keep running. Defaults to False.
     """
 
     syscall_number: int
@@ -45,9 +46,11 @@ class SyscallHandler:
     recursive: bool = False
     enabled: bool = True
     hit_count: int = 0
+    observe: bool = False
 
     _has_entered: bool = False
     _skip_exit: bool = False
+    _rule: dict[str, int] | None = None
 
     def enable(self: SyscallHandler) -> None:
         """Handle the syscall."""
@@ -0,0 +1,147 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import mmap
+import struct
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from libdebug.state.thread_context import ThreadContext
+
+TRACE_MAGIC = b"LDSYSREC"
+TRACE_VERSION = 1
+
+TRACE_HEADER = struct.Struct("<8sIIQQ")
+"""The header of a trace: magic, version, size of a record, capacity and number of records written so far."""
+
+TRACE_RECORD = struct.Struct("<IIIIQ6QQ")
+"""A record of a trace: thread id, syscall number, flags, padding, timestamp, arguments and return value."""
+
+RECORD_RETURNED = 1
+"""The flag of the records of the syscalls that returned, whose return value is valid."""
+
+# The offsets of the fields updated when a syscall returns
+_FLAGS_OFFSET = 8
+_RETURN_OFFSET = TRACE_RECORD.size - 8
+
+
+class SyscallRecorder:
+    """Appends a fixed-size record for every syscall executed by the target process to a ring buffer.
+
+    The ring buffer is either a file mapped in memory or a writable buffer provided by the user. The records are
+    decoded by `libdebug.tools.syscall_trace`.
+
+    Attributes:
+        capacity (int): The number of records the ring buffer holds. Older records are overwritten when exceeded.
+        count (int): The number of records written so far.
+    """
+
+    def __init__(self: SyscallRecorder, output: str | Path | bytearray | memoryview | mmap.mmap, capacity: int) -> None:
+        """Initializes the recorder.
+
+        Args:
+            output (str | Path | bytearray | memoryview | mmap.mmap): The file to create, or the buffer to fill.
+            capacity (int): The number of records the file holds. It is ignored for buffers, which hold as many
+            records as fit.
+        """
+        self._mapped = isinstance(output, str | Path)
+
+        if self._mapped:
+            if capacity <= 0:
+                raise ValueError("The capacity must be positive.")
+
+            # The mapping keeps its own reference to the file
+            with Path(output).open("w+b") as file:
+                file.truncate(TRACE_HEADER.size + capacity * TRACE_RECORD.size)
+                self._buffer = mmap.mmap(file.fileno(), 0)
+        else:
+            self._buffer = memoryview(output).cast("B")
+
+            if self._buffer.readonly:
+                raise ValueError("The buffer must be writable.")
+
+            capacity = (len(self._buffer) - TRACE_HEADER.size) // TRACE_RECORD.size
+
+            if capacity <= 0:
+                raise ValueError("The buffer is too small to hold a record.")
+
+        self.capacity = capacity
+        self.count = 0
+
+        # The sequence numbers of the records of the syscalls each thread is inside of
+        self._pending: dict[int, int] = {}
+
+        self._write_header()
+
+    def _write_header(self: SyscallRecorder) -> None:
+        TRACE_HEADER.pack_into(
+            self._buffer,
+            0,
+            TRACE_MAGIC,
+            TRACE_VERSION,
+            TRACE_RECORD.size,
+            self.capacity,
+            self.count,
+        )
+
+    def _offset(self: SyscallRecorder, sequence: int) -> int:
+        return TRACE_HEADER.size + (sequence % self.capacity) * TRACE_RECORD.size
+
+    def record(self: SyscallRecorder, thread: ThreadContext, entering: bool | None) -> None:
+        """Records a syscall stop of a thread.
+
+        Args:
+            thread (ThreadContext): The thread stopped at the syscall.
+            entering (bool | None): Whether the thread is entering the syscall, or None if the kernel cannot tell.
+        """
+        thread_id = thread.thread_id
+
+        if entering is None:
+            entering = thread_id not in self._pending
+
+        if entering:
+            TRACE_RECORD.pack_into(
+                self._buffer,
+                self._offset(self.count),
+                thread_id,
+                thread.syscall_number & 0xFFFFFFFF,
+                0,
+                0,
+                time.time_ns(),
+                thread.syscall_arg0,
+                thread.syscall_arg1,
+                thread.syscall_arg2,
+                thread.syscall_arg3,
+                thread.syscall_arg4,
+                thread.syscall_arg5,
+                0,
+            )
+            self._pending[thread_id] = self.count
+            self.count += 1
+            self._write_header()
+            return
+
+        sequence = self._pending.pop(thread_id, None)
+
+        # The record might have been overwritten already
+        if sequence is None or self.count - sequence > self.capacity:
+            return
+
+        offset = self._offset(sequence)
+        struct.pack_into("<I", self._buffer, offset + _FLAGS_OFFSET, RECORD_RETURNED)
+        struct.pack_into("<Q", self._buffer, offset + _RETURN_OFFSET, thread.syscall_return & 0xFFFFFFFFFFFFFFFF)
+
+    def close(self: SyscallRecorder) -> None:
+        """Stops recording, and writes the file to disk."""
+        if self._mapped:
+            self._buffer.flush()
+            self._buffer.close()
+        else:
+            self._buffer.release()
@@ -0,0 +1,49 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Tracepoint:
+    """A tracepoint in the target process, which records registers without stopping the process.
+
+    Attributes:
+        address (int): The address of the tracepoint in the target process.
+        symbol (str): The symbol, if available, of the tracepoint in the target process.
+        registers (list[str]): The recorded registers.
+        capacity (int): The number of records the target process can hold between two stops.
+        records (list[tuple[int, ...]]): The values of the registers at each hit, in the order of `registers`. It is
+        updated every time the process stops.
+        dropped (int): The number of hits whose records were overwritten before the process stopped.
+        enabled (bool): Whether the tracepoint is installed. It is removed when its instructions are overwritten.
+    """
+
+    address: int
+    symbol: str
+    registers: list[str]
+    capacity: int
+    records: list[tuple[int, ...]] = field(default_factory=list)
+    dropped: int = 0
+    enabled: bool = True
+
+    # The ring buffer in the target process, and the number of records already read from it
+    _ring: int = 0
+    _tail: int = 0
+
+    # The instructions replaced by the jump to the trampoline
+    _original: bytes = b""
+
+    def values(self: Tracepoint, register: str) -> list[int]:
+        """Returns the recorded values of a register, one for each hit."""
+        index = self.registers.index(register)
+        return [record[index] for record in self.records]
+
+    def __hash__(self: Tracepoint) -> int:
+        """Hash the tracepoint by its address, so that it can be used in sets and maps correctly."""
+        return hash(self.address)
@@ -0,0 +1,193 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING
+
+from libdebug.libdebug import debugger
+from libdebug.liblog import liblog
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    from libdebug.debugger.debugger import Debugger
+    from libdebug.utils.pipe_manager import PipeManager
+
+POOL_TERMINATE = None
+
+
+class DebuggeePool:
+    """A pool of processes started ahead of time, each already stopped at the entry point or at a chosen location.
+
+    Processes are handed out by `run` and given back with `release`, which restarts them in a background thread.
+    """
+
+    argv: list[str]
+    """The command line arguments of the debugged processes."""
+
+    size: int
+    """The number of processes kept in the pool."""
+
+    position: int | str | None
+    """The location the processes are continued to before being handed out, if any."""
+
+    file: str
+    """The backing file used to resolve the location."""
+
+    _debuggers: list[Debugger]
+    """The debuggers owned by the pool."""
+
+    _handed_out: set[Debugger]
+    """The debuggers handed out by `run` and not released yet."""
+
+    _ready: Queue
+    """The queue of the processes ready to be handed out."""
+
+    _to_refill: Queue
+    """The queue of the debuggers whose process must be restarted."""
+
+    _refill_thread: Thread | None
+    """The background thread that restarts the processes."""
+
+    def __init__(
+        self: DebuggeePool,
+        argv: str | list[str],
+        size: int = 4,
+        position: int | str | None = None,
+        file: str = "hybrid",
+        **kwargs: ...,
+    ) -> None:
+        """Initializes the pool and starts spawning its processes in the background.
+
+        Args:
+            argv (str | list[str]): The location of the binary to debug, and any additional arguments to pass to it.
+            size (int, optional): The number of processes kept in the pool. Defaults to 4.
+            position (int | str, optional): The location the processes are continued to before being handed out.
+            Defaults to None, which leaves them at the entry point.
+            file (str, optional): The user-defined backing file to resolve the location in. Defaults to "hybrid".
+            **kwargs: Any other argument accepted by `debugger`.
+        """
+        if size < 1:
+            raise ValueError("The pool must hold at least one process.")
+
+        self.argv = [argv] if isinstance(argv, str) else argv
+        self.size = size
+        self.position = position
+        self.file = file
+
+        self._handed_out = set()
+        self._ready = Queue()
+        self._to_refill = Queue()
+        self._debuggers = [debugger(self.argv, **kwargs) for _ in range(size)]
+
+        for d in self._debuggers:
+            self._to_refill.put(d)
+
+        self._refill_thread = Thread(
+            target=self._refill_thread_function,
+            name="libdebug__pool_refill_thread",
+            daemon=True,
+        )
+        self._refill_thread.start()
+
+    def run(self: DebuggeePool) -> tuple[Debugger, PipeManager]:
+        """Hands out a process of the pool, waiting for one to be ready if needed.
+
+        Returns:
+            tuple[Debugger, PipeManager]: The debugger of the process and the pipe manager to interact with it.
+        """
+        if self._refill_thread is None:
+            raise RuntimeError("The pool has been closed.")
+
+        d, value = self._ready.get()
+
+        if isinstance(value, BaseException):
+            # The debugger can be used again for the next attempt
+            self._to_refill.put(d)
+            raise value
+
+        self._handed_out.add(d)
+        return d, value
+
+    def release(self: DebuggeePool, d: Debugger) -> None:
+        """Gives a process back to the pool, which kills it and starts a new one in its place.
+
+        Args:
+            d (Debugger): The debugger handed out by `run`.
+        """
+        if d not in self._debuggers:
+            raise ValueError("The debugger does not belong to this pool.")
+
+        if d not in self._handed_out:
+            raise ValueError("The debugger has already been released.")
+
+        self._handed_out.remove(d)
+        self._to_refill.put(d)
+
+    def close(self: DebuggeePool) -> None:
+        """Kills every process of the pool and terminates the debuggers.
+
+        The pool cannot be used after this method is called.
+        """
+        if self._refill_thread is None:
+            return
+
+        self._to_refill.put(POOL_TERMINATE)
+        self._refill_thread.join()
+        self._refill_thread = None
+
+        for d in self._debuggers:
+            if d._internal_debugger.instanced:
+                d.kill()
+            d.terminate()
+
+    def __enter__(self: DebuggeePool) -> Self:
+        """Returns the pool itself."""
+        return self
+
+    def __exit__(self: DebuggeePool, *_: object) -> None:
+        """Closes the pool."""
+        self.close()
+
+    def _refill_thread_function(self: DebuggeePool) -> None:
+        """This function is run in a thread. It restarts the processes given back to the pool."""
+        while True:
+            d = self._to_refill.get()
+
+            if d is POOL_TERMINATE:
+                return
+
+            try:
+                pipe_manager = self._start(d)
+            except (OSError, RuntimeError, ValueError) as e:
+                # The process could not be spawned, or the location could not be resolved or reached
+                liblog.debugger("Failed to start a process of the pool: %r", e)
+                self._ready.put((d, e))
+            else:
+                self._ready.put((d, pipe_manager))
+
+    def _start(self: DebuggeePool, d: Debugger) -> PipeManager:
+        """Starts the process of a debugger and continues it to the chosen location."""
+        if d._internal_debugger.instanced:
+            d.kill()
+
+        pipe_manager = d.run()
+
+        if self.position is not None:
+            bp = d.breakpoint(self.position, file=self.file)
+
+            d.cont()
+            d.wait()
+
+            if d.threads[0].dead or d.threads[0].instruction_pointer != bp.address:
+                raise RuntimeError(f"The process did not stop at {self.position}.")
+
+            bp.disable()
+
+        return pipe_manager
@@ -19,12 +19,17 @@ from libdebug.utils.syscall_utils import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
 
     from libdebug.data.breakpoint import Breakpoint
+    from libdebug.data.checkpoint import Checkpoint
+    from libdebug.data.coverage import Coverage
     from libdebug.data.memory_map import MemoryMap
+    from libdebug.data.memory_snapshot import MemorySnapshot
     from libdebug.data.signal_catcher import SignalCatcher
     from libdebug.data.syscall_handler import SyscallHandler
+    from libdebug.data.tracepoint import Tracepoint
     from libdebug.debugger.internal_debugger import InternalDebugger
     from libdebug.state.thread_context import ThreadContext
 
@@ -90,6 +95,72 @@ class Debugger:
         """Prints the memory maps of the process."""
         self._internal_debugger.print_maps()
 
+    def snapshot(self: Debugger, base: MemorySnapshot | None = None) -> MemorySnapshot:
+        """Takes a snapshot of the writable memory of the process.
+
+        When the kernel supports soft-dirty page tracking, only the pages written since the base snapshot are read.
+
+        Args:
+            base (MemorySnapshot, optional): A previous snapshot whose unchanged pages can be reused. Defaults to the
+            last snapshot taken.
+
+        Returns:
+            MemorySnapshot: The snapshot of the writable memory of the process.
+        """
+        return self._internal_debugger.snapshot(base)
+
+    def diff(self: Debugger, snapshot: MemorySnapshot) -> list[tuple[int, int]]:
+        """Returns the memory ranges whose content changed since the snapshot was taken.
+
+        Args:
+            snapshot (MemorySnapshot): The snapshot to compare the current memory with.
+
+        Returns:
+            list[tuple[int, int]]: The sorted list of the changed ranges, as (start, end) tuples.
+        """
+        return self._internal_debugger.diff(snapshot)
+
+    @contextmanager
+    def fork_at(self: Debugger, position: int | str, file: str = "hybrid") -> Iterator[Debugger]:
+        """A context manager that forks the process at the specified location, for running a trial on the child.
+
+        The process is continued until it reaches the location, if it is not already there, and then stays stopped
+        there. Each call forks a new copy-on-write child from that state, which is killed when the context exits.
+
+        Args:
+            position (int | str): The location where the process is forked.
+            file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
+            (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
+            the "binary" map file).
+
+        Yields:
+            Debugger: The debugger attached to the child process.
+        """
+        child = self._internal_debugger.fork_at(position, file)
+        try:
+            yield child
+        finally:
+            self._internal_debugger.release_fork(child)
+
+    def checkpoint(self: Debugger) -> Checkpoint:
+        """Saves the state of the process, so that it can be restored later without restarting it.
+
+        The checkpoint holds the registers of every thread, the content of the writable memory, the program break and
+        the file offsets of the process.
+
+        Returns:
+            Checkpoint: The checkpoint of the process.
+        """
+        return self._internal_debugger.checkpoint()
+
+    def restore(self: Debugger, checkpoint: Checkpoint) -> None:
+        """Restores the process to the state saved in a checkpoint.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to restore.
+        """
+        self._internal_debugger.restore(checkpoint)
+
     def breakpoint(
         self: Debugger,
         position: int | str,
@@ -98,6 +169,8 @@ class Debugger:
         length: int = 1,
         callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
         file: str = "hybrid",
+        counting: bool = False,
+        when: str | None = None,
     ) -> Breakpoint:
         """Sets a breakpoint at the specified location.
 
@@ -105,15 +178,55 @@ class Debugger:
             position (int | bytes): The location of the breakpoint.
             hardware (bool, optional): Whether the breakpoint should be hardware-assisted or purely software.
             Defaults to False.
-            condition (str, optional): The trigger condition for the breakpoint. Defaults to None.
+            condition (str, optional): The trigger condition for the breakpoint. A software breakpoint with the "w" or
+            "rw" condition is a watchpoint implemented by protecting the memory pages it covers. Defaults to None.
             length (int, optional): The length of the breakpoint. Only for watchpoints. Defaults to 1.
             callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when the
             breakpoint is hit. Defaults to None.
             file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
             (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
             the "binary" map file).
+            counting (bool, optional): Whether the breakpoint only counts its hits, without ever stopping the process.
+            Only for software breakpoints. Defaults to False.
+            when (str, optional): A condition on the registers and the memory of the thread, such as
+            `rax == 0x1337 and [rdi + 8] > 5`, evaluated by the debugging backend. Only the hits where the condition
+            holds are reported. Only for software breakpoints. Defaults to None.
         """
-        return self._internal_debugger.breakpoint(position, hardware, condition, length, callback, file)
+        return self._internal_debugger.breakpoint(
+            position,
+            hardware,
+            condition,
+            length,
+            callback,
+            file,
+            counting,
+            when,
+        )
+
+    def breakpoints_bulk(
+        self: Debugger,
+        positions: list[int | str],
+        callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
+        file: str = "hybrid",
+    ) -> list[Breakpoint]:
+        """Sets a software breakpoint at each of the specified locations at once.
+
+        The locations are resolved against a single snapshot of the memory maps, and the breakpoints are installed
+        by the debugging backend in one pass, which is much faster than setting them one at a time.
+
+        Args:
+            positions (list[int | str]): The locations of the breakpoints.
+            callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when any of the
+            breakpoints is hit. Defaults to None.
+            file (str, optional): The user-defined backing file to resolve the addresses in. Defaults to "hybrid"
+            (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
+            the "binary" map file).
+
+        Returns:
+            list[Breakpoint]: The breakpoints, in the same order as the positions. The existing breakpoint is returned
+            for a location that already holds one.
+        """
+        return self._internal_debugger.breakpoints_bulk(positions, callback, file)
 
     def watchpoint(
         self: Debugger,
@@ -122,6 +235,7 @@ class Debugger:
         length: int = 1,
         callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
         file: str = "hybrid",
+        hardware: bool = True,
     ) -> Breakpoint:
         """Sets a watchpoint at the specified location. Internally, watchpoints are implemented as breakpoints.
 
@@ -129,22 +243,69 @@ class Debugger:
             position (int | bytes): The location of the breakpoint.
             condition (str, optional): The trigger condition for the watchpoint (either "w", "rw" or "x").
             Defaults to "w".
-            length (int, optional): The size of the word in being watched (1, 2, 4 or 8). Defaults to 1.
+            length (int, optional): The size of the word in being watched (1, 2, 4 or 8 for hardware watchpoints).
+            Defaults to 1.
             callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when the
             watchpoint is hit. Defaults to None.
             file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
             (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
             the "binary" map file).
+            hardware (bool, optional): Whether the watchpoint should use a debug register. Otherwise, the memory pages
+            holding the watched range are protected, which supports any number of watchpoints of any length, but only
+            the "w" and "rw" conditions. Defaults to True.
         """
         return self._internal_debugger.breakpoint(
             position,
-            hardware=True,
+            hardware=hardware,
             condition=condition,
             length=length,
             callback=callback,
             file=file,
         )
 
+    def coverage(self: Debugger, target: list[int] | str | MemoryMap, file: str = "hybrid") -> Coverage:
+        """Installs one-shot software breakpoints that record which addresses are reached, without stopping the process.
+
+        Each breakpoint is removed by the debugging backend the first time it is hit.
+
+        Args:
+            target (list[int] | str | MemoryMap): The addresses to cover, the name of a function or an executable
+            memory map. Functions and memory maps are covered at the start of each of their basic blocks.
+            file (str, optional): The user-defined backing file to resolve the addresses or the function in. Defaults
+            to "hybrid" (libdebug will first try to solve the address as an absolute address, then as a relative
+            address w.r.t. the "binary" map file).
+
+        Returns:
+            Coverage: The covered addresses, along with the bitmap of the reached ones.
+        """
+        return self._internal_debugger.coverage(target, file)
+
+    def tracepoint(
+        self: Debugger,
+        position: int | str,
+        registers: list[str],
+        capacity: int = 65536,
+        file: str = "hybrid",
+    ) -> Tracepoint:
+        """Sets a tracepoint, which records the registers at every hit without stopping the process.
+
+        The first instructions at the location are replaced by a jump to a trampoline in the process, which appends
+        the registers to a ring buffer and then executes the original instructions.
+
+        Args:
+            position (int | str): The location of the tracepoint.
+            registers (list[str]): The general purpose registers to record, along with `rip` and `eflags`.
+            capacity (int, optional): The number of records the process can hold between two stops, a power of two.
+            Older records are dropped when it is exceeded. Defaults to 65536.
+            file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
+            (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
+            the "binary" map file).
+
+        Returns:
+            Tracepoint: The tracepoint, whose records are updated every time the process stops.
+        """
+        return self._internal_debugger.tracepoint(position, registers, capacity, file)
+
     def catch_signal(
         self: Debugger,
         signal: int | str,
@@ -190,6 +351,7 @@ class Debugger:
         on_enter: Callable[[ThreadContext, SyscallHandler], None] | None = None,
         on_exit: Callable[[ThreadContext, SyscallHandler], None] | None = None,
         recursive: bool = False,
+        observe: bool = False,
     ) -> SyscallHandler:
         """Handle a syscall in the target process.
 
@@ -201,11 +363,13 @@ class Debugger:
             syscall is exited. Defaults to None.
             recursive (bool, optional): Whether, when the syscall is hijacked with another one, the syscall handler
             associated with the new syscall should be considered as well. Defaults to False.
+            observe (bool, optional): Whether the callbacks run while the other threads keep running. Only the
+            registers of the thread that executes the syscall are valid in the callbacks. Defaults to False.
 
         Returns:
             HandledSyscall: The HandledSyscall object.
         """
-        return self._internal_debugger.handle_syscall(syscall, on_enter, on_exit, recursive)
+        return self._internal_debugger.handle_syscall(syscall, on_enter, on_exit, recursive, observe)
 
     def hijack_syscall(
         self: Debugger,
@@ -228,6 +392,47 @@ class Debugger:
         """
         return self._internal_debugger.hijack_syscall(original_syscall, new_syscall, recursive, **kwargs)
 
+    def rewrite_syscall(
+        self: Debugger,
+        syscall: int | str,
+        new_syscall: int | str | None = None,
+        syscall_return: int | None = None,
+        **kwargs: int,
+    ) -> SyscallHandler:
+        """Rewrites a syscall in the target process, without stopping it.
+
+        The syscall is rewritten by the backend at its entry, unless another handler or the pretty print has to see it.
+
+        Args:
+            syscall (int | str): The syscall name or number to rewrite.
+            new_syscall (int | str, optional): The syscall name or number to execute in place of the syscall.
+            Defaults to None.
+            syscall_return (int, optional): The value the syscall returns without being executed. Defaults to None.
+            **kwargs: (int, optional): The arguments to pass to the syscall.
+
+        Returns:
+            HandledSyscall: The HandledSyscall object.
+        """
+        return self._internal_debugger.rewrite_syscall(syscall, new_syscall, syscall_return, **kwargs)
+
+    def record_syscalls(
+        self: Debugger,
+        output: str | Path | bytearray | memoryview | None,
+        capacity: int = 65536,
+    ) -> None:
+        """Records every syscall executed by the process in a binary trace, or stops recording.
+
+        Each syscall is stored as a fixed-size record, with its thread, number, arguments, return value and timestamp.
+        The trace is read with `libdebug.tools.syscall_trace.SyscallTrace`.
+
+        Args:
+            output (str | Path | bytearray | memoryview | None): The file to create, or the writable buffer to fill
+            with the records. None stops recording, and writes the file to disk.
+            capacity (int, optional): The number of records the file holds. Older records are overwritten when it is
+            exceeded. Buffers hold as many records as fit. Defaults to 65536.
+        """
+        self._internal_debugger.record_syscalls(output, capacity)
+
     def gdb(self: Debugger, open_in_new_process: bool = True) -> None:
         """Migrates the current debugging session to GDB."""
         self._internal_debugger.gdb(open_in_new_process)
@@ -268,6 +473,8 @@ class Debugger:
         length: int = 1,
         callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
         file: str = "hybrid",
+        counting: bool = False,
+        when: str | None = None,
     ) -> Breakpoint:
         """Alias for the `breakpoint` method.
 
@@ -275,15 +482,30 @@ class Debugger:
             position (int | bytes): The location of the breakpoint.
             hardware (bool, optional): Whether the breakpoint should be hardware-assisted or purely software.
             Defaults to False.
-            condition (str, optional): The trigger condition for the breakpoint. Defaults to None.
+            condition (str, optional): The trigger condition for the breakpoint. A software breakpoint with the "w" or
+            "rw" condition is a watchpoint implemented by protecting the memory pages it covers. Defaults to None.
             length (int, optional): The length of the breakpoint. Only for watchpoints. Defaults to 1.
             callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when the
             breakpoint is hit. Defaults to None.
             file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
             (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
             the "binary" map file).
+            counting (bool, optional): Whether the breakpoint only counts its hits, without ever stopping the process.
+            Only for software breakpoints. Defaults to False.
+            when (str, optional): A condition on the registers and the memory of the thread, such as
+            `rax == 0x1337 and [rdi + 8] > 5`, evaluated by the debugging backend. Only the hits where the condition
+            holds are reported. Only for software breakpoints. Defaults to None.
         """
-        return self._internal_debugger.breakpoint(position, hardware, condition, length, callback, file)
+        return self._internal_debugger.breakpoint(
+            position,
+            hardware,
+            condition,
+            length,
+            callback,
+            file,
+            counting,
+            when,
+        )
 
     def wp(
         self: Debugger,
@@ -292,6 +514,7 @@ class Debugger:
         length: int = 1,
         callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
         file: str = "hybrid",
+        hardware: bool = True,
     ) -> Breakpoint:
         """Alias for the `watchpoint` method.
 
@@ -301,16 +524,20 @@ class Debugger:
             position (int | bytes): The location of the breakpoint.
             condition (str, optional): The trigger condition for the watchpoint (either "w", "rw" or "x").
             Defaults to "w".
-            length (int, optional): The size of the word in being watched (1, 2, 4 or 8). Defaults to 1.
+            length (int, optional): The size of the word in being watched (1, 2, 4 or 8 for hardware watchpoints).
+            Defaults to 1.
             callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when the
             watchpoint is hit. Defaults to None.
             file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
             (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
             the "binary" map file).
+            hardware (bool, optional): Whether the watchpoint should use a debug register. Otherwise, the memory pages
+            holding the watched range are protected, which supports any number of watchpoints of any length, but only
+            the "w" and "rw" conditions. Defaults to True.
         """
         return self._internal_debugger.breakpoint(
             position,
-            hardware=True,
+            hardware=hardware,
             condition=condition,
             length=length,
             callback=callback,
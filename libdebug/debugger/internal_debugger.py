@@ -10,6 +10,7 @@ from __future__ import annotations
 import functools
 import os
 import signal
+import weakref
 from pathlib import Path
 from queue import Queue
 from signal import SIGKILL, SIGSTOP, SIGTRAP
@@ -23,9 +24,16 @@ from libdebug.architectures.syscall_hijacking_provider import syscall_hijacking_
 from libdebug.builtin.antidebug_syscall_handler import on_enter_ptrace, on_exit_ptrace
 from libdebug.builtin.pretty_print_syscall_handler import pprint_on_enter, pprint_on_exit
 from libdebug.data.breakpoint import Breakpoint
+from libdebug.data.checkpoint import Checkpoint
+from libdebug.data.coverage import Coverage
+from libdebug.data.memory_map import MemoryMap
+from libdebug.data.memory_snapshot import MemorySnapshot
 from libdebug.data.memory_view import MemoryView
 from libdebug.data.signal_catcher import SignalCatcher
 from libdebug.data.syscall_handler import SyscallHandler
+from libdebug.data.syscall_recorder import SyscallRecorder
+from libdebug.data.tracepoint import Tracepoint
+from libdebug.debugger.debugger import Debugger
 from libdebug.debugger.internal_debugger_instance_manager import (
     extend_internal_debugger,
     link_to_internal_debugger,
@@ -38,13 +46,21 @@ from libdebug.utils.debugger_wrappers import (
     change_state_function_process,
     change_state_function_thread,
 )
+from libdebug.utils.coverage_utils import find_basic_blocks
 from libdebug.utils.debugging_utils import (
     check_absolute_address,
     normalize_and_validate_address,
     resolve_symbol_in_maps,
+    resolve_symbol_range_in_maps,
 )
 from libdebug.utils.libcontext import libcontext
 from libdebug.utils.print_style import PrintStyle
+from libdebug.utils.process_utils import (
+    clear_soft_dirty_bits,
+    get_file_offsets,
+    get_soft_dirty_pages,
+    is_soft_dirty_supported,
+)
 from libdebug.utils.signal_utils import (
     resolve_signal_name,
     resolve_signal_number,
@@ -54,17 +70,18 @@ from libdebug.utils.syscall_utils import (
     resolve_syscall_name,
     resolve_syscall_number,
 )
+from libdebug.utils.tracepoint_utils import MAX_TRACEPOINT_CAPACITY
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from libdebug.data.memory_map import MemoryMap
     from libdebug.interfaces.debugging_interface import DebuggingInterface
     from libdebug.state.thread_context import ThreadContext
     from libdebug.utils.pipe_manager import PipeManager
 
 THREAD_TERMINATE = -1
 GDB_GOBACK_LOCATION = str((Path(__file__).parent / "utils" / "gdb.py").resolve())
+SNAPSHOT_CHUNK_SIZE = 0x1000000
 
 
 class InternalDebugger:
@@ -82,6 +99,9 @@ class InternalDebugger:
     escape_antidebug: bool
     """A flag that indicates if the debugger should escape anti-debugging techniques."""
 
+    syscall_filter: bool
+    """A flag that indicates if the handled syscalls should be reported by a seccomp filter."""
+
     autoreach_entrypoint: bool
     """A flag that indicates if the debugger should automatically reach the entry point of the debugged process."""
 
@@ -109,6 +129,9 @@ class InternalDebugger:
     syscalls_to_not_pprint: list[int] | None
     """The syscalls to not pretty print."""
 
+    syscall_recorder: SyscallRecorder | None
+    """The recorder of the syscalls executed by the process, if they are recorded."""
+
     threads: list[ThreadContext]
     """A list of all the threads of the debugged process."""
 
@@ -145,6 +168,15 @@ class InternalDebugger:
     _is_running: bool
     """The overall state of the debugged process. True if the process is running, False otherwise."""
 
+    _soft_dirty_epoch: int
+    """The number of times the soft-dirty bits of the process have been cleared."""
+
+    _last_snapshot: weakref.ref[MemorySnapshot] | None
+    """A weak reference to the last memory snapshot taken, reused by the next one."""
+
+    _fork_children: list[Debugger]
+    """The debuggers of the children created by `fork_at` that have been released, reused by the next forks."""
+
     def __init__(self: InternalDebugger) -> None:
         """Initialize the context."""
         # These must be reinitialized on every call to "debugger"
@@ -153,11 +185,13 @@ class InternalDebugger:
         self.argv = []
         self.env = {}
         self.escape_antidebug = False
+        self.syscall_filter = False
         self.breakpoints = {}
         self.handled_syscalls = {}
         self.caught_signals = {}
         self.syscalls_to_pprint = None
         self.syscalls_to_not_pprint = None
+        self.syscall_recorder = None
         self.signals_to_block = []
         self.pprint_syscalls = False
         self.pipe_manager = None
@@ -166,6 +200,9 @@ class InternalDebugger:
         self.instanced = False
         self._is_running = False
         self.resume_context = ResumeContext()
+        self._soft_dirty_epoch = 0
+        self._last_snapshot = None
+        self._fork_children = []
         self.__polling_thread_command_queue = Queue()
         self.__polling_thread_response_queue = Queue()
 
@@ -177,6 +214,9 @@ class InternalDebugger:
         self.caught_signals.clear()
         self.syscalls_to_pprint = None
         self.syscalls_to_not_pprint = None
+        if self.syscall_recorder is not None:
+            self.syscall_recorder.close()
+            self.syscall_recorder = None
         self.signals_to_block.clear()
         self.pprint_syscalls = False
         self.pipe_manager = None
@@ -184,6 +224,7 @@ class InternalDebugger:
         self.threads.clear()
         self.instanced = False
         self._is_running = False
+        self._last_snapshot = None
         self.resume_context.clear()
 
     def start_up(self: InternalDebugger) -> None:
@@ -195,7 +236,16 @@ class InternalDebugger:
         self.start_processing_thread()
         with extend_internal_debugger(self):
             self.debugging_interface = provide_debugging_interface()
-            self.memory = MemoryView(self._peek_memory, self._poke_memory)
+            self.memory = MemoryView(
+                self._peek_memory,
+                self._poke_memory,
+                bulk_getter=self._read_memory,
+                bulk_setter=self._write_memory,
+                buffer_getter=self._read_memory_into,
+                vector_getter=self._read_memory_many,
+                vector_setter=self._write_memory_many,
+                follow_getter=self._follow_pointers,
+            )
 
     def start_processing_thread(self: InternalDebugger) -> None:
         """Starts the thread that will poll the traced process for state change."""
@@ -302,6 +352,11 @@ class InternalDebugger:
         The debugger object cannot be used after this method is called.
         This method should only be called to free up resources when the debugger object is no longer needed.
         """
+        for child in self._fork_children:
+            child.terminate()
+
+        self._fork_children.clear()
+
         if self.__polling_thread is not None:
             self.__polling_thread_command_queue.put((THREAD_TERMINATE, ()))
             self.__polling_thread.join()
@@ -376,6 +431,317 @@ class InternalDebugger:
             else:
                 print(memory_map)
 
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def snapshot(self: InternalDebugger, base: MemorySnapshot | None = None) -> MemorySnapshot:
+        """Takes a snapshot of the writable memory of the process.
+
+        Args:
+            base (MemorySnapshot, optional): A previous snapshot whose unchanged pages can be reused. Defaults to the
+            last snapshot taken.
+
+        Returns:
+            MemorySnapshot: The snapshot of the writable memory of the process.
+        """
+        if base is None and self._last_snapshot is not None:
+            base = self._last_snapshot()
+
+        snapshot = self._capture_memory(base)
+
+        # From now on, only the pages written by the process will be flagged as dirty
+        if clear_soft_dirty_bits(self.process_id):
+            self._soft_dirty_epoch += 1
+            snapshot._epoch = self._soft_dirty_epoch
+
+        self._last_snapshot = weakref.ref(snapshot)
+
+        return snapshot
+
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def diff(self: InternalDebugger, snapshot: MemorySnapshot) -> list[tuple[int, int]]:
+        """Returns the memory ranges whose content changed since the snapshot was taken.
+
+        Args:
+            snapshot (MemorySnapshot): The snapshot to compare the current memory with.
+
+        Returns:
+            list[tuple[int, int]]: The sorted list of the changed ranges, as (start, end) tuples.
+        """
+        return snapshot.diff(self._capture_memory(snapshot))
+
+    def _capture_memory(self: InternalDebugger, base: MemorySnapshot | None) -> MemorySnapshot:
+        """Reads the writable memory of the process, reusing the pages of the base snapshot that are still clean."""
+        page_size = self.memory.page_size
+        maps = [vmap for vmap in self.debugging_interface.maps() if "w" in vmap.permissions]
+
+        # Pages of the base snapshot can be reused only if no one cleared the soft-dirty bits after it was taken
+        reuse = (
+            base is not None
+            and base.process_id == self.process_id
+            and base._epoch is not None
+            and base._epoch == self._soft_dirty_epoch
+            and is_soft_dirty_supported()
+        )
+
+        pages = {}
+        unique_pages = {}
+
+        for vmap in maps:
+            to_read = range(vmap.start, vmap.end, page_size)
+
+            if reuse:
+                try:
+                    dirty = set(get_soft_dirty_pages(self.process_id, vmap.start, vmap.end, page_size))
+                except OSError:
+                    liblog.debugger("Cannot read the soft-dirty bits of %s, reading it entirely.", vmap.backing_file)
+                else:
+                    to_read = []
+                    for page in range(vmap.start, vmap.end, page_size):
+                        if page in dirty or page not in base.pages:
+                            to_read.append(page)
+                        else:
+                            pages[page] = base.pages[page]
+
+            for address, data in self._read_pages(to_read, page_size):
+                for offset in range(0, len(data), page_size):
+                    content = data[offset : offset + page_size]
+                    # Identical pages, such as zero-filled ones, are stored only once
+                    pages[address + offset] = unique_pages.setdefault(content, content)
+
+        return MemorySnapshot(self.process_id, maps, pages, page_size)
+
+    def _read_pages(self: InternalDebugger, pages: range | list[int], page_size: int) -> list[tuple[int, bytes]]:
+        """Reads the given pages, merging the consecutive ones in larger ranges."""
+        regions = []
+
+        for page in pages:
+            if regions and regions[-1][0] + regions[-1][1] == page and regions[-1][1] < SNAPSHOT_CHUNK_SIZE:
+                regions[-1] = (regions[-1][0], regions[-1][1] + page_size)
+            else:
+                regions.append((page, page_size))
+
+        result = []
+        batch = []
+        batch_size = 0
+
+        for index, region in enumerate(regions):
+            batch.append(region)
+            batch_size += region[1]
+
+            if batch_size < SNAPSHOT_CHUNK_SIZE and index != len(regions) - 1:
+                continue
+
+            try:
+                data = self._read_memory_many(batch)
+            except OSError:
+                # Some of the ranges are not readable, we read them one by one to skip only those
+                for address, size in batch:
+                    try:
+                        result.append((address, self._read_memory(address, size)))
+                    except OSError:
+                        liblog.debugger("Cannot read memory at %#x, skipping it.", address)
+            else:
+                offset = 0
+                for address, size in batch:
+                    result.append((address, data[offset : offset + size]))
+                    offset += size
+
+            batch = []
+            batch_size = 0
+
+        return result
+
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def checkpoint(self: InternalDebugger) -> Checkpoint:
+        """Saves the state of the process, so that it can be restored later without restarting it.
+
+        Returns:
+            Checkpoint: The checkpoint of the process.
+        """
+        program_break = self._inject_syscall(self.threads[0], resolve_syscall_number("brk"), 0)
+
+        return Checkpoint(
+            memory=self.snapshot(),
+            maps=self.debugging_interface.maps(),
+            registers=self.debugging_interface.get_registers(),
+            file_offsets=get_file_offsets(self.process_id),
+            program_break=program_break,
+        )
+
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def restore(self: InternalDebugger, checkpoint: Checkpoint) -> None:
+        """Restores the process to the state saved in a checkpoint.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint to restore.
+        """
+        if checkpoint.process_id != self.process_id:
+            raise ValueError("The checkpoint was taken from a different process.")
+
+        thread = self.threads[0]
+
+        # The heap is resized first, so that all the pages of the checkpoint are mapped
+        brk_number = resolve_syscall_number("brk")
+        if self._inject_syscall(thread, brk_number, 0) != checkpoint.program_break:
+            self._inject_syscall(thread, brk_number, checkpoint.program_break)
+
+        # Anonymous memory mapped after the checkpoint was taken is released, unless the debugger relies on it
+        munmap_number = resolve_syscall_number("munmap")
+        owned = self.debugging_interface.owned_memory()
+        for vmap in self.debugging_interface.maps():
+            if (
+                vmap.backing_file.startswith("anon_")
+                and not any(vmap.start < saved.end and saved.start < vmap.end for saved in checkpoint.maps)
+                and not any(vmap.start < end and start < vmap.end for start, end in owned)
+            ):
+                self._inject_syscall(thread, munmap_number, vmap.start, vmap.size)
+
+        # Only the pages that differ from the checkpoint are written back
+        # When soft-dirty tracking is available, only the dirty pages are read to find them
+        current = self._capture_memory(checkpoint.memory)
+        regions = []
+        lost_pages = 0
+
+        for address in sorted(checkpoint.memory.pages):
+            content = checkpoint.memory.pages[address]
+            current_content = current.pages.get(address)
+
+            if current_content is None:
+                lost_pages += 1
+            elif current_content is not content and current_content != content:
+                if regions and regions[-1][0] + len(regions[-1][1]) == address:
+                    regions[-1] = (regions[-1][0], regions[-1][1] + content)
+                else:
+                    regions.append((address, content))
+
+        if lost_pages:
+            liblog.warning(f"{lost_pages} pages of the checkpoint are no longer mapped and cannot be restored.")
+
+        if regions:
+            self._write_memory_many(regions)
+            self.memory.invalidate_cache()
+
+        offsets = get_file_offsets(self.process_id)
+        lseek_number = resolve_syscall_number("lseek")
+        for fd, offset in checkpoint.file_offsets.items():
+            if fd in offsets and offsets[fd] != offset:
+                self._inject_syscall(thread, lseek_number, fd, offset, os.SEEK_SET)
+
+        if any(t.thread_id not in checkpoint.registers for t in self.threads if not t.dead):
+            liblog.warning("Some threads were created after the checkpoint, their registers cannot be restored.")
+
+        self.debugging_interface.set_registers(checkpoint.registers)
+
+        # The memory now matches the checkpoint, which can be used as the base of the next restore
+        if clear_soft_dirty_bits(self.process_id):
+            self._soft_dirty_epoch += 1
+            checkpoint.memory._epoch = self._soft_dirty_epoch
+
+        self._last_snapshot = weakref.ref(checkpoint.memory)
+
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def fork_at(self: InternalDebugger, position: int | str, file: str = "hybrid") -> Debugger:
+        """Forks the process at the specified location and attaches a debugger to the child.
+
+        The process is continued until one of its threads reaches the location, if none is already there, and then
+        stays stopped there, so that every fork starts from the same state.
+
+        Args:
+            position (int | str): The location where the process is forked.
+            file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
+            (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
+            the "binary" map file).
+
+        Returns:
+            Debugger: The debugger attached to the child process.
+        """
+        if isinstance(position, str):
+            address = self.resolve_symbol(position, file)
+        else:
+            address = self.resolve_address(position, file)
+
+        thread = self._find_thread_at(address)
+
+        if thread is None:
+            bp = self.breakpoints.get(address)
+            temporary = bp is None
+            enabled = not temporary and bp.enabled
+
+            if temporary:
+                bp = self.breakpoint(address, file="absolute")
+            elif not enabled:
+                bp.enable()
+
+            while thread is None:
+                self.cont()
+                self.wait()
+
+                if all(t.dead for t in self.threads):
+                    raise RuntimeError(f"The process exited before reaching {position}.")
+
+                thread = self._find_thread_at(address)
+
+            if temporary:
+                # The breakpoint was only needed to park the thread
+                self._unset_breakpoint(bp)
+            elif not enabled:
+                bp.disable()
+
+        child_id = self._fork_process(thread)
+
+        # Only the debuggers of released children are reused, as attaching would kill a child still in use
+        child = self._fork_children.pop() if self._fork_children else None
+
+        if child is None:
+            internal_debugger = InternalDebugger()
+            internal_debugger.argv = self.argv
+            internal_debugger.env = self.env
+            internal_debugger.aslr_enabled = self.aslr_enabled
+            internal_debugger.autoreach_entrypoint = False
+            internal_debugger.auto_interrupt_on_command = self.auto_interrupt_on_command
+            internal_debugger.escape_antidebug = self.escape_antidebug
+            internal_debugger.syscall_filter = self.syscall_filter
+
+            child = Debugger()
+            child.post_init_(internal_debugger)
+
+        child.attach(child_id)
+
+        return child
+
+    @background_alias(_background_invalid_call)
+    def release_fork(self: InternalDebugger, child: Debugger) -> None:
+        """Kills a child created by `fork_at` and reaps it from the debugged process.
+
+        Args:
+            child (Debugger): The debugger attached to the child process.
+        """
+        child_id = child._internal_debugger.process_id
+
+        if child._internal_debugger.instanced:
+            child.kill()
+
+        # The child is a child of the debugged process, which must collect its exit status
+        for thread in self.threads:
+            if not thread.dead:
+                self._inject_syscall(thread, resolve_syscall_number("wait4"), child_id, 0, 0, 0)
+                break
+
+        if child not in self._fork_children:
+            self._fork_children.append(child)
+
+    def _find_thread_at(self: InternalDebugger, address: int) -> ThreadContext | None:
+        """Returns a thread whose instruction pointer is at the specified address, if any."""
+        for thread in self.threads:
+            if not thread.dead and thread.instruction_pointer == address:
+                return thread
+
+        return None
+
     @background_alias(_background_invalid_call)
     @change_state_function_process
     def breakpoint(
@@ -386,6 +752,8 @@ class InternalDebugger:
         length: int = 1,
         callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
         file: str = "hybrid",
+        counting: bool = False,
+        when: str | None = None,
     ) -> Breakpoint:
         """Sets a breakpoint at the specified location.
 
@@ -393,13 +761,19 @@ class InternalDebugger:
             position (int | bytes): The location of the breakpoint.
             hardware (bool, optional): Whether the breakpoint should be hardware-assisted or purely software.
             Defaults to False.
-            condition (str, optional): The trigger condition for the breakpoint. Defaults to None.
+            condition (str, optional): The trigger condition for the breakpoint. A software breakpoint with the "w" or
+            "rw" condition is a watchpoint implemented by protecting the memory pages it covers. Defaults to None.
             length (int, optional): The length of the breakpoint. Only for watchpoints. Defaults to 1.
             callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when the
             breakpoint is hit. Defaults to None.
             file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
             (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
             the "binary" map file).
+            counting (bool, optional): Whether the breakpoint only counts its hits, without ever stopping the process.
+            Only for software breakpoints. Defaults to False.
+            when (str, optional): A condition on the registers and the memory of the thread, such as
+            `rax == 0x1337 and [rdi + 8] > 5`, evaluated by the debugging backend. Only the hits where the condition
+            holds are reported. Only for software breakpoints. Defaults to None.
         """
         if isinstance(position, str):
             address = self.resolve_symbol(position, file)
@@ -408,25 +782,44 @@ class InternalDebugger:
             position = hex(address)
 
         if condition:
-            if not hardware:
-                raise ValueError(
-                    "Breakpoint condition is supported only for hardware watchpoints.",
-                )
-
             if condition.lower() not in ["w", "rw", "x"]:
                 raise ValueError(
                     "Invalid condition for watchpoints. Supported conditions are 'w', 'rw', 'x'.",
                 )
 
-            if length not in [1, 2, 4, 8]:
+            if hardware and length not in [1, 2, 4, 8]:
                 raise ValueError(
                     "Invalid length for watchpoints. Supported lengths are 1, 2, 4, 8.",
                 )
 
+            if not hardware:
+                if condition.lower() == "x":
+                    raise ValueError(
+                        "Software watchpoints support only the 'w' and 'rw' conditions.",
+                    )
+
+                if length < 1:
+                    raise ValueError("Invalid length for watchpoints. The length must be positive.")
+
+                if counting or when:
+                    raise ValueError("Software watchpoints cannot be counting or have a native condition.")
+
+            condition = condition.lower()
+
+        if counting:
+            if hardware:
+                raise ValueError("Counting breakpoints are supported only for software breakpoints.")
+
+            if callback:
+                raise ValueError("Counting breakpoints cannot have a callback.")
+
+        if when and hardware:
+            raise ValueError("Native breakpoint conditions are supported only for software breakpoints.")
+
         if hardware and not condition:
             condition = "x"
 
-        bp = Breakpoint(address, position, 0, hardware, callback, condition, length)
+        bp = Breakpoint(address, position, 0, hardware, callback, condition, length, counting=counting, when=when)
 
         link_to_internal_debugger(bp, self)
 
@@ -440,6 +833,131 @@ class InternalDebugger:
 
         return bp
 
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def breakpoints_bulk(
+        self: InternalDebugger,
+        positions: list[int | str],
+        callback: None | Callable[[ThreadContext, Breakpoint], None] = None,
+        file: str = "hybrid",
+    ) -> list[Breakpoint]:
+        """Sets a software breakpoint at each of the specified locations at once.
+
+        Args:
+            positions (list[int | str]): The locations of the breakpoints.
+            callback (Callable[[ThreadContext, Breakpoint], None], optional): A callback to be called when any of the
+            breakpoints is hit. Defaults to None.
+            file (str, optional): The user-defined backing file to resolve the addresses in. Defaults to "hybrid"
+            (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
+            the "binary" map file).
+
+        Returns:
+            list[Breakpoint]: The breakpoints, in the same order as the positions. The existing breakpoint is returned
+            for a location that already holds one.
+        """
+        addresses = self._resolve_positions(positions, file)
+
+        bps = {}
+
+        for position, address in zip(positions, addresses, strict=True):
+            if address in self.breakpoints:
+                bps[address] = self.breakpoints[address]
+            elif address not in bps:
+                symbol = position if isinstance(position, str) else hex(address)
+                bps[address] = Breakpoint(address, symbol, 0, False, callback)
+                link_to_internal_debugger(bps[address], self)
+
+        self.__polling_thread_command_queue.put((self.__threaded_breakpoints_bulk, (list(bps.values()),)))
+
+        self._join_and_check_status()
+
+        return [bps[address] for address in addresses]
+
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def coverage(
+        self: InternalDebugger,
+        target: list[int] | str | MemoryMap,
+        file: str = "hybrid",
+    ) -> Coverage:
+        """Installs one-shot software breakpoints that record which addresses are reached, without stopping the process.
+
+        Args:
+            target (list[int] | str | MemoryMap): The addresses to cover, the name of a function or an executable
+            memory map. Functions and memory maps are covered at the start of each of their basic blocks.
+            file (str, optional): The user-defined backing file to resolve the addresses or the function in. Defaults
+            to "hybrid" (libdebug will first try to solve the address as an absolute address, then as a relative
+            address w.r.t. the "binary" map file).
+
+        Returns:
+            Coverage: The covered addresses, along with the bitmap of the reached ones.
+        """
+        if isinstance(target, str):
+            start, end = resolve_symbol_range_in_maps(target, self._filter_maps_for_symbol(target, file))
+
+            if end <= start:
+                raise ValueError(f"The size of the function {target} is unknown.")
+
+            addresses = find_basic_blocks(self._read_memory(start, end - start), start)
+        elif isinstance(target, MemoryMap):
+            if "x" not in target.permissions:
+                raise ValueError("Coverage is supported only for executable memory maps.")
+
+            addresses = find_basic_blocks(self._read_memory(target.start, target.size), target.start)
+        else:
+            addresses = self._resolve_positions(target, file)
+
+        coverage = Coverage(addresses, bytearray((len(addresses) + 7) // 8))
+
+        self.__polling_thread_command_queue.put((self.__threaded_coverage, (coverage,)))
+
+        self._join_and_check_status()
+
+        return coverage
+
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def tracepoint(
+        self: InternalDebugger,
+        position: int | str,
+        registers: list[str],
+        capacity: int = 65536,
+        file: str = "hybrid",
+    ) -> Tracepoint:
+        """Sets a tracepoint, which records the registers at every hit without stopping the process.
+
+        Args:
+            position (int | str): The location of the tracepoint.
+            registers (list[str]): The general purpose registers to record, along with `rip` and `eflags`.
+            capacity (int, optional): The number of records the process can hold between two stops, a power of two.
+            Older records are dropped when it is exceeded. Defaults to 65536.
+            file (str, optional): The user-defined backing file to resolve the address in. Defaults to "hybrid"
+            (libdebug will first try to solve the address as an absolute address, then as a relative address w.r.t.
+            the "binary" map file).
+
+        Returns:
+            Tracepoint: The tracepoint, whose records are updated every time the process stops.
+        """
+        if isinstance(position, str):
+            address = self.resolve_symbol(position, file)
+        else:
+            address = self.resolve_address(position, file)
+            position = hex(address)
+
+        if not registers:
+            raise ValueError("A tracepoint must record at least one register.")
+
+        if capacity <= 0 or capacity & (capacity - 1) or capacity > MAX_TRACEPOINT_CAPACITY:
+            raise ValueError(f"The capacity of a tracepoint must be a power of two up to {MAX_TRACEPOINT_CAPACITY}.")
+
+        tp = Tracepoint(address, position, list(registers), capacity)
+
+        self.__polling_thread_command_queue.put((self.__threaded_tracepoint, (tp,)))
+
+        self._join_and_check_status()
+
+        return tp
+
     @background_alias(_background_invalid_call)
     @change_state_function_process
     def catch_signal(
@@ -544,6 +1062,7 @@ class InternalDebugger:
         on_enter: Callable[[ThreadContext, SyscallHandler], None] | None = None,
         on_exit: Callable[[ThreadContext, SyscallHandler], None] | None = None,
         recursive: bool = False,
+        observe: bool = False,
     ) -> SyscallHandler:
         """Handle a syscall in the target process.
 
@@ -555,6 +1074,8 @@ class InternalDebugger:
             syscall is exited. Defaults to None.
             recursive (bool, optional): Whether, when the syscall is hijacked with another one, the syscall handler
             associated with the new syscall should be considered as well. Defaults to False.
+            observe (bool, optional): Whether the callbacks run while the other threads keep running. Only the
+            registers of the thread that executes the syscall are valid in the callbacks. Defaults to False.
 
         Returns:
             HandledSyscall: The HandledSyscall object.
@@ -564,6 +1085,9 @@ class InternalDebugger:
         if not isinstance(recursive, bool):
             raise TypeError("recursive must be a boolean")
 
+        if not isinstance(observe, bool):
+            raise TypeError("observe must be a boolean")
+
         # Check if the syscall is already handled (by the user or by the pretty print handler)
         if syscall_number in self.handled_syscalls:
             handler = self.handled_syscalls[syscall_number]
@@ -574,7 +1098,9 @@ class InternalDebugger:
             handler.on_enter_user = on_enter
             handler.on_exit_user = on_exit
             handler.recursive = recursive
+            handler.observe = observe
             handler.enabled = True
+            handler._rule = None
         else:
             handler = SyscallHandler(
                 syscall_number,
@@ -583,6 +1109,7 @@ class InternalDebugger:
                 None,
                 None,
                 recursive,
+                observe=observe,
             )
 
             link_to_internal_debugger(handler, self)
@@ -647,6 +1174,8 @@ class InternalDebugger:
             handler.on_exit_user = None
             handler.recursive = recursive
             handler.enabled = True
+            # The backend applies the hijack without stopping, when no other handler has to see it
+            handler._rule = {**kwargs, "syscall_number": new_syscall_number}
         else:
             handler = SyscallHandler(
                 original_syscall_number,
@@ -655,6 +1184,7 @@ class InternalDebugger:
                 None,
                 None,
                 recursive,
+                _rule={**kwargs, "syscall_number": new_syscall_number},
             )
 
             link_to_internal_debugger(handler, self)
@@ -667,6 +1197,76 @@ class InternalDebugger:
 
         return handler
 
+    @background_alias(_background_invalid_call)
+    @change_state_function_process
+    def rewrite_syscall(
+        self: InternalDebugger,
+        syscall: int | str,
+        new_syscall: int | str | None = None,
+        syscall_return: int | None = None,
+        **kwargs: int,
+    ) -> SyscallHandler:
+        """Rewrites a syscall in the target process, without stopping it.
+
+        Args:
+            syscall (int | str): The syscall name or number to rewrite.
+            new_syscall (int | str, optional): The syscall name or number to execute in place of the syscall.
+            Defaults to None.
+            syscall_return (int, optional): The value the syscall returns without being executed. Defaults to None.
+            **kwargs: (int, optional): The arguments to pass to the syscall.
+
+        Returns:
+            HandledSyscall: The HandledSyscall object.
+        """
+        if set(kwargs) - (syscall_hijacking_provider().allowed_args - {"syscall_number"}):
+            raise ValueError("Invalid keyword arguments in syscall rewrite")
+
+        syscall_number = resolve_syscall_number(syscall) if isinstance(syscall, str) else syscall
+
+        rule = dict(kwargs)
+
+        if new_syscall is not None:
+            rule["syscall_number"] = resolve_syscall_number(new_syscall) if isinstance(new_syscall, str) else new_syscall
+
+            if rule["syscall_number"] == syscall_number:
+                raise ValueError("The original syscall and the new syscall must be different during rewriting.")
+
+            if syscall_return is not None:
+                raise ValueError("A skipped syscall cannot be replaced with another syscall.")
+
+        on_enter = syscall_hijacking_provider().create_rewriter(syscall_return, **rule)
+
+        if syscall_return is not None:
+            rule["syscall_return"] = syscall_return
+
+        if not rule:
+            raise ValueError("The rewrite does not change the syscall.")
+
+        # Check if the syscall is already handled (by the user or by the pretty print handler)
+        if syscall_number in self.handled_syscalls:
+            handler = self.handled_syscalls[syscall_number]
+            if handler.on_enter_user or handler.on_exit_user:
+                liblog.warning(
+                    f"Syscall {syscall_number} is already handled by a user-defined handler. Overriding it.",
+                )
+            handler.on_enter_user = on_enter
+            handler.on_exit_user = None
+            handler.recursive = False
+            handler.enabled = True
+            handler._rule = rule
+        else:
+            handler = SyscallHandler(syscall_number, on_enter, None, None, None, _rule=rule)
+
+            link_to_internal_debugger(handler, self)
+
+            self.__polling_thread_command_queue.put(
+                (self.__threaded_handle_syscall, (handler,)),
+            )
+
+            self._join_and_check_status()
+
+        return handler
+
     @background_alias(_background_invalid_call)
     @change_state_function_process
     def gdb(self: InternalDebugger, open_in_new_process: bool = True) -> None:
@@ -712,7 +1312,11 @@ class InternalDebugger:
             if bp.enabled:
                 bp_args.append("-ex")
 
-                if bp.hardware and bp.condition == "rw":
+                if bp._page_watchpoint:
+                    # GDB chooses how to watch the range by itself
+                    command = "awatch" if bp.condition == "rw" else "watch"
+                    bp_args.append(f"{command} *(char (*)[{bp.length}]) {bp.address:#x}")
+                elif bp.hardware and bp.condition == "rw":
                     bp_args.append(f"awatch *(int{bp.length * 8}_t *) {bp.address:0x}")
                 elif bp.hardware and bp.condition == "w":
                     bp_args.append(f"watch *(int{bp.length * 8}_t *) {bp.address:0x}")
@@ -721,7 +1325,7 @@ class InternalDebugger:
                 else:
                     bp_args.append("b *" + hex(bp.address))
 
-                if self.threads[0].instruction_pointer == bp.address and not bp.hardware:
+                if self.threads[0].instruction_pointer == bp.address and not bp.hardware and not bp._page_watchpoint:
                     # We have to enqueue an additional continue
                     bp_args.append("-ex")
                     bp_args.append("ni")
@@ -931,6 +1535,28 @@ class InternalDebugger:
 
         self._join_and_check_status()
 
+    def record_syscalls(
+        self: InternalDebugger,
+        output: str | Path | bytearray | memoryview | None,
+        capacity: int = 65536,
+    ) -> None:
+        """Records every syscall executed by the process, or stops recording.
+
+        Args:
+            output (str | Path | bytearray | memoryview | None): The file to create, or the writable buffer to fill
+            with the records. None stops recording.
+            capacity (int, optional): The number of records the file holds. Older records are overwritten when it is
+            exceeded. Buffers hold as many records as fit. Defaults to 65536.
+        """
+        self._ensure_process_stopped()
+
+        if self.syscall_recorder is not None:
+            self.syscall_recorder.close()
+            self.syscall_recorder = None
+
+        if output is not None:
+            self.syscall_recorder = SyscallRecorder(output, capacity)
+
     def disable_pretty_print(self: InternalDebugger) -> None:
         """Disable the handler for all the syscalls that are pretty printed."""
         self._ensure_process_stopped()
@@ -1034,31 +1660,59 @@ class InternalDebugger:
                 liblog.warning(
                     f"No backing file specified and no corresponding absolute address found for {hex(address)}. Assuming {backing_file}.",
                 )
-        elif (
-            backing_file == (full_backing_path := self._get_process_full_path())
-            or backing_file == "binary"
-            or backing_file == self._get_process_name()
-        ):
-            backing_file = full_backing_path
 
-        filtered_maps = []
-        unique_files = set()
+        return normalize_and_validate_address(address, self._filter_maps_for_file(backing_file, maps))
 
-        for vmap in maps:
-            if backing_file in vmap.backing_file:
-                filtered_maps.append(vmap)
-                unique_files.add(vmap.backing_file)
+    def _resolve_positions(self: InternalDebugger, positions: list[int | str], backing_file: str) -> list[int]:
+        """Resolves many addresses and symbols at once, as `resolve_address` and `resolve_symbol` would.
 
-        if len(unique_files) > 1:
-            raise ValueError(
-                f"The substring {backing_file} is present in multiple, different backing files. The address resolution cannot be accurate. The matching backing files are: {', '.join(unique_files)}.",
-            )
+        The memory maps are read once, each backing file is looked up once, and a single warning is reported for all
+        the addresses that are assumed to be relative to the binary.
 
-        if not filtered_maps:
-            raise ValueError(
-                f"The specified string {backing_file} does not correspond to any backing file. The available backing files are: {', '.join(set(vmap.backing_file for vmap in maps))}."
+        Args:
+            positions (list[int | str]): The addresses and the symbols to resolve.
+            backing_file (str): The backing file to resolve the positions in.
+
+        Returns:
+            list[int]: The resolved addresses, in the same order as the positions.
+        """
+        maps = self.debugging_interface.maps()
+        filtered_maps = {}
+        addresses = []
+        relative = []
+
+        for position in positions:
+            if isinstance(position, str) and backing_file == "absolute":
+                raise ValueError("Cannot use `absolute` backing file with symbols.")
+
+            if not isinstance(position, str) and backing_file in ["hybrid", "absolute"]:
+                if check_absolute_address(position, maps):
+                    addresses.append(position)
+                    continue
+
+                if backing_file == "absolute":
+                    raise ValueError(
+                        "The specified absolute address does not exist. Check the address or specify a backing file.",
+                    )
+
+                relative.append(position)
+
+            file = self._get_process_full_path() if backing_file == "hybrid" else backing_file
+
+            if file not in filtered_maps:
+                filtered_maps[file] = self._filter_maps_for_file(file, maps)
+
+            if isinstance(position, str):
+                addresses.append(resolve_symbol_in_maps(position, filtered_maps[file]))
+            else:
+                addresses.append(normalize_and_validate_address(position, filtered_maps[file]))
+
+        if relative:
+            liblog.warning(
+                f"No backing file specified and no corresponding absolute address found for {len(relative)} addresses, such as {hex(relative[0])}. Assuming {self._get_process_full_path()}.",
             )
-        return normalize_and_validate_address(address, filtered_maps)
+
+        return addresses
 
     def resolve_symbol(self: InternalDebugger, symbol: str, backing_file: str) -> int:
         """Resolves the address of the specified symbol.
@@ -1070,6 +1724,18 @@ class InternalDebugger:
         Returns:
             int: The address of the symbol.
         """
+        return resolve_symbol_in_maps(symbol, self._filter_maps_for_symbol(symbol, backing_file))
+
+    def _filter_maps_for_symbol(self: InternalDebugger, symbol: str, backing_file: str) -> list[MemoryMap]:
+        """Returns the memory maps of the backing file a symbol should be resolved in.
+
+        Args:
+            symbol (str): The symbol to resolve.
+            backing_file (str): The backing file to resolve the symbol in.
+
+        Returns:
+            list[MemoryMap]: The memory maps of the backing file.
+        """
         maps = self.debugging_interface.maps()
 
         if backing_file == "absolute":
@@ -1079,7 +1745,20 @@ class InternalDebugger:
             # If no explicit backing file is specified, we have to assume it is in the main map
             backing_file = self._get_process_full_path()
             liblog.debugger(f"No backing file specified for the symbol {symbol}. Assuming {backing_file}.")
-        elif (
+
+        return self._filter_maps_for_file(backing_file, maps)
+
+    def _filter_maps_for_file(self: InternalDebugger, backing_file: str, maps: list[MemoryMap]) -> list[MemoryMap]:
+        """Returns the memory maps of a backing file.
+
+        Args:
+            backing_file (str): The backing file, a substring of its path, or "binary" for the debugged binary.
+            maps (list[MemoryMap]): The memory maps of the process.
+
+        Returns:
+            list[MemoryMap]: The memory maps of the backing file.
+        """
+        if (
             backing_file == (full_backing_path := self._get_process_full_path())
             or backing_file == "binary"
             or backing_file == self._get_process_name()
@@ -1104,7 +1783,7 @@ class InternalDebugger:
                 f"The specified string {backing_file} does not correspond to any backing file. The available backing files are: {', '.join(set(vmap.backing_file for vmap in maps))}."
             )
 
-        return resolve_symbol_in_maps(symbol, filtered_maps)
+        return filtered_maps
 
     def _background_ensure_process_stopped(self: InternalDebugger) -> None:
         """Validates the state of the process."""
@@ -1250,6 +1929,22 @@ class InternalDebugger:
         liblog.debugger("Setting breakpoint at 0x%x.", bp.address)
         self.debugging_interface.set_breakpoint(bp)
 
+    def __threaded_breakpoints_bulk(self: InternalDebugger, bps: list[Breakpoint]) -> None:
+        liblog.debugger("Setting %d breakpoints.", len(bps))
+        self.debugging_interface.set_breakpoints(bps)
+
+    def __threaded_unset_breakpoint(self: InternalDebugger, bp: Breakpoint) -> None:
+        liblog.debugger("Removing breakpoint at 0x%x.", bp.address)
+        self.debugging_interface.unset_breakpoint(bp)
+
+    def __threaded_coverage(self: InternalDebugger, coverage: Coverage) -> None:
+        liblog.debugger("Installing %d coverage points.", len(coverage.addresses))
+        self.debugging_interface.install_coverage(coverage.addresses, coverage.bitmap)
+
+    def __threaded_tracepoint(self: InternalDebugger, tp: Tracepoint) -> None:
+        liblog.debugger("Setting tracepoint at 0x%x.", tp.address)
+        self.debugging_interface.set_tracepoint(tp)
+
     def __threaded_catch_signal(self: InternalDebugger, catcher: SignalCatcher) -> None:
         liblog.debugger(
             f"Setting the catcher for signal {resolve_signal_name(catcher.signal_number)} ({catcher.signal_number}).",
@@ -1302,6 +1997,43 @@ class InternalDebugger:
         int_data = int.from_bytes(data, "little")
         self.debugging_interface.poke_memory(address, int_data)
 
+    def __threaded_read_memory(self: InternalDebugger, address: int, size: int) -> bytes:
+        return self.debugging_interface.read_memory(address, size)
+
+    def __threaded_read_memory_into(self: InternalDebugger, address: int, buffer: bytearray | memoryview) -> int:
+        return self.debugging_interface.read_memory_into(address, buffer)
+
+    def __threaded_write_memory(self: InternalDebugger, address: int, data: bytes) -> None:
+        self.debugging_interface.write_memory(address, data)
+
+    def __threaded_read_memory_many(self: InternalDebugger, regions: list[tuple[int, int]]) -> bytes:
+        return self.debugging_interface.read_memory_many(regions)
+
+    def __threaded_write_memory_many(self: InternalDebugger, regions: list[tuple[int, bytes]]) -> None:
+        self.debugging_interface.write_memory_many(regions)
+
+    def __threaded_follow_pointers(
+        self: InternalDebugger,
+        address: int,
+        next_offset: int,
+        payload_size: int,
+        max_nodes: int,
+    ) -> list[tuple[int, bytes]]:
+        return self.debugging_interface.follow_pointers(address, next_offset, payload_size, max_nodes)
+
+    def __threaded_fork_process(self: InternalDebugger, thread: ThreadContext) -> int:
+        child_id = self.debugging_interface.inject_syscall(thread.thread_id, resolve_syscall_number("fork"))
+
+        if child_id < 0:
+            raise OSError(-child_id, os.strerror(-child_id))
+
+        self.debugging_interface.detach_forked_child(thread.thread_id, child_id)
+
+        return child_id
+
+    def __threaded_inject_syscall(self: InternalDebugger, thread: ThreadContext, number: int, args: tuple[int]) -> int:
+        return self.debugging_interface.inject_syscall(thread.thread_id, number, *args)
+
     @background_alias(__threaded_peek_memory)
     def _peek_memory(self: InternalDebugger, address: int) -> bytes:
         """Reads memory from the process."""
@@ -1353,6 +2085,230 @@ class InternalDebugger:
 
         self._join_and_check_status()
 
+    @background_alias(__threaded_read_memory)
+    def _read_memory(self: InternalDebugger, address: int, size: int) -> bytes:
+        """Reads a contiguous memory range from the process with a single command."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot read memory.")
+
+        if self.running:
+            # Reading memory while the process is running could lead to concurrency issues
+            # and corrupted values
+            liblog.debugger(
+                "Process is running. Waiting for it to stop before reading memory.",
+            )
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_read_memory, (address, size)),
+        )
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self.__polling_thread_command_queue.join()
+
+        value = self.__polling_thread_response_queue.get()
+        self.__polling_thread_response_queue.task_done()
+
+        if isinstance(value, BaseException):
+            raise value
+
+        return value
+
+    @background_alias(__threaded_read_memory_into)
+    def _read_memory_into(self: InternalDebugger, address: int, buffer: bytearray | memoryview) -> int:
+        """Reads a contiguous memory range from the process directly into the specified buffer."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot read memory.")
+
+        if self.running:
+            # Reading memory while the process is running could lead to concurrency issues
+            # and corrupted values
+            liblog.debugger(
+                "Process is running. Waiting for it to stop before reading memory.",
+            )
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_read_memory_into, (address, buffer)),
+        )
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self.__polling_thread_command_queue.join()
+
+        value = self.__polling_thread_response_queue.get()
+        self.__polling_thread_response_queue.task_done()
+
+        if isinstance(value, BaseException):
+            raise value
+
+        return value
+
+    @background_alias(__threaded_write_memory)
+    def _write_memory(self: InternalDebugger, address: int, data: bytes) -> None:
+        """Writes a contiguous memory range to the process with a single command."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot write memory.")
+
+        if self.running:
+            # Writing memory while the process is running could lead to concurrency issues
+            # and corrupted values
+            liblog.debugger(
+                "Process is running. Waiting for it to stop before writing to memory.",
+            )
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_write_memory, (address, data)),
+        )
+
+        self._join_and_check_status()
+
+    @background_alias(__threaded_read_memory_many)
+    def _read_memory_many(self: InternalDebugger, regions: list[tuple[int, int]]) -> bytes:
+        """Reads multiple memory ranges from the process with a single command."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot read memory.")
+
+        if self.running:
+            # Reading memory while the process is running could lead to concurrency issues
+            # and corrupted values
+            liblog.debugger(
+                "Process is running. Waiting for it to stop before reading memory.",
+            )
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_read_memory_many, (regions,)),
+        )
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self.__polling_thread_command_queue.join()
+
+        value = self.__polling_thread_response_queue.get()
+        self.__polling_thread_response_queue.task_done()
+
+        if isinstance(value, BaseException):
+            raise value
+
+        return value
+
+    @background_alias(__threaded_write_memory_many)
+    def _write_memory_many(self: InternalDebugger, regions: list[tuple[int, bytes]]) -> None:
+        """Writes multiple memory ranges to the process with a single command."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot write memory.")
+
+        if self.running:
+            # Writing memory while the process is running could lead to concurrency issues
+            # and corrupted values
+            liblog.debugger(
+                "Process is running. Waiting for it to stop before writing to memory.",
+            )
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_write_memory_many, (regions,)),
+        )
+
+        self._join_and_check_status()
+
+    @background_alias(__threaded_follow_pointers)
+    def _follow_pointers(
+        self: InternalDebugger,
+        address: int,
+        next_offset: int,
+        payload_size: int,
+        max_nodes: int,
+    ) -> list[tuple[int, bytes]]:
+        """Walks a linked structure in the process with a single command."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot read memory.")
+
+        if self.running:
+            # Reading memory while the process is running could lead to concurrency issues
+            # and corrupted values
+            liblog.debugger(
+                "Process is running. Waiting for it to stop before reading memory.",
+            )
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_follow_pointers, (address, next_offset, payload_size, max_nodes)),
+        )
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self.__polling_thread_command_queue.join()
+
+        value = self.__polling_thread_response_queue.get()
+        self.__polling_thread_response_queue.task_done()
+
+        if isinstance(value, BaseException):
+            raise value
+
+        return value
+
+    @background_alias(__threaded_unset_breakpoint)
+    def _unset_breakpoint(self: InternalDebugger, bp: Breakpoint) -> None:
+        """Removes a breakpoint from the process."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot remove the breakpoint.")
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put((self.__threaded_unset_breakpoint, (bp,)))
+
+        self._join_and_check_status()
+
+    @background_alias(__threaded_fork_process)
+    def _fork_process(self: InternalDebugger, thread: ThreadContext) -> int:
+        """Forks the process from a stopped thread, leaving the child stopped and detached."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot fork it.")
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put((self.__threaded_fork_process, (thread,)))
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self.__polling_thread_command_queue.join()
+
+        value = self.__polling_thread_response_queue.get()
+        self.__polling_thread_response_queue.task_done()
+
+        if isinstance(value, BaseException):
+            raise value
+
+        return value
+
+    @background_alias(__threaded_inject_syscall)
+    def _inject_syscall(self: InternalDebugger, thread: ThreadContext, number: int, *args: int) -> int:
+        """Executes a syscall in the context of a stopped thread, preserving its registers and code."""
+        if not self.instanced:
+            raise RuntimeError("Process not running, cannot inject a syscall.")
+
+        self._ensure_process_stopped()
+
+        self.__polling_thread_command_queue.put(
+            (self.__threaded_inject_syscall, (thread, number, args)),
+        )
+
+        # We cannot call _join_and_check_status here, as we need the return value which might not be an exception
+        self.__polling_thread_command_queue.join()
+
+        value = self.__polling_thread_response_queue.get()
+        self.__polling_thread_response_queue.task_done()
+
+        if isinstance(value, BaseException):
+            raise value
+
+        return value
+
     def _enable_antidebug_escaping(self: InternalDebugger) -> None:
         """Enables the anti-debugging escape mechanism."""
         handler = SyscallHandler(
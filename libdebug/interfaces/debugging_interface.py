@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from libdebug.data.memory_map import MemoryMap
     from libdebug.data.signal_catcher import SignalCatcher
     from libdebug.data.syscall_handler import SyscallHandler
+    from libdebug.data.tracepoint import Tracepoint
     from libdebug.state.thread_context import ThreadContext
 
 
@@ -106,6 +107,14 @@ class DebuggingInterface(ABC):
             bp (Breakpoint): The breakpoint to set.
         """
 
+    @abstractmethod
+    def set_breakpoints(self: DebuggingInterface, bps: list[Breakpoint]) -> None:
+        """Sets many software breakpoints at once.
+
+        Args:
+            bps (list[Breakpoint]): The breakpoints to set.
+        """
+
     @abstractmethod
     def unset_breakpoint(self: DebuggingInterface, bp: Breakpoint) -> None:
         """Restores the original instruction flow at the specified address.
@@ -114,6 +123,31 @@ class DebuggingInterface(ABC):
             bp (Breakpoint): The breakpoint to restore.
         """
 
+    @abstractmethod
+    def install_coverage(self: DebuggingInterface, addresses: list[int], bitmap: bytearray) -> None:
+        """Installs a one-shot breakpoint at each address, which marks the bitmap when it is reached.
+
+        Args:
+            addresses (list[int]): The addresses to cover.
+            bitmap (bytearray): The bitmap whose i-th bit is set when the i-th address is reached.
+        """
+
+    @abstractmethod
+    def set_tracepoint(self: DebuggingInterface, tp: Tracepoint) -> None:
+        """Sets a tracepoint, which records the registers at every hit without stopping the process.
+
+        Args:
+            tp (Tracepoint): The tracepoint to set.
+        """
+
+    @abstractmethod
+    def owned_memory(self: DebuggingInterface) -> list[tuple[int, int]]:
+        """Returns the memory ranges the debugger mapped in the process for its own use.
+
+        Returns:
+            list[tuple[int, int]]: The start and the end of each range.
+        """
+
     @abstractmethod
     def set_syscall_handler(self: DebuggingInterface, handler: SyscallHandler) -> None:
         """Sets a handler for a syscall.
@@ -165,3 +199,113 @@ class DebuggingInterface(ABC):
             address (int): The address to write.
             data (int): The value to write.
         """
+
+    @abstractmethod
+    def read_memory(self: DebuggingInterface, address: int, size: int) -> bytes:
+        """Reads a contiguous memory range.
+
+        Args:
+            address (int): The address to read from.
+            size (int): The number of bytes to read.
+
+        Returns:
+            bytes: The read bytes.
+        """
+
+    @abstractmethod
+    def read_memory_into(self: DebuggingInterface, address: int, buffer: bytearray | memoryview) -> int:
+        """Reads a contiguous memory range directly into a writable buffer.
+
+        Args:
+            address (int): The address to read from.
+            buffer (bytearray | memoryview): The buffer to fill. Its length is the number of bytes to read.
+
+        Returns:
+            int: The number of bytes read.
+        """
+
+    @abstractmethod
+    def write_memory(self: DebuggingInterface, address: int, data: bytes) -> None:
+        """Writes a contiguous memory range.
+
+        Args:
+            address (int): The address to write to.
+            data (bytes): The bytes to write.
+        """
+
+    @abstractmethod
+    def read_memory_many(self: DebuggingInterface, regions: list[tuple[int, int]]) -> bytes:
+        """Reads multiple memory ranges at once.
+
+        Args:
+            regions (list[tuple[int, int]]): The (address, size) pairs to read.
+
+        Returns:
+            bytes: The concatenation of the read ranges, in the same order as the regions.
+        """
+
+    @abstractmethod
+    def write_memory_many(self: DebuggingInterface, regions: list[tuple[int, bytes]]) -> None:
+        """Writes multiple memory ranges at once.
+
+        Args:
+            regions (list[tuple[int, bytes]]): The (address, data) pairs to write.
+        """
+
+    @abstractmethod
+    def follow_pointers(
+        self: DebuggingInterface,
+        address: int,
+        next_offset: int,
+        payload_size: int,
+        max_nodes: int,
+    ) -> list[tuple[int, bytes]]:
+        """Walks a linked structure, reading the payload of every node.
+
+        Args:
+            address (int): The address of the first node.
+            next_offset (int): The offset of the pointer to the next node, inside each node.
+            payload_size (int): The number of bytes to read from the start of each node.
+            max_nodes (int): The maximum number of nodes to visit.
+
+        Returns:
+            list[tuple[int, bytes]]: The address and the payload of each visited node.
+        """
+
+    @abstractmethod
+    def inject_syscall(self: DebuggingInterface, thread_id: int, number: int, *args: int) -> int:
+        """Executes a syscall in the context of a stopped thread, preserving its registers and code.
+
+        Args:
+            thread_id (int): The thread that executes the syscall.
+            number (int): The syscall number.
+            *args (int): The syscall arguments.
+
+        Returns:
+            int: The return value of the syscall.
+        """
+
+    @abstractmethod
+    def detach_forked_child(self: DebuggingInterface, thread_id: int, child_id: int) -> None:
+        """Detaches from a child forked by an injected syscall, leaving it stopped in the state of its parent.
+
+        Args:
+            thread_id (int): The thread that executed the fork.
+            child_id (int): The PID of the child process.
+        """
+
+    @abstractmethod
+    def get_registers(self: DebuggingInterface) -> dict[int, bytes]:
+        """Returns a copy of the register file of each thread.
+
+        Returns:
+            dict[int, bytes]: The register file of each thread, indexed by thread ID.
+        """
+
+    @abstractmethod
+    def set_registers(self: DebuggingInterface, registers: dict[int, bytes]) -> None:
+        """Replaces the register file of the given threads.
+
+        Args:
+            registers (dict[int, bytes]): The register file of each thread, indexed by thread ID.
+        """
@@ -16,6 +16,7 @@ def debugger(
     escape_antidebug: bool = False,
     continue_to_binary_entrypoint: bool = True,
     auto_interrupt_on_command: bool = False,
+    syscall_filter: bool = False,
 ) -> Debugger:
     """This function is used to create a new `Debugger` object. It returns a `Debugger` object.
 
@@ -26,6 +27,7 @@ def debugger(
         escape_antidebug (bool): Whether to automatically attempt to patch antidebugger detectors based on the ptrace syscall.
         continue_to_binary_entrypoint (bool, optional): Whether to automatically continue to the binary entrypoint. Defaults to True.
         auto_interrupt_on_command (bool, optional): Whether to automatically interrupt the process when a command is issued. Defaults to False.
+        syscall_filter (bool, optional): Whether to install a seccomp filter in the process, so that only the handled syscalls stop it. The filter cannot be removed. Defaults to False.
 
     Returns:
         Debugger: The `Debugger` object.
@@ -40,6 +42,7 @@ def debugger(
     internal_debugger.autoreach_entrypoint = continue_to_binary_entrypoint
     internal_debugger.auto_interrupt_on_command = auto_interrupt_on_command
     internal_debugger.escape_antidebug = escape_antidebug
+    internal_debugger.syscall_filter = syscall_filter
 
     debugger = Debugger()
     debugger.post_init_(internal_debugger)
@@ -4,7 +4,7 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 
 PTRACE_EVENT_FORK = 1
 PTRACE_EVENT_VFORK = 2
@@ -17,6 +17,12 @@ PTRACE_EVENT_SECCOMP = 7
 SIGTRAP = 5
 SYSCALL_SIGTRAP = 0x80 | SIGTRAP
 
+# The si_code of a SIGSEGV caused by an access the protection of the page does not allow
+SEGV_ACCERR = 2
+
+# The protection of a page that cannot be accessed, mmap.PROT_NONE is available only since Python 3.13
+PROT_NONE = 0
+
 
 class StopEvents(IntEnum):
     """An enumeration of the stop events that ptrace can return."""
@@ -30,6 +36,28 @@ class StopEvents(IntEnum):
     SECCOMP_EVENT = SIGTRAP | (PTRACE_EVENT_SECCOMP << 8)
 
 
+class SyscallInfoOps(IntEnum):
+    """An enumeration of the kinds of syscall stops reported by PTRACE_GET_SYSCALL_INFO."""
+
+    NONE = 0
+    ENTRY = 1
+    EXIT = 2
+    SECCOMP = 3
+
+
+class SyscallRuleFlags(IntFlag):
+    """An enumeration of the changes a syscall rule of the backend applies at the entry of the syscall."""
+
+    NUMBER = 1 << 0
+    ARG0 = 1 << 1
+    ARG1 = 1 << 2
+    ARG2 = 1 << 3
+    ARG3 = 1 << 4
+    ARG4 = 1 << 5
+    ARG5 = 1 << 6
+    RETURN = 1 << 7
+
+
 class Commands(IntEnum):
     """An enumeration of the available ptrace commands."""
 
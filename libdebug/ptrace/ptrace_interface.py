@@ -7,8 +7,11 @@
 from __future__ import annotations
 
 import errno
+import mmap
 import os
 import pty
+import signal
+import struct
 import tty
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -25,16 +28,42 @@ from libdebug.debugger.internal_debugger_instance_manager import (
 )
 from libdebug.interfaces.debugging_interface import DebuggingInterface
 from libdebug.liblog import liblog
+from libdebug.ptrace.ptrace_constants import PROT_NONE, SEGV_ACCERR, SyscallRuleFlags
 from libdebug.ptrace.ptrace_status_handler import PtraceStatusHandler
 from libdebug.state.thread_context import ThreadContext
+from libdebug.utils.condition_utils import compile_condition
 from libdebug.utils.debugging_utils import normalize_and_validate_address
 from libdebug.utils.elf_utils import get_entry_point
+from libdebug.utils.instruction_utils import (
+    DISPLACED_MAX_LENGTH,
+    get_displaced_instruction,
+    relocate_instructions,
+)
 from libdebug.utils.pipe_manager import PipeManager
 from libdebug.utils.process_utils import (
     disable_self_aslr,
     get_process_maps,
     invalidate_process_cache,
 )
+from libdebug.utils.seccomp_utils import (
+    FILTER_SYSCALLS_SIZE,
+    MAX_FILTERED_SYSCALLS,
+    PR_SET_NO_NEW_PRIVS,
+    SECCOMP_FILTER_FLAG_TSYNC,
+    SECCOMP_SET_MODE_FILTER,
+    build_filter_bitmap,
+    build_filter_program,
+    build_syscall_filter,
+)
+from libdebug.utils.syscall_utils import resolve_syscall_number
+from libdebug.utils.tracepoint_utils import (
+    JUMP_SIZE,
+    RING_HEADER_SIZE,
+    build_jump,
+    build_trampoline_prologue,
+    record_size,
+    ring_size,
+)
 
 JUMPSTART_LOCATION = str(
     (Path(__file__) / ".." / ".." / "ptrace" / "jumpstart" / "jumpstart").resolve(),
@@ -56,6 +85,7 @@ if TYPE_CHECKING:
     from libdebug.data.memory_map import MemoryMap
     from libdebug.data.signal_catcher import SignalCatcher
     from libdebug.data.syscall_handler import SyscallHandler
+    from libdebug.data.tracepoint import Tracepoint
     from libdebug.debugger.internal_debugger import InternalDebugger
 
 
@@ -71,6 +101,27 @@ class PtraceInterface(DebuggingInterface):
     detached: bool
     """Whether the process was detached or not."""
 
+    _memory_fd: int | None
+    """The file descriptor of /proc/<pid>/mem, if it could be opened."""
+
+    _counting_breakpoints: dict[int, Breakpoint]
+    """The software breakpoints whose hits are counted by the backend, indexed by address."""
+
+    _coverage_bitmaps: list[tuple[bytearray, object]]
+    """The bitmaps the backend marks when a coverage point is reached, kept alive while the points exist."""
+
+    _tracepoints: dict[int, Tracepoint]
+    """The installed tracepoints, indexed by address."""
+
+    _trampoline_pages: list[list[int]]
+    """The start and the used size of each page holding the trampolines of the tracepoints."""
+
+    _owned_memory: list[tuple[int, int]]
+    """The memory ranges mapped in the process for the trampolines and the ring buffers of the tracepoints."""
+
+    _protected_pages: dict[int, list[int]]
+    """The original and the current protection of each page protected for the page watchpoints, indexed by address."""
+
     _internal_debugger: InternalDebugger
     """The internal debugger instance."""
 
@@ -89,8 +140,19 @@ class PtraceInterface(DebuggingInterface):
 
         self.process_id = 0
         self.detached = False
+        self._memory_fd = None
 
         self.hardware_bp_helpers = {}
+        self._counting_breakpoints = {}
+        self._coverage_bitmaps = []
+        self._tracepoints = {}
+        self._trampoline_pages = []
+        self._owned_memory = []
+        self._protected_pages = {}
+        self._undisplaced = set()
+        self._filtered_syscalls = set()
+        self._syscall_filter_failed = False
+        self._syscall_rules = set()
 
         self._disabled_aslr = False
 
@@ -99,12 +161,28 @@ class PtraceInterface(DebuggingInterface):
     def reset(self: PtraceInterface) -> None:
         """Resets the state of the interface."""
         self.hardware_bp_helpers.clear()
+        self._counting_breakpoints.clear()
         self.lib_trace.free_thread_list(self._global_state)
         self.lib_trace.free_breakpoints(self._global_state)
+        self.lib_trace.free_coverage_points(self._global_state)
+        self._coverage_bitmaps.clear()
+        self._tracepoints.clear()
+        self._trampoline_pages.clear()
+        self._owned_memory.clear()
+        self._protected_pages.clear()
+        self._undisplaced.clear()
+        self._filtered_syscalls.clear()
+        self._syscall_filter_failed = False
+
+        for number in self._syscall_rules:
+            self._global_state.syscall_rules[number].flags = 0
+            self._global_state.syscall_rules[number].hits = 0
+        self._syscall_rules.clear()
+        self._global_state.syscall_rules_enabled = False
 
     def _set_options(self: PtraceInterface) -> None:
         """Sets the tracer options."""
-        self.lib_trace.ptrace_set_options(self.process_id)
+        self.lib_trace.ptrace_set_options(self.process_id, self._internal_debugger.syscall_filter)
 
     def run(self: PtraceInterface) -> None:
         """Runs the specified process."""
@@ -173,6 +251,7 @@ class PtraceInterface(DebuggingInterface):
         self.register_new_thread(child_pid)
         continue_to_entry_point = self._internal_debugger.autoreach_entrypoint
         self._setup_parent(continue_to_entry_point)
+        self._open_memory_file()
         self._internal_debugger.pipe_manager = self._setup_pipe()
 
     def attach(self: PtraceInterface, pid: int) -> None:
@@ -197,6 +276,7 @@ class PtraceInterface(DebuggingInterface):
         # If we are attaching to a process, we don't want to continue to the entry point
         # which we have probably already passed
         self._setup_parent(False)
+        self._open_memory_file()
 
     def detach(self: PtraceInterface) -> None:
         """Detaches from the process."""
@@ -205,12 +285,29 @@ class PtraceInterface(DebuggingInterface):
             if bp.enabled:
                 self.unset_breakpoint(bp, delete=True)
 
+        for tp in list(self._tracepoints.values()):
+            self._remove_tracepoint(tp)
+
+        self._sync_hardware_breakpoints()
+        self._sync_page_protections(active=False)
+
+        if self._filtered_syscalls:
+            liblog.warning(
+                "The syscall filter cannot be removed from the process. The syscalls it reports will fail with ENOSYS while the process is not traced.",
+            )
+
         self.lib_trace.ptrace_detach_and_cont(self._global_state, self.process_id)
+        self._close_memory_file()
 
         self.detached = True
 
     def kill(self: PtraceInterface) -> None:
         """Instantly terminates the process."""
+        self._close_memory_file()
+        self._collect_breakpoint_hits()
+        self._collect_syscall_rule_hits()
+        self._drain_tracepoints()
+
         if not self.detached:
             self.lib_trace.ptrace_detach_for_kill(self._global_state, self.process_id)
         else:
@@ -241,12 +338,36 @@ class PtraceInterface(DebuggingInterface):
             else:
                 self.unset_breakpoint(bp, delete=False)
 
-        for handler in self._internal_debugger.handled_syscalls.values():
-            if handler.enabled or handler.on_enter_pprint or handler.on_exit_pprint:
-                self._global_state.handle_syscall_enabled = True
-                break
+        handled = [
+            number
+            for number, handler in self._internal_debugger.handled_syscalls.items()
+            if handler.enabled or handler.on_enter_pprint or handler.on_exit_pprint
+        ]
+
+        recording = self._internal_debugger.syscall_recorder is not None
+
+        self._global_state.handle_syscall_enabled = bool(handled) or recording
+
+        if recording:
+            # Every syscall is recorded, so no syscall can be left to the filter
+            self._global_state.syscall_filter_enabled = False
         else:
-            self._global_state.handle_syscall_enabled = False
+            self._sync_syscall_filter(handled)
+
+        # The stops of these syscalls are handled while the other threads keep running
+        handlers = self._internal_debugger.handled_syscalls
+        observed = [
+            number
+            for number in (range(FILTER_SYSCALLS_SIZE) if recording else handled)
+            if number not in handlers or not handlers[number].enabled or handlers[number].observe
+        ]
+        bitmap = build_filter_bitmap(observed)
+        self.ffi.memmove(self._global_state.syscall_observe, bitmap, len(bitmap))
+
+        self._sync_syscall_rules()
+        self._sync_hardware_breakpoints()
+        self._sync_page_protections()
+        self._displace_stopped_breakpoints()
 
         result = self.lib_trace.cont_all_and_set_bps(
             self._global_state,
@@ -266,6 +387,10 @@ class PtraceInterface(DebuggingInterface):
         for bp in self._internal_debugger.breakpoints.values():
             bp._disabled_for_step = True
 
+        self._sync_hardware_breakpoints()
+        self._sync_page_protections()
+        self._displace_stopped_breakpoints()
+
         result = self.lib_trace.singlestep(self._global_state, thread.thread_id)
         if result == -1:
             errno_val = self.ffi.errno
@@ -285,6 +410,12 @@ class PtraceInterface(DebuggingInterface):
         for bp in self._internal_debugger.breakpoints.values():
             bp._disabled_for_step = True
 
+        self._sync_hardware_breakpoints()
+
+        # The backend steps over the instructions without handling the faults of the page watchpoints
+        self._sync_page_protections(active=False)
+        self._displace_stopped_breakpoints()
+
         result = self.lib_trace.step_until(
             self._global_state,
             thread.thread_id,
@@ -296,7 +427,7 @@ class PtraceInterface(DebuggingInterface):
             raise OSError(errno_val, errno.errorcode[errno_val])
 
         # As the wait is done internally, we must invalidate the cache
-        invalidate_process_cache()
+        self._invalidate_caches()
 
     def finish(self: PtraceInterface, thread: ThreadContext, heuristic: str) -> None:
         """Continues execution until the current function returns.
@@ -306,6 +437,10 @@ class PtraceInterface(DebuggingInterface):
             heuristic (str): The heuristic to use.
         """
         if heuristic == "step-mode":
+            self._sync_hardware_breakpoints()
+            self._sync_page_protections(active=False)
+            self._displace_stopped_breakpoints()
+
             result = self.lib_trace.stepping_finish(
                 self._global_state,
                 thread.thread_id,
@@ -316,7 +451,9 @@ class PtraceInterface(DebuggingInterface):
                 raise OSError(errno_val, errno.errorcode[errno_val])
 
             # As the wait is done internally, we must invalidate the cache
-            invalidate_process_cache()
+            self._invalidate_caches()
+            self._collect_breakpoint_hits()
+            self._drain_tracepoints()
         elif heuristic == "backtrace":
             # Breakpoint to return address
             last_saved_instruction_pointer = thread.current_return_address()
@@ -390,7 +527,12 @@ class PtraceInterface(DebuggingInterface):
 
             self.unset_breakpoint(bp)
 
+        self._invalidate_caches()
+
+    def _invalidate_caches(self: PtraceInterface) -> None:
+        """Invalidates every cache that depends on the state of the process."""
         invalidate_process_cache()
+        self._internal_debugger.memory.invalidate_cache()
 
     def wait(self: PtraceInterface) -> None:
         """Waits for the process to stop. Returns True if the wait has to be repeated."""
@@ -398,9 +540,40 @@ class PtraceInterface(DebuggingInterface):
             self._global_state,
             self.process_id,
         )
-        cursor = result
 
-        invalidate_process_cache()
+        # Observed syscalls stop only the thread that executes them
+        while self._global_state.observed_tid:
+            self._invalidate_caches()
+            self._manage_thread_statuses(result)
+
+            resume_context = self._internal_debugger.resume_context
+
+            if not resume_context.resume or resume_context.threads_with_signals_to_forward:
+                # The process must stop, so the other threads are stopped as well
+                result = self.lib_trace.stop_observed_siblings(self._global_state, self.process_id)
+                break
+
+            if self.lib_trace.cont_observed_thread(self._global_state) == -1:
+                raise RuntimeError("Failed to resume the thread after an observed syscall.")
+
+            result = self.lib_trace.wait_all_and_update_regs(
+                self._global_state,
+                self.process_id,
+            )
+
+        self._invalidate_caches()
+        self._collect_breakpoint_hits()
+        self._collect_syscall_rule_hits()
+        self._drain_tracepoints()
+        self._manage_thread_statuses(result)
+
+    def _manage_thread_statuses(self: PtraceInterface, result: object) -> None:
+        """Handles the statuses returned by the backend and frees them.
+
+        Args:
+            result (object): The list of the statuses of the threads, returned by the backend.
+        """
+        cursor = result
 
         results = []
 
@@ -413,6 +586,70 @@ class PtraceInterface(DebuggingInterface):
 
         self.lib_trace.free_thread_status_list(result)
 
+    def _collect_breakpoint_hits(self: PtraceInterface) -> None:
+        """Adds the hits counted by the backend to the counting breakpoints."""
+        for bp in self._counting_breakpoints.values():
+            bp.hit_count += self.lib_trace.collect_breakpoint_hits(self._global_state, bp.address)
+
+    def _collect_syscall_rule_hits(self: PtraceInterface) -> None:
+        """Adds the syscalls rewritten by the backend to the hits of their handlers."""
+        for number in self._syscall_rules:
+            rule = self._global_state.syscall_rules[number]
+
+            if rule.hits and number in self._internal_debugger.handled_syscalls:
+                self._internal_debugger.handled_syscalls[number].hit_count += rule.hits
+
+            rule.hits = 0
+
+    def _sync_hardware_breakpoints(self: PtraceInterface) -> None:
+        """Writes the changes to the hardware breakpoints to the threads, before they resume."""
+        for helper in self.hardware_bp_helpers.values():
+            helper.sync()
+
+    def _drain_tracepoints(self: PtraceInterface) -> None:
+        """Moves the records written by the tracepoints in the process to their `records`."""
+        for tp in self._tracepoints.values():
+            try:
+                self._drain_tracepoint(tp)
+            except OSError as e:
+                # The process might be gone
+                liblog.debugger("Could not read the records of the tracepoint at %x: %s", tp.address, e)
+
+    def _drain_tracepoint(self: PtraceInterface, tp: Tracepoint) -> None:
+        """Moves the records written by a tracepoint in the process to its `records`."""
+        head = int.from_bytes(self.read_memory(tp._ring, 8), "little")
+
+        # The ring buffer goes back in time when a checkpoint is restored
+        tp._tail = min(tp._tail, head)
+
+        if head - tp._tail > tp.capacity:
+            tp.dropped += head - tp._tail - tp.capacity
+            tp._tail = head - tp.capacity
+
+        count = head - tp._tail
+
+        if not count:
+            return
+
+        size = record_size(tp.registers)
+        start = tp._tail % tp.capacity
+        first = min(count, tp.capacity - start)
+
+        regions = [(tp._ring + RING_HEADER_SIZE + start * size, first * size)]
+        if count > first:
+            regions.append((tp._ring + RING_HEADER_SIZE, (count - first) * size))
+
+        data = self.read_memory_many(regions)
+
+        for i, record in enumerate(struct.iter_unpack(f"<{len(tp.registers) + 1}Q", data)):
+            # A thread stopped while writing the record, or the record was overwritten in the meantime
+            if record[0] != tp._tail + i + 1:
+                tp.dropped += 1
+            else:
+                tp.records.append(record[1:])
+
+        tp._tail = head
+
     def forward_signal(self: PtraceInterface) -> None:
         """Set the signals to forward to the threads."""
         # change the global_state
@@ -440,21 +677,30 @@ class PtraceInterface(DebuggingInterface):
 
     def migrate_to_gdb(self: PtraceInterface) -> None:
         """Migrates the current process to GDB."""
+        self._sync_hardware_breakpoints()
+        self._sync_page_protections(active=False)
+
+        if self._filtered_syscalls:
+            liblog.warning("The syscalls reported by the syscall filter will fail with ENOSYS while in GDB.")
+
         self.lib_trace.ptrace_detach_for_migration(self._global_state, self.process_id)
 
     def migrate_from_gdb(self: PtraceInterface) -> None:
         """Migrates the current process from GDB."""
         self.lib_trace.ptrace_reattach_from_gdb(self._global_state, self.process_id)
 
-        invalidate_process_cache()
+        self._invalidate_caches()
         self.status_handler.check_for_new_threads(self.process_id)
 
-        # We have to reinstall any hardware breakpoint
-        for bp in self._internal_debugger.breakpoints.values():
-            if bp.hardware and bp.enabled:
-                for helper in self.hardware_bp_helpers.values():
-                    helper.remove_breakpoint(bp)
-                    helper.install_breakpoint(bp)
+        # The stops of the syscall filter must be traced again
+        if self._filtered_syscalls:
+            for thread in self._internal_debugger.threads:
+                if not thread.dead:
+                    self.lib_trace.ptrace_set_options(thread.thread_id, True)
+
+        # We have to reinstall any hardware breakpoint, GDB might have changed the debug registers
+        for helper in self.hardware_bp_helpers.values():
+            helper.invalidate()
 
     def register_new_thread(self: PtraceInterface, new_thread_id: int) -> None:
         """Registers a new thread.
@@ -479,12 +725,19 @@ class PtraceInterface(DebuggingInterface):
             self._peek_user,
             self._poke_user,
         )
-        self.hardware_bp_helpers[new_thread_id] = thread_hw_bp_helper
 
         # For any hardware breakpoints, we need to reapply them to the new thread
-        for bp in self._internal_debugger.breakpoints.values():
-            if bp.hardware:
-                thread_hw_bp_helper.install_breakpoint(bp)
+        # Every thread has the same ones, which are written to the new thread when it resumes
+        other_helper = next(iter(self.hardware_bp_helpers.values()), None)
+
+        if other_helper is not None:
+            thread_hw_bp_helper.copy_breakpoints(other_helper)
+        else:
+            for bp in self._internal_debugger.breakpoints.values():
+                if bp.hardware and bp.enabled:
+                    thread_hw_bp_helper.install_breakpoint(bp)
+
+        self.hardware_bp_helpers[new_thread_id] = thread_hw_bp_helper
 
     def unregister_thread(
         self: PtraceInterface,
@@ -512,20 +765,79 @@ class PtraceInterface(DebuggingInterface):
         Args:
             bp (Breakpoint): The breakpoint to set.
         """
+        # An invalid condition must be reported before the breakpoint is installed
+        condition = compile_condition(bp.when, self._register_offsets()) if bp.when else None
+
         self.lib_trace.register_breakpoint(
             self._global_state,
             self.process_id,
             bp.address,
         )
 
+        if condition:
+            self.lib_trace.set_breakpoint_condition(
+                self._global_state,
+                bp.address,
+                self.ffi.new("uint64_t[]", condition),
+                len(condition),
+            )
+
+        if bp.counting:
+            self.lib_trace.set_breakpoint_counting(self._global_state, bp.address, 1)
+            self._counting_breakpoints[bp.address] = bp
+
+        self._undisplaced.discard(bp.address)
+        self._set_displaced_instruction(bp.address)
+
+    def _set_displaced_instruction(self: PtraceInterface, address: int) -> None:
+        """Lets the backend step over the breakpoint at the specified address by executing its instruction out of line.
+
+        Args:
+            address (int): The address of the breakpoint.
+        """
+        try:
+            code = self.read_memory(address, DISPLACED_MAX_LENGTH)
+        except OSError:
+            # The instruction is stepped in place
+            return
+
+        displaced = get_displaced_instruction(code, address)
+
+        if displaced is None:
+            return
+
+        instruction, disp_offset, flags = displaced
+        self.lib_trace.set_breakpoint_displacement(
+            self._global_state,
+            address,
+            self.ffi.from_buffer("uint8_t[]", instruction),
+            len(instruction),
+            disp_offset,
+            flags,
+        )
+
     def _unset_sw_breakpoint(self: PtraceInterface, bp: Breakpoint) -> None:
         """Unsets a software breakpoint at the specified address.
 
         Args:
             bp (Breakpoint): The breakpoint to unset.
         """
+        if self._counting_breakpoints.pop(bp.address, None):
+            bp.hit_count += self.lib_trace.collect_breakpoint_hits(self._global_state, bp.address)
+
+        self._undisplaced.discard(bp.address)
         self.lib_trace.unregister_breakpoint(self._global_state, bp.address)
 
+    def _displace_stopped_breakpoints(self: PtraceInterface) -> None:
+        """Decodes the instructions of the breakpoints set in bulk that a thread is about to step over."""
+        if not self._undisplaced:
+            return
+
+        for thread in self._internal_debugger.threads:
+            if not thread.dead and thread.instruction_pointer in self._undisplaced:
+                self._undisplaced.discard(thread.instruction_pointer)
+                self._set_displaced_instruction(thread.instruction_pointer)
+
     def _enable_breakpoint(self: PtraceInterface, bp: Breakpoint) -> None:
         """Enables a breakpoint at the specified address.
 
@@ -552,7 +864,14 @@ class PtraceInterface(DebuggingInterface):
         if bp.hardware:
             for helper in self.hardware_bp_helpers.values():
                 helper.install_breakpoint(bp)
+        elif bp._page_watchpoint:
+            # The pages are protected when the process is resumed
+            if insert:
+                self._check_page_watchpoint(bp)
         elif insert:
+            if self._find_tracepoints(bp.address, 1):
+                raise ValueError(f"The breakpoint at {bp.address:#x} overlaps a tracepoint.")
+
             self._set_sw_breakpoint(bp)
         else:
             self._enable_breakpoint(bp)
@@ -560,6 +879,42 @@ class PtraceInterface(DebuggingInterface):
         if insert:
             self._internal_debugger.breakpoints[bp.address] = bp
 
+    def set_breakpoints(self: PtraceInterface, bps: list[Breakpoint]) -> None:
+        """Sets many software breakpoints at once.
+
+        Args:
+            bps (list[Breakpoint]): The breakpoints to set. Addresses that already hold a breakpoint are skipped.
+        """
+        # A breakpoint already set at an address, such as a hardware one, must not be orphaned
+        bps = [bp for bp in bps if bp.address not in self._internal_debugger.breakpoints]
+
+        if not bps:
+            return
+
+        for bp in bps:
+            if self._find_tracepoints(bp.address, 1):
+                raise ValueError(f"The breakpoint at {bp.address:#x} overlaps a tracepoint.")
+
+        addresses = [bp.address for bp in bps]
+
+        result = self.lib_trace.register_breakpoints(
+            self._global_state,
+            self.process_id,
+            self.ffi.new("uint64_t[]", addresses),
+            len(addresses),
+        )
+        liblog.debugger("Registration of %d breakpoints returned with result %d", len(addresses), result)
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+        # Decoding the instructions is left for when a thread has to step over a breakpoint
+        self._undisplaced.update(addresses)
+
+        for bp in bps:
+            self._internal_debugger.breakpoints[bp.address] = bp
+
     def unset_breakpoint(self: PtraceInterface, bp: Breakpoint, delete: bool = True) -> None:
         """Restores the breakpoint at the specified address.
 
@@ -570,6 +925,9 @@ class PtraceInterface(DebuggingInterface):
         if bp.hardware:
             for helper in self.hardware_bp_helpers.values():
                 helper.remove_breakpoint(bp)
+        elif bp._page_watchpoint:
+            # The pages are restored when the process is resumed
+            pass
         elif delete:
             self._unset_sw_breakpoint(bp)
         else:
@@ -578,6 +936,461 @@ class PtraceInterface(DebuggingInterface):
         if delete:
             del self._internal_debugger.breakpoints[bp.address]
 
+    def _check_page_watchpoint(self: PtraceInterface, bp: Breakpoint) -> None:
+        """Checks that the range of a page watchpoint is mapped and not executable, so that it can be protected."""
+        address = bp.address
+        end = bp.address + bp.length
+
+        for vmap in self.maps():
+            if vmap.start <= address < vmap.end:
+                if "x" in vmap.permissions:
+                    raise ValueError(f"The watchpoint at {bp.address:#x} covers executable memory.")
+
+                address = vmap.end
+
+                if address >= end:
+                    return
+
+        raise ValueError(f"The watchpoint at {bp.address:#x} covers unmapped memory.")
+
+    def _watched_pages(self: PtraceInterface) -> dict[int, bool]:
+        """Returns the pages covered by the enabled page watchpoints, along with whether their reads are watched."""
+        pages = {}
+
+        for bp in self._internal_debugger.breakpoints.values():
+            if bp._page_watchpoint and bp.enabled:
+                for page in range(bp.address & ~(mmap.PAGESIZE - 1), bp.address + bp.length, mmap.PAGESIZE):
+                    pages[page] = pages.get(page, False) or bp.condition == "rw"
+
+        return pages
+
+    def _sync_page_protections(self: PtraceInterface, active: bool = True) -> None:
+        """Protects the pages of the enabled page watchpoints, and restores the pages that are no longer watched.
+
+        Args:
+            active (bool): Whether the page watchpoints must be active. Otherwise, every page is restored.
+        """
+        watched = self._watched_pages() if active else {}
+
+        if not watched and not self._protected_pages or self._global_state.t_HEAD == self.ffi.NULL:
+            return
+
+        new_pages = [page for page in watched if page not in self._protected_pages]
+
+        if new_pages:
+            maps = self.maps()
+
+            for page in new_pages:
+                vmap = next((vmap for vmap in maps if vmap.start <= page < vmap.end), None)
+
+                # The page might have been unmapped since the watchpoint was set
+                if vmap is not None:
+                    protection = sum(
+                        flag
+                        for char, flag in (("r", mmap.PROT_READ), ("w", mmap.PROT_WRITE), ("x", mmap.PROT_EXEC))
+                        if char in vmap.permissions
+                    )
+                    self._protected_pages[page] = [protection, protection]
+
+        # Contiguous pages that need the same protection are changed at once
+        changes = []
+
+        for page, (original, current) in sorted(self._protected_pages.items()):
+            if page not in watched:
+                protection = original
+            elif watched[page]:
+                protection = PROT_NONE
+            else:
+                protection = original & ~mmap.PROT_WRITE
+
+            if protection == current:
+                continue
+
+            if changes and changes[-1][0] + changes[-1][1] == page and changes[-1][2] == protection:
+                changes[-1][1] += mmap.PAGESIZE
+            else:
+                changes.append([page, mmap.PAGESIZE, protection])
+
+        thread_id = self._global_state.t_HEAD.tid
+
+        for start, size, protection in changes:
+            result = self._protect_memory(thread_id, start, size, protection)
+
+            for page in range(start, start + size, mmap.PAGESIZE):
+                if result < 0:
+                    # The page is gone
+                    del self._protected_pages[page]
+                else:
+                    self._protected_pages[page][1] = protection
+
+        for page in [page for page, (original, current) in self._protected_pages.items() if page not in watched]:
+            if original == current:
+                del self._protected_pages[page]
+
+    def _protect_memory(self: PtraceInterface, thread_id: int, address: int, size: int, protection: int) -> int:
+        """Changes the protection of a memory range of the process, returning the result of mprotect."""
+        result = self.inject_syscall(thread_id, resolve_syscall_number("mprotect"), address, size, protection)
+
+        if result < 0:
+            liblog.debugger("Could not protect the memory at %x: %s", address, os.strerror(-result))
+
+        return result
+
+    def _protection_fault_address(self: PtraceInterface, thread_id: int) -> int | None:
+        """Returns the address accessed by a thread that received a SIGSEGV, if a page watchpoint caused it."""
+        if not self._protected_pages:
+            return None
+
+        address = self.ffi.new("uint64_t *")
+
+        if self.lib_trace.ptrace_get_fault_address(thread_id, address) != SEGV_ACCERR:
+            return None
+
+        if address[0] & ~(mmap.PAGESIZE - 1) not in self._protected_pages:
+            return None
+
+        return address[0]
+
+    def handle_page_fault(self: PtraceInterface, thread_id: int) -> list[Breakpoint] | None:
+        """Executes the access of a thread to a page protected for the page watchpoints, and returns the ones it hit.
+
+        The thread is stepped over the faulting instruction with the pages it accesses restored, which are then
+        protected again. The other threads are stopped in the meantime, so that none of their accesses is missed.
+
+        Args:
+            thread_id (int): The thread that received the SIGSEGV.
+
+        Returns:
+            list[Breakpoint] | None: The page watchpoints hit by the access, or None if they did not cause the fault.
+        """
+        address = self._protection_fault_address(thread_id)
+
+        if address is None:
+            return None
+
+        # An access can cross into an adjacent page
+        low = (address & ~(mmap.PAGESIZE - 1)) - mmap.PAGESIZE
+        high = low + 3 * mmap.PAGESIZE
+        watchpoints = [
+            bp
+            for bp in self._internal_debugger.breakpoints.values()
+            if bp._page_watchpoint and bp.enabled and bp.address < high and low < bp.address + bp.length
+        ]
+
+        # A write that leaves the watched bytes unchanged cannot be told apart from a read on a page protected
+        # against both, so the content of the write watchpoints is compared
+        contents = {bp.address: self.read_memory(bp.address, bp.length) for bp in watchpoints if bp.condition == "w"}
+
+        faults = []
+        completed = False
+
+        while address is not None:
+            page = address & ~(mmap.PAGESIZE - 1)
+
+            if any(fault & ~(mmap.PAGESIZE - 1) == page for fault in faults):
+                break
+
+            faults.append(address)
+            self._protect_memory(thread_id, page, mmap.PAGESIZE, self._protected_pages[page][0])
+
+            status = self.lib_trace.ptrace_step_thread(self._global_state, thread_id)
+
+            if status == -1:
+                error = self.ffi.errno
+                raise OSError(error, errno.errorcode[error])
+
+            if not os.WIFSTOPPED(status) or os.WSTOPSIG(status) != signal.SIGSEGV:
+                completed = os.WIFSTOPPED(status)
+                break
+
+            # The instruction might have accessed another protected page as well
+            # Any other fault is raised again when the thread is resumed, and then forwarded
+            address = self._protection_fault_address(thread_id)
+
+        for fault in faults:
+            page = fault & ~(mmap.PAGESIZE - 1)
+            self._protect_memory(thread_id, page, mmap.PAGESIZE, self._protected_pages[page][1])
+
+        if not completed:
+            return []
+
+        # Faults on pages protected only against writes are caused by writes
+        written = all(self._protected_pages[fault & ~(mmap.PAGESIZE - 1)][1] != PROT_NONE for fault in faults)
+        hits = []
+
+        for bp in watchpoints:
+            accessed = any(bp.address <= fault < bp.address + bp.length for fault in faults)
+
+            if bp.condition == "rw":
+                hit = accessed
+            else:
+                hit = (accessed and written) or self.read_memory(bp.address, bp.length) != contents[bp.address]
+
+            if hit:
+                hits.append(bp)
+
+        return hits
+
+    def install_coverage(self: PtraceInterface, addresses: list[int], bitmap: bytearray) -> None:
+        """Installs a one-shot breakpoint at each address, which marks the bitmap when it is reached.
+
+        Args:
+            addresses (list[int]): The addresses to cover.
+            bitmap (bytearray): The bitmap whose i-th bit is set when the i-th address is reached.
+        """
+        buffer = self.ffi.from_buffer("uint8_t[]", bitmap)
+        result = self.lib_trace.ptrace_install_coverage(
+            self._global_state,
+            self.process_id,
+            self.ffi.new("uint64_t[]", addresses),
+            len(addresses),
+            buffer,
+        )
+        liblog.debugger("Installation of %d coverage points returned with result %d", len(addresses), result)
+
+        # The backend writes into the bitmap until the points are reached or freed
+        self._coverage_bitmaps.append((bitmap, buffer))
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+    def set_tracepoint(self: PtraceInterface, tp: Tracepoint) -> None:
+        """Diverts the execution at the address of a tracepoint to a trampoline that records the registers.
+
+        Args:
+            tp (Tracepoint): The tracepoint to set.
+        """
+        # The trampoline ends with the relocated instructions, which are measured at their current address first
+        code = self.read_memory(tp.address, 2 * DISPLACED_MAX_LENGTH)
+        _, length = relocate_instructions(code, tp.address, tp.address, JUMP_SIZE)
+        prologue_size = len(build_trampoline_prologue(tp.address, tp.registers, 0, tp.capacity))
+
+        if self._find_tracepoints(tp.address, length) or any(
+            not bp.hardware and not bp._page_watchpoint and tp.address <= bp.address < tp.address + length
+            for bp in self._internal_debugger.breakpoints.values()
+        ):
+            raise ValueError(f"The tracepoint at {tp.address:#x} overlaps another breakpoint or tracepoint.")
+
+        for thread in self._internal_debugger.threads:
+            if not thread.dead and tp.address < thread.instruction_pointer < tp.address + length:
+                raise ValueError(f"Thread {thread.thread_id} is stopped inside the instructions of the tracepoint.")
+
+        thread_id = self._global_state.t_HEAD.tid
+        ring = self._map_memory(thread_id, 0, ring_size(tp.registers, tp.capacity), mmap.PROT_READ | mmap.PROT_WRITE)
+        trampoline = self._allocate_trampoline(thread_id, tp.address, prologue_size + 2 * length + 4 * JUMP_SIZE)
+
+        prologue = build_trampoline_prologue(tp.address, tp.registers, ring, tp.capacity)
+        relocated, length = relocate_instructions(code, tp.address, trampoline + len(prologue), JUMP_SIZE)
+        end = trampoline + len(prologue) + len(relocated)
+
+        self.write_memory(trampoline, prologue + relocated + build_jump(end, tp.address + length))
+
+        # The bytes after the jump are never executed
+        self.write_memory(tp.address, build_jump(tp.address, trampoline) + b"\xcc" * (length - JUMP_SIZE))
+
+        tp._ring = ring
+        tp._original = code[:length]
+        self._tracepoints[tp.address] = tp
+
+    def owned_memory(self: PtraceInterface) -> list[tuple[int, int]]:
+        """Returns the memory ranges the debugger mapped in the process for its own use.
+
+        Returns:
+            list[tuple[int, int]]: The start and the end of each range.
+        """
+        scratch = [self._global_state.scratch[i] for i in range(self._global_state.scratch_count)]
+        return self._owned_memory + [(address, address + mmap.PAGESIZE) for address in scratch]
+
+    def _find_tracepoints(self: PtraceInterface, address: int, size: int) -> list[Tracepoint]:
+        """Returns the tracepoints whose instructions overlap a memory range."""
+        return [
+            tp
+            for tp in self._tracepoints.values()
+            if tp.address < address + size and address < tp.address + len(tp._original)
+        ]
+
+    def _remove_tracepoint(self: PtraceInterface, tp: Tracepoint) -> None:
+        """Restores the instructions of a tracepoint, after collecting its last records.
+
+        The trampoline is left in place, as a thread might be executing it.
+        """
+        self._drain_tracepoint(tp)
+        del self._tracepoints[tp.address]
+        self.write_memory(tp.address, tp._original)
+        tp.enabled = False
+
+    def _map_memory(self: PtraceInterface, thread_id: int, hint: int, size: int, protection: int) -> int:
+        """Maps anonymous memory in the process for the use of the debugger."""
+        address = self.inject_syscall(
+            thread_id,
+            resolve_syscall_number("mmap"),
+            hint,
+            size,
+            protection,
+            mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS,
+            -1,
+            0,
+        )
+
+        if address < 0:
+            raise OSError(-address, os.strerror(-address))
+
+        self._owned_memory.append((address, address + size))
+        return address
+
+    def _allocate_trampoline(self: PtraceInterface, thread_id: int, address: int, size: int) -> int:
+        """Returns the address of an executable area of the process, close enough to be reached with a jump."""
+        for page in self._trampoline_pages:
+            start, used = page
+
+            if used + size <= mmap.PAGESIZE and abs(start - address) < (1 << 31) - mmap.PAGESIZE:
+                page[1] += size
+                return start + used
+
+        # The page is requested 1 GiB away from the code, well within the range of a jump
+        hint = address - (1 << 30) if address > 1 << 31 else address + (1 << 30)
+        start = self._map_memory(thread_id, hint & ~(mmap.PAGESIZE - 1), mmap.PAGESIZE, mmap.PROT_READ | mmap.PROT_EXEC)
+
+        self._trampoline_pages.append([start, size])
+        return start
+
+    def _sync_syscall_filter(self: PtraceInterface, handled: list[int]) -> None:
+        """Lets a seccomp filter report the handled syscalls, so that the threads do not stop at any other syscall.
+
+        Filters cannot be removed, so a new filter is installed only when a syscall that is not reported yet is
+        handled. The threads are stopped at every syscall when the filter is disabled or cannot be installed.
+
+        Args:
+            handled (list[int]): The numbers of the handled syscalls.
+        """
+        if (
+            self._internal_debugger.syscall_filter
+            and not self._syscall_filter_failed
+            and handled
+            and not self._filtered_syscalls.issuperset(handled)
+        ):
+            if len(handled) > MAX_FILTERED_SYSCALLS:
+                liblog.debugger("Too many handled syscalls, the threads stop at every syscall.")
+            else:
+                try:
+                    self._install_syscall_filter(handled)
+                except OSError as e:
+                    liblog.warning(f"The syscall filter cannot be installed ({e}), the threads stop at every syscall.")
+                    self._syscall_filter_failed = True
+
+        # The backend resumes the threads with PTRACE_SYSCALL only inside the syscalls the filter reports
+        if self._filtered_syscalls and self._filtered_syscalls.issuperset(handled):
+            self._global_state.syscall_filter_enabled = True
+            bitmap = build_filter_bitmap(handled)
+            self.ffi.memmove(self._global_state.syscall_filter, bitmap, len(bitmap))
+        else:
+            self._global_state.syscall_filter_enabled = False
+
+    def _install_syscall_filter(self: PtraceInterface, numbers: list[int]) -> None:
+        """Installs a seccomp filter in every thread, which reports the specified syscalls to the debugger.
+
+        Args:
+            numbers (list[int]): The numbers of the syscalls to report.
+        """
+        thread_id = self._global_state.t_HEAD.tid
+
+        if not self._filtered_syscalls:
+            # An unprivileged process must give up gaining privileges to install a filter
+            result = self.inject_syscall(thread_id, resolve_syscall_number("prctl"), PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0)
+
+            if result < 0:
+                raise OSError(-result, os.strerror(-result))
+
+        syscall_filter = build_syscall_filter(numbers)
+        size = 16 + len(syscall_filter)
+
+        # The kernel copies the filter, the memory that holds it is released right away
+        address = self.inject_syscall(
+            thread_id,
+            resolve_syscall_number("mmap"),
+            0,
+            size,
+            mmap.PROT_READ | mmap.PROT_WRITE,
+            mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS,
+            -1,
+            0,
+        )
+
+        if address < 0:
+            raise OSError(-address, os.strerror(-address))
+
+        try:
+            self.write_memory(address, build_filter_program(address, syscall_filter))
+            result = self.inject_syscall(
+                thread_id,
+                resolve_syscall_number("seccomp"),
+                SECCOMP_SET_MODE_FILTER,
+                SECCOMP_FILTER_FLAG_TSYNC,
+                address,
+            )
+        finally:
+            self.inject_syscall(thread_id, resolve_syscall_number("munmap"), address, size)
+
+        if result < 0:
+            raise OSError(-result, os.strerror(-result))
+
+        if result > 0:
+            raise OSError(errno.EAGAIN, f"Thread {result} cannot install the filter")
+
+        self._filtered_syscalls.update(numbers)
+        liblog.debugger("Installed a syscall filter for %d syscalls", len(numbers))
+
+    def _sync_syscall_rules(self: PtraceInterface) -> None:
+        """Lets the backend rewrite the hijacked syscalls at their entry, so that the process does not stop.
+
+        A syscall is rewritten by the callback of its handler instead when it is pretty printed or recorded, or when
+        the handler of the new syscall has to be called as well.
+        """
+        handlers = self._internal_debugger.handled_syscalls
+        recording = self._internal_debugger.syscall_recorder is not None
+
+        rules = {}
+
+        for number, handler in handlers.items():
+            if not handler.enabled or handler._rule is None or number >= FILTER_SYSCALLS_SIZE:
+                continue
+
+            if recording or handler.on_enter_pprint or handler.on_exit_pprint:
+                continue
+
+            target = handlers.get(handler._rule.get("syscall_number"))
+
+            if target is not None and (target.on_enter_pprint or (handler.recursive and target.enabled)):
+                continue
+
+            rules[number] = handler._rule
+
+        for number in self._syscall_rules - rules.keys():
+            self._global_state.syscall_rules[number].flags = 0
+
+        for number, rule in rules.items():
+            entry = self._global_state.syscall_rules[number]
+            flags = 0
+
+            if "syscall_number" in rule:
+                flags |= SyscallRuleFlags.NUMBER
+                entry.new_number = rule["syscall_number"] & 0xFFFFFFFFFFFFFFFF
+
+            for index in range(6):
+                if f"syscall_arg{index}" in rule:
+                    flags |= SyscallRuleFlags.ARG0 << index
+                    entry.args[index] = rule[f"syscall_arg{index}"] & 0xFFFFFFFFFFFFFFFF
+
+            if "syscall_return" in rule:
+                flags |= SyscallRuleFlags.RETURN
+                entry.return_value = rule["syscall_return"] & 0xFFFFFFFFFFFFFFFF
+
+            entry.flags = flags
+
+        self._syscall_rules.update(rules)
+        self._global_state.syscall_rules_enabled = bool(rules)
+
     def set_syscall_handler(self: PtraceInterface, handler: SyscallHandler) -> None:
         """Sets a handler for a syscall.
 
@@ -623,10 +1436,20 @@ class PtraceInterface(DebuggingInterface):
         if error:
             raise OSError(error, errno.errorcode[error])
 
+        if self._has_patched_memory():
+            word = self.ffi.new("uint64_t *", result)
+            self._mask_breakpoints(address, self.ffi.cast("uint8_t *", word), 8)
+            result = word[0]
+
         return result
 
     def poke_memory(self: PtraceInterface, address: int, value: int) -> None:
         """Writes the memory at the specified address."""
+        if self._has_patched_memory():
+            word = self.ffi.new("uint64_t *", value)
+            self._shadow_breakpoints(address, self.ffi.cast("uint8_t *", word), 8)
+            value = word[0]
+
         result = self.lib_trace.ptrace_pokedata(self.process_id, address, value)
         liblog.debugger(
             "POKEDATA at address %d returned with result %d",
@@ -638,6 +1461,338 @@ class PtraceInterface(DebuggingInterface):
             error = self.ffi.errno
             raise OSError(error, errno.errorcode[error])
 
+    def read_memory(self: PtraceInterface, address: int, size: int) -> bytes:
+        """Reads a contiguous memory range in a single pass."""
+        data = b""
+
+        if self._memory_fd is not None:
+            try:
+                data = os.pread(self._memory_fd, size, address)
+            except (OSError, OverflowError) as e:
+                # OverflowError is raised for addresses that do not fit in a file offset
+                liblog.debugger("pread on /proc/%d/mem failed at address %x: %s", self.process_id, address, e)
+
+        if len(data) < size:
+            # Read what /proc/<pid>/mem could not provide through ptrace
+            buffer = self.ffi.new("uint8_t[]", size - len(data))
+            self._ptrace_read_memory(address + len(data), buffer, size - len(data))
+            data += self.ffi.buffer(buffer)[:]
+
+        if not self._has_patched_memory():
+            return data
+
+        masked = bytearray(data)
+        self._mask_breakpoints(address, self.ffi.from_buffer("uint8_t[]", masked), size)
+        return bytes(masked)
+
+    def read_memory_into(self: PtraceInterface, address: int, buffer: bytearray | memoryview) -> int:
+        """Reads a contiguous memory range directly into the specified writable buffer.
+
+        Args:
+            address (int): The address to read from.
+            buffer (bytearray | memoryview): The buffer to fill. Its length is the number of bytes to read.
+
+        Returns:
+            int: The number of bytes read.
+        """
+        view = memoryview(buffer).cast("B")
+        size = len(view)
+        read = 0
+
+        if self._memory_fd is not None:
+            try:
+                read = os.preadv(self._memory_fd, [view], address)
+            except (OSError, OverflowError) as e:
+                # OverflowError is raised for addresses that do not fit in a file offset
+                liblog.debugger("preadv on /proc/%d/mem failed at address %x: %s", self.process_id, address, e)
+
+        if read < size:
+            # Read what /proc/<pid>/mem could not provide through ptrace
+            remainder = self.ffi.from_buffer("uint8_t[]", view[read:], require_writable=True)
+            self._ptrace_read_memory(address + read, remainder, size - read)
+
+        if self._has_patched_memory():
+            self._mask_breakpoints(address, self.ffi.from_buffer("uint8_t[]", view, require_writable=True), size)
+
+        return size
+
+    def write_memory(self: PtraceInterface, address: int, data: bytes) -> None:
+        """Writes a contiguous memory range in a single pass."""
+        written = 0
+
+        if self._has_patched_memory():
+            data = bytearray(data)
+            self._shadow_breakpoints(address, self.ffi.from_buffer("uint8_t[]", data), len(data))
+
+        if self._memory_fd is not None:
+            try:
+                written = os.pwrite(self._memory_fd, data, address)
+            except (OSError, OverflowError) as e:
+                # OverflowError is raised for addresses that do not fit in a file offset
+                liblog.debugger("pwrite on /proc/%d/mem failed at address %x: %s", self.process_id, address, e)
+
+            if written == len(data):
+                return
+
+        # Write what /proc/<pid>/mem could not accept through ptrace
+        buffer = self.ffi.from_buffer("uint8_t[]", data)
+        result = self.lib_trace.ptrace_write_memory(
+            self.process_id,
+            address + written,
+            buffer + written,
+            len(data) - written,
+        )
+        liblog.debugger(
+            "Write of %d bytes at address %x returned with result %d",
+            len(data) - written,
+            address + written,
+            result,
+        )
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+    def read_memory_many(self: PtraceInterface, regions: list[tuple[int, int]]) -> bytes:
+        """Reads multiple memory ranges with as few syscalls as possible.
+
+        Args:
+            regions (list[tuple[int, int]]): The (address, size) pairs to read.
+
+        Returns:
+            bytes: The concatenation of the read ranges, in the same order as the regions.
+        """
+        addresses = self.ffi.new("uint64_t[]", [address for address, _ in regions])
+        sizes = self.ffi.new("uint64_t[]", [size for _, size in regions])
+        buffer = self.ffi.new("uint8_t[]", sum(size for _, size in regions))
+
+        result = self.lib_trace.ptrace_read_memory_vector(self.process_id, addresses, sizes, len(regions), buffer)
+        liblog.debugger("Read of %d memory ranges returned with result %d", len(regions), result)
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+        if self._has_patched_memory():
+            offset = 0
+            for address, size in regions:
+                self._mask_breakpoints(address, buffer + offset, size)
+                offset += size
+
+        return self.ffi.buffer(buffer)[:]
+
+    def write_memory_many(self: PtraceInterface, regions: list[tuple[int, bytes]]) -> None:
+        """Writes multiple memory ranges with as few syscalls as possible.
+
+        Args:
+            regions (list[tuple[int, bytes]]): The (address, data) pairs to write.
+        """
+        addresses = self.ffi.new("uint64_t[]", [address for address, _ in regions])
+        sizes = self.ffi.new("uint64_t[]", [len(data) for _, data in regions])
+        joined = bytearray().join(data for _, data in regions)
+        buffer = self.ffi.from_buffer("uint8_t[]", joined)
+
+        if self._has_patched_memory():
+            offset = 0
+            for address, region in regions:
+                self._shadow_breakpoints(address, buffer + offset, len(region))
+                offset += len(region)
+
+        result = self.lib_trace.ptrace_write_memory_vector(self.process_id, addresses, sizes, len(regions), buffer)
+        liblog.debugger("Write of %d memory ranges returned with result %d", len(regions), result)
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+    def follow_pointers(
+        self: PtraceInterface,
+        address: int,
+        next_offset: int,
+        payload_size: int,
+        max_nodes: int,
+    ) -> list[tuple[int, bytes]]:
+        """Walks a linked structure, reading the payload of every node.
+
+        Args:
+            address (int): The address of the first node.
+            next_offset (int): The offset of the pointer to the next node, inside each node.
+            payload_size (int): The number of bytes to read from the start of each node.
+            max_nodes (int): The maximum number of nodes to visit.
+
+        Returns:
+            list[tuple[int, bytes]]: The address and the payload of each visited node.
+        """
+        nodes = self.ffi.new("uint64_t[]", max_nodes)
+        payloads = self.ffi.new("uint8_t[]", max_nodes * payload_size)
+
+        count = self.lib_trace.ptrace_follow_pointers(
+            self.process_id,
+            address,
+            next_offset,
+            payload_size,
+            max_nodes,
+            nodes,
+            payloads,
+        )
+        liblog.debugger("Pointer walk from address %x returned with result %d", address, count)
+
+        if count == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+        if self._has_patched_memory():
+            for i in range(count):
+                self._mask_breakpoints(nodes[i], payloads + i * payload_size, payload_size)
+
+        data = self.ffi.buffer(payloads, count * payload_size)[:]
+
+        return [(nodes[i], data[i * payload_size : (i + 1) * payload_size]) for i in range(count)]
+
+    def inject_syscall(self: PtraceInterface, thread_id: int, number: int, *args: int) -> int:
+        """Executes a syscall in the context of a stopped thread, preserving its registers and code.
+
+        Args:
+            thread_id (int): The thread that executes the syscall.
+            number (int): The syscall number.
+            *args (int): The syscall arguments.
+
+        Returns:
+            int: The return value of the syscall.
+        """
+        if len(args) > 6:
+            raise ValueError("A syscall accepts at most 6 arguments.")
+
+        arguments = self.ffi.new("uint64_t[6]", [arg & 0xFFFFFFFFFFFFFFFF for arg in args])
+        result = self.ffi.new("uint64_t *")
+
+        retval = self.lib_trace.ptrace_inject_syscall(self._global_state, thread_id, number, arguments, result)
+        error = self.ffi.errno
+        liblog.debugger("Injected syscall %d in thread %d returned %#x", number, thread_id, result[0])
+
+        # The syscall might have changed the memory and the memory maps of the process
+        self._invalidate_caches()
+
+        if retval == -1:
+            raise OSError(error, errno.errorcode[error])
+
+        # Syscalls return negative error codes
+        return result[0] - (1 << 64) if result[0] & (1 << 63) else result[0]
+
+    def detach_forked_child(self: PtraceInterface, thread_id: int, child_id: int) -> None:
+        """Detaches from a child forked by an injected syscall, leaving it stopped in the state of its parent.
+
+        Args:
+            thread_id (int): The thread that executed the fork.
+            child_id (int): The PID of the child process.
+        """
+        # The pages protected for the page watchpoints are given back their original protection in the child
+        pages = [(page, original) for page, (original, current) in self._protected_pages.items() if original != current]
+
+        result = self.lib_trace.ptrace_detach_forked_child(
+            self._global_state,
+            thread_id,
+            child_id,
+            self.ffi.new("uint64_t[]", [page for page, _ in pages]),
+            self.ffi.new("uint64_t[]", [protection for _, protection in pages]),
+            len(pages),
+        )
+        liblog.debugger("Detach from forked child %d returned with result %d", child_id, result)
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+    def get_registers(self: PtraceInterface) -> dict[int, bytes]:
+        """Returns a copy of the register file of each thread.
+
+        Returns:
+            dict[int, bytes]: The register file of each thread, indexed by thread ID.
+        """
+        registers = {}
+
+        cursor = self._global_state.t_HEAD
+        while cursor != self.ffi.NULL:
+            registers[cursor.tid] = self.ffi.buffer(self.ffi.addressof(cursor, "regs"))[:]
+            cursor = cursor.next
+
+        return registers
+
+    def set_registers(self: PtraceInterface, registers: dict[int, bytes]) -> None:
+        """Replaces the register file of the given threads. The changes are applied when the process is resumed.
+
+        Args:
+            registers (dict[int, bytes]): The register file of each thread, indexed by thread ID.
+        """
+        cursor = self._global_state.t_HEAD
+        while cursor != self.ffi.NULL:
+            if cursor.tid in registers:
+                register_file = registers[cursor.tid]
+                self.ffi.memmove(self.ffi.addressof(cursor, "regs"), register_file, len(register_file))
+            cursor = cursor.next
+
+    def _ptrace_read_memory(self: PtraceInterface, address: int, buffer: object, size: int) -> None:
+        """Reads a contiguous memory range into a cffi buffer through the ptrace backend."""
+        result = self.lib_trace.ptrace_read_memory(self.process_id, address, buffer, size)
+        liblog.debugger(
+            "Read of %d bytes at address %x returned with result %d",
+            size,
+            address,
+            result,
+        )
+
+        if result == -1:
+            error = self.ffi.errno
+            raise OSError(error, errno.errorcode[error])
+
+    def _register_offsets(self: PtraceInterface) -> dict[str, int]:
+        """Returns the offset of each register in the register file of a thread, as seen by the breakpoint conditions."""
+        return {name: field.offset for name, field in self.ffi.typeof("struct user_regs_struct").fields}
+
+    def _has_patched_memory(self: PtraceInterface) -> bool:
+        """Returns whether the backend keeps breakpoints installed in the memory of the process."""
+        return (
+            self._global_state.b_HEAD != self.ffi.NULL
+            or self._global_state.cov_installed > 0
+            or bool(self._tracepoints)
+        )
+
+    def _mask_breakpoints(self: PtraceInterface, address: int, buffer: object, size: int) -> None:
+        """Replaces the installed software breakpoints in a cffi buffer read from memory with the original bytes."""
+        self.lib_trace.ptrace_mask_breakpoints(self._global_state, address, buffer, size)
+
+        for tp in self._find_tracepoints(address, size):
+            start = max(address, tp.address)
+            end = min(address + size, tp.address + len(tp._original))
+            self.ffi.memmove(buffer + (start - address), tp._original[start - tp.address : end - tp.address], end - start)
+
+    def _shadow_breakpoints(self: PtraceInterface, address: int, buffer: object, size: int) -> None:
+        """Preserves the installed software breakpoints in a cffi buffer about to be written to memory.
+
+        The bytes the buffer holds at the breakpoint addresses are saved as their original instructions. The
+        tracepoints whose instructions are overwritten are removed.
+        """
+        for tp in self._find_tracepoints(address, size):
+            self._remove_tracepoint(tp)
+
+        self.lib_trace.ptrace_shadow_breakpoints(self._global_state, address, buffer, size)
+
+    def _open_memory_file(self: PtraceInterface) -> None:
+        """Opens /proc/<pid>/mem, which is used as the preferred memory access method."""
+        self._close_memory_file()
+
+        try:
+            self._memory_fd = os.open(f"/proc/{self.process_id}/mem", os.O_RDWR | os.O_CLOEXEC)
+        except OSError as e:
+            # The ptrace backend will be used for every memory access
+            liblog.debugger("Could not open /proc/%d/mem: %s", self.process_id, e)
+
+    def _close_memory_file(self: PtraceInterface) -> None:
+        """Closes /proc/<pid>/mem, if it was open."""
+        if self._memory_fd is not None:
+            os.close(self._memory_fd)
+            self._memory_fd = None
+
     def _peek_user(self: PtraceInterface, thread_id: int, address: int) -> int:
         """Reads the memory at the specified address."""
         result = self.lib_trace.ptrace_peekuser(thread_id, address)
@@ -670,6 +1825,20 @@ class PtraceInterface(DebuggingInterface):
         """Returns the event message."""
         return self.lib_trace.ptrace_geteventmsg(thread_id)
 
+    def _get_syscall_info(self: PtraceInterface, thread_id: int) -> tuple[int, list[int]]:
+        """Returns the kind of the syscall stop of a thread and the syscall information.
+
+        Args:
+            thread_id (int): The thread to query.
+
+        Returns:
+            tuple[int, list[int]]: The kind of the stop, as a SyscallInfoOps, or -1 if the kernel cannot report it,
+            and the syscall number, the six arguments and the return value, where the kind of stop provides them.
+        """
+        info = self.ffi.new("uint64_t[8]")
+        op = self.lib_trace.ptrace_get_syscall_info(thread_id, info)
+        return op, list(info)
+
     def maps(self: PtraceInterface) -> list[MemoryMap]:
         """Returns the memory maps of the process."""
         return get_process_maps(self.process_id)
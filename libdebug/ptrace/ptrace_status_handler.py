@@ -16,7 +16,7 @@ from libdebug.architectures.ptrace_software_breakpoint_patcher import (
 )
 from libdebug.debugger.internal_debugger_instance_manager import provide_internal_debugger
 from libdebug.liblog import liblog
-from libdebug.ptrace.ptrace_constants import SYSCALL_SIGTRAP, StopEvents
+from libdebug.ptrace.ptrace_constants import SYSCALL_SIGTRAP, StopEvents, SyscallInfoOps
 from libdebug.utils.signal_utils import resolve_signal_name
 
 if TYPE_CHECKING:
@@ -108,13 +108,39 @@ class PtraceStatusHandler:
 
         if bp:
             self.forward_signal = False
-            bp.hit_count += 1
+            self._handle_hit(thread, bp)
 
-            if bp.callback:
-                bp.callback(thread, bp)
-            else:
-                # If the breakpoint has no callback, we need to stop the process despite the other signals
-                self.internal_debugger.resume_context.resume = False
+    def _handle_hit(self: PtraceStatusHandler, thread: ThreadContext, bp: Breakpoint) -> None:
+        """Handle the hit of a breakpoint or of a watchpoint."""
+        bp.hit_count += 1
+
+        if bp.callback:
+            bp.callback(thread, bp)
+        elif not bp.counting:
+            # If the breakpoint has no callback, we need to stop the process despite the other signals
+            # Counting breakpoints never stop the process, even when their hit is reported with another stop
+            self.internal_debugger.resume_context.resume = False
+
+    def _handle_page_fault(self: PtraceStatusHandler, thread: ThreadContext) -> bool:
+        """Handle a SIGSEGV caused by the page watchpoints, returning whether it was."""
+        hits = self.ptrace_interface.handle_page_fault(thread.thread_id)
+
+        if hits is None:
+            return False
+
+        # The faulting instruction has been executed, as after the hit of a hardware watchpoint
+        self.forward_signal = False
+
+        for bp in hits:
+            liblog.debugger("Page watchpoint hit at 0x%x", bp.address)
+            self._handle_hit(thread, bp)
+
+        if self.internal_debugger.resume_context.is_a_step:
+            # The process is stepping, we need to stop the execution
+            self.internal_debugger.resume_context.resume = False
+            self.internal_debugger.resume_context.is_a_step = False
+
+        return True
 
     def _manage_syscall_on_enter(
         self: PtraceStatusHandler,
@@ -140,6 +166,9 @@ class PtraceStatusHandler:
             syscall_number_after_callback = thread.syscall_number
 
             if syscall_number_after_callback != syscall_number:
+                # The exit is reported with the new syscall number, so the hit is counted now, as by the backend
+                handler.hit_count += 1
+
                 # Pretty print the syscall number before the callback
                 if handler.on_enter_pprint:
                     handler.on_enter_pprint(
@@ -205,6 +234,21 @@ class PtraceStatusHandler:
 
         syscall_number = thread.syscall_number
 
+        # The kernel tells whether this thread is entering or exiting the syscall, as other threads might be inside
+        # the same syscall; older kernels cannot, so the last stop of the handler is considered instead
+        op, _ = self.ptrace_interface._get_syscall_info(thread_id)
+
+        if op == SyscallInfoOps.EXIT:
+            entering = False
+        elif op in (SyscallInfoOps.ENTRY, SyscallInfoOps.SECCOMP):
+            entering = True
+        else:
+            entering = None
+
+        if self.internal_debugger.syscall_recorder is not None:
+            # The syscall is recorded as the process executes it, before any callback alters it
+            self.internal_debugger.syscall_recorder.record(thread, entering)
+
         if syscall_number not in self.internal_debugger.handled_syscalls:
             # This is a syscall we don't care about
             # Resume the execution
@@ -212,7 +256,10 @@ class PtraceStatusHandler:
 
         handler = self.internal_debugger.handled_syscalls[syscall_number]
 
-        if not handler._has_entered:
+        if entering is None:
+            entering = not handler._has_entered
+
+        if entering:
             # The syscall is being entered
             liblog.debugger(
                 "Syscall %d entered on thread %d",
@@ -314,6 +361,10 @@ class PtraceStatusHandler:
         """Handle the signal trap."""
         signal_number = thread._signal_number
 
+        # Accesses to the pages protected for the page watchpoints are never delivered to the process
+        if signal_number == signal.SIGSEGV and self._handle_page_fault(thread):
+            return
+
         if signal_number in self.internal_debugger.caught_signals:
             catcher = self.internal_debugger.caught_signals[signal_number]
 
@@ -363,9 +414,18 @@ class PtraceStatusHandler:
                     )
                     self._handle_clone(message, results)
                     self.forward_signal = False
+                case StopEvents.EXEC_EVENT:
+                    # The process has executed a new image, the old address space is gone
+                    liblog.debugger(f"Process {pid} executed a new image")
+                    self.ptrace_interface._open_memory_file()
+                    self.forward_signal = False
                 case StopEvents.SECCOMP_EVENT:
-                    # The process has installed a seccomp
-                    liblog.debugger(f"Process {pid} installed a seccomp")
+                    # The seccomp filter of the debugger reports the entry of a handled syscall
+                    if self.ptrace_interface._global_state.syscall_filter_enabled:
+                        liblog.debugger("Child thread %d stopped on a filtered syscall", pid)
+                        self._handle_syscall(pid)
+                    else:
+                        liblog.debugger(f"Process {pid} stopped on a seccomp filter")
                     self.forward_signal = False
                 case StopEvents.EXIT_EVENT:
                     # The tracee is still alive; it needs
@@ -0,0 +1,91 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+HEADER = """#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+# This file is generated by libdebug/tools/generate_syscall_table.py, do not edit it by hand.
+"""
+
+
+def _format_signature(signature: list[str] | None) -> list[str]:
+    """Returns the lines of an entry of the tuple of the signatures, split when they exceed the line length."""
+    if signature is None:
+        return ["    None,"]
+
+    if not signature:
+        return ["    (),"]
+
+    arguments = [json.dumps(argument) for argument in signature]
+    line = f"    ({', '.join(arguments)}{',' if len(arguments) == 1 else ''}),"
+
+    if len(line) <= 120:
+        return [line]
+
+    return ["    (", *(f"        {argument}," for argument in arguments), "    ),"]
+
+
+def generate_syscall_table(definitions: dict) -> str:
+    """Returns the source of a module holding a syscall table, indexed both by number and by name.
+
+    Args:
+        definitions (dict): The syscall definitions, in the format of https://syscalls.mebeim.net.
+
+    Returns:
+        str: The source of the module.
+    """
+    syscalls = {syscall["number"]: syscall for syscall in definitions["syscalls"]}
+    size = max(syscalls) + 1
+
+    lines = [HEADER]
+
+    lines.append("SYSCALL_NAMES: tuple[str | None, ...] = (")
+    for number in range(size):
+        name = json.dumps(syscalls[number]["name"]) if number in syscalls else None
+        lines.append(f"    {name},")
+    lines.append(")")
+    lines.append('"""The syscall names, indexed by number. Unassigned numbers are None."""')
+    lines.append("")
+
+    lines.append("SYSCALL_SIGNATURES: tuple[tuple[str, ...] | None, ...] = (")
+    for number in range(size):
+        lines.extend(_format_signature(syscalls[number]["signature"] if number in syscalls else None))
+    lines.append(")")
+    lines.append('"""The arguments of the syscalls, indexed by number. Unassigned numbers are None."""')
+    lines.append("")
+
+    lines.append("SYSCALL_NUMBERS: dict[str, int] = {")
+    for number in sorted(syscalls):
+        lines.append(f"    {json.dumps(syscalls[number]['name'])}: {number},")
+    lines.append("}")
+    lines.append('"""The syscall numbers, indexed by name."""')
+
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Writes the module of a syscall table from its JSON definition."""
+    if len(sys.argv) != 3:
+        print(f"Usage: {sys.argv[0]} TABLE_JSON OUTPUT_PY", file=sys.stderr)
+        sys.exit(1)
+
+    with Path(sys.argv[1]).open() as f:
+        definitions = json.load(f)
+
+    Path(sys.argv[2]).write_text(generate_syscall_table(definitions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from libdebug.data.syscall_recorder import (
+    RECORD_RETURNED,
+    TRACE_HEADER,
+    TRACE_MAGIC,
+    TRACE_RECORD,
+)
+from libdebug.utils.print_style import PrintStyle
+from libdebug.utils.syscall_utils import resolve_syscall_arguments, resolve_syscall_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+
+@dataclass
+class SyscallRecord:
+    """A syscall recorded by `Debugger.record_syscalls`.
+
+    Attributes:
+        thread_id (int): The thread that executed the syscall.
+        syscall_number (int): The syscall number.
+        args (tuple[int, ...]): The six arguments of the syscall.
+        return_value (int | None): The return value of the syscall, or None if it did not return while recorded.
+        timestamp (int): The time the syscall was entered, in nanoseconds since the epoch.
+    """
+
+    thread_id: int
+    syscall_number: int
+    args: tuple[int, ...]
+    return_value: int | None
+    timestamp: int
+
+    def format(self: SyscallRecord, color: bool = True) -> str:
+        """Returns the syscall in the style of the pretty print of syscalls.
+
+        Args:
+            color (bool, optional): Whether to color the output for the terminal. Defaults to True.
+        """
+        try:
+            name = resolve_syscall_name(self.syscall_number)
+            signature = resolve_syscall_arguments(self.syscall_number)
+        except ValueError:
+            name = f"syscall_{self.syscall_number}"
+            signature = [f"arg{i}" for i in range(len(self.args))]
+
+        if color:
+            blue, yellow, bright_yellow = PrintStyle.BLUE, PrintStyle.YELLOW, PrintStyle.BRIGHT_YELLOW
+            default, reset = PrintStyle.DEFAULT_COLOR, PrintStyle.RESET
+        else:
+            blue = yellow = bright_yellow = default = reset = ""
+
+        entries = [
+            f"{arg} = {bright_yellow}0x{value:x}{default}"
+            for arg, value in zip(signature, self.args, strict=False)
+            if arg is not None
+        ]
+        result = "?" if self.return_value is None else f"{self.return_value:#x}"
+
+        return f"[{self.thread_id}] {blue}{name}{default}({', '.join(entries)}) = {yellow}{result}{reset}"
+
+
+class SyscallTrace:
+    """A trace written by `Debugger.record_syscalls`, whose records are decoded only when accessed.
+
+    Attributes:
+        capacity (int): The number of records the trace holds.
+        total (int): The number of syscalls recorded, including the ones whose records were overwritten.
+    """
+
+    def __init__(self: SyscallTrace, source: str | Path | bytes | bytearray | memoryview) -> None:
+        """Opens a trace.
+
+        Args:
+            source (str | Path | bytes | bytearray | memoryview): The file of the trace, or the buffer it was
+            recorded in.
+        """
+        self._data = Path(source).read_bytes() if isinstance(source, str | Path) else memoryview(source).cast("B")
+
+        magic, _, record_size, self.capacity, self.total = TRACE_HEADER.unpack_from(self._data, 0)
+
+        if magic != TRACE_MAGIC or record_size != TRACE_RECORD.size:
+            raise ValueError("The data is not a syscall trace.")
+
+    def __len__(self: SyscallTrace) -> int:
+        """Returns the number of records held by the trace."""
+        return min(self.total, self.capacity)
+
+    def __getitem__(self: SyscallTrace, index: int) -> SyscallRecord:
+        """Returns a record, from the oldest one held by the trace."""
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Record index out of range.")
+
+        sequence = self.total - len(self) + index
+        offset = TRACE_HEADER.size + (sequence % self.capacity) * TRACE_RECORD.size
+
+        thread_id, number, flags, _, timestamp, *args, return_value = TRACE_RECORD.unpack_from(self._data, offset)
+
+        if flags & RECORD_RETURNED:
+            # Negative return values are errors
+            return_value = return_value - (1 << 64) if return_value >> 63 else return_value
+        else:
+            return_value = None
+
+        return SyscallRecord(thread_id, number, tuple(args), return_value, timestamp)
+
+    def __iter__(self: SyscallTrace) -> Iterator[SyscallRecord]:
+        """Iterates over the records, from the oldest one."""
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def dropped(self: SyscallTrace) -> int:
+        """The number of records that were overwritten by newer ones."""
+        return self.total - len(self)
+
+    def pprint(self: SyscallTrace, file: TextIO | None = None, color: bool = True) -> None:
+        """Prints the records, from the oldest one.
+
+        Args:
+            file (TextIO, optional): The stream to print to. Defaults to the standard output.
+            color (bool, optional): Whether to color the output for the terminal. Defaults to True.
+        """
+        for record in self:
+            print(record.format(color), file=file)
+
+
+def main() -> None:
+    """Prints the traces passed on the command line."""
+    if len(sys.argv) < 2:
+        print(f"Usage: {sys.argv[0]} TRACE...", file=sys.stderr)
+        sys.exit(1)
+
+    for path in sys.argv[1:]:
+        SyscallTrace(path).pprint(color=sys.stdout.isatty())
+
+
+if __name__ == "__main__":
+    main()
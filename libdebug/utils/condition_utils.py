@@ -0,0 +1,166 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import ast
+
+# The opcodes must match the CONDITION_* definitions of the ptrace backend
+CONDITION_CONST = 0
+CONDITION_REGISTER = 1
+CONDITION_LOAD = 2
+CONDITION_ADD = 3
+CONDITION_SUB = 4
+CONDITION_MUL = 5
+CONDITION_AND = 6
+CONDITION_OR = 7
+CONDITION_XOR = 8
+CONDITION_SHL = 9
+CONDITION_SHR = 10
+CONDITION_NEG = 11
+CONDITION_INVERT = 12
+CONDITION_NOT = 13
+CONDITION_EQ = 14
+CONDITION_NE = 15
+CONDITION_LT = 16
+CONDITION_LE = 17
+CONDITION_GT = 18
+CONDITION_GE = 19
+CONDITION_JZ = 20
+CONDITION_JNZ = 21
+CONDITION_POP = 22
+CONDITION_BOOL = 23
+
+CONDITION_STACK_SIZE = 32
+"""The maximum depth of the evaluation stack of the backend."""
+
+_BINARY_OPERATORS = {
+    ast.Add: CONDITION_ADD,
+    ast.Sub: CONDITION_SUB,
+    ast.Mult: CONDITION_MUL,
+    ast.BitAnd: CONDITION_AND,
+    ast.BitOr: CONDITION_OR,
+    ast.BitXor: CONDITION_XOR,
+    ast.LShift: CONDITION_SHL,
+    ast.RShift: CONDITION_SHR,
+}
+
+_UNARY_OPERATORS = {
+    ast.USub: CONDITION_NEG,
+    ast.Invert: CONDITION_INVERT,
+    ast.Not: CONDITION_NOT,
+}
+
+_COMPARISON_OPERATORS = {
+    ast.Eq: CONDITION_EQ,
+    ast.NotEq: CONDITION_NE,
+    ast.Lt: CONDITION_LT,
+    ast.LtE: CONDITION_LE,
+    ast.Gt: CONDITION_GT,
+    ast.GtE: CONDITION_GE,
+}
+
+_LOAD_SIZES = {"byte": 1, "word": 2, "dword": 4, "qword": 8}
+
+
+class _ConditionCompiler:
+    """Compiles the syntax tree of a condition to the bytecode of the backend."""
+
+    def __init__(self: _ConditionCompiler, condition: str, registers: dict[str, int]) -> None:
+        self.condition = condition
+        self.registers = registers
+        self.code = []
+        self.depth = 0
+        self.max_depth = 0
+
+    def _emit(self: _ConditionCompiler, opcode: int, *operands: int, effect: int) -> None:
+        """Appends an instruction, tracking the depth of the evaluation stack."""
+        self.code.append(opcode)
+        self.code.extend(operands)
+        self.depth += effect
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def _error(self: _ConditionCompiler, message: str) -> ValueError:
+        return ValueError(f"Invalid breakpoint condition {self.condition!r}: {message}.")
+
+    def compile(self: _ConditionCompiler, node: ast.expr) -> None:
+        """Compiles an expression, which pushes exactly one value."""
+        match node:
+            case ast.Constant(value=bool() | int() as value):
+                self._emit(CONDITION_CONST, int(value) & 0xFFFFFFFFFFFFFFFF, effect=1)
+            case ast.Name(id=name):
+                if name not in self.registers:
+                    raise self._error(f"unknown register {name}")
+
+                self._emit(CONDITION_REGISTER, self.registers[name], effect=1)
+            case ast.List(elts=[address]):
+                self.compile(address)
+                self._emit(CONDITION_LOAD, 8, effect=0)
+            case ast.Subscript(value=ast.Name(id=size), slice=address) if size in _LOAD_SIZES:
+                self.compile(address)
+                self._emit(CONDITION_LOAD, _LOAD_SIZES[size], effect=0)
+            case ast.UnaryOp(op=op, operand=operand) if type(op) in _UNARY_OPERATORS:
+                self.compile(operand)
+                self._emit(_UNARY_OPERATORS[type(op)], effect=0)
+            case ast.BinOp(left=left, op=op, right=right) if type(op) in _BINARY_OPERATORS:
+                self.compile(left)
+                self.compile(right)
+                self._emit(_BINARY_OPERATORS[type(op)], effect=-1)
+            case ast.Compare(left=left, ops=[op], comparators=[right]) if type(op) in _COMPARISON_OPERATORS:
+                self.compile(left)
+                self.compile(right)
+                self._emit(_COMPARISON_OPERATORS[type(op)], effect=-1)
+            case ast.Compare():
+                raise self._error("chained comparisons are not supported")
+            case ast.BoolOp(op=op, values=values):
+                self._compile_boolean(CONDITION_JZ if isinstance(op, ast.And) else CONDITION_JNZ, values)
+            case _:
+                raise self._error(f"unsupported expression {ast.unparse(node)}")
+
+    def _compile_boolean(self: _ConditionCompiler, jump: int, values: list[ast.expr]) -> None:
+        """Compiles a short-circuited boolean operator."""
+        patches = []
+
+        for i, value in enumerate(values):
+            self.compile(value)
+            self._emit(CONDITION_BOOL, effect=0)
+
+            if i < len(values) - 1:
+                # The operand of the jump is patched once the end is known
+                self._emit(jump, 0, effect=0)
+                patches.append(len(self.code) - 1)
+                self._emit(CONDITION_POP, effect=-1)
+
+        for patch in patches:
+            self.code[patch] = len(self.code)
+
+
+def compile_condition(condition: str, registers: dict[str, int]) -> list[int]:
+    """Compiles a breakpoint condition to the bytecode evaluated by the debugging backend.
+
+    The condition is an expression over the registers of the thread, such as `rax == 0x1337 and [rdi + 8] > 5`.
+    `[address]` reads a qword from memory, while `byte[address]`, `word[address]` and `dword[address]` read smaller
+    values. Arithmetic is performed on 64-bit unsigned integers.
+
+    Args:
+        condition (str): The condition to compile.
+        registers (dict[str, int]): The offset of each available register in the register file of a thread.
+
+    Returns:
+        list[int]: The compiled condition.
+    """
+    try:
+        tree = ast.parse(condition.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid breakpoint condition {condition!r}: {e.msg}.") from e
+
+    compiler = _ConditionCompiler(condition, registers)
+    compiler.compile(tree.body)
+
+    if compiler.max_depth > CONDITION_STACK_SIZE:
+        raise ValueError(f"Invalid breakpoint condition {condition!r}: the expression is too deep.")
+
+    return compiler.code
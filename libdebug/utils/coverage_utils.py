@@ -0,0 +1,43 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from capstone import CS_GRP_JUMP, CS_GRP_RET, CS_OP_IMM
+
+from libdebug.utils.instruction_utils import get_disassembler
+
+
+def find_basic_blocks(code: bytes, start: int) -> list[int]:
+    """Returns the first address of each basic block in a range of code.
+
+    The blocks are split at the targets of direct jumps and after every jump or return. Indirect jump targets are not
+    followed.
+
+    Args:
+        code (bytes): The code to disassemble.
+        start (int): The address of the first byte of the code.
+
+    Returns:
+        list[int]: The sorted addresses of the basic blocks.
+    """
+    end = start + len(code)
+    leaders = {start}
+
+    for instruction in get_disassembler().disasm(code, start):
+        # Skipped data has no instruction id
+        if not instruction.id:
+            continue
+
+        if instruction.group(CS_GRP_JUMP):
+            operand = instruction.operands[0] if instruction.operands else None
+            if operand is not None and operand.type == CS_OP_IMM and start <= operand.imm < end:
+                leaders.add(operand.imm)
+        elif not instruction.group(CS_GRP_RET):
+            continue
+
+        if instruction.address + instruction.size < end:
+            leaders.add(instruction.address + instruction.size)
+
+    return sorted(leaders)
@@ -6,7 +6,12 @@
 
 from libdebug.data.memory_map import MemoryMap
 from libdebug.liblog import liblog
-from libdebug.utils.elf_utils import is_pie, resolve_address, resolve_symbol
+from libdebug.utils.elf_utils import (
+    is_pie,
+    resolve_address,
+    resolve_symbol,
+    resolve_symbol_range,
+)
 
 
 def check_absolute_address(address: int, maps: list[MemoryMap]) -> bool:
@@ -79,6 +84,42 @@ def resolve_symbol_in_maps(symbol: str, maps: list[MemoryMap]) -> int:
     raise ValueError(f"Symbol {symbol} not found in the specified mapped file. Please specify a valid symbol.")
 
 
+def resolve_symbol_range_in_maps(symbol: str, maps: list[MemoryMap]) -> tuple[int, int]:
+    """Returns the address range of the specified symbol in the specified memory maps.
+
+    Args:
+        symbol (str): The symbol whose address range should be returned.
+        maps (list[MemoryMap]): The memory maps.
+
+    Returns:
+        tuple[int, int]: The start and the end addresses of the specified symbol in the specified memory maps.
+
+    Throws:
+        ValueError: If the specified symbol does not belong to any memory map.
+    """
+    mapped_files = {}
+
+    for vmap in maps:
+        if vmap.backing_file and vmap.backing_file not in mapped_files and vmap.backing_file[0] != "[":
+            mapped_files[vmap.backing_file] = vmap.start
+
+    for file, base_address in mapped_files.items():
+        try:
+            start, end = resolve_symbol_range(file, symbol)
+
+            if is_pie(file):
+                start += base_address
+                end += base_address
+
+            return start, end
+        except OSError as e:
+            liblog.debugger(f"Error while resolving symbol {symbol} in {file}: {e}")
+        except ValueError:
+            pass
+
+    raise ValueError(f"Symbol {symbol} not found in the specified mapped file. Please specify a valid symbol.")
+
+
 def resolve_address_in_maps(address: int, maps: list[MemoryMap]) -> str:
     """Returns the symbol corresponding to the specified address in the specified memory maps.
 
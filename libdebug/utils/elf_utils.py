@@ -128,15 +128,15 @@ def _parse_elf_file(path: str, debug_info_level: int) -> tuple[dict[str, tuple[i
 
 
 @functools.cache
-def resolve_symbol(path: str, symbol: str) -> int:
-    """Returns the address of the specified symbol in the specified ELF file.
+def resolve_symbol_range(path: str, symbol: str) -> tuple[int, int]:
+    """Returns the address range of the specified symbol in the specified ELF file.
 
     Args:
         path (str): The path to the ELF file.
-        symbol (str): The symbol whose address should be returned.
+        symbol (str): The symbol whose address range should be returned.
 
     Returns:
-        int: The address of the specified symbol in the specified ELF file.
+        tuple[int, int]: The start and the end addresses of the specified symbol in the specified ELF file.
     """
     if libcontext.sym_lvl == 0:
         raise Exception(
@@ -146,7 +146,7 @@ def resolve_symbol(path: str, symbol: str) -> int:
     # Retrieve the symbols from the SymbolTableSection
     symbols, buildid, debug_file = _parse_elf_file(path, libcontext.sym_lvl)
     if symbol in symbols:
-        return symbols[symbol][0]
+        return symbols[symbol]
 
     # Retrieve the symbols from the external debuginfo file
     if buildid and debug_file and libcontext.sym_lvl > 2:
@@ -154,7 +154,7 @@ def resolve_symbol(path: str, symbol: str) -> int:
         absolute_debug_path_str = str((LOCAL_DEBUG_PATH / folder / debug_file).resolve())
         symbols = _collect_external_info(absolute_debug_path_str)
         if symbol in symbols:
-            return symbols[symbol][0]
+            return symbols[symbol]
 
     # Retrieve the symbols from debuginfod
     if buildid and libcontext.sym_lvl > 4:
@@ -162,12 +162,26 @@ def resolve_symbol(path: str, symbol: str) -> int:
         if absolute_debug_path.exists():
             symbols = _collect_external_info(str(absolute_debug_path))
             if symbol in symbols:
-                return symbols[symbol][0]
+                return symbols[symbol]
 
     # Symbol not found
     raise ValueError(f"Symbol {symbol} not found in {path}. Please specify a valid symbol.")
 
 
+@functools.cache
+def resolve_symbol(path: str, symbol: str) -> int:
+    """Returns the address of the specified symbol in the specified ELF file.
+
+    Args:
+        path (str): The path to the ELF file.
+        symbol (str): The symbol whose address should be returned.
+
+    Returns:
+        int: The address of the specified symbol in the specified ELF file.
+    """
+    return resolve_symbol_range(path, symbol)[0]
+
+
 @functools.cache
 def resolve_address(path: str, address: int) -> str:
     """Returns the symbol corresponding to the specified address in the specified ELF file.
@@ -0,0 +1,186 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from capstone import (
+    CS_ARCH_X86,
+    CS_GRP_CALL,
+    CS_GRP_INT,
+    CS_GRP_IRET,
+    CS_GRP_JUMP,
+    CS_GRP_PRIVILEGE,
+    CS_GRP_RET,
+    CS_MODE_64,
+    CS_OP_IMM,
+    CS_OP_MEM,
+    Cs,
+)
+from capstone.x86 import X86_INS_SYSCALL, X86_INS_SYSENTER, X86_INS_XBEGIN, X86_REG_RIP
+
+from libdebug.utils.libcontext import libcontext
+
+# The flags must match the DISPLACED_* definitions of the ptrace backend
+DISPLACED_ABSOLUTE = 1
+DISPLACED_CALL = 2
+
+DISPLACED_MAX_LENGTH = 16
+"""The maximum length of an instruction that can be executed out of line."""
+
+# Instructions whose effects depend on where they are executed, beyond their operands
+_IN_PLACE_INSTRUCTIONS = {X86_INS_SYSCALL, X86_INS_SYSENTER, X86_INS_XBEGIN}
+
+
+def get_disassembler() -> Cs:
+    """Returns a disassembler for the current architecture."""
+    match libcontext.arch:
+        case "amd64":
+            md = Cs(CS_ARCH_X86, CS_MODE_64)
+        case _:
+            raise ValueError(f"Architecture {libcontext.arch} not supported")
+
+    md.detail = True
+    # Data embedded in the code must not stop the disassembly
+    md.skipdata = True
+    return md
+
+
+def get_displaced_instruction(code: bytes, address: int) -> tuple[bytes, int, int] | None:
+    """Describes how the first instruction of a range of code can be executed out of line.
+
+    Args:
+        code (bytes): The code, starting with the instruction.
+        address (int): The address of the instruction.
+
+    Returns:
+        tuple[bytes, int, int] | None: The bytes of the instruction, the offset of its RIP-relative displacement (0 if
+        it has none) and its DISPLACED_* flags, or None if the instruction must be executed in place.
+    """
+    instruction = next(get_disassembler().disasm(code[:DISPLACED_MAX_LENGTH], address, count=1), None)
+
+    # Skipped data has no instruction id
+    if instruction is None or not instruction.id or instruction.id in _IN_PLACE_INSTRUCTIONS:
+        return None
+
+    if instruction.group(CS_GRP_INT) or instruction.group(CS_GRP_IRET) or instruction.group(CS_GRP_PRIVILEGE):
+        return None
+
+    disp_offset = 0
+
+    if any(operand.type == CS_OP_MEM and operand.mem.base == X86_REG_RIP for operand in instruction.operands):
+        encoding = getattr(instruction, "encoding", None)
+
+        # The displacement can be relocated only if its position is known
+        if encoding is None or encoding.disp_size != 4 or not encoding.disp_offset:
+            return None
+
+        disp_offset = encoding.disp_offset
+
+    flags = 0
+
+    if instruction.group(CS_GRP_RET):
+        flags |= DISPLACED_ABSOLUTE
+    elif instruction.group(CS_GRP_CALL) or instruction.group(CS_GRP_JUMP):
+        # Direct branches land relative to the instruction, the others on an address they compute
+        if not instruction.operands or instruction.operands[0].type != CS_OP_IMM:
+            flags |= DISPLACED_ABSOLUTE
+
+        if instruction.group(CS_GRP_CALL):
+            flags |= DISPLACED_CALL
+
+    return bytes(instruction.bytes), disp_offset, flags
+
+
+def _relocated_displacement(instruction: object, target: int) -> bytes:
+    """Returns the bytes of an instruction with a RIP-relative operand, moved to the target address."""
+    encoding = getattr(instruction, "encoding", None)
+
+    if encoding is None or encoding.disp_size != 4 or not encoding.disp_offset:
+        raise ValueError(f"The instruction at {instruction.address:#x} cannot be relocated.")
+
+    code = bytearray(instruction.bytes)
+    offset = encoding.disp_offset
+    displacement = int.from_bytes(code[offset : offset + 4], "little", signed=True) + instruction.address - target
+
+    if not -(1 << 31) <= displacement < 1 << 31:
+        raise ValueError(f"The operand of the instruction at {instruction.address:#x} is out of range.")
+
+    code[offset : offset + 4] = displacement.to_bytes(4, "little", signed=True)
+    return bytes(code)
+
+
+def _relocated_branch(instruction: object, target: int) -> bytes:
+    """Returns a direct branch moved to the target address, always encoded with a 32-bit displacement."""
+    code = instruction.bytes
+
+    if code[0] == 0xE8:
+        opcode = b"\xe8"
+    elif code[0] in (0xE9, 0xEB):
+        opcode = b"\xe9"
+    elif 0x70 <= code[0] <= 0x7F:
+        opcode = bytes([0x0F, 0x80 | (code[0] & 0xF)])
+    elif code[0] == 0x0F and 0x80 <= code[1] <= 0x8F:
+        opcode = bytes(code[:2])
+    else:
+        # e.g. loop and jrcxz, which have no long form
+        raise ValueError(f"The branch at {instruction.address:#x} cannot be relocated.")
+
+    displacement = instruction.operands[0].imm - (target + len(opcode) + 4)
+
+    if not -(1 << 31) <= displacement < 1 << 31:
+        raise ValueError(f"The destination of the branch at {instruction.address:#x} is out of range.")
+
+    return opcode + displacement.to_bytes(4, "little", signed=True)
+
+
+def relocate_instructions(code: bytes, address: int, target: int, size: int) -> tuple[bytes, int]:
+    """Moves the instructions that cover the first bytes of a range of code to another address.
+
+    Direct branches and RIP-relative operands are fixed to reach the same destinations. Only the last of the moved
+    instructions can be a branch.
+
+    Args:
+        code (bytes): The code, starting with the instructions.
+        address (int): The address of the code.
+        target (int): The address the instructions are moved to.
+        size (int): The minimum number of bytes to cover.
+
+    Returns:
+        tuple[bytes, int]: The moved instructions and the number of bytes of the code they cover.
+    """
+    relocated = bytearray()
+    length = 0
+
+    for instruction in get_disassembler().disasm(code, address):
+        if length >= size:
+            break
+
+        if (
+            not instruction.id
+            or instruction.id in _IN_PLACE_INSTRUCTIONS
+            or instruction.group(CS_GRP_INT)
+            or instruction.group(CS_GRP_IRET)
+            or instruction.group(CS_GRP_PRIVILEGE)
+        ):
+            raise ValueError(f"The instruction at {instruction.address:#x} cannot be relocated.")
+
+        destination = target + len(relocated)
+        branch = instruction.group(CS_GRP_JUMP) or instruction.group(CS_GRP_CALL) or instruction.group(CS_GRP_RET)
+
+        if branch and instruction.operands and instruction.operands[0].type == CS_OP_IMM:
+            relocated += _relocated_branch(instruction, destination)
+        elif any(operand.type == CS_OP_MEM and operand.mem.base == X86_REG_RIP for operand in instruction.operands):
+            relocated += _relocated_displacement(instruction, destination)
+        else:
+            relocated += instruction.bytes
+
+        length += instruction.size
+
+        if branch and length < size:
+            raise ValueError(f"The branch at {instruction.address:#x} is too close to {address:#x}.")
+
+    if length < size:
+        raise ValueError(f"The code at {address:#x} is too short to be relocated.")
+
+    return bytes(relocated), length
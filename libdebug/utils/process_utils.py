@@ -11,6 +11,8 @@ from pathlib import Path
 from libdebug.cffi._personality_cffi import lib as lib_personality
 from libdebug.data.memory_map import MemoryMap
 
+PAGEMAP_SOFT_DIRTY = 1 << 55
+
 
 @functools.cache
 def get_process_maps(process_id: int) -> list[MemoryMap]:
@@ -41,6 +43,94 @@ def get_open_fds(process_id: int) -> list[int]:
     return [int(fd) for fd in os.listdir(f"/proc/{process_id}/fd")]
 
 
+def get_file_offsets(process_id: int) -> dict[int, int]:
+    """Returns the file offset of each file descriptor of the specified process.
+
+    Args:
+        process_id (int): The PID of the process whose file offsets should be returned.
+
+    Returns:
+        dict: A dictionary mapping each file descriptor to its file offset.
+    """
+    offsets = {}
+
+    for fd in get_open_fds(process_id):
+        try:
+            with Path(f"/proc/{process_id}/fdinfo/{fd}").open() as fdinfo_file:
+                for line in fdinfo_file:
+                    if line.startswith("pos:"):
+                        offsets[fd] = int(line.split()[1])
+                        break
+        except OSError:
+            # The file descriptor was closed in the meantime
+            continue
+
+    return offsets
+
+
+@functools.cache
+def is_soft_dirty_supported() -> bool:
+    """Returns whether the running kernel tracks soft-dirty bits for the pages of a process.
+
+    Returns:
+        bool: True if the kernel was built with soft-dirty tracking, False otherwise.
+    """
+    try:
+        with Path("/proc/self/smaps").open() as smaps_file:
+            for line in smaps_file:
+                if line.startswith("VmFlags:"):
+                    return "sd" in line.split()[1:]
+    except OSError:
+        pass
+
+    return False
+
+
+def clear_soft_dirty_bits(process_id: int) -> bool:
+    """Clears the soft-dirty bits of all the pages of the specified process.
+
+    Args:
+        process_id (int): The PID of the process whose soft-dirty bits should be cleared.
+
+    Returns:
+        bool: True if the bits were cleared, False otherwise.
+    """
+    if not is_soft_dirty_supported():
+        return False
+
+    try:
+        with Path(f"/proc/{process_id}/clear_refs").open("w") as clear_refs_file:
+            clear_refs_file.write("4")
+    except OSError:
+        return False
+
+    return True
+
+
+def get_soft_dirty_pages(process_id: int, start: int, end: int, page_size: int) -> list[int]:
+    """Returns the pages in the specified range that were written since the soft-dirty bits were last cleared.
+
+    Args:
+        process_id (int): The PID of the process whose pages should be checked.
+        start (int): The start address of the range, aligned to the page size.
+        end (int): The end address of the range, aligned to the page size.
+        page_size (int): The page size of the system.
+
+    Returns:
+        list: A list with the addresses of the dirty pages.
+    """
+    first_page = start // page_size
+
+    with Path(f"/proc/{process_id}/pagemap").open("rb", buffering=0) as pagemap_file:
+        entries = os.pread(pagemap_file.fileno(), (end - start) // page_size * 8, first_page * 8)
+
+    return [
+        (first_page + index) * page_size
+        for index, entry in enumerate(memoryview(entries).cast("Q"))
+        if entry & PAGEMAP_SOFT_DIRTY
+    ]
+
+
 def invalidate_process_cache() -> None:
     """Invalidates the cache of the functions in this module. Must be executed any time the process executes code."""
     get_process_maps.cache_clear()
@@ -0,0 +1,97 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import struct
+
+from libdebug.utils.libcontext import libcontext
+
+PR_SET_NO_NEW_PRIVS = 38
+SECCOMP_SET_MODE_FILTER = 1
+SECCOMP_FILTER_FLAG_TSYNC = 1
+
+MAX_FILTERED_SYSCALLS = 256
+"""The maximum number of syscalls reported by a seccomp filter, more are traced at every syscall instead."""
+
+FILTER_SYSCALLS_SIZE = 1024
+"""The number of syscalls whose traced state is kept by the backend, the others are always reported."""
+
+_BPF_LD_W_ABS = 0x20
+_BPF_JEQ_K = 0x15
+_BPF_JGE_K = 0x35
+_BPF_RET_K = 0x06
+
+_SECCOMP_RET_ALLOW = 0x7FFF0000
+_SECCOMP_RET_TRACE = 0x7FF00000
+
+# The offsets of the fields of struct seccomp_data
+_DATA_NR = 0
+_DATA_ARCH = 4
+
+_AUDIT_ARCH_X86_64 = 0xC000003E
+_X32_SYSCALL_BIT = 0x40000000
+
+
+def _instruction(code: int, jt: int, jf: int, k: int) -> bytes:
+    """Returns a struct sock_filter."""
+    return struct.pack("<HBBI", code, jt, jf, k)
+
+
+def build_syscall_filter(numbers: list[int]) -> bytes:
+    """Returns a seccomp filter that reports the specified syscalls to the tracer and allows any other syscall.
+
+    Syscalls of other ABIs, such as the 32-bit one, are always reported, as their numbers differ.
+
+    Args:
+        numbers (list[int]): The syscall numbers to report.
+
+    Returns:
+        bytes: The instructions of the filter, an array of struct sock_filter.
+    """
+    if libcontext.arch != "amd64":
+        raise ValueError(f"Architecture {libcontext.arch} not supported")
+
+    # Every check falls through to the following return of SECCOMP_RET_TRACE, or skips it
+    trace = _instruction(_BPF_RET_K, 0, 0, _SECCOMP_RET_TRACE)
+
+    code = bytearray()
+    code += _instruction(_BPF_LD_W_ABS, 0, 0, _DATA_ARCH)
+    code += _instruction(_BPF_JEQ_K, 1, 0, _AUDIT_ARCH_X86_64) + trace
+    code += _instruction(_BPF_LD_W_ABS, 0, 0, _DATA_NR)
+    code += _instruction(_BPF_JGE_K, 0, 1, _X32_SYSCALL_BIT) + trace
+
+    for number in sorted(set(numbers)):
+        code += _instruction(_BPF_JEQ_K, 0, 1, number) + trace
+
+    code += _instruction(_BPF_RET_K, 0, 0, _SECCOMP_RET_ALLOW)
+
+    return bytes(code)
+
+
+def build_filter_program(address: int, syscall_filter: bytes) -> bytes:
+    """Returns a struct sock_fprog for a filter, which follows it in memory.
+
+    Args:
+        address (int): The address of the program in the target process.
+        syscall_filter (bytes): The instructions of the filter.
+
+    Returns:
+        bytes: The program, followed by the instructions of the filter.
+    """
+    header_size = 16
+    return struct.pack("<H6xQ", len(syscall_filter) // 8, address + header_size) + syscall_filter
+
+
+def build_filter_bitmap(numbers: list[int]) -> bytes:
+    """Returns a bitmap of syscalls kept by the backend, such as the one of the reported syscalls."""
+    bitmap = bytearray(FILTER_SYSCALLS_SIZE // 8)
+
+    for number in numbers:
+        if number < FILTER_SYSCALLS_SIZE:
+            bitmap[number // 8] |= 1 << (number % 8)
+
+    return bytes(bitmap)
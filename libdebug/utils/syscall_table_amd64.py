@@ -0,0 +1,1568 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+# This file is generated by libdebug/tools/generate_syscall_table.py, do not edit it by hand.
+
+SYSCALL_NAMES: tuple[str | None, ...] = (
+    "read",
+    "write",
+    "open",
+    "close",
+    "stat",
+    "fstat",
+    "lstat",
+    "poll",
+    "lseek",
+    "mmap",
+    "mprotect",
+    "munmap",
+    "brk",
+    "rt_sigaction",
+    "rt_sigprocmask",
+    "rt_sigreturn",
+    "ioctl",
+    "pread64",
+    "pwrite64",
+    "readv",
+    "writev",
+    "access",
+    "pipe",
+    "select",
+    "sched_yield",
+    "mremap",
+    "msync",
+    "mincore",
+    "madvise",
+    "shmget",
+    "shmat",
+    "shmctl",
+    "dup",
+    "dup2",
+    "pause",
+    "nanosleep",
+    "getitimer",
+    "alarm",
+    "setitimer",
+    "getpid",
+    "sendfile",
+    "socket",
+    "connect",
+    "accept",
+    "sendto",
+    "recvfrom",
+    "sendmsg",
+    "recvmsg",
+    "shutdown",
+    "bind",
+    "listen",
+    "getsockname",
+    "getpeername",
+    "socketpair",
+    "setsockopt",
+    "getsockopt",
+    "clone",
+    "fork",
+    "vfork",
+    "execve",
+    "exit",
+    "wait4",
+    "kill",
+    "uname",
+    "semget",
+    "semop",
+    "semctl",
+    "shmdt",
+    "msgget",
+    "msgsnd",
+    "msgrcv",
+    "msgctl",
+    "fcntl",
+    "flock",
+    "fsync",
+    "fdatasync",
+    "truncate",
+    "ftruncate",
+    "getdents",
+    "getcwd",
+    "chdir",
+    "fchdir",
+    "rename",
+    "mkdir",
+    "rmdir",
+    "creat",
+    "link",
+    "unlink",
+    "symlink",
+    "readlink",
+    "chmod",
+    "fchmod",
+    "chown",
+    "fchown",
+    "lchown",
+    "umask",
+    "gettimeofday",
+    "getrlimit",
+    "getrusage",
+    "sysinfo",
+    "times",
+    "ptrace",
+    "getuid",
+    "syslog",
+    "getgid",
+    "setuid",
+    "setgid",
+    "geteuid",
+    "getegid",
+    "setpgid",
+    "getppid",
+    "getpgrp",
+    "setsid",
+    "setreuid",
+    "setregid",
+    "getgroups",
+    "setgroups",
+    "setresuid",
+    "getresuid",
+    "setresgid",
+    "getresgid",
+    "getpgid",
+    "setfsuid",
+    "setfsgid",
+    "getsid",
+    "capget",
+    "capset",
+    "rt_sigpending",
+    "rt_sigtimedwait",
+    "rt_sigqueueinfo",
+    "rt_sigsuspend",
+    "sigaltstack",
+    "utime",
+    "mknod",
+    "uselib",
+    "personality",
+    "ustat",
+    "statfs",
+    "fstatfs",
+    "sysfs",
+    "getpriority",
+    "setpriority",
+    "sched_setparam",
+    "sched_getparam",
+    "sched_setscheduler",
+    "sched_getscheduler",
+    "sched_get_priority_max",
+    "sched_get_priority_min",
+    "sched_rr_get_interval",
+    "mlock",
+    "munlock",
+    "mlockall",
+    "munlockall",
+    "vhangup",
+    "modify_ldt",
+    "pivot_root",
+    "_sysctl",
+    "prctl",
+    "arch_prctl",
+    "adjtimex",
+    "setrlimit",
+    "chroot",
+    "sync",
+    "acct",
+    "settimeofday",
+    "mount",
+    "umount2",
+    "swapon",
+    "swapoff",
+    "reboot",
+    "sethostname",
+    "setdomainname",
+    "iopl",
+    "ioperm",
+    "create_module",
+    "init_module",
+    "delete_module",
+    "get_kernel_syms",
+    "query_module",
+    "quotactl",
+    "nfsservctl",
+    "getpmsg",
+    "putpmsg",
+    "afs_syscall",
+    "tuxcall",
+    "security",
+    "gettid",
+    "readahead",
+    "setxattr",
+    "lsetxattr",
+    "fsetxattr",
+    "getxattr",
+    "lgetxattr",
+    "fgetxattr",
+    "listxattr",
+    "llistxattr",
+    "flistxattr",
+    "removexattr",
+    "lremovexattr",
+    "fremovexattr",
+    "tkill",
+    "time",
+    "futex",
+    "sched_setaffinity",
+    "sched_getaffinity",
+    "set_thread_area",
+    "io_setup",
+    "io_destroy",
+    "io_getevents",
+    "io_submit",
+    "io_cancel",
+    "get_thread_area",
+    "lookup_dcookie",
+    "epoll_create",
+    "epoll_ctl_old",
+    "epoll_wait_old",
+    "remap_file_pages",
+    "getdents64",
+    "set_tid_address",
+    "restart_syscall",
+    "semtimedop",
+    "fadvise64",
+    "timer_create",
+    "timer_settime",
+    "timer_gettime",
+    "timer_getoverrun",
+    "timer_delete",
+    "clock_settime",
+    "clock_gettime",
+    "clock_getres",
+    "clock_nanosleep",
+    "exit_group",
+    "epoll_wait",
+    "epoll_ctl",
+    "tgkill",
+    "utimes",
+    "vserver",
+    "mbind",
+    "set_mempolicy",
+    "get_mempolicy",
+    "mq_open",
+    "mq_unlink",
+    "mq_timedsend",
+    "mq_timedreceive",
+    "mq_notify",
+    "mq_getsetattr",
+    "kexec_load",
+    "waitid",
+    "add_key",
+    "request_key",
+    "keyctl",
+    "ioprio_set",
+    "ioprio_get",
+    "inotify_init",
+    "inotify_add_watch",
+    "inotify_rm_watch",
+    "migrate_pages",
+    "openat",
+    "mkdirat",
+    "mknodat",
+    "fchownat",
+    "futimesat",
+    "newfstatat",
+    "unlinkat",
+    "renameat",
+    "linkat",
+    "symlinkat",
+    "readlinkat",
+    "fchmodat",
+    "faccessat",
+    "pselect6",
+    "ppoll",
+    "unshare",
+    "set_robust_list",
+    "get_robust_list",
+    "splice",
+    "tee",
+    "sync_file_range",
+    "vmsplice",
+    "move_pages",
+    "utimensat",
+    "epoll_pwait",
+    "signalfd",
+    "timerfd_create",
+    "eventfd",
+    "fallocate",
+    "timerfd_settime",
+    "timerfd_gettime",
+    "accept4",
+    "signalfd4",
+    "eventfd2",
+    "epoll_create1",
+    "dup3",
+    "pipe2",
+    "inotify_init1",
+    "preadv",
+    "pwritev",
+    "rt_tgsigqueueinfo",
+    "perf_event_open",
+    "recvmmsg",
+    "fanotify_init",
+    "fanotify_mark",
+    "prlimit64",
+    "name_to_handle_at",
+    "open_by_handle_at",
+    "clock_adjtime",
+    "syncfs",
+    "sendmmsg",
+    "setns",
+    "getcpu",
+    "process_vm_readv",
+    "process_vm_writev",
+    "kcmp",
+    "finit_module",
+    "sched_setattr",
+    "sched_getattr",
+    "renameat2",
+    "seccomp",
+    "getrandom",
+    "memfd_create",
+    "kexec_file_load",
+    "bpf",
+    "execveat",
+    "userfaultfd",
+    "membarrier",
+    "mlock2",
+    "copy_file_range",
+    "preadv2",
+    "pwritev2",
+    "pkey_mprotect",
+    "pkey_alloc",
+    "pkey_free",
+    "statx",
+    "io_pgetevents",
+    "rseq",
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    "pidfd_send_signal",
+    "io_uring_setup",
+    "io_uring_enter",
+    "io_uring_register",
+    "open_tree",
+    "move_mount",
+    "fsopen",
+    "fsconfig",
+    "fsmount",
+    "fspick",
+    "pidfd_open",
+    "clone3",
+    "close_range",
+    "openat2",
+    "pidfd_getfd",
+    "faccessat2",
+    "process_madvise",
+    "epoll_pwait2",
+    "mount_setattr",
+    "quotactl_fd",
+    "landlock_create_ruleset",
+    "landlock_add_rule",
+    "landlock_restrict_self",
+    "memfd_secret",
+    "process_mrelease",
+    "futex_waitv",
+    "set_mempolicy_home_node",
+    "cachestat",
+    "fchmodat2",
+    "map_shadow_stack",
+    "futex_wake",
+    "futex_wait",
+    "futex_requeue",
+    "statmount",
+    "listmount",
+    "lsm_get_self_attr",
+    "lsm_set_self_attr",
+    "lsm_list_modules",
+    "mseal",
+)
+"""The syscall names, indexed by number. Unassigned numbers are None."""
+
+SYSCALL_SIGNATURES: tuple[tuple[str, ...] | None, ...] = (
+    ("unsigned int fd", "char __user *buf", "size_t count"),
+    ("unsigned int fd", "const char __user *buf", "size_t count"),
+    ("const char __user *filename", "int flags", "umode_t mode"),
+    ("unsigned int fd",),
+    ("const char __user *filename", "struct stat __user *statbuf"),
+    ("unsigned int fd", "struct stat __user *statbuf"),
+    ("const char __user *filename", "struct stat __user *statbuf"),
+    ("struct pollfd __user *ufds", "unsigned int nfds", "int timeout_msecs"),
+    ("unsigned int fd", "off_t offset", "unsigned int whence"),
+    (
+        "unsigned long addr",
+        "unsigned long len",
+        "unsigned long prot",
+        "unsigned long flags",
+        "unsigned long fd",
+        "unsigned long off",
+    ),
+    ("unsigned long start", "size_t len", "unsigned long prot"),
+    ("unsigned long addr", "size_t len"),
+    ("unsigned long brk",),
+    ("int sig", "const struct sigaction __user *act", "struct sigaction __user *oact", "size_t sigsetsize"),
+    ("int how", "sigset_t __user *nset", "sigset_t __user *oset", "size_t sigsetsize"),
+    (),
+    ("unsigned int fd", "unsigned int cmd", "unsigned long arg"),
+    ("unsigned int fd", "char __user *buf", "size_t count", "loff_t pos"),
+    ("unsigned int fd", "const char __user *buf", "size_t count", "loff_t pos"),
+    ("unsigned long fd", "const struct iovec __user *vec", "unsigned long vlen"),
+    ("unsigned long fd", "const struct iovec __user *vec", "unsigned long vlen"),
+    ("const char __user *filename", "int mode"),
+    ("int __user *fildes",),
+    (
+        "int n",
+        "fd_set __user *inp",
+        "fd_set __user *outp",
+        "fd_set __user *exp",
+        "struct __kernel_old_timeval __user *tvp",
+    ),
+    (),
+    (
+        "unsigned long addr",
+        "unsigned long old_len",
+        "unsigned long new_len",
+        "unsigned long flags",
+        "unsigned long new_addr",
+    ),
+    ("unsigned long start", "size_t len", "int flags"),
+    ("unsigned long start", "size_t len", "unsigned char __user *vec"),
+    ("unsigned long start", "size_t len_in", "int behavior"),
+    ("key_t key", "size_t size", "int shmflg"),
+    ("int shmid", "char __user *shmaddr", "int shmflg"),
+    ("int shmid", "int cmd", "struct shmid_ds __user *buf"),
+    ("unsigned int fildes",),
+    ("unsigned int oldfd", "unsigned int newfd"),
+    (),
+    ("struct __kernel_timespec __user *rqtp", "struct __kernel_timespec __user *rmtp"),
+    ("int which", "struct __kernel_old_itimerval __user *value"),
+    ("unsigned int seconds",),
+    ("int which", "struct __kernel_old_itimerval __user *value", "struct __kernel_old_itimerval __user *ovalue"),
+    (),
+    ("int out_fd", "int in_fd", "off_t __user *offset", "size_t count"),
+    ("int family", "int type", "int protocol"),
+    ("int fd", "struct sockaddr __user *uservaddr", "int addrlen"),
+    ("int fd", "struct sockaddr __user *upeer_sockaddr", "int __user *upeer_addrlen"),
+    ("int fd", "void __user *buff", "size_t len", "unsigned int flags", "struct sockaddr __user *addr", "int addr_len"),
+    (
+        "int fd",
+        "void __user *ubuf",
+        "size_t size",
+        "unsigned int flags",
+        "struct sockaddr __user *addr",
+        "int __user *addr_len",
+    ),
+    ("int fd", "struct user_msghdr __user *msg", "unsigned int flags"),
+    ("int fd", "struct user_msghdr __user *msg", "unsigned int flags"),
+    ("int fd", "int how"),
+    ("int fd", "struct sockaddr __user *umyaddr", "int addrlen"),
+    ("int fd", "int backlog"),
+    ("int fd", "struct sockaddr __user *usockaddr", "int __user *usockaddr_len"),
+    ("int fd", "struct sockaddr __user *usockaddr", "int __user *usockaddr_len"),
+    ("int family", "int type", "int protocol", "int __user *usockvec"),
+    ("int fd", "int level", "int optname", "char __user *optval", "int optlen"),
+    ("int fd", "int level", "int optname", "char __user *optval", "int __user *optlen"),
+    (
+        "unsigned long clone_flags",
+        "unsigned long newsp",
+        "int __user *parent_tidptr",
+        "int __user *child_tidptr",
+        "unsigned long tls",
+    ),
+    (),
+    (),
+    ("const char __user *filename", "const char __user *const __user *argv", "const char __user *const __user *envp"),
+    ("int error_code",),
+    ("pid_t upid", "int __user *stat_addr", "int options", "struct rusage __user *ru"),
+    ("pid_t pid", "int sig"),
+    ("struct new_utsname __user *name",),
+    ("key_t key", "int nsems", "int semflg"),
+    ("int semid", "struct sembuf __user *tsops", "unsigned nsops"),
+    ("int semid", "int semnum", "int cmd", "unsigned long arg"),
+    ("char __user *shmaddr",),
+    ("key_t key", "int msgflg"),
+    ("int msqid", "struct msgbuf __user *msgp", "size_t msgsz", "int msgflg"),
+    ("int msqid", "struct msgbuf __user *msgp", "size_t msgsz", "long msgtyp", "int msgflg"),
+    ("int msqid", "int cmd", "struct msqid_ds __user *buf"),
+    ("unsigned int fd", "unsigned int cmd", "unsigned long arg"),
+    ("unsigned int fd", "unsigned int cmd"),
+    ("unsigned int fd",),
+    ("unsigned int fd",),
+    ("const char __user *path", "long length"),
+    ("unsigned int fd", "off_t length"),
+    ("unsigned int fd", "struct linux_dirent __user *dirent", "unsigned int count"),
+    ("char __user *buf", "unsigned long size"),
+    ("const char __user *filename",),
+    ("unsigned int fd",),
+    ("const char __user *oldname", "const char __user *newname"),
+    ("const char __user *pathname", "umode_t mode"),
+    ("const char __user *pathname",),
+    ("const char __user *pathname", "umode_t mode"),
+    ("const char __user *oldname", "const char __user *newname"),
+    ("const char __user *pathname",),
+    ("const char __user *oldname", "const char __user *newname"),
+    ("const char __user *path", "char __user *buf", "int bufsiz"),
+    ("const char __user *filename", "umode_t mode"),
+    ("unsigned int fd", "umode_t mode"),
+    ("const char __user *filename", "uid_t user", "gid_t group"),
+    ("unsigned int fd", "uid_t user", "gid_t group"),
+    ("const char __user *filename", "uid_t user", "gid_t group"),
+    ("int mask",),
+    ("struct __kernel_old_timeval __user *tv", "struct timezone __user *tz"),
+    ("unsigned int resource", "struct rlimit __user *rlim"),
+    ("int who", "struct rusage __user *ru"),
+    ("struct sysinfo __user *info",),
+    ("struct tms __user *tbuf",),
+    ("long request", "long pid", "unsigned long addr", "unsigned long data"),
+    (),
+    ("int type", "char __user *buf", "int len"),
+    (),
+    ("uid_t uid",),
+    ("gid_t gid",),
+    (),
+    (),
+    ("pid_t pid", "pid_t pgid"),
+    (),
+    (),
+    (),
+    ("uid_t ruid", "uid_t euid"),
+    ("gid_t rgid", "gid_t egid"),
+    ("int gidsetsize", "gid_t __user *grouplist"),
+    ("int gidsetsize", "gid_t __user *grouplist"),
+    ("uid_t ruid", "uid_t euid", "uid_t suid"),
+    ("uid_t __user *ruidp", "uid_t __user *euidp", "uid_t __user *suidp"),
+    ("gid_t rgid", "gid_t egid", "gid_t sgid"),
+    ("gid_t __user *rgidp", "gid_t __user *egidp", "gid_t __user *sgidp"),
+    ("pid_t pid",),
+    ("uid_t uid",),
+    ("gid_t gid",),
+    ("pid_t pid",),
+    ("cap_user_header_t header", "cap_user_data_t dataptr"),
+    ("cap_user_header_t header", "const cap_user_data_t data"),
+    ("sigset_t __user *uset", "size_t sigsetsize"),
+    (
+        "const sigset_t __user *uthese",
+        "siginfo_t __user *uinfo",
+        "const struct __kernel_timespec __user *uts",
+        "size_t sigsetsize",
+    ),
+    ("pid_t pid", "int sig", "siginfo_t __user *uinfo"),
+    ("sigset_t __user *unewset", "size_t sigsetsize"),
+    ("const stack_t __user *uss", "stack_t __user *uoss"),
+    ("char __user *filename", "struct utimbuf __user *times"),
+    ("const char __user *filename", "umode_t mode", "unsigned dev"),
+    ("const char __user *library",),
+    ("unsigned int personality",),
+    ("unsigned dev", "struct ustat __user *ubuf"),
+    ("const char __user *pathname", "struct statfs __user *buf"),
+    ("unsigned int fd", "struct statfs __user *buf"),
+    ("int option", "unsigned long arg1", "unsigned long arg2"),
+    ("int which", "int who"),
+    ("int which", "int who", "int niceval"),
+    ("pid_t pid", "struct sched_param __user *param"),
+    ("pid_t pid", "struct sched_param __user *param"),
+    ("pid_t pid", "int policy", "struct sched_param __user *param"),
+    ("pid_t pid",),
+    ("int policy",),
+    ("int policy",),
+    ("pid_t pid", "struct __kernel_timespec __user *interval"),
+    ("unsigned long start", "size_t len"),
+    ("unsigned long start", "size_t len"),
+    ("int flags",),
+    (),
+    (),
+    ("int func", "void __user *ptr", "unsigned long bytecount"),
+    ("const char __user *new_root", "const char __user *put_old"),
+    (),
+    ("int option", "unsigned long arg2", "unsigned long arg3", "unsigned long arg4", "unsigned long arg5"),
+    ("int option", "unsigned long arg2"),
+    ("struct __kernel_timex __user *txc_p",),
+    ("unsigned int resource", "struct rlimit __user *rlim"),
+    ("const char __user *filename",),
+    (),
+    ("const char __user *name",),
+    ("struct __kernel_old_timeval __user *tv", "struct timezone __user *tz"),
+    ("char __user *dev_name", "char __user *dir_name", "char __user *type", "unsigned long flags", "void __user *data"),
+    ("char __user *name", "int flags"),
+    ("const char __user *specialfile", "int swap_flags"),
+    ("const char __user *specialfile",),
+    ("int magic1", "int magic2", "unsigned int cmd", "void __user *arg"),
+    ("char __user *name", "int len"),
+    ("char __user *name", "int len"),
+    ("unsigned int level",),
+    ("unsigned long from", "unsigned long num", "int turn_on"),
+    (),
+    ("void __user *umod", "unsigned long len", "const char __user *uargs"),
+    ("const char __user *name_user", "unsigned int flags"),
+    (),
+    (),
+    ("unsigned int cmd", "const char __user *special", "qid_t id", "void __user *addr"),
+    (),
+    (),
+    (),
+    (),
+    (),
+    (),
+    (),
+    ("int fd", "loff_t offset", "size_t count"),
+    ("const char __user *pathname", "const char __user *name", "const void __user *value", "size_t size", "int flags"),
+    ("const char __user *pathname", "const char __user *name", "const void __user *value", "size_t size", "int flags"),
+    ("int fd", "const char __user *name", "const void __user *value", "size_t size", "int flags"),
+    ("const char __user *pathname", "const char __user *name", "void __user *value", "size_t size"),
+    ("const char __user *pathname", "const char __user *name", "void __user *value", "size_t size"),
+    ("int fd", "const char __user *name", "void __user *value", "size_t size"),
+    ("const char __user *pathname", "char __user *list", "size_t size"),
+    ("const char __user *pathname", "char __user *list", "size_t size"),
+    ("int fd", "char __user *list", "size_t size"),
+    ("const char __user *pathname", "const char __user *name"),
+    ("const char __user *pathname", "const char __user *name"),
+    ("int fd", "const char __user *name"),
+    ("pid_t pid", "int sig"),
+    ("__kernel_old_time_t __user *tloc",),
+    (
+        "u32 __user *uaddr",
+        "int op",
+        "u32 val",
+        "const struct __kernel_timespec __user *utime",
+        "u32 __user *uaddr2",
+        "u32 val3",
+    ),
+    ("pid_t pid", "unsigned int len", "unsigned long __user *user_mask_ptr"),
+    ("pid_t pid", "unsigned int len", "unsigned long __user *user_mask_ptr"),
+    ("struct user_desc __user *u_info",),
+    ("unsigned nr_events", "aio_context_t __user *ctxp"),
+    ("aio_context_t ctx",),
+    (
+        "aio_context_t ctx_id",
+        "long min_nr",
+        "long nr",
+        "struct io_event __user *events",
+        "struct __kernel_timespec __user *timeout",
+    ),
+    ("aio_context_t ctx_id", "long nr", "struct iocb __user *__user *iocbpp"),
+    ("aio_context_t ctx_id", "struct iocb __user *iocb", "struct io_event __user *result"),
+    ("struct user_desc __user *u_info",),
+    (),
+    ("int size",),
+    (),
+    (),
+    ("unsigned long start", "unsigned long size", "unsigned long prot", "unsigned long pgoff", "unsigned long flags"),
+    ("unsigned int fd", "struct linux_dirent64 __user *dirent", "unsigned int count"),
+    ("int __user *tidptr",),
+    (),
+    (
+        "int semid",
+        "struct sembuf __user *tsops",
+        "unsigned int nsops",
+        "const struct __kernel_timespec __user *timeout",
+    ),
+    ("int fd", "loff_t offset", "size_t len", "int advice"),
+    ("const clockid_t which_clock", "struct sigevent __user *timer_event_spec", "timer_t __user *created_timer_id"),
+    (
+        "timer_t timer_id",
+        "int flags",
+        "const struct __kernel_itimerspec __user *new_setting",
+        "struct __kernel_itimerspec __user *old_setting",
+    ),
+    ("timer_t timer_id", "struct __kernel_itimerspec __user *setting"),
+    ("timer_t timer_id",),
+    ("timer_t timer_id",),
+    ("const clockid_t which_clock", "const struct __kernel_timespec __user *tp"),
+    ("const clockid_t which_clock", "struct __kernel_timespec __user *tp"),
+    ("const clockid_t which_clock", "struct __kernel_timespec __user *tp"),
+    (
+        "const clockid_t which_clock",
+        "int flags",
+        "const struct __kernel_timespec __user *rqtp",
+        "struct __kernel_timespec __user *rmtp",
+    ),
+    ("int error_code",),
+    ("int epfd", "struct epoll_event __user *events", "int maxevents", "int timeout"),
+    ("int epfd", "int op", "int fd", "struct epoll_event __user *event"),
+    ("pid_t tgid", "pid_t pid", "int sig"),
+    ("char __user *filename", "struct __kernel_old_timeval __user *utimes"),
+    (),
+    (
+        "unsigned long start",
+        "unsigned long len",
+        "unsigned long mode",
+        "const unsigned long __user *nmask",
+        "unsigned long maxnode",
+        "unsigned int flags",
+    ),
+    ("int mode", "const unsigned long __user *nmask", "unsigned long maxnode"),
+    (
+        "int __user *policy",
+        "unsigned long __user *nmask",
+        "unsigned long maxnode",
+        "unsigned long addr",
+        "unsigned long flags",
+    ),
+    ("const char __user *u_name", "int oflag", "umode_t mode", "struct mq_attr __user *u_attr"),
+    ("const char __user *u_name",),
+    (
+        "mqd_t mqdes",
+        "const char __user *u_msg_ptr",
+        "size_t msg_len",
+        "unsigned int msg_prio",
+        "const struct __kernel_timespec __user *u_abs_timeout",
+    ),
+    (
+        "mqd_t mqdes",
+        "char __user *u_msg_ptr",
+        "size_t msg_len",
+        "unsigned int __user *u_msg_prio",
+        "const struct __kernel_timespec __user *u_abs_timeout",
+    ),
+    ("mqd_t mqdes", "const struct sigevent __user *u_notification"),
+    ("mqd_t mqdes", "const struct mq_attr __user *u_mqstat", "struct mq_attr __user *u_omqstat"),
+    (
+        "unsigned long entry",
+        "unsigned long nr_segments",
+        "struct kexec_segment __user *segments",
+        "unsigned long flags",
+    ),
+    ("int which", "pid_t upid", "struct siginfo __user *infop", "int options", "struct rusage __user *ru"),
+    (
+        "const char __user *_type",
+        "const char __user *_description",
+        "const void __user *_payload",
+        "size_t plen",
+        "key_serial_t ringid",
+    ),
+    (
+        "const char __user *_type",
+        "const char __user *_description",
+        "const char __user *_callout_info",
+        "key_serial_t destringid",
+    ),
+    ("int option", "unsigned long arg2", "unsigned long arg3", "unsigned long arg4", "unsigned long arg5"),
+    ("int which", "int who", "int ioprio"),
+    ("int which", "int who"),
+    (),
+    ("int fd", "const char __user *pathname", "u32 mask"),
+    ("int fd", "__s32 wd"),
+    (
+        "pid_t pid",
+        "unsigned long maxnode",
+        "const unsigned long __user *old_nodes",
+        "const unsigned long __user *new_nodes",
+    ),
+    ("int dfd", "const char __user *filename", "int flags", "umode_t mode"),
+    ("int dfd", "const char __user *pathname", "umode_t mode"),
+    ("int dfd", "const char __user *filename", "umode_t mode", "unsigned int dev"),
+    ("int dfd", "const char __user *filename", "uid_t user", "gid_t group", "int flag"),
+    ("int dfd", "const char __user *filename", "struct __kernel_old_timeval __user *utimes"),
+    ("int dfd", "const char __user *filename", "struct stat __user *statbuf", "int flag"),
+    ("int dfd", "const char __user *pathname", "int flag"),
+    ("int olddfd", "const char __user *oldname", "int newdfd", "const char __user *newname"),
+    ("int olddfd", "const char __user *oldname", "int newdfd", "const char __user *newname", "int flags"),
+    ("const char __user *oldname", "int newdfd", "const char __user *newname"),
+    ("int dfd", "const char __user *pathname", "char __user *buf", "int bufsiz"),
+    ("int dfd", "const char __user *filename", "umode_t mode"),
+    ("int dfd", "const char __user *filename", "int mode"),
+    (
+        "int n",
+        "fd_set __user *inp",
+        "fd_set __user *outp",
+        "fd_set __user *exp",
+        "struct __kernel_timespec __user *tsp",
+        "void __user *sig",
+    ),
+    (
+        "struct pollfd __user *ufds",
+        "unsigned int nfds",
+        "struct __kernel_timespec __user *tsp",
+        "const sigset_t __user *sigmask",
+        "size_t sigsetsize",
+    ),
+    ("unsigned long unshare_flags",),
+    ("struct robust_list_head __user *head", "size_t len"),
+    ("int pid", "struct robust_list_head __user *__user *head_ptr", "size_t __user *len_ptr"),
+    ("int fd_in", "loff_t __user *off_in", "int fd_out", "loff_t __user *off_out", "size_t len", "unsigned int flags"),
+    ("int fdin", "int fdout", "size_t len", "unsigned int flags"),
+    ("int fd", "loff_t offset", "loff_t nbytes", "unsigned int flags"),
+    ("int fd", "const struct iovec __user *uiov", "unsigned long nr_segs", "unsigned int flags"),
+    (
+        "pid_t pid",
+        "unsigned long nr_pages",
+        "const void __user *__user *pages",
+        "const int __user *nodes",
+        "int __user *status",
+        "int flags",
+    ),
+    ("int dfd", "const char __user *filename", "struct __kernel_timespec __user *utimes", "int flags"),
+    (
+        "int epfd",
+        "struct epoll_event __user *events",
+        "int maxevents",
+        "int timeout",
+        "const sigset_t __user *sigmask",
+        "size_t sigsetsize",
+    ),
+    ("int ufd", "sigset_t __user *user_mask", "size_t sizemask"),
+    ("int clockid", "int flags"),
+    ("unsigned int count",),
+    ("int fd", "int mode", "loff_t offset", "loff_t len"),
+    (
+        "int ufd",
+        "int flags",
+        "const struct __kernel_itimerspec __user *utmr",
+        "struct __kernel_itimerspec __user *otmr",
+    ),
+    ("int ufd", "struct __kernel_itimerspec __user *otmr"),
+    ("int fd", "struct sockaddr __user *upeer_sockaddr", "int __user *upeer_addrlen", "int flags"),
+    ("int ufd", "sigset_t __user *user_mask", "size_t sizemask", "int flags"),
+    ("unsigned int count", "int flags"),
+    ("int flags",),
+    ("unsigned int oldfd", "unsigned int newfd", "int flags"),
+    ("int __user *fildes", "int flags"),
+    ("int flags",),
+    (
+        "unsigned long fd",
+        "const struct iovec __user *vec",
+        "unsigned long vlen",
+        "unsigned long pos_l",
+        "unsigned long pos_h",
+    ),
+    (
+        "unsigned long fd",
+        "const struct iovec __user *vec",
+        "unsigned long vlen",
+        "unsigned long pos_l",
+        "unsigned long pos_h",
+    ),
+    ("pid_t tgid", "pid_t pid", "int sig", "siginfo_t __user *uinfo"),
+    ("struct perf_event_attr __user *attr_uptr", "pid_t pid", "int cpu", "int group_fd", "unsigned long flags"),
+    (
+        "int fd",
+        "struct mmsghdr __user *mmsg",
+        "unsigned int vlen",
+        "unsigned int flags",
+        "struct __kernel_timespec __user *timeout",
+    ),
+    ("unsigned int flags", "unsigned int event_f_flags"),
+    ("int fanotify_fd", "unsigned int flags", "__u64 mask", "int dfd", "const char __user *pathname"),
+    (
+        "pid_t pid",
+        "unsigned int resource",
+        "const struct rlimit64 __user *new_rlim",
+        "struct rlimit64 __user *old_rlim",
+    ),
+    ("int dfd", "const char __user *name", "struct file_handle __user *handle", "void __user *mnt_id", "int flag"),
+    ("int mountdirfd", "struct file_handle __user *handle", "int flags"),
+    ("const clockid_t which_clock", "struct __kernel_timex __user *utx"),
+    ("int fd",),
+    ("int fd", "struct mmsghdr __user *mmsg", "unsigned int vlen", "unsigned int flags"),
+    ("int fd", "int flags"),
+    ("unsigned __user *cpup", "unsigned __user *nodep", "struct getcpu_cache __user *unused"),
+    (
+        "pid_t pid",
+        "const struct iovec __user *lvec",
+        "unsigned long liovcnt",
+        "const struct iovec __user *rvec",
+        "unsigned long riovcnt",
+        "unsigned long flags",
+    ),
+    (
+        "pid_t pid",
+        "const struct iovec __user *lvec",
+        "unsigned long liovcnt",
+        "const struct iovec __user *rvec",
+        "unsigned long riovcnt",
+        "unsigned long flags",
+    ),
+    ("pid_t pid1", "pid_t pid2", "int type", "unsigned long idx1", "unsigned long idx2"),
+    ("int fd", "const char __user *uargs", "int flags"),
+    ("pid_t pid", "struct sched_attr __user *uattr", "unsigned int flags"),
+    ("pid_t pid", "struct sched_attr __user *uattr", "unsigned int usize", "unsigned int flags"),
+    ("int olddfd", "const char __user *oldname", "int newdfd", "const char __user *newname", "unsigned int flags"),
+    ("unsigned int op", "unsigned int flags", "void __user *uargs"),
+    ("char __user *ubuf", "size_t len", "unsigned int flags"),
+    ("const char __user *uname", "unsigned int flags"),
+    (
+        "int kernel_fd",
+        "int initrd_fd",
+        "unsigned long cmdline_len",
+        "const char __user *cmdline_ptr",
+        "unsigned long flags",
+    ),
+    ("int cmd", "union bpf_attr __user *uattr", "unsigned int size"),
+    (
+        "int fd",
+        "const char __user *filename",
+        "const char __user *const __user *argv",
+        "const char __user *const __user *envp",
+        "int flags",
+    ),
+    ("int flags",),
+    ("int cmd", "unsigned int flags", "int cpu_id"),
+    ("unsigned long start", "size_t len", "int flags"),
+    ("int fd_in", "loff_t __user *off_in", "int fd_out", "loff_t __user *off_out", "size_t len", "unsigned int flags"),
+    (
+        "unsigned long fd",
+        "const struct iovec __user *vec",
+        "unsigned long vlen",
+        "unsigned long pos_l",
+        "unsigned long pos_h",
+        "rwf_t flags",
+    ),
+    (
+        "unsigned long fd",
+        "const struct iovec __user *vec",
+        "unsigned long vlen",
+        "unsigned long pos_l",
+        "unsigned long pos_h",
+        "rwf_t flags",
+    ),
+    ("unsigned long start", "size_t len", "unsigned long prot", "int pkey"),
+    ("unsigned long flags", "unsigned long init_val"),
+    ("int pkey",),
+    ("int dfd", "const char __user *filename", "unsigned flags", "unsigned int mask", "struct statx __user *buffer"),
+    (
+        "aio_context_t ctx_id",
+        "long min_nr",
+        "long nr",
+        "struct io_event __user *events",
+        "struct __kernel_timespec __user *timeout",
+        "const struct __aio_sigset __user *usig",
+    ),
+    ("struct rseq __user *rseq", "u32 rseq_len", "int flags", "u32 sig"),
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    ("int pidfd", "int sig", "siginfo_t __user *info", "unsigned int flags"),
+    ("u32 entries", "struct io_uring_params __user *params"),
+    ("unsigned int fd", "u32 to_submit", "u32 min_complete", "u32 flags", "const void __user *argp", "size_t argsz"),
+    ("unsigned int fd", "unsigned int opcode", "void __user *arg", "unsigned int nr_args"),
+    ("int dfd", "const char __user *filename", "unsigned flags"),
+    (
+        "int from_dfd",
+        "const char __user *from_pathname",
+        "int to_dfd",
+        "const char __user *to_pathname",
+        "unsigned int flags",
+    ),
+    ("const char __user *_fs_name", "unsigned int flags"),
+    ("int fd", "unsigned int cmd", "const char __user *_key", "const void __user *_value", "int aux"),
+    ("int fs_fd", "unsigned int flags", "unsigned int attr_flags"),
+    ("int dfd", "const char __user *path", "unsigned int flags"),
+    ("pid_t pid", "unsigned int flags"),
+    ("struct clone_args __user *uargs", "size_t size"),
+    ("unsigned int fd", "unsigned int max_fd", "unsigned int flags"),
+    ("int dfd", "const char __user *filename", "struct open_how __user *how", "size_t usize"),
+    ("int pidfd", "int fd", "unsigned int flags"),
+    ("int dfd", "const char __user *filename", "int mode", "int flags"),
+    ("int pidfd", "const struct iovec __user *vec", "size_t vlen", "int behavior", "unsigned int flags"),
+    (
+        "int epfd",
+        "struct epoll_event __user *events",
+        "int maxevents",
+        "const struct __kernel_timespec __user *timeout",
+        "const sigset_t __user *sigmask",
+        "size_t sigsetsize",
+    ),
+    ("int dfd", "const char __user *path", "unsigned int flags", "struct mount_attr __user *uattr", "size_t usize"),
+    ("unsigned int fd", "unsigned int cmd", "qid_t id", "void __user *addr"),
+    ("const struct landlock_ruleset_attr __user *const attr", "const size_t size", "const __u32 flags"),
+    (
+        "const int ruleset_fd",
+        "const enum landlock_rule_type rule_type",
+        "const void __user *const rule_attr",
+        "const __u32 flags",
+    ),
+    ("const int ruleset_fd", "const __u32 flags"),
+    ("unsigned int flags",),
+    ("int pidfd", "unsigned int flags"),
+    (
+        "struct futex_waitv __user *waiters",
+        "unsigned int nr_futexes",
+        "unsigned int flags",
+        "struct __kernel_timespec __user *timeout",
+        "clockid_t clockid",
+    ),
+    ("unsigned long start", "unsigned long len", "unsigned long home_node", "unsigned long flags"),
+    (
+        "unsigned int fd",
+        "struct cachestat_range __user *cstat_range",
+        "struct cachestat __user *cstat",
+        "unsigned int flags",
+    ),
+    ("int dfd", "const char __user *filename", "umode_t mode", "unsigned int flags"),
+    ("unsigned long addr", "unsigned long size", "unsigned int flags"),
+    ("void __user *uaddr", "unsigned long mask", "int nr", "unsigned int flags"),
+    (
+        "void __user *uaddr",
+        "unsigned long val",
+        "unsigned long mask",
+        "unsigned int flags",
+        "struct __kernel_timespec __user *timeout",
+        "clockid_t clockid",
+    ),
+    ("struct futex_waitv __user *waiters", "unsigned int flags", "int nr_wake", "int nr_requeue"),
+    ("const struct mnt_id_req __user *req", "struct statmount __user *buf", "size_t bufsize", "unsigned int flags"),
+    ("const struct mnt_id_req __user *req", "u64 __user *mnt_ids", "size_t nr_mnt_ids", "unsigned int flags"),
+    ("unsigned int attr", "struct lsm_ctx __user *ctx", "u32 __user *size", "u32 flags"),
+    ("unsigned int attr", "struct lsm_ctx __user *ctx", "u32 size", "u32 flags"),
+    ("u64 __user *ids", "u32 __user *size", "u32 flags"),
+    ("unsigned long start", "size_t len", "unsigned long flags"),
+)
+"""The arguments of the syscalls, indexed by number. Unassigned numbers are None."""
+
+SYSCALL_NUMBERS: dict[str, int] = {
+    "read": 0,
+    "write": 1,
+    "open": 2,
+    "close": 3,
+    "stat": 4,
+    "fstat": 5,
+    "lstat": 6,
+    "poll": 7,
+    "lseek": 8,
+    "mmap": 9,
+    "mprotect": 10,
+    "munmap": 11,
+    "brk": 12,
+    "rt_sigaction": 13,
+    "rt_sigprocmask": 14,
+    "rt_sigreturn": 15,
+    "ioctl": 16,
+    "pread64": 17,
+    "pwrite64": 18,
+    "readv": 19,
+    "writev": 20,
+    "access": 21,
+    "pipe": 22,
+    "select": 23,
+    "sched_yield": 24,
+    "mremap": 25,
+    "msync": 26,
+    "mincore": 27,
+    "madvise": 28,
+    "shmget": 29,
+    "shmat": 30,
+    "shmctl": 31,
+    "dup": 32,
+    "dup2": 33,
+    "pause": 34,
+    "nanosleep": 35,
+    "getitimer": 36,
+    "alarm": 37,
+    "setitimer": 38,
+    "getpid": 39,
+    "sendfile": 40,
+    "socket": 41,
+    "connect": 42,
+    "accept": 43,
+    "sendto": 44,
+    "recvfrom": 45,
+    "sendmsg": 46,
+    "recvmsg": 47,
+    "shutdown": 48,
+    "bind": 49,
+    "listen": 50,
+    "getsockname": 51,
+    "getpeername": 52,
+    "socketpair": 53,
+    "setsockopt": 54,
+    "getsockopt": 55,
+    "clone": 56,
+    "fork": 57,
+    "vfork": 58,
+    "execve": 59,
+    "exit": 60,
+    "wait4": 61,
+    "kill": 62,
+    "uname": 63,
+    "semget": 64,
+    "semop": 65,
+    "semctl": 66,
+    "shmdt": 67,
+    "msgget": 68,
+    "msgsnd": 69,
+    "msgrcv": 70,
+    "msgctl": 71,
+    "fcntl": 72,
+    "flock": 73,
+    "fsync": 74,
+    "fdatasync": 75,
+    "truncate": 76,
+    "ftruncate": 77,
+    "getdents": 78,
+    "getcwd": 79,
+    "chdir": 80,
+    "fchdir": 81,
+    "rename": 82,
+    "mkdir": 83,
+    "rmdir": 84,
+    "creat": 85,
+    "link": 86,
+    "unlink": 87,
+    "symlink": 88,
+    "readlink": 89,
+    "chmod": 90,
+    "fchmod": 91,
+    "chown": 92,
+    "fchown": 93,
+    "lchown": 94,
+    "umask": 95,
+    "gettimeofday": 96,
+    "getrlimit": 97,
+    "getrusage": 98,
+    "sysinfo": 99,
+    "times": 100,
+    "ptrace": 101,
+    "getuid": 102,
+    "syslog": 103,
+    "getgid": 104,
+    "setuid": 105,
+    "setgid": 106,
+    "geteuid": 107,
+    "getegid": 108,
+    "setpgid": 109,
+    "getppid": 110,
+    "getpgrp": 111,
+    "setsid": 112,
+    "setreuid": 113,
+    "setregid": 114,
+    "getgroups": 115,
+    "setgroups": 116,
+    "setresuid": 117,
+    "getresuid": 118,
+    "setresgid": 119,
+    "getresgid": 120,
+    "getpgid": 121,
+    "setfsuid": 122,
+    "setfsgid": 123,
+    "getsid": 124,
+    "capget": 125,
+    "capset": 126,
+    "rt_sigpending": 127,
+    "rt_sigtimedwait": 128,
+    "rt_sigqueueinfo": 129,
+    "rt_sigsuspend": 130,
+    "sigaltstack": 131,
+    "utime": 132,
+    "mknod": 133,
+    "uselib": 134,
+    "personality": 135,
+    "ustat": 136,
+    "statfs": 137,
+    "fstatfs": 138,
+    "sysfs": 139,
+    "getpriority": 140,
+    "setpriority": 141,
+    "sched_setparam": 142,
+    "sched_getparam": 143,
+    "sched_setscheduler": 144,
+    "sched_getscheduler": 145,
+    "sched_get_priority_max": 146,
+    "sched_get_priority_min": 147,
+    "sched_rr_get_interval": 148,
+    "mlock": 149,
+    "munlock": 150,
+    "mlockall": 151,
+    "munlockall": 152,
+    "vhangup": 153,
+    "modify_ldt": 154,
+    "pivot_root": 155,
+    "_sysctl": 156,
+    "prctl": 157,
+    "arch_prctl": 158,
+    "adjtimex": 159,
+    "setrlimit": 160,
+    "chroot": 161,
+    "sync": 162,
+    "acct": 163,
+    "settimeofday": 164,
+    "mount": 165,
+    "umount2": 166,
+    "swapon": 167,
+    "swapoff": 168,
+    "reboot": 169,
+    "sethostname": 170,
+    "setdomainname": 171,
+    "iopl": 172,
+    "ioperm": 173,
+    "create_module": 174,
+    "init_module": 175,
+    "delete_module": 176,
+    "get_kernel_syms": 177,
+    "query_module": 178,
+    "quotactl": 179,
+    "nfsservctl": 180,
+    "getpmsg": 181,
+    "putpmsg": 182,
+    "afs_syscall": 183,
+    "tuxcall": 184,
+    "security": 185,
+    "gettid": 186,
+    "readahead": 187,
+    "setxattr": 188,
+    "lsetxattr": 189,
+    "fsetxattr": 190,
+    "getxattr": 191,
+    "lgetxattr": 192,
+    "fgetxattr": 193,
+    "listxattr": 194,
+    "llistxattr": 195,
+    "flistxattr": 196,
+    "removexattr": 197,
+    "lremovexattr": 198,
+    "fremovexattr": 199,
+    "tkill": 200,
+    "time": 201,
+    "futex": 202,
+    "sched_setaffinity": 203,
+    "sched_getaffinity": 204,
+    "set_thread_area": 205,
+    "io_setup": 206,
+    "io_destroy": 207,
+    "io_getevents": 208,
+    "io_submit": 209,
+    "io_cancel": 210,
+    "get_thread_area": 211,
+    "lookup_dcookie": 212,
+    "epoll_create": 213,
+    "epoll_ctl_old": 214,
+    "epoll_wait_old": 215,
+    "remap_file_pages": 216,
+    "getdents64": 217,
+    "set_tid_address": 218,
+    "restart_syscall": 219,
+    "semtimedop": 220,
+    "fadvise64": 221,
+    "timer_create": 222,
+    "timer_settime": 223,
+    "timer_gettime": 224,
+    "timer_getoverrun": 225,
+    "timer_delete": 226,
+    "clock_settime": 227,
+    "clock_gettime": 228,
+    "clock_getres": 229,
+    "clock_nanosleep": 230,
+    "exit_group": 231,
+    "epoll_wait": 232,
+    "epoll_ctl": 233,
+    "tgkill": 234,
+    "utimes": 235,
+    "vserver": 236,
+    "mbind": 237,
+    "set_mempolicy": 238,
+    "get_mempolicy": 239,
+    "mq_open": 240,
+    "mq_unlink": 241,
+    "mq_timedsend": 242,
+    "mq_timedreceive": 243,
+    "mq_notify": 244,
+    "mq_getsetattr": 245,
+    "kexec_load": 246,
+    "waitid": 247,
+    "add_key": 248,
+    "request_key": 249,
+    "keyctl": 250,
+    "ioprio_set": 251,
+    "ioprio_get": 252,
+    "inotify_init": 253,
+    "inotify_add_watch": 254,
+    "inotify_rm_watch": 255,
+    "migrate_pages": 256,
+    "openat": 257,
+    "mkdirat": 258,
+    "mknodat": 259,
+    "fchownat": 260,
+    "futimesat": 261,
+    "newfstatat": 262,
+    "unlinkat": 263,
+    "renameat": 264,
+    "linkat": 265,
+    "symlinkat": 266,
+    "readlinkat": 267,
+    "fchmodat": 268,
+    "faccessat": 269,
+    "pselect6": 270,
+    "ppoll": 271,
+    "unshare": 272,
+    "set_robust_list": 273,
+    "get_robust_list": 274,
+    "splice": 275,
+    "tee": 276,
+    "sync_file_range": 277,
+    "vmsplice": 278,
+    "move_pages": 279,
+    "utimensat": 280,
+    "epoll_pwait": 281,
+    "signalfd": 282,
+    "timerfd_create": 283,
+    "eventfd": 284,
+    "fallocate": 285,
+    "timerfd_settime": 286,
+    "timerfd_gettime": 287,
+    "accept4": 288,
+    "signalfd4": 289,
+    "eventfd2": 290,
+    "epoll_create1": 291,
+    "dup3": 292,
+    "pipe2": 293,
+    "inotify_init1": 294,
+    "preadv": 295,
+    "pwritev": 296,
+    "rt_tgsigqueueinfo": 297,
+    "perf_event_open": 298,
+    "recvmmsg": 299,
+    "fanotify_init": 300,
+    "fanotify_mark": 301,
+    "prlimit64": 302,
+    "name_to_handle_at": 303,
+    "open_by_handle_at": 304,
+    "clock_adjtime": 305,
+    "syncfs": 306,
+    "sendmmsg": 307,
+    "setns": 308,
+    "getcpu": 309,
+    "process_vm_readv": 310,
+    "process_vm_writev": 311,
+    "kcmp": 312,
+    "finit_module": 313,
+    "sched_setattr": 314,
+    "sched_getattr": 315,
+    "renameat2": 316,
+    "seccomp": 317,
+    "getrandom": 318,
+    "memfd_create": 319,
+    "kexec_file_load": 320,
+    "bpf": 321,
+    "execveat": 322,
+    "userfaultfd": 323,
+    "membarrier": 324,
+    "mlock2": 325,
+    "copy_file_range": 326,
+    "preadv2": 327,
+    "pwritev2": 328,
+    "pkey_mprotect": 329,
+    "pkey_alloc": 330,
+    "pkey_free": 331,
+    "statx": 332,
+    "io_pgetevents": 333,
+    "rseq": 334,
+    "pidfd_send_signal": 424,
+    "io_uring_setup": 425,
+    "io_uring_enter": 426,
+    "io_uring_register": 427,
+    "open_tree": 428,
+    "move_mount": 429,
+    "fsopen": 430,
+    "fsconfig": 431,
+    "fsmount": 432,
+    "fspick": 433,
+    "pidfd_open": 434,
+    "clone3": 435,
+    "close_range": 436,
+    "openat2": 437,
+    "pidfd_getfd": 438,
+    "faccessat2": 439,
+    "process_madvise": 440,
+    "epoll_pwait2": 441,
+    "mount_setattr": 442,
+    "quotactl_fd": 443,
+    "landlock_create_ruleset": 444,
+    "landlock_add_rule": 445,
+    "landlock_restrict_self": 446,
+    "memfd_secret": 447,
+    "process_mrelease": 448,
+    "futex_waitv": 449,
+    "set_mempolicy_home_node": 450,
+    "cachestat": 451,
+    "fchmodat2": 452,
+    "map_shadow_stack": 453,
+    "futex_wake": 454,
+    "futex_wait": 455,
+    "futex_requeue": 456,
+    "statmount": 457,
+    "listmount": 458,
+    "lsm_get_self_attr": 459,
+    "lsm_set_self_attr": 460,
+    "lsm_list_modules": 461,
+    "mseal": 462,
+}
+"""The syscall numbers, indexed by name."""
@@ -4,95 +4,59 @@
 # Licensed under the MIT license. See LICENSE file in the project root for details.
 #
 
-import functools
-import json
-from pathlib import Path
+from __future__ import annotations
 
-import requests
+from typing import TYPE_CHECKING
 
+from libdebug.utils import syscall_table_amd64
 from libdebug.utils.libcontext import libcontext
 
-SYSCALLS_REMOTE = "https://syscalls.mebeim.net/db"
-LOCAL_FOLDER_PATH = (Path.home() / ".cache" / "libdebug" / "syscalls").resolve()
+if TYPE_CHECKING:
+    from types import ModuleType
 
 
-def get_remote_definition_url(arch: str) -> str:
-    """Get the URL of the remote syscall definition file."""
+def get_syscall_table(arch: str) -> ModuleType:
+    """Get the syscall table bundled for the specified architecture.
+
+    The table is generated from https://syscalls.mebeim.net by libdebug/tools/generate_syscall_table.py.
+    """
     match arch:
         case "amd64":
-            return f"{SYSCALLS_REMOTE}/x86/64/x64/latest/table.json"
+            return syscall_table_amd64
         case _:
             raise ValueError(f"Architecture {arch} not supported")
 
 
-def fetch_remote_syscall_definition(arch: str) -> dict:
-    """Fetch the syscall definition file from the remote server."""
-    url = get_remote_definition_url(arch)
-
-    response = requests.get(url, timeout=1)
-    response.raise_for_status()
-
-    # Save the response to a local file
-    with Path(f"{LOCAL_FOLDER_PATH}/{arch}.json").open("w") as f:
-        f.write(response.text)
-
-    return response.json()
-
-
-@functools.cache
-def get_syscall_definitions(arch: str) -> dict:
-    """Get the syscall definitions for the specified architecture."""
-    LOCAL_FOLDER_PATH.mkdir(parents=True, exist_ok=True)
-
-    if (LOCAL_FOLDER_PATH / f"{arch}.json").exists():
-        try:
-            with (LOCAL_FOLDER_PATH / f"{arch}.json").open() as f:
-                return json.load(f)
-        except json.decoder.JSONDecodeError:
-            pass
-
-    return fetch_remote_syscall_definition(arch)
-
-
-@functools.cache
 def resolve_syscall_number(name: str) -> int:
     """Resolve a syscall name to its number."""
-    definitions = get_syscall_definitions(libcontext.arch)
+    numbers = get_syscall_table(libcontext.arch).SYSCALL_NUMBERS
 
-    for syscall in definitions["syscalls"]:
-        if syscall["name"] == name:
-            return syscall["number"]
+    if name not in numbers:
+        raise ValueError(f'Syscall "{name}" not found')
 
-    raise ValueError(f'Syscall "{name}" not found')
+    return numbers[name]
 
 
-@functools.cache
 def resolve_syscall_name(number: int) -> str:
     """Resolve a syscall number to its name."""
-    definitions = get_syscall_definitions(libcontext.arch)
+    names = get_syscall_table(libcontext.arch).SYSCALL_NAMES
 
-    for syscall in definitions["syscalls"]:
-        if syscall["number"] == number:
-            return syscall["name"]
+    if not 0 <= number < len(names) or names[number] is None:
+        raise ValueError(f'Syscall number "{number}" not found')
 
-    raise ValueError(f'Syscall number "{number}" not found')
+    return names[number]
 
 
-@functools.cache
 def resolve_syscall_arguments(number: int) -> list[str]:
     """Resolve a syscall number to its argument definition."""
-    definitions = get_syscall_definitions(libcontext.arch)
+    signatures = get_syscall_table(libcontext.arch).SYSCALL_SIGNATURES
 
-    for syscall in definitions["syscalls"]:
-        if syscall["number"] == number:
-            return syscall["signature"]
+    if not 0 <= number < len(signatures) or signatures[number] is None:
+        raise ValueError(f'Syscall number "{number}" not found')
 
-    raise ValueError(f'Syscall number "{number}" not found')
+    return list(signatures[number])
 
 
-@functools.cache
 def get_all_syscall_numbers() -> list[int]:
     """Retrieves all the syscall numbers."""
-    definitions = get_syscall_definitions(libcontext.arch)
-
-    return [syscall["number"] for syscall in definitions["syscalls"]]
+    return list(get_syscall_table(libcontext.arch).SYSCALL_NUMBERS.values())
@@ -0,0 +1,143 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from __future__ import annotations
+
+import struct
+
+from libdebug.utils.libcontext import libcontext
+
+JUMP_SIZE = 5
+"""The size of the jump that diverts a tracepoint to its trampoline."""
+
+RING_HEADER_SIZE = 64
+"""The size of the header of a ring buffer, which holds the number of records ever written."""
+
+MAX_TRACEPOINT_CAPACITY = 1 << 24
+"""The maximum number of records of a ring buffer."""
+
+# The encoding of the general purpose registers
+_GENERAL_PURPOSE_REGISTERS = {
+    "rax": 0,
+    "rcx": 1,
+    "rdx": 2,
+    "rbx": 3,
+    "rsp": 4,
+    "rbp": 5,
+    "rsi": 6,
+    "rdi": 7,
+    "r8": 8,
+    "r9": 9,
+    "r10": 10,
+    "r11": 11,
+    "r12": 12,
+    "r13": 13,
+    "r14": 14,
+    "r15": 15,
+}
+
+TRACEPOINT_REGISTERS = frozenset(_GENERAL_PURPOSE_REGISTERS) | {"rip", "eflags"}
+"""The registers a tracepoint can record."""
+
+_RED_ZONE_SIZE = 128
+
+# The offsets of the values the trampoline saves on the stack while it writes a record
+_SAVED_REGISTERS = {"rdx": 8, "rcx": 16, "rax": 24, "eflags": 32}
+_SAVED_SIZE = 40
+
+
+def record_size(registers: list[str]) -> int:
+    """Returns the size of a record of the ring buffer, a sequence number followed by the registers."""
+    return 8 * (1 + len(registers))
+
+
+def ring_size(registers: list[str], capacity: int) -> int:
+    """Returns the size of a ring buffer, including its header."""
+    return RING_HEADER_SIZE + capacity * record_size(registers)
+
+
+def build_jump(source: int, destination: int) -> bytes:
+    """Returns a jump from the source address to the destination address.
+
+    Args:
+        source (int): The address of the jump.
+        destination (int): The destination of the jump.
+
+    Returns:
+        bytes: The encoded jump, JUMP_SIZE bytes long.
+    """
+    displacement = destination - (source + JUMP_SIZE)
+
+    if not -(1 << 31) <= displacement < 1 << 31:
+        raise ValueError(f"The address {destination:#x} is out of the range of a jump from {source:#x}.")
+
+    return b"\xe9" + struct.pack("<i", displacement)
+
+
+def build_trampoline_prologue(address: int, registers: list[str], ring: int, capacity: int) -> bytes:
+    """Returns the code that appends the registers of the thread to a ring buffer, leaving the thread unchanged.
+
+    The record is reserved with an atomic increment of the header, so that threads can record concurrently. Its
+    sequence number is written last, so that a record the thread did not complete can be told apart.
+
+    Args:
+        address (int): The address of the tracepoint, which is recorded as the instruction pointer.
+        registers (list[str]): The registers to record.
+        ring (int): The address of the ring buffer.
+        capacity (int): The number of records of the ring buffer, a power of two.
+
+    Returns:
+        bytes: The encoded code.
+    """
+    if libcontext.arch != "amd64":
+        raise ValueError(f"Architecture {libcontext.arch} not supported")
+
+    for register in registers:
+        if register not in TRACEPOINT_REGISTERS:
+            raise ValueError(f"Register {register} cannot be recorded by a tracepoint.")
+
+    code = bytearray()
+
+    # lea rsp, [rsp - 128]; pushfq; push rax; push rcx; push rdx
+    code += b"\x48\x8d\x64\x24\x80\x9c\x50\x51\x52"
+    # mov rax, ring
+    code += b"\x48\xb8" + struct.pack("<Q", ring)
+    # mov ecx, 1; lock xadd [rax], rcx
+    code += b"\xb9\x01\x00\x00\x00\xf0\x48\x0f\xc1\x08"
+    # mov rdx, rcx; inc rdx; push rdx
+    code += b"\x48\x89\xca\x48\xff\xc2\x52"
+    # and rcx, capacity - 1; imul rcx, rcx, record size; lea rcx, [rax + rcx + header]
+    code += b"\x48\x81\xe1" + struct.pack("<I", capacity - 1)
+    code += b"\x48\x69\xc9" + struct.pack("<I", record_size(registers))
+    code += b"\x48\x8d\x8c\x08" + struct.pack("<I", RING_HEADER_SIZE)
+
+    for i, register in enumerate(registers):
+        offset = struct.pack("<I", 8 * (1 + i))
+
+        if register in _SAVED_REGISTERS:
+            # mov rdx, [rsp + saved]
+            code += b"\x48\x8b\x94\x24" + struct.pack("<I", _SAVED_REGISTERS[register])
+        elif register == "rsp":
+            # lea rdx, [rsp + saved + red zone]
+            code += b"\x48\x8d\x94\x24" + struct.pack("<I", _SAVED_SIZE + _RED_ZONE_SIZE)
+        elif register == "rip":
+            # mov rdx, address
+            code += b"\x48\xba" + struct.pack("<Q", address)
+        else:
+            # mov [rcx + offset], register
+            number = _GENERAL_PURPOSE_REGISTERS[register]
+            code += bytes([0x4C if number >= 8 else 0x48, 0x89, 0x81 | (number & 7) << 3]) + offset
+            continue
+
+        # mov [rcx + offset], rdx
+        code += b"\x48\x89\x91" + offset
+
+    # pop rdx; mov [rcx], rdx
+    code += b"\x5a\x48\x89\x11"
+    # pop rdx; pop rcx; pop rax; popfq; lea rsp, [rsp + 128]
+    code += b"\x5a\x59\x58\x9d\x48\x8d\xa4\x24" + struct.pack("<I", _RED_ZONE_SIZE)
+
+    return bytes(code)
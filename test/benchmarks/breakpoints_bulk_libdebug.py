@@ -0,0 +1,61 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from time import perf_counter
+import pickle
+from libdebug import debugger
+
+
+def test(bulk):
+    """ This test includes the time to:
+    - resolve the addresses of 10000 breakpoints,
+    - install them in the debugged process.
+    """
+    # Start the process (it will stop at the entrypoint)
+    d.run()
+
+    # The breakpoints are never hit, so they can be placed at any byte of the code of libc
+    libc = next(vmap for vmap in d.maps() if "libc" in vmap.backing_file and "x" in vmap.permissions)
+    addresses = list(range(libc.start, libc.start + 10000))
+
+    # Start the timer
+    start = perf_counter()
+
+    # Set the breakpoints
+    if bulk:
+        d.breakpoints_bulk(addresses, file="absolute")
+    else:
+        for address in addresses:
+            d.breakpoint(address, file="absolute")
+
+    # Stop the timer
+    end = perf_counter()
+
+    # Kill for a clean exit
+    d.kill()
+
+    return end - start
+
+
+# Initialize the results
+results = {"bulk": [], "single": []}
+
+# Initialize the debugger
+d = debugger("../binaries/math_loop_test")
+
+for _ in range(10):
+    results["bulk"].append(test(bulk=True))
+    results["single"].append(test(bulk=False))
+
+# Terminate the debugger
+d.terminate()
+
+# Save the result in a pickle file
+with open("breakpoints_bulk_libdebug.pkl", "wb") as f:
+    pickle.dump(results, f)
+
+for name, times in results.items():
+    print(f"{name}: {sum(times) / len(times):.6f}s on average")
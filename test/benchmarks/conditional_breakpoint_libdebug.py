@@ -0,0 +1,72 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from time import perf_counter
+import pickle
+from libdebug import debugger
+
+
+def callback(t, b):
+    """ Python version of the condition, the process is stopped only on the last iteration """
+    if int.from_bytes(t.memory[t.regs.rbp - 0x10, 4], "little") == 999:
+        t._internal_debugger.resume_context.resume = False
+
+
+def test(native):
+    """ This test includes the time to:
+    - run the debugged process from the entrypoint,
+    - hit the breakpoint 1000 times, evaluating a condition on the loop counter at each hit,
+    - stop on the single hit where the condition holds,
+    - wait the process to end.
+    """
+    # Start the process (it will stop at the entrypoint)
+    d.run()
+
+    # Set the conditional breakpoint
+    if native:
+        d.breakpoint(0x401302, when="dword[rbp - 0x10] == 999", file="absolute")
+    else:
+        d.breakpoint(0x401302, callback=callback, file="absolute")
+
+    # Start the timer
+    start = perf_counter()
+
+    # Continue the process from the entrypoint, it stops on the last iteration
+    d.cont()
+    d.wait()
+
+    # Continue until the end of the process
+    d.cont()
+    d.wait()
+
+    # Stop the timer
+    end = perf_counter()
+
+    # Kill for a clean exit
+    d.kill()
+
+    return end - start
+
+
+# Initialize the results
+results = {"native": [], "callback": []}
+
+# Initialize the debugger
+d = debugger("../binaries/math_loop_test")
+
+for _ in range(100):
+    results["native"].append(test(native=True))
+    results["callback"].append(test(native=False))
+
+# Terminate the debugger
+d.terminate()
+
+# Save the result in a pickle file
+with open("conditional_breakpoint_libdebug.pkl", "wb") as f:
+    pickle.dump(results, f)
+
+for name, times in results.items():
+    print(f"{name}: {sum(times) / len(times):.6f}s on average")
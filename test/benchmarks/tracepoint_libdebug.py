@@ -0,0 +1,69 @@
+#
+# This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+# Copyright (c) 2024 Roberto Alessandro Bertolini. All rights reserved.
+# Licensed under the MIT license. See LICENSE file in the project root for details.
+#
+
+from time import perf_counter
+import pickle
+from libdebug import debugger
+
+
+records = []
+
+
+def callback(t, b):
+    """ Python version of the tracepoint, the registers are recorded at each hit """
+    records.append((t.regs.rdi, t.regs.rsp))
+
+
+def test(tracepoint):
+    """ This test includes the time to:
+    - run the debugged process from the entrypoint,
+    - record two registers at each of the 1000 hits of the traced instruction,
+    - wait the process to end.
+    """
+    # Start the process (it will stop at the entrypoint)
+    d.run()
+
+    # Set the tracepoint, or the equivalent breakpoint
+    if tracepoint:
+        d.tracepoint(0x401302, ["rdi", "rsp"], file="absolute")
+    else:
+        d.breakpoint(0x401302, callback=callback, file="absolute")
+
+    # Start the timer
+    start = perf_counter()
+
+    # Continue until the end of the process
+    d.cont()
+    d.wait()
+
+    # Stop the timer
+    end = perf_counter()
+
+    # Kill for a clean exit
+    d.kill()
+
+    return end - start
+
+
+# Initialize the results
+results = {"tracepoint": [], "callback": []}
+
+# Initialize the debugger
+d = debugger("../binaries/math_loop_test")
+
+for _ in range(100):
+    results["tracepoint"].append(test(tracepoint=True))
+    results["callback"].append(test(tracepoint=False))
+
+# Terminate the debugger
+d.terminate()
+
+# Save the result in a pickle file
+with open("tracepoint_libdebug.pkl", "wb") as f:
+    pickle.dump(results, f)
+
+for name, times in results.items():
+    print(f"{name}: {sum(times) / len(times):.6f}s on average")
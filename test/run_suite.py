@@ -50,14 +50,29 @@ def fast_suite():
     suite.addTest(BreakpointTest("test_bp_disable_hw"))
     suite.addTest(BreakpointTest("test_bp_disable_reenable"))
     suite.addTest(BreakpointTest("test_bp_disable_reenable_hw"))
+    suite.addTest(BreakpointTest("test_bp_hw_pending_changes"))
     suite.addTest(BreakpointTest("test_bps_running"))
     suite.addTest(BreakpointTest("test_bp_backing_file"))
+    suite.addTest(BreakpointTest("test_bp_memory_access"))
+    suite.addTest(BreakpointTest("test_bp_counting"))
+    suite.addTest(BreakpointTest("test_bp_coverage"))
+    suite.addTest(BreakpointTest("test_bp_bulk"))
+    suite.addTest(BreakpointTest("test_bp_when"))
+    suite.addTest(BreakpointTest("test_bp_step_over"))
+    suite.addTest(BreakpointTest("test_tracepoint"))
     suite.addTest(BreakpointTest("test_bp_disable_on_creation"))
     suite.addTest(BreakpointTest("test_bp_disable_on_creation_2"))
     suite.addTest(BreakpointTest("test_bp_disable_on_creation_hardware"))
     suite.addTest(BreakpointTest("test_bp_disable_on_creation_2_hardware"))
     suite.addTest(MemoryTest("test_memory"))
     suite.addTest(MemoryTest("test_mem_access_libs"))
+    suite.addTest(MemoryTest("test_memory_large_read_write"))
+    suite.addTest(MemoryTest("test_memory_readinto"))
+    suite.addTest(MemoryTest("test_memory_cache"))
+    suite.addTest(MemoryTest("test_memory_snapshot"))
+    suite.addTest(MemoryTest("test_memory_read_write_many"))
+    suite.addTest(MemoryTest("test_memory_follow"))
+    suite.addTest(MemoryTest("test_memory_find"))
     suite.addTest(MemoryTest("test_memory_access_methods_backing_file"))
     suite.addTest(MemoryTest("test_memory_exceptions"))
     suite.addTest(MemoryTest("test_memory_multiple_runs"))
@@ -74,6 +89,7 @@ def fast_suite():
     suite.addTest(AttachDetachTest("test_attach_and_detach_4"))
     suite.addTest(ThreadTest("test_thread"))
     suite.addTest(ThreadTest("test_thread_hardware"))
+    suite.addTest(ThreadTest("test_thread_hardware_new_threads"))
     suite.addTest(ComplexThreadTest("test_thread"))
     suite.addTest(CallbackTest("test_callback_simple"))
     suite.addTest(CallbackTest("test_callback_simple_hardware"))
@@ -115,6 +131,8 @@ def fast_suite():
     suite.addTest(AutoWaitingTest("test_jumpout_auto_waiting"))
     suite.addTest(AutoWaitingNlinks("test_nlinks"))
     suite.addTest(WatchpointTest("test_watchpoint"))
+    suite.addTest(WatchpointTest("test_watchpoint_page"))
+    suite.addTest(WatchpointTest("test_watchpoint_page_fork_at"))
     suite.addTest(WatchpointTest("test_watchpoint_callback"))
     suite.addTest(WatchpointTest("test_watchpoint_disable"))
     suite.addTest(WatchpointTest("test_watchpoint_disable_reenable"))
@@ -122,6 +140,9 @@ def fast_suite():
     suite.addTest(WatchpointAliasTest("test_watchpoint_callback"))
     suite.addTest(HandleSyscallTest("test_handles"))
     suite.addTest(HandleSyscallTest("test_handles_with_pprint"))
+    suite.addTest(HandleSyscallTest("test_handles_filter"))
+    suite.addTest(HandleSyscallTest("test_handles_observe"))
+    suite.addTest(HandleSyscallTest("test_resolve_syscalls"))
     suite.addTest(HandleSyscallTest("test_handle_disabling"))
     suite.addTest(HandleSyscallTest("test_handle_disabling_with_pprint"))
     suite.addTest(HandleSyscallTest("test_handle_overwrite"))
@@ -136,9 +157,11 @@ def fast_suite():
     suite.addTest(SyscallHijackTest("test_hijack_syscall_args"))
     suite.addTest(SyscallHijackTest("test_hijack_syscall_args_with_pprint"))
     suite.addTest(SyscallHijackTest("test_hijack_syscall_wrong_args"))
+    suite.addTest(SyscallHijackTest("test_rewrite_syscall"))
     suite.addTest(SyscallHijackTest("loop_detection_test"))
     suite.addTest(PPrintSyscallsTest("test_pprint_syscalls_generic"))
     suite.addTest(PPrintSyscallsTest("test_pprint_syscalls_with_statement"))
+    suite.addTest(PPrintSyscallsTest("test_record_syscalls"))
     suite.addTest(PPrintSyscallsTest("test_pprint_handle_syscalls"))
     suite.addTest(PPrintSyscallsTest("test_pprint_hijack_syscall"))
     suite.addTest(PPrintSyscallsTest("test_pprint_which_syscalls_pprint_after"))
@@ -195,6 +218,11 @@ def complete_suite():
     suite.addTest(Vmwhere1("test_vmwhere1"))
     suite.addTest(Vmwhere1("test_vmwhere1_callback"))
     suite.addTest(BruteTest("test_bruteforce"))
+    suite.addTest(BruteTest("test_bruteforce_checkpoint"))
+    suite.addTest(BruteTest("test_bruteforce_fork_server"))
+    suite.addTest(BruteTest("test_fork_at_nested"))
+    suite.addTest(BruteTest("test_bruteforce_pool"))
+    suite.addTest(BruteTest("test_pool_double_release"))
     suite.addTest(CallbackTest("test_callback_bruteforce"))
     suite.addTest(SpeedTest("test_speed"))
     suite.addTest(SpeedTest("test_speed_hardware"))
@@ -248,6 +248,29 @@ class BreakpointTest(unittest.TestCase):
 
         self.d.kill()
 
+    def test_bp_hw_pending_changes(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        bp1 = d.bp(0x40115B, hardware=True)
+        bp2 = d.bp(0x40116D, hardware=True)
+
+        # Only the state of the breakpoints when the process resumes is written to the thread
+        for _ in range(3):
+            bp1.disable()
+            bp1.enable()
+
+        bp1.disable()
+
+        d.cont()
+
+        self.assertTrue(bp2.hit_on(d))
+        self.assertEqual(bp1.hit_count, 0)
+
+        d.kill()
+        d.terminate()
+
     def test_bps_running(self):
         d = self.d
 
@@ -378,6 +401,244 @@ class BreakpointTest(unittest.TestCase):
 
         d.kill()
 
+    def test_bp_memory_access(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        bp = d.bp(0x40115B)
+
+        original = d.memory[bp.address, 8, "absolute"]
+
+        d.cont()
+
+        self.assertTrue(bp.hit_on(d))
+
+        # The breakpoint stays installed while the process is stopped, but it is not visible
+        self.assertEqual(d.memory[bp.address, 8, "absolute"], original)
+        self.assertEqual(d.memory[bp.address - 4, 8, "absolute"][4:], original[:4])
+
+        # Writing over the breakpoint replaces the original instruction, the breakpoint is kept
+        d.memory[bp.address, 8, "absolute"] = original
+
+        d.cont()
+
+        self.assertTrue(bp.hit_on(d))
+        self.assertEqual(bp.hit_count, 2)
+        self.assertEqual(d.memory[bp.address, 8, "absolute"], original)
+
+        d.kill()
+        d.terminate()
+
+    def test_bp_counting(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        bp1 = d.bp(0x40115B, counting=True)
+        bp2 = d.bp(0x40116D)
+
+        d.cont()
+
+        # The counting breakpoint never stops the process
+        self.assertTrue(bp2.hit_on(d))
+        self.assertFalse(bp1.hit_on(d))
+        self.assertEqual(bp1.hit_count, 10)
+        self.assertEqual(bp2.hit_count, 1)
+
+        with self.assertRaises(ValueError):
+            d.bp("random_function", hardware=True, counting=True)
+
+        with self.assertRaises(ValueError):
+            d.bp("random_function", callback=lambda _, __: None, counting=True)
+
+        d.kill()
+        d.terminate()
+
+    def test_bp_coverage(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        cov1 = d.coverage("random_function")
+        cov2 = d.coverage([0x40116D, 0x40119C])
+        bp = d.bp(0x40116D)
+
+        # The pending coverage points are invisible in memory
+        self.assertEqual(d.memory[0x40119C, 1], b"\x5d")
+
+        d.cont()
+
+        self.assertTrue(bp.hit_on(d))
+        self.assertEqual(cov1.addresses, [0x401136, 0x401158, 0x401162, 0x401168])
+        self.assertEqual(cov1.reached, cov1.addresses)
+        self.assertEqual(cov1.ratio, 1.0)
+        self.assertEqual(cov2.reached, [0x40116D])
+        self.assertEqual(cov2.missed, [0x40119C])
+        self.assertEqual(d.memory[0x401136, 1], b"\x55")
+
+        with self.assertRaises(ValueError):
+            d.coverage(next(vmap for vmap in d.maps() if vmap.backing_file == "[stack]"))
+
+        d.kill()
+        d.terminate()
+
+    def test_bp_bulk(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        bp1, bp2, bp3, bp4 = d.breakpoints_bulk(["random_function", 0x40115B, 0x40116D, 0x40115B])
+
+        # Duplicate positions share the same breakpoint
+        self.assertIs(bp2, bp4)
+        self.assertEqual(bp1.address, 0x401136)
+        self.assertEqual(bp2.symbol, "0x40115b")
+        self.assertEqual(len(d.breakpoints), 3)
+
+        # The installed breakpoints are invisible in memory
+        self.assertEqual(d.memory[0x401136, 1], b"\x55")
+
+        d.cont()
+        self.assertTrue(bp1.hit_on(d))
+
+        for i in range(10):
+            d.cont()
+            self.assertTrue(bp2.hit_on(d))
+            self.assertEqual(bp2.hit_count, i + 1)
+
+        d.cont()
+        self.assertTrue(bp3.hit_on(d))
+        self.assertEqual(d.regs.rsi, 45)
+        self.assertEqual(bp1.hit_count, 1)
+
+        with self.assertRaises(ValueError):
+            d.breakpoints_bulk(["random_function"], file="absolute")
+
+        # A location that already holds a breakpoint keeps it
+        bp5 = d.breakpoint(0x401162, hardware=True)
+        bp6, bp7 = d.breakpoints_bulk([0x401162, 0x40115B])
+
+        self.assertIs(bp6, bp5)
+        self.assertIs(bp7, bp2)
+        self.assertTrue(bp6.hardware)
+        self.assertEqual(len(d.breakpoints), 4)
+
+        d.kill()
+        d.terminate()
+
+    def test_bp_when(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        bp1 = d.bp(0x40115B, when="rax == 7")
+        bp2 = d.bp(0x40115E, when="dword[rbp - 8] == 3 and [rbp - 8] != 0")
+        bp3 = d.bp(0x40116D)
+
+        d.cont()
+
+        self.assertTrue(bp2.hit_on(d))
+        self.assertEqual(d.regs.rax, 3)
+
+        d.cont()
+
+        self.assertTrue(bp1.hit_on(d))
+        self.assertEqual(d.regs.rax, 7)
+
+        d.cont()
+
+        self.assertTrue(bp3.hit_on(d))
+        self.assertEqual(bp1.hit_count, 1)
+        self.assertEqual(bp2.hit_count, 1)
+
+        with self.assertRaises(ValueError):
+            d.bp("random_function", when="rax < rbx < rcx")
+
+        with self.assertRaises(ValueError):
+            d.bp("random_function", when="foo == 1")
+
+        with self.assertRaises(ValueError):
+            d.bp("random_function", hardware=True, when="rax == 1")
+
+        self.assertNotIn(0x401136, d.breakpoints)
+
+        d.kill()
+        d.terminate()
+
+    def test_bp_step_over(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        # An indirect RIP-relative jump, a conditional jump, a call and a return
+        bp1 = d.bp(0x401030)
+        bp2 = d.bp(0x401166)
+        bp3 = d.bp(0x401177)
+        bp4 = d.bp(0x40117E)
+        bp5 = d.bp(0x401197)
+
+        d.cont()
+        self.assertTrue(bp1.hit_on(d))
+        d.cont()
+        self.assertTrue(bp1.hit_on(d))
+
+        # The last check of the loop falls through
+        for _ in range(11):
+            d.cont()
+            self.assertTrue(bp2.hit_on(d))
+
+        d.cont()
+        self.assertTrue(bp3.hit_on(d))
+        self.assertEqual(d.memory[0x401177, 5], b"\xe8\xc4\xfe\xff\xff")
+
+        d.cont()
+        self.assertTrue(bp4.hit_on(d))
+        self.assertEqual(d.memory[d.regs.rsp, 8], (0x401197).to_bytes(8, "little"))
+
+        d.cont()
+        self.assertTrue(bp5.hit_on(d))
+
+        self.assertEqual(bp1.hit_count, 2)
+        self.assertEqual(bp2.hit_count, 11)
+        self.assertEqual(bp3.hit_count, 1)
+        self.assertEqual(bp4.hit_count, 1)
+
+        d.kill()
+        d.terminate()
+
+    def test_tracepoint(self):
+        d = debugger("binaries/breakpoint_test")
+
+        d.run()
+
+        tp = d.tracepoint(0x401158, ["rip", "rbp", "rsp"])
+        bp = d.bp(0x40116D)
+
+        # The jump to the trampoline is invisible in memory
+        self.assertEqual(d.memory[0x401158, 6], b"\x8b\x45\xf8\x01\x45\xfc")
+
+        with self.assertRaises(ValueError):
+            d.bp(0x40115B)
+
+        with self.assertRaises(ValueError):
+            d.tracepoint("random_function", ["xmm0"])
+
+        d.cont()
+
+        # The traced instructions are executed as usual
+        self.assertTrue(bp.hit_on(d))
+        self.assertEqual(d.regs.rsi, 45)
+
+        self.assertEqual(len(tp.records), 10)
+        self.assertEqual(tp.values("rip"), [0x401158] * 10)
+        self.assertEqual(tp.values("rbp"), [d.regs.rbp] * 10)
+        self.assertEqual(tp.values("rsp"), [d.regs.rsp] * 10)
+        self.assertEqual(tp.dropped, 0)
+
+        d.kill()
+        d.terminate()
+
     def test_bp_disable_on_creation(self):
         d = debugger("binaries/breakpoint_test")
 
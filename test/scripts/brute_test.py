@@ -7,7 +7,7 @@
 import string
 import unittest
 
-from libdebug import debugger
+from libdebug import DebuggeePool, debugger
 
 
 class BruteTest(unittest.TestCase):
@@ -49,6 +49,159 @@ class BruteTest(unittest.TestCase):
 
         self.assertEqual(flag, "BRUTINOBRUTONE")
 
+    def test_bruteforce_checkpoint(self):
+        flag = b""
+
+        d = debugger("binaries/brute_test")
+
+        r = d.run()
+        read = d.breakpoint(0x11f5, hardware=True)
+        check = d.breakpoint(0x123a, hardware=True)
+        d.cont()
+
+        r.sendlineafter(b"chars\n", b"")
+
+        self.assertEqual(d.regs.rip, read.address)
+        read.disable()
+
+        # Every candidate is written over the input and checked from here
+        buffer = d.regs.rbp - 0x50
+        checkpoint = d.checkpoint()
+
+        while flag != b"BRUTINOBRUTONE":
+            for c in string.printable.encode():
+                d.memory[buffer, len(flag) + 2, "absolute"] = flag + bytes([c, 0])
+                d.cont()
+
+                self.assertEqual(d.regs.rip, check.address)
+
+                # The index of the first wrong character
+                index = int.from_bytes(d.memory[d.regs.rbp - 0x64, 4, "absolute"], "little")
+
+                d.restore(checkpoint)
+
+                self.assertEqual(d.regs.rip, read.address)
+
+                if index > len(flag):
+                    flag += bytes([c])
+                    break
+            else:
+                self.fail("No character matched.")
+
+        d.kill()
+
+    def test_bruteforce_fork_server(self):
+        flag = b""
+
+        d = debugger("binaries/brute_test")
+
+        r = d.run()
+
+        # The input is consumed by the parent, before it is forked
+        r.sendline(b"")
+
+        while flag != b"BRUTINOBRUTONE":
+            for c in string.printable.encode():
+                with d.fork_at(0x11f5) as child:
+                    self.assertNotEqual(child.pid, d.pid)
+                    forked_at = child.regs.rip
+
+                    buffer = child.regs.rbp - 0x50
+                    child.memory[buffer, len(flag) + 2, "absolute"] = flag + bytes([c, 0])
+
+                    check = child.breakpoint(0x123a, hardware=True)
+                    child.cont()
+
+                    self.assertEqual(child.regs.rip, check.address)
+
+                    # The index of the first wrong character
+                    index = int.from_bytes(child.memory[child.regs.rbp - 0x64, 4, "absolute"], "little")
+
+                # The parent is still parked where it was forked
+                self.assertEqual(d.regs.rip, forked_at)
+
+                if index > len(flag):
+                    flag += bytes([c])
+                    break
+            else:
+                self.fail("No character matched.")
+
+        d.kill()
+
+    def test_fork_at_nested(self):
+        d = debugger("binaries/brute_test")
+
+        r = d.run()
+        r.sendline(b"")
+
+        with d.fork_at(0x11f5) as outer:
+            # The breakpoint used to reach the location is removed
+            self.assertEqual(len(d.breakpoints), 0)
+
+            forked_at = outer.regs.rip
+
+            with d.fork_at(0x11f5) as inner:
+                self.assertIsNot(inner, outer)
+                self.assertNotEqual(inner.pid, outer.pid)
+                self.assertEqual(inner.regs.rip, forked_at)
+
+            # The outer child is still alive
+            self.assertEqual(outer.regs.rip, forked_at)
+
+        # The debuggers of the released children are reused
+        with d.fork_at(0x11f5) as child:
+            self.assertTrue(child is outer or child is inner)
+            self.assertEqual(child.regs.rip, forked_at)
+
+        d.kill()
+
+    def test_bruteforce_pool(self):
+        flag = ""
+
+        with DebuggeePool("binaries/brute_test", size=4) as pool:
+            while flag != "BRUTINOBRUTONE":
+                for c in string.printable:
+                    d, r = pool.run()
+
+                    # The process is already stopped at the entry point
+                    self.assertEqual(len(d.threads), 1)
+
+                    check = d.breakpoint(0x123a, hardware=True)
+                    d.cont()
+
+                    r.sendlineafter(b"chars\n", (flag + c).encode())
+
+                    self.assertEqual(d.regs.rip, check.address)
+
+                    # The index of the first wrong character
+                    index = int.from_bytes(d.memory[d.regs.rbp - 0x64, 4, "absolute"], "little")
+
+                    pool.release(d)
+
+                    if index > len(flag):
+                        flag += c
+                        break
+                else:
+                    self.fail("No character matched.")
+
+        self.assertEqual(flag, "BRUTINOBRUTONE")
+
+    def test_pool_double_release(self):
+        with DebuggeePool("binaries/brute_test", size=1) as pool:
+            d, _ = pool.run()
+
+            pool.release(d)
+
+            with self.assertRaises(ValueError):
+                pool.release(d)
+
+            # The process is handed out only once
+            d2, _ = pool.run()
+            self.assertIs(d2, d)
+            self.assertTrue(pool._ready.empty())
+
+            pool.release(d2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,12 @@ import sys
 import unittest
 
 from libdebug import debugger
+from libdebug.utils.syscall_utils import (
+    get_all_syscall_numbers,
+    resolve_syscall_arguments,
+    resolve_syscall_name,
+    resolve_syscall_number,
+)
 
 
 class HandleSyscallTest(unittest.TestCase):
@@ -90,6 +96,122 @@ class HandleSyscallTest(unittest.TestCase):
         self.assertEqual(handler2.hit_count, 1)
         self.assertEqual(handler3.hit_count, 1)
 
+    def test_handles_filter(self):
+        d = debugger("binaries/handle_syscall_test", syscall_filter=True)
+
+        r = d.run()
+
+        ptr = 0
+        write_count = 0
+
+        def on_enter_write(d, sh):
+            nonlocal write_count
+
+            self.assertTrue(sh.syscall_number == 1)
+            self.assertEqual(d.syscall_arg0, 1)
+            write_count += 1
+
+        def on_exit_mmap(d, sh):
+            self.assertTrue(sh.syscall_number == 9)
+
+            nonlocal ptr
+
+            ptr = d.regs.rax
+
+        handler1 = d.handle_syscall("write", on_enter_write, None)
+        handler2 = d.handle_syscall("mmap", None, on_exit_mmap)
+        handler3 = d.handle_syscall("getcwd")
+
+        r.sendline(b"provola")
+
+        # The threads stop only at the syscalls reported by the filter
+        d.cont()
+        d.wait()
+
+        self.assertTrue(handler3.hit_on_enter(d))
+        self.assertEqual(d.syscall_arg0, ptr)
+
+        d.cont()
+        d.wait()
+
+        self.assertTrue(handler3.hit_on_exit(d))
+        self.assertEqual(d.memory[d.syscall_arg0, 8], os.getcwd()[:8].encode())
+
+        d.cont()
+
+        d.kill()
+
+        self.assertEqual(write_count, 2)
+        self.assertEqual(handler1.hit_count, 2)
+        self.assertEqual(handler2.hit_count, 1)
+        self.assertEqual(handler3.hit_count, 1)
+
+    def test_handles_observe(self):
+        d = debugger("binaries/handle_syscall_test")
+
+        r = d.run()
+
+        ptr = 0
+        write_count = 0
+
+        def on_enter_write(d, sh):
+            nonlocal write_count
+
+            self.assertTrue(sh.syscall_number == 1)
+            self.assertEqual(d.syscall_arg0, 1)
+            write_count += 1
+
+        def on_exit_mmap(d, sh):
+            self.assertTrue(sh.syscall_number == 9)
+
+            nonlocal ptr
+
+            ptr = d.regs.rax
+
+        handler1 = d.handle_syscall("write", on_enter_write, None, observe=True)
+        handler2 = d.handle_syscall("mmap", None, on_exit_mmap, observe=True)
+        handler3 = d.handle_syscall("getcwd")
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+
+        self.assertTrue(handler3.hit_on_enter(d))
+        self.assertEqual(d.syscall_arg0, ptr)
+
+        d.cont()
+        d.wait()
+
+        self.assertTrue(handler3.hit_on_exit(d))
+
+        d.cont()
+
+        d.kill()
+
+        self.assertEqual(write_count, 2)
+        self.assertEqual(handler1.hit_count, 2)
+        self.assertEqual(handler2.hit_count, 1)
+        self.assertEqual(handler3.hit_count, 1)
+
+    def test_resolve_syscalls(self):
+        self.assertEqual(resolve_syscall_number("read"), 0)
+        self.assertEqual(resolve_syscall_number("getcwd"), 79)
+        self.assertEqual(resolve_syscall_number("exit_group"), 231)
+        self.assertEqual(resolve_syscall_name(1), "write")
+        self.assertEqual(resolve_syscall_name(435), "clone3")
+        self.assertEqual(resolve_syscall_arguments(0), ["unsigned int fd", "char __user *buf", "size_t count"])
+        self.assertEqual(len(resolve_syscall_arguments(9)), 6)
+
+        for number in get_all_syscall_numbers():
+            self.assertEqual(resolve_syscall_number(resolve_syscall_name(number)), number)
+
+        with self.assertRaises(ValueError):
+            resolve_syscall_name(400)
+
+        with self.assertRaises(ValueError):
+            resolve_syscall_number("not_a_syscall")
+
     def test_handles_with_pprint(self):
         d = debugger("binaries/handle_syscall_test")
 
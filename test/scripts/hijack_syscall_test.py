@@ -302,6 +302,64 @@ class SyscallHijackTest(unittest.TestCase):
 
         d.kill()
 
+    def test_rewrite_syscall(self):
+        d = debugger("binaries/handle_syscall_test")
+
+        r = d.run()
+
+        # Both writes are cut to 6 bytes, and read returns without waiting for input
+        write_handler = d.rewrite_syscall("write", syscall_arg2=6)
+        read_handler = d.rewrite_syscall("read", syscall_return=0)
+
+        d.cont()
+        d.wait()
+
+        self.assertEqual(r.recv(12), b"Hello," + b"\x00" * 6)
+        self.assertEqual(write_handler.hit_count, 2)
+        self.assertEqual(read_handler.hit_count, 1)
+
+        d.kill()
+
+        # The hijack is applied by the backend, the hit is counted anyway
+        r = d.run()
+
+        handler = d.hijack_syscall("getcwd", "write")
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+        d.kill()
+
+        self.assertEqual(handler.hit_count, 1)
+
+        # The pretty print needs the callback of the hijack, the hit is counted the same
+        r = d.run()
+
+        d.pprint_syscalls = True
+        handler = d.hijack_syscall("getcwd", "write")
+
+        r.sendline(b"provola")
+
+        d.cont()
+        d.wait()
+        d.kill()
+
+        self.assertEqual(handler.hit_count, 1)
+
+        d.run()
+
+        with self.assertRaises(ValueError):
+            d.rewrite_syscall("read")
+
+        with self.assertRaises(ValueError):
+            d.rewrite_syscall("read", "write", syscall_return=0)
+
+        with self.assertRaises(ValueError):
+            d.rewrite_syscall("read", syscall_number=1)
+
+        d.kill()
+
     def loop_detection_test(self):
         d = debugger("binaries/handle_syscall_test")
 
@@ -6,6 +6,7 @@
 
 import io
 import logging
+import re
 import unittest
 
 from libdebug import debugger, libcontext
@@ -49,6 +50,239 @@ class MemoryTest(unittest.TestCase):
 
         d.kill()
 
+    def test_memory_large_read_write(self):
+        d = self.d
+
+        d.run()
+
+        bp = d.breakpoint("change_memory")
+
+        d.cont()
+
+        assert d.regs.rip == bp.address
+
+        # Read a whole library map at once and compare it with the kernel's view
+        libc_map = next(vmap for vmap in d.maps() if "libc" in vmap.backing_file and "x" in vmap.permissions)
+
+        with open(f"/proc/{d.pid}/mem", "rb") as f:
+            f.seek(libc_map.start)
+            expected = f.read(libc_map.size)
+
+        self.assertEqual(d.memory[libc_map.start, libc_map.size], expected)
+
+        # Write a range that spans multiple pages of the heap and restore it afterwards
+        heap_map = next(vmap for vmap in d.maps() if vmap.backing_file == "[heap]")
+        address = heap_map.start + 0x123
+        size = 0x2345
+
+        original = d.memory[address, size]
+        pattern = bytes(i * 7 & 0xFF for i in range(size))
+
+        d.memory[address, size] = pattern
+        self.assertEqual(d.memory[address, size], pattern)
+
+        d.memory[address, size] = original
+        self.assertEqual(d.memory[address, size], original)
+
+        d.kill()
+
+    def test_memory_readinto(self):
+        d = self.d
+
+        d.run()
+
+        bp = d.breakpoint("change_memory")
+
+        d.cont()
+
+        assert d.regs.rip == bp.address
+
+        address = d.regs.rdi
+
+        buffer = bytearray(256)
+        self.assertEqual(d.memory.readinto(address, buffer), 256)
+        self.assertEqual(buffer, bytes(range(256)))
+
+        # Reading into a slice of a larger buffer leaves the rest untouched
+        buffer = bytearray(b"\xff" * 64)
+        view = memoryview(buffer)
+        self.assertEqual(d.memory.readinto(address + 8, view[16:32]), 16)
+        self.assertEqual(buffer[:16], b"\xff" * 16)
+        self.assertEqual(buffer[16:32], bytes(range(8, 24)))
+        self.assertEqual(buffer[32:], b"\xff" * 32)
+
+        d.kill()
+
+    def test_memory_cache(self):
+        d = debugger("binaries/memory_test_2")
+
+        d.run()
+
+        d.memory.enable_cache()
+
+        bp = d.breakpoint("do_nothing")
+
+        self.assertEqual(int.from_bytes(d.memory["state", 8], "little"), 0)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, bp.address)
+
+        # The cache must have been dropped when the process stopped
+        self.assertEqual(int.from_bytes(d.memory["state", 8], "little"), 0xDEADBEEF)
+
+        # Writes must be applied to the cached pages as well
+        d.memory["state", 8] = (0x1337).to_bytes(8, "little")
+        self.assertEqual(int.from_bytes(d.memory["state", 8], "little"), 0x1337)
+
+        d.memory.disable_cache()
+
+        self.assertEqual(int.from_bytes(d.memory["state", 8], "little"), 0x1337)
+
+        d.kill()
+
+    def test_memory_snapshot(self):
+        d = debugger("binaries/memory_test_2")
+
+        d.run()
+
+        bp = d.breakpoint("do_nothing")
+
+        snapshot = d.snapshot()
+
+        # Nothing was executed since the snapshot was taken
+        self.assertEqual(d.diff(snapshot), [])
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, bp.address)
+
+        changes = d.diff(snapshot)
+        self.assertNotEqual(changes, [])
+
+        for start, end in changes:
+            self.assertLess(start, end)
+            if start in snapshot.pages:
+                self.assertNotEqual(snapshot.read(start, end - start), d.memory[start, end - start, "absolute"])
+
+        second = d.snapshot()
+        self.assertEqual(d.diff(second), [])
+
+        d.memory["state", 4] = (0x1337).to_bytes(4, "little")
+
+        changes = d.diff(second)
+        self.assertEqual(len(changes), 1)
+
+        start, end = changes[0]
+        self.assertEqual(end - start, 4)
+        self.assertEqual(second.read(start, 4), (0xDEADBEEF).to_bytes(4, "little"))
+        self.assertEqual(d.memory[start, 4, "absolute"], (0x1337).to_bytes(4, "little"))
+
+        # The first snapshot still holds the original content
+        self.assertEqual(snapshot.read(start, 4), bytes(4))
+
+        d.kill()
+
+    def test_memory_read_write_many(self):
+        d = self.d
+
+        d.run()
+
+        bp = d.breakpoint("change_memory")
+
+        d.cont()
+
+        assert d.regs.rip == bp.address
+
+        address = d.regs.rdi
+        regions = [(address, 8), (address + 100, 4), (address + 250, 6), (address + 16, 0)]
+
+        values = d.memory.read_many(regions)
+        self.assertEqual(values, [bytes(range(0, 8)), bytes(range(100, 104)), bytes(range(250, 256)), b""])
+
+        data, offsets = d.memory.read_many(regions, packed=True)
+        self.assertEqual(data, b"".join(values))
+        self.assertEqual(offsets, [0, 8, 12, 18])
+
+        d.memory.write_many([(address + 128, b"abcd"), (address + 132, b"1234"), (address, b"\xff")])
+
+        self.assertEqual(d.memory[address, 1], b"\xff")
+        self.assertEqual(d.memory[address + 128, 8], b"abcd1234")
+
+        d.kill()
+
+    def test_memory_follow(self):
+        d = debugger("binaries/linked_list_test")
+
+        d.run()
+
+        bp_list = d.breakpoint("inspect_list")
+        bp_circular = d.breakpoint("inspect_circular_list")
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, bp_list.address)
+
+        head = d.regs.rdi
+        nodes = d.memory.follow(head, next_offset=8, payload_size=8)
+
+        self.assertEqual(len(nodes), 100)
+        self.assertEqual(nodes[0][0], head)
+        self.assertEqual([int.from_bytes(payload, "little") for _, payload in nodes], list(range(0x1000, 0x1064)))
+
+        # Each node must point to the following one
+        nodes = d.memory.follow(head, next_offset=8, payload_size=16, max_nodes=10)
+        self.assertEqual(len(nodes), 10)
+
+        for (_, payload), (address, _) in zip(nodes, nodes[1:]):
+            self.assertEqual(int.from_bytes(payload[8:], "little"), address)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, bp_circular.address)
+
+        # The walk must stop when the list loops back to the first node
+        nodes = d.memory.follow(d.regs.rdi, next_offset=8, payload_size=8)
+        self.assertEqual(len(nodes), 100)
+
+        d.kill()
+
+    def test_memory_find(self):
+        d = self.d
+
+        d.run()
+
+        bp = d.breakpoint("change_memory")
+
+        d.cont()
+
+        assert d.regs.rip == bp.address
+
+        address = d.regs.rdi
+
+        # Bytes pattern
+        self.assertEqual(d.memory.find(bytes(range(10, 20)), maps="heap"), [address + 10])
+
+        # Aligned integer pattern, which must not match at unaligned addresses
+        value = int.from_bytes(bytes(range(16, 24)), "little")
+        self.assertEqual(d.memory.find(value, maps="heap"), [address + 16])
+        value = int.from_bytes(bytes(range(17, 25)), "little")
+        self.assertEqual(d.memory.find(value, maps="heap"), [])
+
+        # Regular expression pattern
+        self.assertEqual(d.memory.find(re.compile(b"\x10\x11.\x13"), maps="heap"), [address + 16])
+
+        # Matches crossing the boundary of a chunk must be found
+        heap = next(vmap for vmap in d.maps() if vmap.backing_file == "[heap]")
+        chunk_size = address - heap.start + 12
+        self.assertEqual(d.memory.find(bytes(range(10, 20)), maps="heap", chunk_size=chunk_size), [address + 10])
+
+        # The search is lazy and covers every writable map by default
+        iterator = d.memory.finditer(bytes(range(100, 120)))
+        self.assertEqual(next(iterator), address + 100)
+
+        d.kill()
+
     def test_mem_access_libs(self):
         d = self.d
 
@@ -9,6 +9,8 @@ import sys
 import unittest
 
 from libdebug import debugger
+from libdebug.tools.syscall_trace import SyscallTrace
+from libdebug.utils.syscall_utils import resolve_syscall_name
 
 
 class PPrintSyscallsTest(unittest.TestCase):
@@ -75,6 +77,44 @@ class PPrintSyscallsTest(unittest.TestCase):
         self.assertEqual(self.capturedOutput.getvalue().count("getcwd"), 1)
         self.assertEqual(self.capturedOutput.getvalue().count("exit_group"), 1)
 
+    def test_record_syscalls(self):
+        d = debugger("binaries/handle_syscall_test")
+
+        buffer = bytearray(1 << 16)
+
+        r = d.run()
+        d.record_syscalls(buffer)
+
+        r.sendline(b"provola")
+
+        d.cont()
+
+        d.kill()
+
+        # Nothing is printed while recording
+        self.assertEqual(self.capturedOutput.getvalue(), "")
+
+        trace = SyscallTrace(buffer)
+        names = [resolve_syscall_name(record.syscall_number) for record in trace]
+
+        self.assertEqual(trace.dropped, 0)
+        self.assertEqual(names.count("write"), 2)
+        self.assertEqual(names.count("read"), 1)
+        self.assertEqual(names.count("mmap"), 1)
+        self.assertEqual(names.count("getcwd"), 1)
+        self.assertEqual(names[-1], "exit_group")
+
+        mmap = next(record for record in trace if record.syscall_number == 9)
+        self.assertEqual(mmap.args[1], 0x1000)
+        self.assertIsNotNone(mmap.return_value)
+        self.assertIsNone(trace[-1].return_value)
+
+        trace.pprint()
+
+        self.assertEqual(self.capturedOutput.getvalue().count("getcwd"), 1)
+
+        d.record_syscalls(None)
+
     def test_pprint_handle_syscalls(self):
         def on_enter_read(d, sh):
             pass
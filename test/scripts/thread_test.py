@@ -79,6 +79,33 @@ class ThreadTest(unittest.TestCase):
         d.kill()
         d.terminate()
 
+    def test_thread_hardware_new_threads(self):
+        d = debugger("binaries/thread_test")
+
+        d.run()
+
+        # The breakpoints are set before the threads exist, they are copied to each new thread
+        bp_t1 = d.breakpoint("thread_1_function", hardware=True)
+        bp_t2 = d.breakpoint("thread_2_function", hardware=True)
+        bp_t3 = d.breakpoint("thread_3_function", hardware=True)
+        bp_t0 = d.breakpoint("do_nothing", hardware=True)
+
+        d.cont()
+
+        for _ in range(15):
+            if bp_t0.hit_on(d):
+                break
+
+            d.cont()
+
+        self.assertEqual(bp_t0.hit_count, 1)
+        self.assertEqual(bp_t1.hit_count, 1)
+        self.assertEqual(bp_t2.hit_count, 1)
+        self.assertEqual(bp_t3.hit_count, 1)
+
+        d.kill()
+        d.terminate()
+
 
 class ComplexThreadTest(unittest.TestCase):
     def setUp(self):
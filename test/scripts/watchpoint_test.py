@@ -60,6 +60,99 @@ class WatchpointTest(unittest.TestCase):
 
         d.kill()
 
+    def test_watchpoint_page(self):
+        d = debugger("binaries/watchpoint_test", auto_interrupt_on_command=False)
+
+        d.run()
+
+        wp_char = d.watchpoint("global_char", condition="rw", length=1, hardware=False)
+        wp_int = d.watchpoint("global_int", condition="w", length=4, hardware=False)
+        wp_long = d.watchpoint("global_long", condition="rw", length=8, hardware=False)
+
+        # Page watchpoints are not limited by the debug registers
+        wp_bytes = [d.watchpoint(f"global_int+{i}", condition="w", length=1, hardware=False) for i in range(1, 4)]
+        wp_bytes.append(d.watchpoint("global_long+4", condition="w", length=4, hardware=False))
+
+        with self.assertRaises(ValueError):
+            d.watchpoint("global_char", condition="x", hardware=False)
+
+        with self.assertRaises(ValueError):
+            d.watchpoint(0x401111, condition="w", hardware=False)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, 0x401111)  # mov byte ptr [global_char], 0x1
+        self.assertEqual(wp_char.hit_count, 1)
+        self.assertEqual(wp_int.hit_count, 0)
+        self.assertEqual(wp_long.hit_count, 0)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, 0x401124)  # mov dword ptr [global_int], 0x4050607
+        self.assertEqual(wp_char.hit_count, 1)
+        self.assertEqual(wp_int.hit_count, 1)
+        self.assertEqual(wp_long.hit_count, 0)
+
+        d.cont()
+
+        self.assertEqual(
+            d.regs.rip, 0x401135
+        )  # mov qword ptr [global_long], 0x8090a0b0c0d0e0f
+        self.assertEqual(wp_char.hit_count, 1)
+        self.assertEqual(wp_int.hit_count, 1)
+        self.assertEqual(wp_long.hit_count, 1)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, 0x401155)  # movzx eax, byte ptr [global_char]
+        self.assertEqual(wp_char.hit_count, 2)
+        self.assertEqual(wp_int.hit_count, 1)
+        self.assertEqual(wp_long.hit_count, 1)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, 0x401173)  # mov rax, qword ptr [global_long]
+        self.assertEqual(wp_char.hit_count, 2)
+        self.assertEqual(wp_int.hit_count, 1)
+        self.assertEqual(wp_long.hit_count, 2)
+
+        # The bytes are hit along with the watchpoints that cover them
+        self.assertEqual([wp.hit_count for wp in wp_bytes], [1, 1, 1, 1])
+
+        d.kill()
+
+    def test_watchpoint_page_fork_at(self):
+        d = debugger("binaries/watchpoint_test", auto_interrupt_on_command=False)
+
+        d.run()
+
+        wp_char = d.watchpoint("global_char", condition="rw", length=1, hardware=False)
+        wp_long = d.watchpoint("global_long", condition="rw", length=8, hardware=False)
+
+        d.cont()
+
+        self.assertEqual(d.regs.rip, 0x401111)  # mov byte ptr [global_char], 0x1
+        self.assertEqual(wp_char.hit_count, 1)
+
+        with d.fork_at(0x401111) as child:
+            # The child is not watched, so it accesses the watched pages freely
+            check = child.breakpoint(0x401173)
+            child.cont()
+
+            self.assertEqual(child.regs.rip, check.address)
+
+        self.assertEqual(wp_char.hit_count, 1)
+        self.assertEqual(wp_long.hit_count, 0)
+
+        # The pages of the parent are still watched
+        d.cont()
+
+        self.assertEqual(d.regs.rip, 0x401135)  # mov qword ptr [global_long], 0x8090a0b0c0d0e0f
+        self.assertEqual(wp_char.hit_count, 1)
+        self.assertEqual(wp_long.hit_count, 1)
+
+        d.kill()
+
     def test_watchpoint_callback(self):
         global_char_ip = []
         global_int_ip = []
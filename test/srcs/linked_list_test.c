@@ -0,0 +1,47 @@
+//
+// This file is part of libdebug Python library (https://github.com/libdebug/libdebug).
+// Copyright (c) 2024 Roberto Alessandro Bertolini, Gabriele Digregorio. All rights reserved.
+// Licensed under the MIT license. See LICENSE file in the project root for details.
+//
+
+#include <stdint.h>
+#include <stdlib.h>
+
+struct node {
+    uint64_t value;
+    struct node *next;
+};
+
+void inspect_list(struct node *head)
+{
+    (void) head;
+}
+
+void inspect_circular_list(struct node *head)
+{
+    (void) head;
+}
+
+int main()
+{
+    struct node *head = NULL;
+
+    for (int i = 99; i >= 0; i--) {
+        struct node *n = malloc(sizeof(struct node));
+        n->value = 0x1000 + i;
+        n->next = head;
+        head = n;
+    }
+
+    inspect_list(head);
+
+    // Close the list on itself
+    struct node *tail = head;
+    while (tail->next)
+        tail = tail->next;
+    tail->next = head;
+
+    inspect_circular_list(head);
+
+    return 0;
+}